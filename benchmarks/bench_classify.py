@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Compare keyword classification CPU per article: one substring scan per keyword vs the compiled classifier.
+
+Run from the repository root:
+
+    python benchmarks/bench_classify.py [--articles 500] [--words 200 800 3200] [--repeat 3]
+
+"before" replays what categorize_article and detect_indian_content used
+to do: rebuild the keyword dict and run one ``keyword in text`` scan per
+keyword (~200 per article) over title and full body. "after" is
+KeywordClassifier.classify_batch. Both label the same synthetic article
+bodies at each body length; the script checks the labels agree and
+prints CPU milliseconds per article from ``time.process_time`` (best of
+``--repeat`` rounds).
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'server'))
+
+from services.keyword_classifier import KeywordClassifier, CATEGORY_KEYWORDS, INDIAN_KEYWORDS, SOURCE_CATEGORIES
+
+SENTENCES = [
+    "Officials said on Tuesday that the new regional transport plan would cut commuting times across the metro area.",
+    "Critics warned that funding remained uncertain after the state budget was delayed for a second year.",
+    "The company reported quarterly revenue ahead of market expectations as demand for its software grew.",
+    "Researchers at the university published a study on vaccine treatment outcomes in rural hospitals.",
+    "The prime minister told parliament the government would table the election bill before the winter session.",
+    "Fans packed the stadium as the home team won the championship match in the final over.",
+    "The film's director said the festival award would help the independent cinema reach streaming audiences.",
+    "Engineers in Bengaluru are building machine learning tools for farmers, according to the startup's founder.",
+    "Heavy rain flooded low-lying streets in Mumbai and Chennai, disrupting trains for thousands of commuters.",
+    "Diplomats met in Geneva to discuss sanctions and a possible treaty on maritime borders.",
+]
+SOURCES = ['BBC News', 'Reuters', 'Times of India', 'NDTV', 'The Hindu', 'Al Jazeera', 'TechCrunch']
+
+
+def legacy_categorize(title: str, content: str = "", source: str = "") -> str:
+    title_lower = title.lower()
+    content_lower = content.lower() if content else ""
+    source_lower = source.lower()
+    combined = f"{title_lower} {content_lower}"
+    if source_lower in SOURCE_CATEGORIES:
+        return SOURCE_CATEGORIES[source_lower]
+    # The old code built this dict on every call
+    categories = {category: list(keywords) for category, keywords in CATEGORY_KEYWORDS.items()}
+    scores = {}
+    for category, keywords in categories.items():
+        score = 0
+        for keyword in keywords:
+            if keyword in combined:
+                score += 3 if keyword in title_lower else 1
+        scores[category] = score
+    max_category = max(scores, key=scores.get)
+    return max_category if scores[max_category] >= 2 else 'general'
+
+
+def legacy_region(title: str, content: str = "", source: str = "") -> str:
+    combined = f"{title.lower()} {content.lower() if content else ''} {source.lower()}"
+    indian_keywords = list(INDIAN_KEYWORDS)
+    return 'indian' if any(keyword in combined for keyword in indian_keywords) else 'international'
+
+
+def build_corpus(count: int, words: int, seed: int = 7):
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(count):
+        body = []
+        while sum(len(sentence.split()) for sentence in body) < words:
+            body.append(rng.choice(SENTENCES))
+        title = rng.choice(SENTENCES).rstrip('.')[:90]
+        corpus.append({'title': title, 'fullContent': ' '.join(body), 'source': rng.choice(SOURCES)})
+    return corpus
+
+
+def measure(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.process_time()
+        func()
+        timings.append(time.process_time() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--articles', type=int, default=500, help='articles per body length')
+    parser.add_argument('--words', type=int, nargs='+', default=[200, 800, 3200], help='body lengths in words')
+    parser.add_argument('--repeat', type=int, default=3, help='rounds per variant; the fastest is reported')
+    args = parser.parse_args()
+
+    classifier = KeywordClassifier()
+    print(f"{'words':>6} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for words in args.words:
+        corpus = build_corpus(args.articles, words)
+
+        before_labels = [(legacy_categorize(a['title'], a['fullContent'], a['source']),
+                          legacy_region(a['title'], a['fullContent'], a['source'])) for a in corpus]
+        after_labels = classifier.classify_batch(corpus)
+        mismatches = sum(1 for before, after in zip(before_labels, after_labels) if before != after)
+        if mismatches:
+            print(f"WARNING: {mismatches} of {len(corpus)} labels differ at {words} words")
+
+        before = measure(lambda: [(legacy_categorize(a['title'], a['fullContent'], a['source']),
+                                   legacy_region(a['title'], a['fullContent'], a['source'])) for a in corpus],
+                         args.repeat)
+        after = measure(lambda: classifier.classify_batch(corpus), args.repeat)
+        print(f"{words:>6} {before * 1000 / len(corpus):>10.3f} {after * 1000 / len(corpus):>10.3f} "
+              f"{before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Compare feed parse CPU and memory: a full BeautifulSoup XML tree vs the streaming iterparse parser.
+
+Run from the repository root:
+
+    python benchmarks/bench_feed.py [--items 100] [--limit 25] [--feeds 50] [--repeat 3]
+
+"before" replays what parse_feed_items used to do: build a
+``BeautifulSoup(content, 'xml')`` tree of the whole feed, then
+``find_all('item')[:limit]`` and ``find`` title/link/description in each
+item. "after" is feed_parser.parse_feed, which stops at the item cap.
+Both parse the same synthetic RSS feeds (``--items`` items with HTML
+descriptions and media tags, like real news feeds). The script checks
+that titles and links agree and prints CPU milliseconds per feed from
+``time.process_time`` (best of ``--repeat`` rounds) and the peak Python
+allocation while parsing one feed, from ``tracemalloc`` (libxml2's own
+buffers are not counted on either side).
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from xml.sax.saxutils import escape
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'server'))
+
+from bs4 import BeautifulSoup
+from services.feed_parser import parse_feed
+
+DESCRIPTION = ("<p>Officials said on Tuesday that the new regional transport plan would cut commuting times "
+               "across the metro area, while critics warned that funding remained uncertain.</p>") * 4
+
+
+def build_feed(index: int, items: int) -> bytes:
+    entries = ''.join(
+        f'<item><title>Transport plan update {index}-{i}: councils agree on the next phase</title>'
+        f'<link>https://news.example/{index}/story-{i}</link>'
+        f'<guid isPermaLink="false">story-{index}-{i}</guid>'
+        f'<description>{escape(DESCRIPTION)}</description>'
+        f'<pubDate>Tue, 10 Jun 2025 {i % 24:02d}:30:00 GMT</pubDate>'
+        f'<media:content url="https://img.example/{index}/{i}.jpg" medium="image" width="1024"/>'
+        f'<media:thumbnail url="https://img.example/{index}/{i}-thumb.jpg"/>'
+        f'</item>'
+        for i in range(items)
+    )
+    return ('<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"><channel>'
+            f'<title>Example News</title><link>https://news.example/</link>{entries}</channel></rss>').encode('utf-8')
+
+
+def legacy_parse(content: bytes, item_limit: int):
+    soup = BeautifulSoup(content, 'xml')
+    feed_items = []
+    for item in soup.find_all('item')[:item_limit]:
+        title_elem = item.find('title')
+        link_elem = item.find('link')
+        desc_elem = item.find('description')
+        if title_elem and title_elem.text:
+            title = title_elem.text.strip()
+            if len(title) > 20:
+                feed_items.append({
+                    'title': title,
+                    'url': link_elem.text.strip() if link_elem else "",
+                    'description': desc_elem.text.strip() if desc_elem and desc_elem.text else ""
+                })
+    return feed_items
+
+
+def measure(func, feeds, limit: int, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.process_time()
+        for content in feeds:
+            func(content, limit)
+        timings.append(time.process_time() - start)
+    return min(timings) * 1000 / len(feeds)
+
+
+def peak_kib(func, content: bytes, limit: int) -> float:
+    tracemalloc.start()
+    func(content, limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=100, help='items per synthetic feed')
+    parser.add_argument('--limit', type=int, default=25, help='item cap, as in the source registry')
+    parser.add_argument('--feeds', type=int, default=50, help='number of feeds to parse per round')
+    parser.add_argument('--repeat', type=int, default=3, help='rounds per variant; the fastest is reported')
+    args = parser.parse_args()
+
+    feeds = [build_feed(i, args.items) for i in range(args.feeds)]
+    before_items = legacy_parse(feeds[0], args.limit)
+    after_items = parse_feed(feeds[0], args.limit)
+    if [(i['title'], i['url']) for i in before_items] != [(i['title'], i['url']) for i in after_items]:
+        print("WARNING: the two parsers disagree on titles or links")
+
+    print(f"Parsing {len(feeds)} feeds of {args.items} items ({len(feeds[0]) // 1024} KiB each), cap {args.limit}")
+    print(f"{'':<8}{'cpu ms/feed':>12}{'peak KiB':>10}")
+    before = measure(legacy_parse, feeds, args.limit, args.repeat)
+    after = measure(parse_feed, feeds, args.limit, args.repeat)
+    before_kib = peak_kib(legacy_parse, feeds[0], args.limit)
+    after_kib = peak_kib(parse_feed, feeds[0], args.limit)
+    print(f"{'before':<8}{before:>12.2f}{before_kib:>10.0f}")
+    print(f"{'after':<8}{after:>12.2f}{after_kib:>10.0f}")
+    print(f"speedup {before / after:>11.1f}x{before_kib / after_kib:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Compare parse CPU per article: separate BeautifulSoup passes vs one shared lxml tree.
+
+Run from the repository root:
+
+    python benchmarks/bench_parse.py [--articles 100] [--repeat 3]
+
+"before" replays what extract_article_from_html used to do, where
+newspaper3k parsed the page and ran its NLP pass, and then the image,
+content-fallback and media extractors each re-parsed ``article.html``
+with BeautifulSoup. Image downloads are left out of both sides because
+they are network I/O, not parsing.
+"after" is the current extract_article_from_html. Both run on the
+same synthetic pages and the script prints CPU milliseconds per article
+from ``time.process_time`` (best of ``--repeat`` rounds).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'server'))
+
+from bs4 import BeautifulSoup
+from services.scraper import NewsScraper
+from services.html_extract import SITE_SELECTORS, COMMON_SELECTORS
+
+PARAGRAPH = ("Officials said on Tuesday that the new regional transport plan would cut commuting times "
+             "across the metro area, while critics warned that funding remained uncertain. ")
+
+
+def build_page(index: int, with_lead_image: bool) -> str:
+    """A news page with the usual chrome around the story body"""
+    meta = f'<meta property="og:image" content="https://cdn.example/lead-{index}.jpg">' if with_lead_image else ''
+    nav = ''.join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(40))
+    scripts = ''.join(f'<script>window.__data{i} = {{"k": {i}, "v": "{"x" * 200}"}};</script>' for i in range(15))
+    body = ''.join(
+        f'<p>{PARAGRAPH * 3}</p>' + (f'<figure><img src="/img/{index}-{i}.jpg" alt="Figure {i}"></figure>' if i % 4 == 0 else '')
+        for i in range(24)
+    )
+    related = ''.join(f'<div class="card"><a href="/story/{i}"><img src="//cdn.example/t{i}.jpg">'
+                      f'<span>Related story {i}</span></a></div>' for i in range(30))
+    return (f'<html><head><title>Transport plan {index}</title>{meta}{scripts}</head><body>'
+            f'<header><nav><ul>{nav}</ul></nav></header>'
+            f'<main><article class="article-body"><h1>Transport plan {index}</h1>{body}'
+            f'<iframe src="https://www.youtube.com/embed/{index}"></iframe></article></main>'
+            f'<aside>{related}</aside><footer><p>Copyright example news</p></footer></body></html>')
+
+
+def legacy_image_pass(html: str, url: str):
+    soup = BeautifulSoup(html, 'html.parser')
+    for selector in ['meta[property="og:image"]', 'meta[name="twitter:image"]', 'meta[property="twitter:image"]']:
+        meta_tag = soup.select_one(selector)
+        if meta_tag and meta_tag.get('content', '').startswith(('http://', 'https://')):
+            return meta_tag.get('content')
+    for img in soup.find_all('img', src=True, limit=5):
+        return img.get('src')
+    return None
+
+
+def legacy_content_pass(html: str, url: str) -> str:
+    soup = BeautifulSoup(html, 'html.parser')
+    for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'form', 'iframe', 'noscript']):
+        element.decompose()
+    content = ""
+    for selectors in SITE_SELECTORS.values():
+        for selector in selectors:
+            elements = soup.select(selector)
+            if elements:
+                content = ' '.join(elem.get_text(strip=True) for elem in elements)
+                break
+        if content:
+            break
+    if len(content) < 300:
+        for selector in COMMON_SELECTORS:
+            elements = soup.select(selector)
+            if elements:
+                content = ' '.join(elem.get_text(strip=True) for elem in elements)
+                if len(content) > 300:
+                    break
+    return content
+
+
+def legacy_media_pass(html: str, url: str) -> str:
+    soup = BeautifulSoup(html, 'html.parser')
+    links = [f"[IMAGE: {img.get('alt', 'Image')}] {img.get('src')}" for img in soup.find_all('img', src=True)]
+    links += [f"[VIDEO] {video.get('src')}" for video in soup.find_all('video', src=True)]
+    links += [f"[EMBEDDED] {iframe.get('src')}" for iframe in soup.find_all('iframe', src=True)]
+    return '\n'.join(links)
+
+
+def legacy_extract(scraper: NewsScraper, url: str, html: str):
+    """The old per-article work: newspaper parse plus up to three BeautifulSoup re-parses"""
+    article = scraper._build_article(url)
+    article.set_html(html)
+    article.parse()
+    try:
+        article.nlp()
+    except Exception:
+        pass
+    content = article.text.strip() if article.text else ""
+    if len(content) < 100:
+        content = legacy_content_pass(article.html, url)
+    if content:
+        legacy_media_pass(article.html, url)
+    if not article.top_image:
+        legacy_image_pass(article.html, url)
+
+
+def measure(label: str, func, pages, repeat: int) -> float:
+    # Best of several rounds keeps GC pauses and CPU frequency changes out of the number
+    timings = []
+    for _ in range(repeat):
+        start = time.process_time()
+        for url, html in pages:
+            func(url, html)
+        timings.append(time.process_time() - start)
+    per_article_ms = min(timings) * 1000 / len(pages)
+    print(f"{label:<8} {per_article_ms:8.2f} ms CPU/article")
+    return per_article_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--articles', type=int, default=100, help='number of synthetic pages to parse')
+    parser.add_argument('--repeat', type=int, default=3, help='rounds per variant; the fastest is reported')
+    args = parser.parse_args()
+
+    scraper = NewsScraper({'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None})
+    # Alternate pages with and without a lead image so the image fallback is exercised too
+    pages = [(f"https://news.example/story/{i}", build_page(i, with_lead_image=i % 2 == 0))
+             for i in range(args.articles)]
+
+    # Warm up imports, selector compilation and newspaper's stopword lists
+    for url, html in pages[:5]:
+        legacy_extract(scraper, url, html)
+        scraper.extract_article_from_html(url, html)
+
+    print(f"Parsing {len(pages)} articles")
+    before = measure('before', lambda url, html: legacy_extract(scraper, url, html), pages, args.repeat)
+    after = measure('after', scraper.extract_article_from_html, pages, args.repeat)
+    print(f"saved    {before - after:8.2f} ms CPU/article ({(1 - after / before) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
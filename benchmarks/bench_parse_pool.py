@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Compare article parse throughput: parsing in the extraction threads vs a process pool.
+
+Run from the repository root:
+
+    python benchmarks/bench_parse_pool.py [--articles 200] [--workers 4] [--threads 8]
+
+Both sides hand the same synthetic pages (from bench_parse) to
+``extract_article_from_html`` through the scraper's ExtractionPool with
+``--threads`` threads, as a cycle does once pages are downloaded.
+"before" has ``parse_workers`` 0, so parsing holds the GIL in those
+threads; "after" sends the HTML to ``--workers`` worker processes. The
+script checks that both give the same article text and prints wall-clock
+articles per second. Worker start-up is excluded by warming the pool
+first; the gain depends on how many cores the machine has.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'server'))
+sys.path.append(os.path.dirname(__file__))
+
+from bench_parse import build_page
+from services.scraper import NewsScraper
+
+BENCH_CONFIG = {'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None, 'html_cache_dir': None}
+
+
+def run(scraper: NewsScraper, pages):
+    start = time.perf_counter()
+    results = scraper.extraction_pool.map(lambda page: scraper.extract_article_from_html(*page), pages,
+                                          key=lambda page: page[0])
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--articles', type=int, default=200, help='number of synthetic pages to parse')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='parse worker processes')
+    parser.add_argument('--threads', type=int, default=8, help='extraction threads, as in extraction_workers')
+    args = parser.parse_args()
+
+    # One host per page so the per-host limit does not serialize the batch
+    pages = [(f"https://news{i}.example/story/{i}", build_page(i, with_lead_image=i % 2 == 0))
+             for i in range(args.articles)]
+    threaded = NewsScraper(dict(BENCH_CONFIG, extraction_workers=args.threads))
+    pooled = NewsScraper(dict(BENCH_CONFIG, extraction_workers=args.threads, parse_workers=args.workers))
+    try:
+        # Start the workers and warm up imports on both sides
+        run(threaded, pages[:args.threads])
+        run(pooled, pages[:args.workers * 2])
+
+        print(f"Parsing {len(pages)} articles with {args.threads} threads; {os.cpu_count()} cores")
+        before, before_seconds = run(threaded, pages)
+        after, after_seconds = run(pooled, pages)
+        if [r['fullContent'] for r in before] != [r['fullContent'] for r in after]:
+            print("WARNING: threaded and pooled extraction disagree")
+        print(f"before   {len(pages) / before_seconds:8.1f} articles/s (parse in threads)")
+        print(f"after    {len(pages) / after_seconds:8.1f} articles/s ({args.workers} worker processes)")
+        print(f"speedup  {before_seconds / after_seconds:8.1f}x")
+    finally:
+        threaded.extraction_pool.shutdown()
+        pooled.extraction_pool.shutdown()
+        pooled.parse_pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
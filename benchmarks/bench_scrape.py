@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""Offline benchmark of scrape_source, scrape_source_comprehensive and extract_full_article.
+
+Run from the repository root:
+
+    python benchmarks/bench_scrape.py [--fixtures DIR] [--articles 10] [--repeat 3] [--latency-ms 0]
+                                      [--check] [--update-baseline] [--tolerance 0.3]
+
+Every request goes to a local stub server holding recorded feeds,
+homepages and article pages for each source in scrape_source (see
+fixtures.py; ``--fixtures`` loads a set captured by record_fixtures.py,
+otherwise a deterministic synthetic set is built). Nothing touches the
+network, so the numbers only move when the code does.
+
+For each stage the script reports articles/sec (wall clock), CPU
+milliseconds per article (``time.process_time``, all threads), p50/p95
+latency per call and the stage's peak RSS, taking the fastest of
+``--repeat`` rounds. Politeness limits are raised so the rate limiter
+does not dominate the timings.
+
+``--check`` compares the run against baseline.json and exits non-zero
+when a metric is worse than the baseline by more than ``--tolerance``.
+Timings are scaled by a CPU calibration loop stored with the baseline,
+so a baseline recorded on another machine stays usable.
+``--update-baseline`` stores the current run as the new baseline.
+"""
+
+import argparse
+import json
+import logging
+import os
+import resource
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'server'))
+
+from services.scraper import NewsScraper
+
+from fixtures import SOURCES, article_urls, load_fixtures, synthesize_fixtures
+from stub_server import StubServer, route_scraper
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+DEFAULT_TOLERANCE = 0.3
+
+BENCH_CONFIG = {
+    'feed_cache_file': None,
+    'seen_urls_file': None,
+    'near_duplicate_file': None,
+    'html_cache_dir': None,
+    'host_requests_per_second': 10000.0,
+    'host_burst': 10000,
+}
+
+# Metric name -> True when a larger value is better
+METRICS = {
+    'articles_per_sec': True,
+    'cpu_ms_per_article': False,
+    'p50_ms': False,
+    'p95_ms': False,
+    'peak_rss_mb': False,
+}
+# Metrics that scale with CPU speed and are adjusted by the calibration ratio
+TIMED_METRICS = {'articles_per_sec', 'cpu_ms_per_article', 'p50_ms', 'p95_ms'}
+
+
+def calibrate() -> float:
+    """Seconds for a fixed pure-Python workload, to compare timings across machines"""
+    best = float('inf')
+    for _ in range(5):
+        start = time.process_time()
+        total = 0
+        for i in range(300000):
+            total += len(str(i * 7)) % 3
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def reset_peak_rss():
+    """Start a new peak RSS window (Linux only; elsewhere the process high-water mark is reported)"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def peak_rss_mb() -> float:
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / (1024 * 1024) if sys.platform == 'darwin' else maxrss / 1024
+
+
+def make_scraper(server: StubServer) -> NewsScraper:
+    scraper = NewsScraper(dict(BENCH_CONFIG))
+    route_scraper(scraper, server)
+    return scraper
+
+
+def run_stage(server: StubServer, calls: List[Callable[[NewsScraper], int]], repeat: int) -> Dict[str, float]:
+    """Time each call on a fresh scraper per round and keep the fastest round"""
+    best: Optional[Dict[str, float]] = None
+    for _ in range(repeat):
+        scraper = make_scraper(server)
+        scraper.start_cycle()
+        reset_peak_rss()
+        latencies = []
+        articles = 0
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        for call in calls:
+            call_start = time.perf_counter()
+            articles += call(scraper)
+            latencies.append(time.perf_counter() - call_start)
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        scraper.extraction_pool.shutdown()
+
+        result = {
+            'articles': articles,
+            'articles_per_sec': articles / wall if wall else 0.0,
+            'cpu_ms_per_article': cpu * 1000 / articles if articles else 0.0,
+            'p50_ms': statistics.median(latencies) * 1000,
+            'p95_ms': sorted(latencies)[max(0, int(len(latencies) * 0.95) - 1)] * 1000,
+            'peak_rss_mb': peak_rss_mb(),
+        }
+        if best is None or result['articles_per_sec'] > best['articles_per_sec']:
+            best = result
+    return best
+
+
+def stage_calls(pages) -> Dict[str, List[Callable[[NewsScraper], int]]]:
+    return {
+        'scrape_source': [
+            lambda scraper, source=source: len(scraper.scrape_source(source['url'], source['name']))
+            for source in SOURCES
+        ],
+        'scrape_source_comprehensive': [
+            lambda scraper, source=source: len(scraper.scrape_source_comprehensive(source['url'], source['name']))
+            for source in SOURCES
+        ],
+        'extract_full_article': [
+            lambda scraper, url=url: int(bool(scraper.extract_full_article(url).get('fullContent')))
+            for url in sorted(article_urls(pages))
+        ],
+    }
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Regressions of results against baseline, as human-readable lines"""
+    scale = results['calibration_s'] / baseline['calibration_s'] if baseline.get('calibration_s') else 1.0
+    regressions = []
+    for stage, metrics in baseline['stages'].items():
+        current = results['stages'].get(stage)
+        if current is None:
+            continue
+        if current['articles'] != metrics['articles']:
+            regressions.append(f"{stage}: produced {current['articles']} articles, baseline {metrics['articles']}")
+        for name, higher_is_better in METRICS.items():
+            expected = metrics[name]
+            if name in TIMED_METRICS:
+                # A slower machine gets proportionally lower throughput and higher latency
+                expected = expected / scale if higher_is_better else expected * scale
+            if higher_is_better and current[name] < expected * (1 - tolerance):
+                regressions.append(f"{stage}: {name} {current[name]:.2f} < {expected:.2f} (-{tolerance:.0%} allowed)")
+            elif not higher_is_better and current[name] > expected * (1 + tolerance):
+                regressions.append(f"{stage}: {name} {current[name]:.2f} > {expected:.2f} (+{tolerance:.0%} allowed)")
+    return regressions
+
+
+def run(pages, fixtures_label: str, repeat: int, latency_ms: float) -> Dict:
+    results = {'fixtures': fixtures_label, 'latency_ms': latency_ms, 'calibration_s': calibrate(), 'stages': {}}
+    with StubServer(pages, latency_ms=latency_ms) as server:
+        # Warm up imports, selector compilation and newspaper's stopword lists
+        warmup = make_scraper(server)
+        for url in sorted(article_urls(pages))[:3]:
+            warmup.extract_full_article(url)
+        warmup.extraction_pool.shutdown()
+
+        for stage, calls in stage_calls(pages).items():
+            results['stages'][stage] = run_stage(server, calls, repeat)
+        results['stub_misses'] = sorted(set(server.misses))
+    return results
+
+
+def print_results(results: Dict):
+    print(f"Fixtures: {results['fixtures']}, calibration {results['calibration_s'] * 1000:.1f} ms")
+    print(f"{'stage':<30}{'articles':>9}{'art/s':>9}{'cpu ms/art':>12}{'p50 ms':>9}{'p95 ms':>9}{'peak MB':>9}")
+    for stage, m in results['stages'].items():
+        print(f"{stage:<30}{m['articles']:>9}{m['articles_per_sec']:>9.1f}{m['cpu_ms_per_article']:>12.2f}"
+              f"{m['p50_ms']:>9.1f}{m['p95_ms']:>9.1f}{m['peak_rss_mb']:>9.1f}")
+    if results['stub_misses']:
+        print(f"Requests with no fixture: {len(results['stub_misses'])} (e.g. {results['stub_misses'][0]})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--fixtures', help='directory written by record_fixtures.py (default: synthetic pages)')
+    parser.add_argument('--articles', type=int, default=10, help='synthetic articles per source')
+    parser.add_argument('--repeat', type=int, default=3, help='rounds per stage; the fastest is reported')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='delay the stub server adds to each response')
+    parser.add_argument('--check', action='store_true', help='fail if worse than the stored baseline')
+    parser.add_argument('--update-baseline', action='store_true', help='store this run as the baseline')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='allowed relative regression')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='baseline file to compare against or update')
+    args = parser.parse_args()
+    # Per-article INFO logging would swamp the report
+    logging.disable(logging.INFO)
+
+    if args.fixtures:
+        pages = load_fixtures(args.fixtures)
+        fixtures_label = f"recorded:{os.path.basename(os.path.normpath(args.fixtures))}"
+    else:
+        pages = synthesize_fixtures(args.articles)
+        fixtures_label = f"synthetic:{args.articles}"
+
+    results = run(pages, fixtures_label, args.repeat, args.latency_ms)
+    print_results(results)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baseline written to {args.baseline}")
+
+    if args.check:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if (baseline['fixtures'], baseline.get('latency_ms', 0.0)) != (fixtures_label, args.latency_ms):
+            print(f"Baseline was recorded with {baseline['fixtures']} at {baseline.get('latency_ms', 0.0)} ms latency; "
+                  f"rerun with the same fixtures or update the baseline")
+            sys.exit(2)
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Fixture pages for the offline benchmarks: feeds, homepages and article HTML for every source.
+
+A fixture set maps each URL the scraper requests to the status, content
+type and body it should get back. ``record_fixtures.py`` captures a set
+from the live sites and ``save_fixtures``/``load_fixtures`` keep it on
+disk. ``synthesize_fixtures`` builds a deterministic set shaped like each
+site's markup (RSS items, Reuters cards, Hacker News rows, the content
+selectors from html_extract), so the suite also runs without network
+access and gives the same pages on every machine.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import random
+import sys
+from typing import Dict, List, Tuple
+from urllib.parse import urlparse
+from xml.sax.saxutils import escape
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'server'))
+
+from services.sources import RSS_FEEDS, default_registry
+from services.html_extract import SITE_SELECTORS
+
+# url -> (status, content type, body)
+FixturePages = Dict[str, Tuple[int, str, bytes]]
+
+# The default sources the app seeds (server/storage.ts), one per source registry row
+SOURCES = [
+    {'name': 'BBC News', 'url': 'https://www.bbc.com/news'},
+    {'name': 'Reuters', 'url': 'https://www.reuters.com'},
+    {'name': 'TechCrunch', 'url': 'https://techcrunch.com'},
+    {'name': 'Hacker News', 'url': 'https://news.ycombinator.com'},
+    {'name': 'CNN', 'url': 'https://www.cnn.com'},
+    {'name': 'The Guardian', 'url': 'https://www.theguardian.com'},
+    {'name': 'NPR', 'url': 'https://www.npr.org'},
+    {'name': 'Associated Press', 'url': 'https://apnews.com'},
+    {'name': 'India Today', 'url': 'https://www.indiatoday.in'},
+    {'name': 'NDTV', 'url': 'https://www.ndtv.com'},
+    {'name': 'Times of India', 'url': 'https://timesofindia.indiatimes.com'},
+    {'name': 'The Hindu', 'url': 'https://www.thehindu.com'},
+    {'name': 'Economic Times', 'url': 'https://economictimes.indiatimes.com'},
+    {'name': 'WIRED', 'url': 'https://www.wired.com'},
+    {'name': 'Engadget', 'url': 'https://www.engadget.com'},
+    {'name': 'Ars Technica', 'url': 'https://arstechnica.com'},
+    {'name': 'The Verge', 'url': 'https://www.theverge.com'},
+]
+
+MANIFEST_FILENAME = "manifest.json"
+HTML = 'text/html; charset=utf-8'
+RSS = 'application/rss+xml; charset=utf-8'
+
+WORDS = ("government minister officials said on tuesday plan budget city council transport rail commuters "
+         "flood rain storm market shares investors company revenue quarter growth startup founder software "
+         "court ruling judge election campaign voters parliament bill hospital patients vaccine study research "
+         "university students team match final season coach stadium film festival director streaming music "
+         "police investigation report data security network phone chip battery launch climate energy solar "
+         "farmers crops prices inflation bank rates policy trade talks border treaty sanctions summit leaders "
+         "water supply district villages workers strike union factory exports airline flights airport delays").split()
+PLACES = ['Mumbai', 'Delhi', 'Bengaluru', 'Chennai', 'Kolkata', 'London', 'Washington', 'Tokyo', 'Berlin', 'Nairobi']
+
+
+def _sentence(rng: random.Random, length: int) -> str:
+    words = [rng.choice(WORDS) for _ in range(length)]
+    return " ".join(words).capitalize() + "."
+
+
+def _headline(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(7, 11))]
+    words.insert(rng.randrange(len(words)), rng.choice(PLACES))
+    return " ".join(words).capitalize()
+
+
+def _content_class(source_key: str) -> str:
+    """The first class selector html_extract tries for this site, so the site-specific path is exercised"""
+    for selector in SITE_SELECTORS.get(source_key, []):
+        if selector.startswith('.') and ' ' not in selector:
+            return selector[1:]
+    return 'article-body'
+
+
+def article_page(rng: random.Random, url: str, title: str, source_key: str) -> str:
+    """An article page with the usual chrome: scripts, navigation, related links and embeds"""
+    host = urlparse(url).netloc
+    scripts = ''.join(f'<script>window.__state{i} = {{"id": {i}, "v": "{"x" * 300}"}};</script>' for i in range(12))
+    nav = ''.join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(40))
+    paragraphs = ''.join(
+        f'<p>{" ".join(_sentence(rng, rng.randint(12, 22)) for _ in range(rng.randint(3, 5)))}</p>'
+        + (f'<figure><img src="https://cdn.{host}/img/{i}.jpg" alt="Figure {i}"><figcaption>Figure {i}</figcaption></figure>'
+           if i % 6 == 0 else '')
+        for i in range(rng.randint(12, 24))
+    )
+    related = ''.join(f'<li><a href="/news/related-{i}">{_headline(rng)}</a></li>' for i in range(15))
+    return (f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>{title}</title>'
+            f'<meta property="og:title" content="{title}">'
+            f'<meta property="og:image" content="https://cdn.{host}/lead/{rng.randrange(100000)}.jpg">'
+            f'<meta name="author" content="Staff Reporter">'
+            f'<meta property="article:published_time" content="2025-07-17T08:00:00+00:00">{scripts}</head>'
+            f'<body><header><nav><ul>{nav}</ul></nav></header><main>'
+            f'<article><h1>{title}</h1><div class="{_content_class(source_key)}">{paragraphs}'
+            f'<iframe src="https://www.youtube.com/embed/{rng.randrange(100000)}"></iframe></div></article>'
+            f'<aside><h3>Related</h3><ul>{related}</ul></aside></main>'
+            f'<footer><p>Privacy policy</p><p>Terms of service</p></footer></body></html>')
+
+
+def rss_feed(rng: random.Random, items: List[Tuple[str, str]]) -> str:
+    entries = ''.join(
+        f'<item><title>{escape(title)}</title><link>{escape(url)}</link>'
+        f'<description>{escape(_sentence(rng, 30))}</description>'
+        f'<pubDate>Thu, 17 Jul 2025 08:00:00 GMT</pubDate></item>'
+        for title, url in items
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Feed</title>{entries}</channel></rss>'
+
+
+def homepage(source_key: str, items: List[Tuple[str, str]]) -> str:
+    """A homepage listing the articles in the markup the source's index parser looks for"""
+    if source_key == 'reuters.com':
+        cards = ''.join(f'<div data-testid="ArticleCard"><a href="{urlparse(url).path}"><h3>{title}</h3></a></div>'
+                        for title, url in items)
+    elif source_key == 'ycombinator.com':
+        cards = '<table>' + ''.join(
+            f'<tr class="athing" id="{i}"><td><span class="titleline"><a href="{url}">{title}</a></span></td></tr>'
+            for i, (title, url) in enumerate(items)
+        ) + '</table>'
+    else:
+        cards = ''.join(f'<article class="story-card"><h2><a href="{urlparse(url).path}">{title}</a></h2></article>'
+                        for title, url in items)
+    menu = ''.join(f'<li><a href="/section/{i}">Menu section {i}</a></li>' for i in range(30))
+    return (f'<html><head><title>Home</title></head><body><header><nav><ul>{menu}</ul></nav></header>'
+            f'<main class="content">{cards}</main><footer><a href="/about">About us and contact</a></footer></body></html>')
+
+
+def synthesize_fixtures(articles_per_source: int = 10, seed: int = 0) -> FixturePages:
+    """Deterministic feeds, homepages and article pages for every source in SOURCES"""
+    rng = random.Random(seed)
+    pages: FixturePages = {}
+    for source in SOURCES:
+        source_key = default_registry.key_for(source['url'])
+        host = urlparse(source['url']).netloc
+        items = []
+        for index in range(articles_per_source):
+            title = _headline(rng)
+            slug = '-'.join(title.lower().split()[:6])
+            if source_key == 'ycombinator.com':
+                # Hacker News links out to other sites
+                url = f"https://blog{index}.example.org/posts/{slug}"
+            else:
+                url = f"https://{host}/news/{slug}-{index}"
+            items.append((title, url))
+            pages[url] = (200, HTML, article_page(rng, url, title, source_key).encode('utf-8'))
+
+        pages[source['url']] = (200, HTML, homepage(source_key, items).encode('utf-8'))
+        if source_key in RSS_FEEDS:
+            pages[RSS_FEEDS[source_key]['rss_url']] = (200, RSS, rss_feed(rng, items).encode('utf-8'))
+    return pages
+
+
+def article_urls(pages: FixturePages) -> List[str]:
+    """Fixture URLs that hold article pages rather than feeds or homepages"""
+    index_urls = {source['url'] for source in SOURCES} | {feed['rss_url'] for feed in RSS_FEEDS.values()}
+    return [url for url, (status, content_type, _) in pages.items()
+            if url not in index_urls and status == 200 and 'html' in content_type]
+
+
+def save_fixtures(pages: FixturePages, directory: str):
+    """Write a fixture set as gzip bodies plus a manifest of URL -> status, content type and file"""
+    os.makedirs(directory, exist_ok=True)
+    manifest = {}
+    for url, (status, content_type, body) in pages.items():
+        filename = f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.gz"
+        with open(os.path.join(directory, filename), 'wb') as f:
+            f.write(gzip.compress(body, mtime=0))
+        manifest[url] = {'status': status, 'content_type': content_type, 'file': filename}
+    with open(os.path.join(directory, MANIFEST_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+
+def load_fixtures(directory: str) -> FixturePages:
+    with open(os.path.join(directory, MANIFEST_FILENAME), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    pages: FixturePages = {}
+    for url, entry in manifest.items():
+        with open(os.path.join(directory, entry['file']), 'rb') as f:
+            pages[url] = (entry['status'], entry['content_type'], gzip.decompress(f.read()))
+    return pages
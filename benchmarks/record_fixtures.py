@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Record the feeds, homepages and article pages each source serves, for bench_scrape.py.
+
+Run from the repository root on a machine with network access:
+
+    python benchmarks/record_fixtures.py OUTPUT_DIR [--sources "BBC News" Reuters ...]
+
+Runs scrape_source and scrape_source_comprehensive against the live
+sites and saves every response the scraper's session received, under
+the URL it asked for, in the layout load_fixtures reads. Replaying the
+directory with ``bench_scrape.py --fixtures OUTPUT_DIR`` then requests
+exactly the same URLs.
+"""
+
+import argparse
+import os
+import sys
+from typing import Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'server'))
+
+from services.partial_fetch import is_html_content_type
+from services.scraper import NewsScraper
+
+from fixtures import SOURCES, FixturePages, save_fixtures
+
+
+def is_recordable(content_type: Optional[str]) -> bool:
+    """Pages and feeds; anything else the scraper rejects by content type without reading it"""
+    return is_html_content_type(content_type) or 'xml' in content_type.lower()
+
+
+def record_session(scraper: NewsScraper, pages: FixturePages):
+    """Store the final response of every GET the scraper's session makes.
+
+    Streamed responses (pages, indexes and articles go through
+    read_page_body) are read in full before the scraper sees them; the
+    body stays on the response, so the scraper streams it from memory
+    with the same byte cap and early stop as on replay.
+    """
+    request = scraper.session.request
+
+    def recording_request(method, url, *args, **kwargs):
+        response = request(method, url, *args, **kwargs)
+        if method.upper() != 'GET':
+            return response
+        content_type = response.headers.get('Content-Type', 'text/html')
+        body = response.content if not kwargs.get('stream') or is_recordable(content_type) else b''
+        pages[url] = (response.status_code, content_type, body)
+        return response
+
+    scraper.session.request = recording_request
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('output', help='directory to write the fixture set to')
+    parser.add_argument('--sources', nargs='*', help='source names to record (default: all)')
+    args = parser.parse_args()
+
+    sources = [source for source in SOURCES if not args.sources or source['name'] in args.sources]
+    scraper = NewsScraper({'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None,
+                           'html_cache_dir': None})
+    pages: FixturePages = {}
+    record_session(scraper, pages)
+
+    for source in sources:
+        scraper.start_cycle()
+        scraper.scrape_source(source['url'], source['name'])
+        scraper.scrape_source_comprehensive(source['url'], source['name'])
+        print(f"{source['name']}: {len(pages)} responses recorded so far")
+
+    save_fixtures(pages, args.output)
+    print(f"Saved {len(pages)} responses to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Local HTTP server that answers the scraper's requests from a fixture set.
+
+The scraper keeps requesting the real URLs (``https://www.bbc.com/news``
+and so on); ``route_scraper`` mounts an adapter on its session that sends
+each request to the stub server instead. Only the connection and request
+path are redirected: the rate limiter, retries, response cache and
+everything downstream still see the original URL, so the benchmark runs
+the production request path without leaving the machine.
+"""
+
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import urlsplit
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'server'))
+
+from services.rate_limiter import RateLimitedAdapter
+
+from fixtures import FixturePages
+
+
+def _fixture_key(url: str) -> str:
+    return url.rstrip('/')
+
+
+class StubServer:
+    """Serves a fixture set on 127.0.0.1 with optional per-response latency.
+
+    Requests arrive as ``/<scheme>/<host><path>`` and are answered with the
+    fixture recorded for ``<scheme>://<host><path>``; anything missing gets
+    a 404 and is listed in ``misses``.
+    """
+
+    def __init__(self, pages: FixturePages, latency_ms: float = 0.0):
+        self.pages = {_fixture_key(url): page for url, page in pages.items()}
+        self.latency = latency_ms / 1000
+        self.requests = 0
+        self.misses: List[str] = []
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @staticmethod
+    def route(url: str) -> str:
+        """Request path on the stub server for an original URL"""
+        parts = urlsplit(url)
+        path = f"/{parts.scheme}/{parts.netloc}{parts.path or '/'}"
+        return f"{path}?{parts.query}" if parts.query else path
+
+    @staticmethod
+    def original_url(path: str) -> str:
+        scheme, _, rest = path.lstrip('/').partition('/')
+        return f"{scheme}://{rest}"
+
+    def respond(self, path: str):
+        url = self.original_url(path)
+        with self._lock:
+            self.requests += 1
+            page = self.pages.get(_fixture_key(url))
+            if page is None:
+                self.misses.append(url)
+        if self.latency:
+            time.sleep(self.latency)
+        return page or (404, 'text/html; charset=utf-8', b'<html><body>Not found</body></html>')
+
+    def start(self) -> 'StubServer':
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so pooled connections are reused as they would be against real hosts
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                status, content_type, body = stub.respond(self.path)
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class StubRoutingAdapter(RateLimitedAdapter):
+    """RateLimitedAdapter whose connections all go to the stub server"""
+
+    def __init__(self, server: StubServer, rate_limiter, *args, **kwargs):
+        self.server = server
+        super().__init__(rate_limiter, *args, **kwargs)
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self.poolmanager.connection_from_url(self.server.base_url)
+
+    def get_connection(self, url, proxies=None):
+        return self.poolmanager.connection_from_url(self.server.base_url)
+
+    def cert_verify(self, conn, url, verify, cert):
+        # The stub speaks plain HTTP even for https:// fixtures
+        pass
+
+    def request_url(self, request, proxies):
+        return self.server.route(request.url)
+
+
+def route_scraper(scraper, server: StubServer):
+    """Send every request the scraper's session makes to the stub server"""
+    current = scraper.session.get_adapter("https://")
+    adapter = StubRoutingAdapter(server, scraper.rate_limiter, max_retries=current.max_retries,
+                                 pool_connections=current._pool_connections, pool_maxsize=current._pool_maxsize)
+    scraper.session.mount("http://", adapter)
+    scraper.session.mount("https://", adapter)
@@ -20,7 +20,7 @@ logger = logging.getLogger(__name__)
 class FastScraper:
     def __init__(self):
         self.scraper = NewsScraper()
-        self.storage = StorageIntegration()
+        self.storage = StorageIntegration(seen_urls=self.scraper.seen_urls, metrics=self.scraper.metrics)
         
     def process_source_batch(self, sources, batch_size=3):
         """Process sources in batches for faster processing"""
@@ -100,6 +100,8 @@ class FastScraper:
         logger.info(f"   Articles saved: {total_saved}")
         logger.info(f"   Sources processed: {len(working_sources)}")
         logger.info(f"   Average per source: {total_saved / len(working_sources):.1f} articles")
+        for line in self.scraper.metrics.summary_lines():
+            logger.info(f"   {line}")
         
         return total_saved
 
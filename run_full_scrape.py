@@ -11,6 +11,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
 
 from services.scraper import NewsScraper
 from services.storage_integration import StorageIntegration
+from services.pipeline import ScrapePipeline
 import logging
 
 # Configure logging
@@ -24,7 +25,7 @@ def run_full_scrape():
     
     # Initialize components
     scraper = NewsScraper()
-    storage = StorageIntegration()
+    storage = StorageIntegration(seen_urls=scraper.seen_urls, metrics=scraper.metrics)
     
     # Get all active sources
     logger.info("Fetching active news sources...")
@@ -42,21 +43,6 @@ def run_full_scrape():
     
     start_time = time.time()
     
-    # Scrape all sources with enhanced content extraction
-    logger.info("Starting comprehensive scraping...")
-    all_articles = scraper.scrape_all_sources(sources)
-    
-    scrape_time = time.time() - start_time
-    
-    # Validate results
-    logger.info("\n" + "=" * 50)
-    logger.info("SCRAPING RESULTS SUMMARY")
-    logger.info("=" * 50)
-    logger.info(f"Total articles scraped: {len(all_articles)}")
-    logger.info(f"Expected articles: {len(sources) * 20}")
-    logger.info(f"Scraping time: {scrape_time:.2f} seconds")
-    
-    # Analyze content quality
     content_stats = {
         'with_full_content': 0,
         'with_media_links': 0,
@@ -65,8 +51,12 @@ def run_full_scrape():
         'avg_content_length': 0,
         'total_content_length': 0
     }
+    source_distribution = {}
+    region_distribution = {'indian': 0, 'international': 0}
+    category_distribution = {}
     
-    for article in all_articles:
+    def record_article(article):
+        """Update running statistics so articles can be saved and released as they stream past"""
         full_content = article.get('fullContent', '')
         if full_content and len(full_content) > 100:
             content_stats['with_full_content'] += 1
@@ -80,23 +70,7 @@ def run_full_scrape():
         
         if article.get('author'):
             content_stats['with_authors'] += 1
-    
-    if content_stats['with_full_content'] > 0:
-        content_stats['avg_content_length'] = content_stats['total_content_length'] / content_stats['with_full_content']
-    
-    logger.info(f"\nCONTENT QUALITY ANALYSIS:")
-    logger.info(f"  Articles with full content: {content_stats['with_full_content']}/{len(all_articles)} ({content_stats['with_full_content']/len(all_articles)*100:.1f}%)")
-    logger.info(f"  Articles with media links: {content_stats['with_media_links']}/{len(all_articles)} ({content_stats['with_media_links']/len(all_articles)*100:.1f}%)")
-    logger.info(f"  Articles with images: {content_stats['with_images']}/{len(all_articles)} ({content_stats['with_images']/len(all_articles)*100:.1f}%)")
-    logger.info(f"  Articles with authors: {content_stats['with_authors']}/{len(all_articles)} ({content_stats['with_authors']/len(all_articles)*100:.1f}%)")
-    logger.info(f"  Average content length: {content_stats['avg_content_length']:.0f} characters")
-    
-    # Analyze distribution
-    source_distribution = {}
-    region_distribution = {'indian': 0, 'international': 0}
-    category_distribution = {}
-    
-    for article in all_articles:
+        
         source = article.get('source', 'unknown')
         region = article.get('region', 'international')
         category = article.get('category', 'general')
@@ -105,6 +79,42 @@ def run_full_scrape():
         region_distribution[region] = region_distribution.get(region, 0) + 1
         category_distribution[category] = category_distribution.get(category, 0) + 1
     
+    # Scrape all sources and save to Supabase in batches while scraping continues
+    logger.info("Starting comprehensive scraping (articles are saved as they are extracted)...")
+    pipeline = ScrapePipeline(scraper, storage)
+    stats = pipeline.run(sources, on_article=record_article)
+    total_scraped = stats['scraped']
+    
+    scrape_time = time.time() - start_time
+    
+    # Validate results
+    logger.info("\n" + "=" * 50)
+    logger.info("SCRAPING RESULTS SUMMARY")
+    logger.info("=" * 50)
+    logger.info(f"Total articles scraped: {total_scraped}")
+    logger.info(f"Expected articles: {len(sources) * 20}")
+    logger.info(f"Scraping and saving time: {scrape_time:.2f} seconds")
+    if stats['first_save_seconds'] is not None:
+        logger.info(f"First batch saved after: {stats['first_save_seconds']:.2f} seconds")
+    
+    if not total_scraped:
+        logger.error("❌ FAILED: No articles scraped")
+        return False
+    
+    if content_stats['with_full_content'] > 0:
+        content_stats['avg_content_length'] = content_stats['total_content_length'] / content_stats['with_full_content']
+    
+    logger.info(f"\nSTAGE TIMINGS (slowest first):")
+    for line in scraper.metrics.summary_lines():
+        logger.info(f"  {line}")
+    
+    logger.info(f"\nCONTENT QUALITY ANALYSIS:")
+    logger.info(f"  Articles with full content: {content_stats['with_full_content']}/{total_scraped} ({content_stats['with_full_content']/total_scraped*100:.1f}%)")
+    logger.info(f"  Articles with media links: {content_stats['with_media_links']}/{total_scraped} ({content_stats['with_media_links']/total_scraped*100:.1f}%)")
+    logger.info(f"  Articles with images: {content_stats['with_images']}/{total_scraped} ({content_stats['with_images']/total_scraped*100:.1f}%)")
+    logger.info(f"  Articles with authors: {content_stats['with_authors']}/{total_scraped} ({content_stats['with_authors']/total_scraped*100:.1f}%)")
+    logger.info(f"  Average content length: {content_stats['avg_content_length']:.0f} characters")
+    
     logger.info(f"\nDISTRIBUTION ANALYSIS:")
     logger.info(f"  Region distribution: {region_distribution}")
     logger.info(f"  Category distribution: {category_distribution}")
@@ -112,22 +122,20 @@ def run_full_scrape():
     for source_name, count in source_distribution.items():
         logger.info(f"    {source_name}: {count} articles")
     
-    # Save to Supabase
+    # Saving happened alongside scraping
     logger.info("\n" + "=" * 50)
-    logger.info("SAVING TO SUPABASE DATABASE")
+    logger.info("SUPABASE SAVE RESULTS")
     logger.info("=" * 50)
     
-    save_start = time.time()
-    success = storage.save_scraped_articles(all_articles)
-    save_time = time.time() - save_start
-    
-    if success:
-        logger.info(f"✅ SUCCESS: All {len(all_articles)} articles saved to Supabase")
-        logger.info(f"Save time: {save_time:.2f} seconds")
-    else:
+    if stats['batches_failed'] and not stats['batches_saved']:
         logger.error("❌ FAILED: Could not save articles to Supabase")
         return False
     
+    saved_articles = total_scraped - stats['articles_in_failed_batches']
+    logger.info(f"✅ SUCCESS: {saved_articles} of {total_scraped} articles sent to Supabase in {stats['batches_saved']} batches")
+    if stats['batches_failed']:
+        logger.warning(f"{stats['batches_failed']} batches failed to save")
+    
     # Update scraper status
     logger.info("\nUpdating scraper status...")
     storage.update_scraper_last_run()
@@ -137,10 +145,10 @@ def run_full_scrape():
     logger.info("\n" + "=" * 80)
     logger.info("FULL SCRAPING CYCLE COMPLETED SUCCESSFULLY")
     logger.info("=" * 80)
-    logger.info(f"Total articles processed: {len(all_articles)}")
-    logger.info(f"Articles saved to Supabase: {len(all_articles)}")
+    logger.info(f"Total articles processed: {total_scraped}")
+    logger.info(f"Articles saved to Supabase: {saved_articles}")
     logger.info(f"Total processing time: {total_time:.2f} seconds")
-    logger.info(f"Average time per article: {total_time/len(all_articles):.2f} seconds")
+    logger.info(f"Average time per article: {total_time/total_scraped:.2f} seconds")
     logger.info("Enhanced content extraction with media links: ENABLED")
     logger.info("Strict 20 articles per source rule: ENFORCED")
     
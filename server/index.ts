@@ -29,8 +29,8 @@ installPythonRequirements();
 const app = express();
 const port = process.env.PORT || 5000;
 
-// Parse JSON bodies
-app.use(express.json());
+// Parse JSON bodies (gzip/deflate request bodies are inflated; bulk article ingest needs the larger limit)
+app.use(express.json({ limit: '20mb' }));
 
 // In production, serve static files from dist/public
 if (process.env.NODE_ENV === 'production') {
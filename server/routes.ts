@@ -8,6 +8,20 @@ import path from "path";
 import { setupVite, serveStatic } from "./vite";
 import { scraperScheduler } from "./scheduler";
 
+// Fix timestamp formatting - convert string dates to Date objects
+function normalizeArticleDates(rawData: any) {
+  if (rawData.publishedAt && typeof rawData.publishedAt === 'string') {
+    rawData.publishedAt = new Date(rawData.publishedAt);
+  }
+  if (rawData.scrapedAt && typeof rawData.scrapedAt === 'string') {
+    rawData.scrapedAt = new Date(rawData.scrapedAt);
+  }
+  if (rawData.rephrasedAt && typeof rawData.rephrasedAt === 'string') {
+    rawData.rephrasedAt = new Date(rawData.rephrasedAt);
+  }
+  return rawData;
+}
+
 export async function registerRoutes(app: Express): Promise<Server> {
   // Health check endpoint for Render
   app.get('/api/health', (_req, res) => {
@@ -123,19 +137,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
   app.post("/api/articles", requireAuth, async (req, res) => {
     try {
-      const rawData = req.body;
-      
-      // Fix timestamp formatting - convert string dates to Date objects
-      if (rawData.publishedAt && typeof rawData.publishedAt === 'string') {
-        rawData.publishedAt = new Date(rawData.publishedAt);
-      }
-      if (rawData.scrapedAt && typeof rawData.scrapedAt === 'string') {
-        rawData.scrapedAt = new Date(rawData.scrapedAt);
-      }
-      if (rawData.rephrasedAt && typeof rawData.rephrasedAt === 'string') {
-        rawData.rephrasedAt = new Date(rawData.rephrasedAt);
-      }
-      
+      const rawData = normalizeArticleDates(req.body);
       const validatedData = insertNewsArticleSchema.parse(rawData);
       const article = await storage.createNewsArticle(validatedData);
       res.json(article);
@@ -149,6 +151,32 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
 
+  // Bulk ingest used by the Python scraper: one request per chunk, one result per article
+  app.post("/api/articles/bulk", requireAuth, async (req, res) => {
+    const items = req.body?.articles;
+    if (!Array.isArray(items)) {
+      return res.status(400).json({ error: "Expected an articles array" });
+    }
+
+    const results = [];
+    for (const rawData of items) {
+      try {
+        const validatedData = insertNewsArticleSchema.parse(normalizeArticleDates(rawData));
+        const article = await storage.createNewsArticle(validatedData);
+        results.push({ success: true, id: article.id });
+      } catch (error) {
+        if (error instanceof z.ZodError) {
+          results.push({ success: false, status: 400, error: "Invalid data", details: error.errors });
+        } else {
+          console.error('Error creating news article:', error);
+          results.push({ success: false, status: 500, error: "Failed to create news article" });
+        }
+      }
+    }
+
+    res.json({ saved: results.filter((result) => result.success).length, results });
+  });
+
   app.get("/api/articles/pending", requireAuth, async (req, res) => {
     try {
       const articles = await storage.getNewsArticlesByStatus("pending");
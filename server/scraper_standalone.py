@@ -21,6 +21,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 try:
     from services.scraper import NewsScraper
     from services.ai_rephraser import AIRephraser
+    from services.storage_integration import StorageIntegration
 except ImportError as e:
     print(f"Warning: Could not import scraper services: {e}")
     print("Scraper services not available - basic functionality only")
@@ -35,6 +36,8 @@ except ImportError as e:
         def rephrase_headline(self, headline):
             logger.warning("AIRephraser service not available")
             return headline
+    
+    StorageIntegration = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -59,6 +62,12 @@ class NewsScraperStandalone:
             self.scraper = None
             self.ai_rephraser = None
 
+        # Bulk saves through the storage client; save_article is used when it is unavailable
+        self.storage = StorageIntegration(
+            base_url=self.base_url,
+            metrics=getattr(self.scraper, 'metrics', None)
+        ) if StorageIntegration else None
+
     def get_sources(self) -> List[Dict]:
         """Get active news sources from the backend"""
         try:
@@ -142,6 +151,11 @@ class NewsScraperStandalone:
         
         logger.info(f"Found {len(active_sources)} active sources")
         
+        metrics = getattr(self.scraper, 'metrics', None)
+        if metrics is not None:
+            # New response cache and metrics window for this run
+            self.scraper.start_cycle()
+        
         total_articles = 0
         for source in active_sources:
             try:
@@ -152,8 +166,8 @@ class NewsScraperStandalone:
                     # Rephrase headlines
                     articles = self.rephrase_headlines(articles)
                     
-                    # Save articles to backend
-                    saved_count = 0
+                    # Format articles for the backend schema
+                    formatted_articles = []
                     for article in articles:
                         # Format article for backend schema
                         published_at = article.get('publishedAt')
@@ -184,9 +198,20 @@ class NewsScraperStandalone:
                         
                         # Debug log to help identify issues
                         logger.debug(f"Formatted article: {formatted_article['originalTitle'][:50]}...")
-                        
-                        if self.save_article(formatted_article):
-                            saved_count += 1
+                        formatted_articles.append(formatted_article)
+                    
+                    # Save articles to backend in bulk chunks
+                    if self.storage:
+                        results = self.storage.save_article_payloads(formatted_articles)
+                    else:
+                        results = [self.save_article(formatted_article) for formatted_article in formatted_articles]
+                    saved_urls = [formatted_article['originalUrl']
+                                  for formatted_article, saved in zip(formatted_articles, results) if saved]
+                    saved_count = len(saved_urls)
+                    
+                    # Remember saved URLs so the next run skips them before extraction
+                    if getattr(self.scraper, 'seen_urls', None) is not None:
+                        self.scraper.seen_urls.add_many(saved_urls)
                     
                     logger.info(f"Saved {saved_count}/{len(articles)} articles from {source['name']}")
                     total_articles += saved_count
@@ -196,6 +221,11 @@ class NewsScraperStandalone:
                 continue
         
         logger.info(f"Scraper run completed. Total articles saved: {total_articles}")
+        if metrics is not None:
+            self.scraper.finish_cycle()
+            for line in metrics.summary_lines():
+                logger.info(f"Run timing: {line}")
+            metrics.write_snapshot(os.getenv('SCRAPER_METRICS_FILE', 'metrics.json'))
 
     def start_scheduler(self):
         """Start the scheduled scraper"""
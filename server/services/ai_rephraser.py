@@ -1,71 +1,139 @@
 import requests
 import json
+import re
 import time
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 import logging
 import os
+from .rate_limiter import HostRateLimiter, RateLimitedAdapter
+from .rephrase_cache import RephraseCache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_REPHRASE_BATCH_SIZE = 20
+DEFAULT_REPHRASE_CONCURRENCY = 4
+DEFAULT_REPHRASE_REQUESTS_PER_SECOND = 1.0
+DEFAULT_REPHRASE_TOKENS_PER_MINUTE = 60000
+# Completion tokens allowed per headline in a request
+TOKENS_PER_HEADLINE = 60
+# Part of every rephrase cache key; bump it when the prompts change so old answers are not reused
+PROMPT_VERSION = 1
+NUMBERED_LINE = re.compile(r'^\s*(\d+)[.):]\s*(.+?)\s*$')
+
+
+def clean_headline(text: str) -> str:
+    """Strip whitespace and the quotes models like to wrap headlines in"""
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in '"\'':
+        text = text[1:-1].strip()
+    return text
+
+
+def parse_batch_answer(content: str, count: int) -> List[Optional[str]]:
+    """Read count headlines back from a batch answer: a JSON array, or numbered lines as a fallback.
+
+    Headlines the answer does not give are None.
+    """
+    text = content.strip()
+    if text.startswith('```'):
+        text = text.strip('`').split('\n', 1)[-1]
+    start, end = text.find('['), text.rfind(']')
+    if start != -1 and end > start:
+        try:
+            answers = json.loads(text[start:end + 1])
+            if isinstance(answers, list) and len(answers) == count and all(isinstance(answer, str) for answer in answers):
+                return [clean_headline(answer) or None for answer in answers]
+        except ValueError:
+            pass
+
+    headlines: List[Optional[str]] = [None] * count
+    for line in text.splitlines():
+        match = NUMBERED_LINE.match(line)
+        if match and 1 <= int(match.group(1)) <= count:
+            headlines[int(match.group(1)) - 1] = clean_headline(match.group(2)) or None
+    return headlines
+
+
 class AIRephraser:
-    def __init__(self):
-        self.api_key = os.getenv('OPENROUTER_API_KEY') or os.getenv('OPENROUTER_KEY') or ""
-        self.base_url = "https://openrouter.ai/api/v1"
+    """Rephrases headlines through the OpenRouter chat completions API.
+
+    ``rephrase_articles`` packs ``batch_size`` headlines into one prompt and
+    sends up to ``max_concurrency`` batches at once over a pooled session.
+    Requests are held to ``requests_per_second`` and the estimated tokens
+    to ``tokens_per_minute``; a 429 pauses every batch for Retry-After
+    and the request is retried once.
+    Headlines missing from a batch answer are rephrased one at a time.
+    With a ``cache``, headlines rephrased before, by this or another
+    source, are answered from it, and each distinct headline is sent once.
+    """
+
+    def __init__(self, requests_per_second: float = DEFAULT_REPHRASE_REQUESTS_PER_SECOND,
+                 batch_size: int = DEFAULT_REPHRASE_BATCH_SIZE,
+                 max_concurrency: int = DEFAULT_REPHRASE_CONCURRENCY,
+                 tokens_per_minute: Optional[int] = DEFAULT_REPHRASE_TOKENS_PER_MINUTE,
+                 api_key: Optional[str] = None, base_url: str = "https://openrouter.ai/api/v1",
+                 cache: Optional[RephraseCache] = None):
+        self.api_key = api_key or os.getenv('OPENROUTER_API_KEY') or os.getenv('OPENROUTER_KEY') or ""
+        self.base_url = base_url.rstrip('/')
         self.model = "mistralai/mistral-small"
+        self.batch_size = max(1, int(batch_size))
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.cache = cache
+        # Rate limiting - be respectful to the API; concurrent batches may start together, then go at the steady rate
+        self.rate_limiter = HostRateLimiter(requests_per_second=requests_per_second, burst=self.max_concurrency)
+        self.token_limiter = HostRateLimiter(requests_per_second=tokens_per_minute / 60.0,
+                                             burst=tokens_per_minute) if tokens_per_minute else None
+        # A 429 is retried once after its Retry-After, so one busy moment does not fail the whole batch
+        from urllib3.util.retry import Retry
+
+        retry_strategy = Retry(
+            total=1,
+            status_forcelist=[429],
+            allowed_methods=frozenset(['POST']),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # One keep-alive pool for every request; the adapter waits for the rate limiter and honours 429s
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": os.getenv('REPLIT_DOMAINS', 'http://localhost:5000').split(',')[0],
+            "X-Title": "News Scraper"
+        })
+        adapter = RateLimitedAdapter(self.rate_limiter, max_retries=retry_strategy,
+                                     pool_connections=1, pool_maxsize=self.max_concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         
         if not self.api_key:
             logger.warning("OpenRouter API key not found. AI rephrasing will be disabled.")
-    
-    def rephrase_headline(self, original_headline: str, source: str) -> Optional[str]:
-        """Rephrase a single headline using Mistral AI"""
-        if not self.api_key:
-            logger.warning("API key not available, skipping rephrasing")
-            return None
-            
-        try:
-            prompt = f"""You are a professional news editor. Please rephrase the following news headline to make it more engaging and clear while preserving the original meaning and factual accuracy. 
 
-Original headline: "{original_headline}"
-Source: {source}
-
-Please provide only the rephrased headline without any additional text or explanations."""
-
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": os.getenv('REPLIT_DOMAINS', 'http://localhost:5000').split(',')[0],
-                "X-Title": "News Scraper"
-            }
-            
-            data = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "max_tokens": 100,
-                "temperature": 0.7
-            }
-            
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=30
-            )
-            
+    def complete(self, prompt: str, max_tokens: int) -> Optional[str]:
+        """Send one chat completion request and return the answer text, or None on failure"""
+        data = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "max_tokens": max_tokens,
+            "temperature": 0.7
+        }
+        try:
+            if self.token_limiter is not None:
+                # Roughly four characters per prompt token, plus everything the answer may use
+                self.token_limiter.acquire(self.base_url, len(prompt) / 4 + max_tokens)
+            response = self.session.post(f"{self.base_url}/chat/completions", json=data, timeout=30)
             response.raise_for_status()
             result = response.json()
             
             if 'choices' in result and len(result['choices']) > 0:
-                rephrased = result['choices'][0]['message']['content'].strip()
-                # Remove quotes if present
-                if rephrased.startswith('"') and rephrased.endswith('"'):
-                    rephrased = rephrased[1:-1]
-                return rephrased
+                return result['choices'][0]['message']['content']
             else:
                 logger.error("No choices in API response")
                 return None
@@ -77,20 +145,98 @@ Please provide only the rephrased headline without any additional text or explan
             logger.error(f"Error rephrasing headline: {str(e)}")
             return None
     
+    def cache_key(self, headline: str, source: str) -> str:
+        return RephraseCache.key(headline, source, self.model, PROMPT_VERSION)
+
+    def cached(self, headline: str, source: str) -> Optional[str]:
+        """The cached rephrasing of headline, if any"""
+        return self.cache.get(self.cache_key(headline, source)) if self.cache is not None else None
+
+    def remember(self, headline: str, source: str, rephrased: Optional[str]):
+        if self.cache is not None and rephrased:
+            self.cache.put(self.cache_key(headline, source), rephrased)
+
+    def rephrase_headline(self, original_headline: str, source: str) -> Optional[str]:
+        """Rephrase a single headline using Mistral AI, from the cache when it has been rephrased before"""
+        rephrased = self.cached(original_headline, source)
+        if rephrased is None:
+            rephrased = self.request_headline(original_headline, source)
+            self.remember(original_headline, source, rephrased)
+        return rephrased
+
+    def request_headline(self, original_headline: str, source: str) -> Optional[str]:
+        """Ask the API to rephrase one headline"""
+        if not self.api_key:
+            logger.warning("API key not available, skipping rephrasing")
+            return None
+            
+        prompt = f"""You are a professional news editor. Please rephrase the following news headline to make it more engaging and clear while preserving the original meaning and factual accuracy. 
+
+Original headline: "{original_headline}"
+Source: {source}
+
+Please provide only the rephrased headline without any additional text or explanations."""
+
+        content = self.complete(prompt, 100)
+        return clean_headline(content) if content else None
+
+    def rephrase_batch(self, headlines: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """Rephrase (headline, source) pairs with one request, in order; None where rephrasing failed"""
+        rephrased = self.request_batch(headlines)
+        for (headline, source), title in zip(headlines, rephrased):
+            self.remember(headline, source, title)
+        return rephrased
+
+    def request_batch(self, headlines: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """Ask the API to rephrase several headlines in one request"""
+        if not self.api_key:
+            logger.warning("API key not available, skipping rephrasing")
+            return [None] * len(headlines)
+        if len(headlines) == 1:
+            return [self.request_headline(*headlines[0])]
+
+        numbered = "\n".join(f"{i}. [{source}] {headline}" for i, (headline, source) in enumerate(headlines, 1))
+        prompt = f"""You are a professional news editor. Please rephrase each of the following news headlines to make it more engaging and clear while preserving the original meaning and factual accuracy. Each headline is prefixed with its source.
+
+{numbered}
+
+Reply with only a JSON array of exactly {len(headlines)} strings: the rephrased headlines, in the same order, without the sources."""
+
+        content = self.complete(prompt, TOKENS_PER_HEADLINE * len(headlines))
+        if content is None:
+            return [None] * len(headlines)
+        rephrased = parse_batch_answer(content, len(headlines))
+        missing = [i for i, headline in enumerate(rephrased) if headline is None]
+        if missing:
+            logger.warning(f"Batch answer is missing {len(missing)} of {len(headlines)} headlines; rephrasing them one by one")
+            for i in missing:
+                rephrased[i] = self.request_headline(*headlines[i])
+        return rephrased
+    
     def rephrase_articles(self, articles: List[Dict]) -> List[Dict]:
-        """Rephrase multiple articles"""
+        """Rephrase multiple articles, in batches sent concurrently"""
+        headlines = [(article.get('title', ''), article.get('source', '')) for article in articles]
+        rephrased_titles = [self.cached(headline, source) for headline, source in headlines]
+        # Each distinct headline not in the cache is sent once, however many sources carry it
+        pending: Dict[str, List[int]] = {}
+        for i, (headline, source) in enumerate(headlines):
+            if rephrased_titles[i] is None:
+                pending.setdefault(self.cache_key(headline, source), []).append(i)
+        unique = [headlines[indices[0]] for indices in pending.values()]
+        batches = [unique[i:i + self.batch_size] for i in range(0, len(unique), self.batch_size)]
+        logger.info(f"Rephrasing {len(headlines)} headlines: {len(headlines) - sum(map(len, pending.values()))} cached, "
+                    f"{len(unique)} distinct ones in {len(batches)} batches")
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            results = [title for batch in executor.map(self.rephrase_batch, batches) for title in batch]
+        for indices, title in zip(pending.values(), results):
+            for i in indices:
+                rephrased_titles[i] = title
+
         rephrased_articles = []
-        
-        for article in articles:
+        for article, rephrased_title in zip(articles, rephrased_titles):
             original_title = article.get('title', '')
-            source = article.get('source', '')
-            
-            logger.info(f"Rephrasing: {original_title[:50]}...")
-            
-            rephrased_title = self.rephrase_headline(original_title, source)
-            
             rephrased_article = {
-                'source': source,
+                'source': article.get('source', ''),
                 'original': original_title,
                 'rephrased': rephrased_title or f"[AI Error] {original_title}",
                 'url': article.get('url', ''),
@@ -98,9 +244,6 @@ Please provide only the rephrased headline without any additional text or explan
             }
             
             rephrased_articles.append(rephrased_article)
-            
-            # Rate limiting - be respectful to the API
-            time.sleep(1)
         
         return rephrased_articles
 
@@ -126,11 +269,15 @@ def save_rephrased_articles(articles: List[Dict], filename: str = "rephrased_new
         logger.error(f"Error saving rephrased articles: {str(e)}")
 
 if __name__ == "__main__":
-    rephraser = AIRephraser()
+    # Headlines rephrased on an earlier run, by any source, are answered from disk
+    cache = RephraseCache()
+    rephraser = AIRephraser(cache=cache)
     articles = load_articles_from_json()
     
     if articles:
         rephrased = rephraser.rephrase_articles(articles)
         save_rephrased_articles(rephrased)
+        logger.info(f"Rephrase cache: {cache.hits} hits, {cache.misses} misses")
     else:
         logger.warning("No articles found to rephrase")
+    cache.close()
@@ -0,0 +1,504 @@
+import asyncio
+import importlib.util
+import logging
+import time
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from .extraction_pool import DEFAULT_PER_DOMAIN_CONCURRENCY
+from .html_extract import parse_html, extract_head_meta
+from .partial_fetch import HeadBuffer, PageBuffer, NotHTMLError, is_html_content_type, DEFAULT_HEAD_MAX_BYTES
+from .scraper import NewsScraper
+from .sources import DEFAULT_FEED_TIMEOUT, DEFAULT_FEED_ITEM_LIMIT, DEFAULT_INDEX_TIMEOUT, DEFAULT_COMPREHENSIVE_TIMEOUT
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Same transient statuses NewsScraper's urllib3 Retry adapter retries on
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class AsyncNewsScraper:
+    """Event-loop scraping engine with the same per-source dispatch as NewsScraper.
+
+    Feeds, index pages and article pages are all fetched over one pooled
+    ``httpx.AsyncClient`` (HTTP/2 when the ``h2`` package is installed).
+    Parsing reuses NewsScraper's extractors in worker threads so the loop
+    keeps fetching while pages are parsed. Use it as an async context
+    manager, or call ``open()``/``close()`` explicitly.
+    """
+
+    def __init__(self, config: Optional[Dict] = None, scraper: Optional[NewsScraper] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        config = config or {}
+        self.scraper = scraper or NewsScraper(config)
+        self.max_connections = config.get('async_max_connections', 100)
+        self.per_domain_concurrency = config.get('per_domain_concurrency', DEFAULT_PER_DOMAIN_CONCURRENCY)
+        self.http2 = config.get('http2', True) and importlib.util.find_spec('h2') is not None
+        self.retries = 3
+        self.backoff_factor = 1.0
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> 'AsyncNewsScraper':
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def open(self) -> httpx.AsyncClient:
+        """Create the pooled client on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=dict(self.scraper.session.headers),
+                http2=self.http2,
+                follow_redirects=True,
+                transport=self._transport,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+        return self._client
+
+    async def close(self):
+        """Close the pooled client and its connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(
+                self.scraper.sources.concurrency(host, self.per_domain_concurrency))
+        return self._host_limits[host]
+
+    async def fetch(self, url: str, timeout: float = 15, headers: Optional[Dict[str, str]] = None,
+                    stop_early: Optional[bool] = None) -> httpx.Response:
+        """GET a URL through the shared client, retrying transient failures.
+
+        Plain page GETs are answered from the scraper's per-cycle response
+        cache; conditional feed requests always go to the network. With
+        ``stop_early`` set the URL is an HTML page, streamed as in
+        ``NewsScraper.fetch_page``.
+        """
+        if headers is None:
+            return await self.scraper.response_cache.aget_or_fetch(
+                url, lambda: self._fetch(url, timeout, stop_early=stop_early)
+            )
+        return await self._fetch(url, timeout, headers, stop_early)
+
+    async def _read_page(self, client: httpx.AsyncClient, url: str, timeout: float, stop_early: bool) -> httpx.Response:
+        """Stream an HTML page into ``response.content``, up to the scraper's page_max_bytes"""
+        async with client.stream('GET', url, timeout=timeout) as response:
+            if response.status_code < 400:
+                content_type = response.headers.get('content-type')
+                if not is_html_content_type(content_type):
+                    raise NotHTMLError(f"Not an HTML page ({content_type}): {url}")
+            page = PageBuffer(self.scraper.page_max_bytes, stop_early=stop_early and self.scraper.page_stop_early)
+            async for chunk in response.aiter_bytes():
+                if page.feed(chunk):
+                    break
+            # What response.content would hold had the whole body been read
+            response._content = page.content()
+        return response
+
+    async def _fetch(self, url: str, timeout: float, headers: Optional[Dict[str, str]] = None,
+                     stop_early: Optional[bool] = None) -> httpx.Response:
+        if self.scraper.replay_mode:
+            raise httpx.ConnectError(f"Replay mode: not fetching {url}")
+        client = await self.open()
+        rate_limiter = self.scraper.rate_limiter
+        metrics = self.scraper.metrics
+        host = urlparse(url).netloc.lower()
+        async with self._host_limit(url):
+            for attempt in range(self.retries + 1):
+                try:
+                    # Same per-host token bucket as the blocking scraper; other hosts are not delayed
+                    delay = rate_limiter.reserve(url)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    try:
+                        with metrics.time('fetch_seconds', host=host):
+                            if stop_early is None:
+                                response = await client.get(url, timeout=timeout, headers=headers)
+                            else:
+                                response = await self._read_page(client, url, timeout, stop_early)
+                    except NotHTMLError:
+                        metrics.increment('pages_rejected_total', host=host)
+                        raise
+                    metrics.increment('fetched_bytes_total', len(response.content), host=host)
+                    throttled = rate_limiter.observe(url, response.status_code, response.headers)
+                    if response.status_code in RETRY_STATUSES and attempt < self.retries:
+                        metrics.increment('fetch_retries_total', host=host)
+                        # A throttled host makes the next reserve() wait out Retry-After; otherwise back off
+                        if not throttled:
+                            await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+                        continue
+                    if response.status_code == 304:
+                        # Conditional request answered from the caller's cache
+                        return response
+                    if response.status_code >= 400:
+                        metrics.increment('fetch_failures_total', host=host)
+                    response.raise_for_status()
+                    return response
+                except httpx.TransportError:
+                    if attempt >= self.retries:
+                        metrics.increment('fetch_failures_total', host=host)
+                        raise
+                    metrics.increment('fetch_retries_total', host=host)
+                    await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+
+    async def fetch_page_head(self, url: str, max_bytes: int = DEFAULT_HEAD_MAX_BYTES, timeout: float = 10) -> str:
+        """The start of a page up to its </head>, read from a stream without downloading the body"""
+        if self.scraper.replay_mode:
+            raise httpx.ConnectError(f"Replay mode: not fetching {url}")
+        client = await self.open()
+        rate_limiter = self.scraper.rate_limiter
+        metrics = self.scraper.metrics
+        host = urlparse(url).netloc.lower()
+        head = HeadBuffer(max_bytes)
+        async with self._host_limit(url):
+            delay = rate_limiter.reserve(url)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                with metrics.time('fetch_seconds', host=host):
+                    async with client.stream('GET', url, timeout=timeout, headers=head.range_header()) as response:
+                        rate_limiter.observe(url, response.status_code, response.headers)
+                        if response.status_code >= 400:
+                            metrics.increment('fetch_failures_total', host=host)
+                        response.raise_for_status()
+                        async for chunk in response.aiter_bytes():
+                            if head.feed(chunk):
+                                break
+                        encoding = response.encoding
+            except httpx.TransportError:
+                metrics.increment('fetch_failures_total', host=host)
+                raise
+        metrics.increment('fetched_bytes_total', len(head), host=host)
+        return head.text(encoding)
+
+    async def summarize_article(self, article: Dict) -> Dict:
+        """Fill in what the feed left out from the og: and meta tags in the article page's head"""
+        if not self.scraper.is_article_url(article.get('url', '')):
+            return article
+        try:
+            html = await self.fetch_page_head(article['url'])
+        except Exception as e:
+            logger.debug(f"Head fetch failed for {article['url']}: {str(e)}")
+            return article
+
+        def parse():
+            with self.scraper.metrics.time('parse_seconds', kind='head'):
+                return extract_head_meta(parse_html(html), article['url'])
+
+        return self.scraper.apply_head_meta(article, await asyncio.to_thread(parse))
+
+    async def extract_full_article(self, url: str) -> Dict:
+        """Download an article page on the loop and parse it in a worker thread"""
+        if not self.scraper.is_article_url(url):
+            return self.scraper.extract_article_from_html(url, '')
+
+        html_cache = self.scraper.html_cache
+        html = html_cache.get(url) if html_cache is not None else None
+        if html is None:
+            try:
+                response = await self.fetch(url, timeout=15, stop_early=True)
+            except NotHTMLError as e:
+                logger.debug(f"Skipping {url}: {str(e)}")
+                return self.scraper.extract_article_from_html(url, '')
+            except Exception as e:
+                logger.warning(f"Failed to extract full article from {url}: {str(e)}")
+                return self.scraper.extract_article_from_html(url, '')
+            html = response.text
+            if html_cache is not None:
+                html_cache.put(url, html)
+
+        return await asyncio.to_thread(self.scraper.extract_article_from_html, url, html)
+
+    async def extract_articles(self, articles: List[Dict]) -> List[Dict]:
+        """Extract full content for new article candidates concurrently"""
+        articles = self.scraper.skip_seen(articles)
+
+        async def extract(article):
+            article_details = await self.extract_full_article(article['url']) if article.get('url') else {}
+            article.update(article_details)
+
+        await asyncio.gather(*(extract(article) for article in articles))
+        return articles
+
+    async def _extract_with_feed_fallback(self, article: Dict, description: str) -> Dict:
+        article_url = article['url']
+        article_details = await self.extract_full_article(article_url) if article_url else {}
+
+        # Use RSS description as fallback if full content extraction fails
+        if not article_details.get('fullContent') and description:
+            article_details['fullContent'] = description
+
+        # If still no content, try direct scraping
+        if not article_details.get('fullContent') and article_url:
+            try:
+                direct_response = await self.fetch(article_url, timeout=8, stop_early=True)
+                fallback_content = await asyncio.to_thread(
+                    self.scraper._extract_content_fallback, article_url, direct_response.text
+                )
+                if fallback_content:
+                    article_details['fullContent'] = fallback_content
+            except Exception:
+                pass
+
+        # Ensure we always have some content
+        if not article_details.get('fullContent'):
+            article_details['fullContent'] = f"Complete article available at {article['source']}: {article_url}"
+
+        return self.scraper.label_feed_article(article, article_details)
+
+    async def fetch_feed_items(self, source_key: str) -> List[Dict]:
+        """Download and parse the RSS feed of the source registered under source_key"""
+        source = self.scraper.sources[source_key]
+        rss_url = source['rss_url']
+        feed_cache = self.scraper.feed_cache
+        headers = feed_cache.conditional_headers(rss_url) if feed_cache else None
+        response = await self.fetch(rss_url, timeout=DEFAULT_FEED_TIMEOUT, headers=headers)
+        if response.status_code == 304 and feed_cache:
+            return self.scraper.cached_feed_items(rss_url)
+
+        feed_items = await asyncio.to_thread(
+            self.scraper.parse_feed_items, response.content, source.get('item_limit', DEFAULT_FEED_ITEM_LIMIT)
+        )
+        if feed_cache:
+            feed_cache.store(rss_url, response.headers, feed_items)
+        return feed_items
+
+    async def extract_feed_articles(self, source_key: str, feed_items: List[Dict]) -> List[Dict]:
+        """Turn parsed feed items into articles, fetching as much of each page as the source's depth asks"""
+        source = self.scraper.sources[source_key]
+        depth = self.scraper.depth_for(source_key)
+        if depth != 'full':
+            articles = self.scraper.skip_seen([self.scraper.feed_article(source, item) for item in feed_items])
+            if depth == 'summary':
+                await asyncio.gather(*(self.summarize_article(article) for article in articles))
+            for article in articles:
+                self.scraper.label_feed_article(article, {})
+            return articles
+
+        articles = [{
+            'title': item['title'],
+            'url': item['url'],
+            'source': source['source']
+        } for item in feed_items]
+
+        if source.get('description_fallback'):
+            descriptions = {item['url']: item['description'] for item in feed_items}
+            articles = self.scraper.skip_seen(articles)
+            await asyncio.gather(*(
+                self._extract_with_feed_fallback(article, descriptions.get(article['url'], ''))
+                for article in articles
+            ))
+        else:
+            articles = await self.extract_articles(articles)
+        return self.scraper.apply_feed_details(articles, feed_items)
+
+    async def _scrape_index(self, url: str, parser, *args, timeout: float = DEFAULT_INDEX_TIMEOUT) -> List[Dict]:
+        response = await self.fetch(url, timeout=timeout, stop_early=False)
+        candidates = await asyncio.to_thread(parser, response.content, url, *args)
+        return await self.extract_articles(candidates)
+
+    async def scrape_registered_source(self, source_key: str, url: str) -> List[Dict]:
+        """Scrape a registry source: its feed, then its index parser, then the generic homepage scraper"""
+        source = self.scraper.sources[source_key]
+        source_name = source['source']
+        if source.get('rss_url'):
+            try:
+                return await self.extract_feed_articles(source_key, await self.fetch_feed_items(source_key))
+            except Exception as e:
+                logger.error(f"Error scraping {source_name} RSS: {str(e)}")
+
+        if source.get('index_parser'):
+            try:
+                return await self._scrape_index(url, getattr(self.scraper, source['index_parser']),
+                                                timeout=source.get('index_timeout', DEFAULT_INDEX_TIMEOUT))
+            except Exception as e:
+                logger.error(f"Error scraping {source_name} website: {str(e)}")
+
+        if source.get('generic_fallback', True):
+            return await self.scrape_generic_news(url, source_name)
+        return []
+
+    async def scrape_generic_news(self, url: str, source_name: str) -> List[Dict]:
+        """Enhanced generic news scraper for other sources"""
+        try:
+            return await self._scrape_index(url, self.scraper.parse_generic_index, source_name)
+        except Exception as e:
+            logger.error(f"Error scraping {source_name}: {str(e)}")
+            return []
+
+    async def scrape_generic_comprehensive(self, url: str, source_name: str) -> List[Dict]:
+        """Collect every visible article link from a homepage without article fetches"""
+        try:
+            response = await self.fetch(url, timeout=DEFAULT_COMPREHENSIVE_TIMEOUT, stop_early=False)
+            return await asyncio.to_thread(
+                self.scraper.parse_generic_comprehensive_index, response.content, url, source_name
+            )
+        except Exception as e:
+            logger.error(f"COMPREHENSIVE generic scraping failed for {source_name}: {e}")
+            return []
+
+    async def scrape_source(self, url: str, source_name: str) -> List[Dict]:
+        """Scrape a news source with its registry row, or generically when it has none"""
+        source_key = self.scraper.sources.key_for(url)
+        if source_key is None:
+            return await self.scrape_generic_news(url, source_name)
+        return await self.scrape_registered_source(source_key, url)
+
+    async def scrape_source_comprehensive(self, url: str, source_name: str) -> List[Dict]:
+        """Feed plus homepage scraping, mirroring NewsScraper.scrape_source_comprehensive"""
+        try:
+            logger.info(f"COMPREHENSIVE: Starting complete extraction from {source_name}")
+            source_key = self.scraper.sources.key_for(url)
+
+            if source_key is None:
+                articles = await self.scrape_generic_comprehensive(url, source_name)
+            else:
+                source = self.scraper.sources[source_key]
+                homepage_name = source.get('homepage_source', source['source'])
+                if source.get('merge_feed'):
+                    # Feed and homepage are independent, so fetch them side by side
+                    articles, additional = await asyncio.gather(
+                        self.scrape_registered_source(source_key, url),
+                        self.scrape_generic_comprehensive(url, homepage_name)
+                    )
+                    articles = self.scraper.merge_comprehensive(articles, additional)
+                else:
+                    articles = await self.scrape_generic_comprehensive(url, homepage_name)
+
+            logger.info(f"COMPREHENSIVE: Extracted {len(articles)} total articles from {source_name}")
+            return articles
+
+        except Exception as e:
+            logger.error(f"COMPREHENSIVE scraping failed for {source_name}: {e}")
+            return await self.scrape_source(url, source_name)
+
+    async def stream_all_sources(self, sources: List[Dict],
+                                 timeout: Optional[float] = None) -> AsyncIterator[Tuple[Dict, List[Dict]]]:
+        """Scrape every active source concurrently and yield (source, articles) as each one finishes.
+
+        Each source's articles are finalized in a worker thread, one source
+        at a time, while the other sources keep fetching. When ``timeout``
+        seconds pass, sources that have not finished are cancelled and
+        listed in the scraper's ``deferred_sources``; a source being
+        finalized is always finished first.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        self.scraper.start_cycle()
+        self.scraper.new_articles_by_source = {}
+        self.scraper.deferred_sources = []
+        active_sources = [source for source in sources if source.get('isActive', True)]
+        tasks = {
+            asyncio.create_task(self.scrape_source_comprehensive(source['url'], source['name'])): source
+            for source in active_sources
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                # Past the deadline this still collects sources that finished while another was finalized
+                remaining = None if deadline is None else max(0.0, deadline - loop.time())
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                for task in done:
+                    source = tasks[task]
+                    if task.exception() is not None:
+                        continue
+                    processed_articles = await asyncio.to_thread(
+                        self.scraper.finalize_source_articles, source['name'], task.result()
+                    )
+                    self.scraper.new_articles_by_source[source['url']] = len(processed_articles)
+                    logger.info(f"{source['name']} provided {len(processed_articles)} articles")
+                    yield source, processed_articles
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                logger.warning(f"Cancelled {len(pending)} sources still running after {timeout}s")
+            self.scraper.deferred_sources = [tasks[task] for task in tasks if task in pending]
+            self.scraper.finish_cycle()
+
+    async def scrape_all_sources(self, sources: List[Dict], timeout: Optional[float] = None) -> List[Dict]:
+        """Scrape every active source concurrently and return all their articles.
+
+        When ``timeout`` seconds pass, sources that have not finished are
+        cancelled, listed in the scraper's ``deferred_sources``, and whatever
+        completed is returned.
+        """
+        all_articles = []
+        async for source, processed_articles in self.stream_all_sources(sources, timeout=timeout):
+            all_articles.extend(processed_articles)
+        active_count = sum(1 for source in sources if source.get('isActive', True))
+        logger.info(f"Async scrape collected {len(all_articles)} articles from {active_count} sources")
+        return all_articles
+
+
+def scrape_all_sources_async(sources: List[Dict], config: Optional[Dict] = None,
+                             timeout: Optional[float] = None, scraper: Optional[NewsScraper] = None,
+                             transport: Optional[httpx.AsyncBaseTransport] = None) -> List[Dict]:
+    """Blocking entry point that runs AsyncNewsScraper.scrape_all_sources on a fresh loop.
+
+    Pass ``scraper`` to share a long-lived NewsScraper's caches, metrics and
+    parse workers; otherwise one is made for this call and its parse
+    workers are shut down afterwards.
+    """
+    async def run():
+        async with AsyncNewsScraper(config, scraper=scraper, transport=transport) as engine:
+            try:
+                return await engine.scrape_all_sources(sources, timeout=timeout)
+            finally:
+                if scraper is None and engine.scraper.parse_pool is not None:
+                    engine.scraper.parse_pool.shutdown()
+
+    return asyncio.run(run())
+
+
+class AsyncSourceRunner:
+    """Runs a cycle on the async engine behind NewsScraper's ``iter_all_sources`` interface.
+
+    ScrapePipeline drives it like the blocking scraper, so the scheduler can
+    switch engines with the ``scrape_engine`` config key. The event loop
+    runs while the pipeline pulls articles, and each source's articles are
+    yielded as soon as that source finishes; the pipeline's bounded queue
+    pauses the loop when storage falls behind.
+    """
+
+    def __init__(self, scraper: NewsScraper, config: Optional[Dict] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.scraper = scraper
+        self.config = config or {}
+        self.transport = transport
+
+    def iter_all_sources(self, sources: List[Dict], deadline: Optional[float] = None) -> Iterator[Dict]:
+        timeout = None if deadline is None else max(0.0, deadline - time.time())
+        engine = AsyncNewsScraper(self.config, scraper=self.scraper, transport=self.transport)
+        stream = engine.stream_all_sources(sources, timeout=timeout)
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(engine.open())
+            while True:
+                try:
+                    source, processed_articles = loop.run_until_complete(stream.__anext__())
+                except StopAsyncIteration:
+                    break
+                yield from processed_articles
+        finally:
+            # Also runs when the pipeline stops early: unfinished sources are cancelled and the cycle finished
+            loop.run_until_complete(stream.aclose())
+            loop.run_until_complete(engine.close())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
@@ -0,0 +1,109 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from newspaper import nlp
+from newspaper.images import minimal_area
+from PIL import ImageFile
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENRICH_NLP = False
+DEFAULT_PROBE_IMAGES = False
+# Enough bytes for the header of every common image format
+IMAGE_PROBE_BYTES = 64 * 1024
+IMAGE_PROBE_TIMEOUT = 5
+MAX_SUMMARY_SENTENCES = 5
+
+
+class ArticleEnricher:
+    """Optional work on extracted articles that the cycle does not need to save them.
+
+    Extraction only produces text and metadata. When enabled in config,
+    this stage adds newspaper3k's NLP keywords and summary and probes the
+    lead image's dimensions (dropping images too small to be a lead, as
+    newspaper's ``fetch_images`` check did). It runs after seen-URL and
+    near-duplicate filtering, so only articles that are kept pay for it.
+    """
+
+    def __init__(self, session, extraction_pool, nlp_enabled: bool = DEFAULT_ENRICH_NLP,
+                 probe_images: bool = DEFAULT_PROBE_IMAGES, language: str = 'en'):
+        self.session = session
+        self.extraction_pool = extraction_pool
+        self.nlp_enabled = nlp_enabled
+        self.probe_images = probe_images
+        self.language = language
+        self._stopwords_loaded = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.nlp_enabled or self.probe_images
+
+    def add_nlp(self, article: Dict):
+        """Attach newspaper3k keywords and a short extractive summary"""
+        text = article.get('fullContent') or ''
+        title = article.get('title') or ''
+        if not text:
+            return
+        try:
+            if not self._stopwords_loaded:
+                nlp.load_stopwords(self.language)
+                self._stopwords_loaded = True
+            article['keywords'] = sorted(set(nlp.keywords(title)) | set(nlp.keywords(text)))
+        except Exception as e:
+            logger.warning(f"Keyword extraction failed for {article.get('url')}: {str(e)}")
+        try:
+            # Sentence splitting needs NLTK's punkt data
+            article['summary'] = '\n'.join(nlp.summarize(title=title, text=text, max_sents=MAX_SUMMARY_SENTENCES))
+        except Exception as e:
+            logger.warning(f"Summary failed for {article.get('url')}: {str(e)}")
+
+    def image_dimensions(self, image_url: str, referer: Optional[str] = None) -> Optional[Tuple[int, int]]:
+        """Width and height from the first bytes of an image, without downloading all of it"""
+        try:
+            with self.session.get(image_url, stream=True, timeout=IMAGE_PROBE_TIMEOUT,
+                                  headers={'Referer': referer} if referer else None) as response:
+                if response.status_code != 200 or 'image' not in response.headers.get('Content-Type', ''):
+                    return None
+                parser = ImageFile.Parser()
+                received = 0
+                for chunk in response.iter_content(chunk_size=4096):
+                    parser.feed(chunk)
+                    received += len(chunk)
+                    if parser.image or received >= IMAGE_PROBE_BYTES:
+                        break
+                return parser.image.size if parser.image else None
+        except Exception as e:
+            logger.debug(f"Could not probe image {image_url}: {str(e)}")
+            return None
+
+    def add_image_size(self, article: Dict):
+        """Record the lead image's size and drop it if it is too small to be a lead image"""
+        image_url = article.get('imageUrl')
+        if not image_url or not image_url.startswith(('http://', 'https://')):
+            return
+        dimensions = self.image_dimensions(image_url, referer=article.get('url'))
+        if dimensions is None:
+            return
+        article['imageWidth'], article['imageHeight'] = dimensions
+        if dimensions[0] * dimensions[1] < minimal_area:
+            logger.info(f"Dropping {dimensions[0]}x{dimensions[1]} lead image for {article.get('url')}")
+            article['imageUrl'] = None
+
+    def enrich_article(self, article: Dict) -> Dict:
+        if self.nlp_enabled:
+            self.add_nlp(article)
+        if self.probe_images:
+            self.add_image_size(article)
+        return article
+
+    def enrich(self, articles: List[Dict]) -> List[Dict]:
+        """Run the enabled enrichment steps over articles in parallel"""
+        if not self.enabled or not articles:
+            return articles
+        self.extraction_pool.map(
+            self.enrich_article,
+            articles,
+            key=lambda article: article.get('imageUrl') or article.get('url') or ''
+        )
+        return articles
@@ -0,0 +1,111 @@
+import logging
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PER_DOMAIN_CONCURRENCY = 2
+
+
+class ExtractionPool:
+    """Bounded thread pool that runs article extractions in parallel.
+
+    Work is dispatched per host: at most ``max_workers`` extractions run at
+    once overall and at most ``per_domain_concurrency`` against any single
+    host, so one slow site cannot take every worker. ``host_concurrency``
+    can raise or lower that limit for particular hosts.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS,
+                 per_domain_concurrency: int = DEFAULT_PER_DOMAIN_CONCURRENCY,
+                 host_concurrency: Optional[Callable[[str, int], int]] = None):
+        self.max_workers = max(1, int(max_workers))
+        self.per_domain_concurrency = max(1, int(per_domain_concurrency))
+        self.host_concurrency = host_concurrency
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='article-extract'
+                )
+            return self._executor
+
+    @staticmethod
+    def _host(url: str) -> str:
+        try:
+            return urlparse(url).netloc.lower()
+        except Exception:
+            return ''
+
+    def _host_limit(self, host: str) -> int:
+        if self.host_concurrency is None:
+            return self.per_domain_concurrency
+        return max(1, int(self.host_concurrency(host, self.per_domain_concurrency)))
+
+    def map(self, func: Callable[[Any], Any], items: List[Any],
+            key: Optional[Callable[[Any], str]] = None, default: Any = None) -> List[Any]:
+        """Run ``func(item)`` for every item and return results in input order.
+
+        ``key`` maps an item to the URL used for per-host accounting (items
+        are treated as URLs when omitted). A failing call yields ``default``
+        instead of aborting the whole batch.
+        """
+        results: List[Any] = [default] * len(items)
+        queues: Dict[str, deque] = OrderedDict()
+        for index, item in enumerate(items):
+            url = key(item) if key else item
+            queues.setdefault(self._host(url or ''), deque()).append(index)
+
+        if not queues:
+            return results
+
+        executor = self._get_executor()
+        active = {}
+        in_flight: Dict[str, int] = {}
+        limits = {host: self._host_limit(host) for host in queues}
+
+        def fill():
+            # Round-robin across hosts so a long feed from one site does not
+            # starve articles hosted elsewhere
+            progressed = True
+            while progressed and len(active) < self.max_workers:
+                progressed = False
+                for host, queue in queues.items():
+                    if len(active) >= self.max_workers:
+                        break
+                    if queue and in_flight.get(host, 0) < limits[host]:
+                        index = queue.popleft()
+                        future = executor.submit(func, items[index])
+                        active[future] = (index, host)
+                        in_flight[host] = in_flight.get(host, 0) + 1
+                        progressed = True
+
+        fill()
+        while active:
+            done, _ = wait(list(active), return_when=FIRST_COMPLETED)
+            for future in done:
+                index, host = active.pop(future)
+                in_flight[host] -= 1
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    logger.warning(f"Extraction task failed for {host or 'unknown host'}: {str(e)}")
+            fill()
+
+        return results
+
+    def shutdown(self, wait_for_tasks: bool = True):
+        """Stop the worker threads"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait_for_tasks)
+                self._executor = None
@@ -0,0 +1,101 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_FEED_CACHE_FILE = "feed_cache.json"
+
+
+class FeedCache:
+    """On-disk ETag / Last-Modified store for RSS feeds.
+
+    Each feed URL keeps the validators from its last 200 response together
+    with the items parsed from it. Requests carry ``If-None-Match`` /
+    ``If-Modified-Since`` and a 304 replays the stored items, so an
+    unchanged feed costs neither the download nor the XML parse.
+    """
+
+    def __init__(self, filename: str = DEFAULT_FEED_CACHE_FILE):
+        self.filename = filename
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable feed cache {self.filename}: {str(e)}")
+            return {}
+
+    def _save(self):
+        # Write to a temp file first so a crash never leaves a truncated cache behind
+        tmp_filename = f"{self.filename}.tmp"
+        try:
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_filename, self.filename)
+        except Exception as e:
+            logger.error(f"Error saving feed cache: {str(e)}")
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Validator headers for the next request to url, empty when nothing is cached"""
+        with self._lock:
+            entry = self._entries.get(url)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def not_modified(self, url: str) -> Optional[List[Dict]]:
+        """Record a 304 for url and return the items stored with its validators"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        logger.info(f"Feed unchanged, reusing {len(entry['items'])} cached items: {url}")
+        return list(entry['items'])
+
+    def store(self, url: str, headers, items: List[Dict]):
+        """Remember the validators of a fresh 200 response and the items parsed from it"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        with self._lock:
+            self.misses += 1
+            if not etag and not last_modified:
+                # Nothing to revalidate with next time
+                if self._entries.pop(url, None) is not None:
+                    self._save()
+                return
+            self._entries[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'items': items,
+                'fetched_at': datetime.now().isoformat()
+            }
+            self._save()
+
+    def stats(self) -> Dict:
+        """Hit/miss counters since this cache was created"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'feeds': len(self._entries)
+            }
@@ -0,0 +1,199 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterator, Optional, Tuple
+
+from .seen_urls import canonicalize_url
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_HTML_CACHE_DIR = None
+DEFAULT_HTML_CACHE_MAX_MB = 256
+DEFAULT_HTML_CACHE_TTL_HOURS = 72
+# The index is rewritten after this many new pages, and on flush()
+INDEX_SAVE_EVERY = 25
+COMPRESS_LEVEL = 6
+
+INDEX_FILENAME = "index.json"
+OBJECTS_DIRNAME = "objects"
+
+
+class HtmlCache:
+    """Content-addressed, gzip-compressed store of downloaded article HTML.
+
+    Pages are keyed by canonical URL and stored once per body hash under
+    ``objects/``, so identical pages served at several URLs share a file.
+    ``index.json`` maps URLs to hashes with fetch and access times. Entries
+    older than ``ttl_hours`` are dropped and the least recently used pages
+    are evicted once the compressed objects exceed ``max_mb``. A crash
+    loses at most the last few index updates; objects nobody references
+    are removed on the next load.
+    """
+
+    def __init__(self, directory: str, max_mb: float = DEFAULT_HTML_CACHE_MAX_MB,
+                 ttl_hours: float = DEFAULT_HTML_CACHE_TTL_HOURS):
+        self.directory = directory
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.ttl_seconds = ttl_hours * 3600
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._objects_dir = os.path.join(directory, OBJECTS_DIRNAME)
+        self._index_file = os.path.join(directory, INDEX_FILENAME)
+        self._unsaved = 0
+        os.makedirs(self._objects_dir, exist_ok=True)
+        self._entries: Dict[str, Dict] = self._load()
+        self._rebuild_objects()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self._index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable HTML cache index {self._index_file}: {str(e)}")
+            return {}
+
+    def _save(self):
+        tmp_filename = f"{self._index_file}.tmp"
+        try:
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_filename, self._index_file)
+            self._unsaved = 0
+        except Exception as e:
+            logger.error(f"Error saving HTML cache index: {str(e)}")
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self._objects_dir, f"{digest}.html.gz")
+
+    def _rebuild_objects(self):
+        """Object sizes on disk; drops index entries without an object and objects without an entry"""
+        sizes = {}
+        for filename in os.listdir(self._objects_dir):
+            if filename.endswith('.html.gz'):
+                sizes[filename[:-len('.html.gz')]] = os.path.getsize(os.path.join(self._objects_dir, filename))
+            elif filename.endswith('.tmp'):
+                os.remove(os.path.join(self._objects_dir, filename))
+
+        self._entries = {key: entry for key, entry in self._entries.items() if entry.get('hash') in sizes}
+        self._refs: Dict[str, int] = {}
+        for entry in self._entries.values():
+            self._refs[entry['hash']] = self._refs.get(entry['hash'], 0) + 1
+        for digest in set(sizes) - set(self._refs):
+            os.remove(self._object_path(digest))
+        self._objects = {digest: size for digest, size in sizes.items() if digest in self._refs}
+        self._total_bytes = sum(self._objects.values())
+        self._prune()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._total_bytes
+
+    def _drop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        digest = entry['hash']
+        self._refs[digest] -= 1
+        if self._refs[digest] == 0:
+            del self._refs[digest]
+            self._total_bytes -= self._objects.pop(digest, 0)
+            try:
+                os.remove(self._object_path(digest))
+            except FileNotFoundError:
+                pass
+
+    def _prune(self):
+        """Drop expired pages, then least recently used ones until the size cap holds"""
+        cutoff = time.time() - self.ttl_seconds
+        for key in [key for key, entry in self._entries.items() if entry['fetched_at'] < cutoff]:
+            self._drop(key)
+        if self._total_bytes <= self.max_bytes:
+            return
+        for key, _ in sorted(self._entries.items(), key=lambda item: item[1]['accessed_at']):
+            self._drop(key)
+            if self._total_bytes <= self.max_bytes:
+                break
+
+    def get(self, url: str) -> Optional[str]:
+        """Cached HTML for url, or None if it is missing or expired"""
+        key = canonicalize_url(url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry['fetched_at'] >= self.ttl_seconds:
+                self.misses += 1
+                return None
+            entry['accessed_at'] = time.time()
+            path = self._object_path(entry['hash'])
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                html = f.read()
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cached page for {url}: {str(e)}")
+            with self._lock:
+                self._drop(key)
+            return None
+        with self._lock:
+            self.hits += 1
+        return html
+
+    def put(self, url: str, html: str):
+        """Store the HTML downloaded for url"""
+        if not html:
+            return
+        data = html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        compressed = None
+        with self._lock:
+            known = digest in self._objects
+        if not known:
+            compressed = gzip.compress(data, compresslevel=COMPRESS_LEVEL)
+
+        now = time.time()
+        key = canonicalize_url(url)
+        with self._lock:
+            if digest not in self._objects:
+                path = self._object_path(digest)
+                tmp_path = f"{path}.tmp"
+                try:
+                    with open(tmp_path, 'wb') as f:
+                        f.write(compressed if compressed is not None else gzip.compress(data, compresslevel=COMPRESS_LEVEL))
+                    os.replace(tmp_path, path)
+                except Exception as e:
+                    logger.error(f"Error caching HTML for {url}: {str(e)}")
+                    return
+                self._objects[digest] = os.path.getsize(path)
+                self._total_bytes += self._objects[digest]
+            # Take the new reference before dropping the old one so a shared object survives
+            self._refs[digest] = self._refs.get(digest, 0) + 1
+            self._drop(key)
+            self._entries[key] = {'url': url, 'hash': digest, 'fetched_at': now, 'accessed_at': now}
+            self._unsaved += 1
+            if self._unsaved >= INDEX_SAVE_EVERY:
+                self._prune()
+                self._save()
+
+    def flush(self):
+        """Apply TTL and size limits and write the index"""
+        with self._lock:
+            self._prune()
+            self._save()
+
+    def iter_pages(self) -> Iterator[Tuple[str, str]]:
+        """(url, html) for every fresh cached page, for replaying extraction offline"""
+        with self._lock:
+            urls = [entry['url'] for entry in self._entries.values()]
+        for url in urls:
+            html = self.get(url)
+            if html is not None:
+                yield url, html
@@ -0,0 +1,344 @@
+"""
+Tree-based extractors for article pages.
+
+Every function here works on an lxml tree that was parsed once per document
+(normally newspaper3k's untouched ``clean_doc``), so content, image and media
+extraction no longer re-parse the raw HTML with BeautifulSoup each time.
+None of the extractors modify the tree they are given.
+"""
+
+import logging
+import re
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urljoin, urlparse
+
+import lxml.html
+from lxml.cssselect import CSSSelector
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Elements the content fallback ignores, as if they had been removed from the page
+FALLBACK_SKIP_TAGS = frozenset(['script', 'style', 'nav', 'header', 'footer', 'aside', 'form', 'iframe', 'noscript'])
+MEDIA_SKIP_TAGS = frozenset(['script', 'style', 'nav', 'header', 'footer', 'aside', 'form', 'ads'])
+
+# Site-specific selectors for better content extraction
+SITE_SELECTORS = {
+    'timesofindia.indiatimes.com': [
+        '.Normal', '.ga-headline', '._s30J', '.yYiw2',
+        '.story_content', '.article_content', '.article-body',
+        '.story-body', '.post-content', '.content-body'
+    ],
+    'indiatoday.in': [
+        '.story-details', '.story-content', '.description',
+        '.content-body', '.post-content', '.story-body'
+    ],
+    'ndtv.com': [
+        '.ins_storybody', '.story-content', '.content-body',
+        '.article-body', '.story-body', '.post-content'
+    ],
+    'thehindu.com': [
+        '.articlebodycontent', '.article-body', '.story-content',
+        '.content-body', '.post-content', '.story-body'
+    ],
+    'economictimes.indiatimes.com': [
+        '.Normal', '.articleText', '.article-body',
+        '.story-content', '.content-body', '.post-content'
+    ],
+    'bbc.com': [
+        '.story-body__inner', '.story-body', '.article-body',
+        '.content-body', '.post-content'
+    ],
+    'cnn.com': [
+        '.zn-body__paragraph', '.paragraph', '.article-body',
+        '.story-body', '.content-body'
+    ],
+    'techcrunch.com': [
+        '.article-content', '.entry-content', '.post-content',
+        '.article-body', '.story-body'
+    ],
+    'theverge.com': [
+        '.duet--article--article-body-component', '.article-body',
+        '.entry-content', '.post-content'
+    ]
+}
+
+COMMON_SELECTORS = [
+    'article', '[role="main"]', '.article-content', '.story-content',
+    '.post-content', '.content', '.entry-content', '.article-body',
+    '.story-body', 'main', '.content-body', '.article-text'
+]
+
+MEDIA_CONTENT_SELECTORS = [
+    'article', '[role="main"]', '.article-content', '.post-content',
+    '.entry-content', '.content', '.story-body', '.article-body',
+    '.article-text', '.post-body', 'main'
+]
+
+PARAGRAPH_SKIP_PHRASES = ['subscribe', 'advertisement', 'follow us', 'share', 'tweet', 'facebook', 'copyright',
+                          'terms of service', 'privacy policy', 'cookie policy']
+
+# Compile every CSS selector once instead of per article
+_compiled = {}
+
+
+def _selector(css: str) -> CSSSelector:
+    compiled = _compiled.get(css)
+    if compiled is None:
+        compiled = _compiled[css] = CSSSelector(css)
+    return compiled
+
+
+_META_IMAGE_XPATH = [
+    '//meta[@property="og:image"]',
+    '//meta[@name="twitter:image"]',
+    '//meta[@property="twitter:image"]'
+]
+
+
+# Head meta keys per article field, most specific first
+_HEAD_META_KEYS = {
+    'title': ['og:title', 'twitter:title'],
+    'description': ['og:description', 'twitter:description', 'description'],
+    'imageUrl': ['og:image', 'og:image:url', 'twitter:image', 'twitter:image:src'],
+    'publishedAt': ['article:published_time', 'og:article:published_time', 'pubdate', 'date', 'dc.date'],
+    'author': ['author', 'article:author', 'twitter:creator'],
+}
+
+
+def parse_html(html) -> Optional[lxml.html.HtmlElement]:
+    """Parse raw HTML once with lxml; returns None for empty or unparseable input"""
+    if not html:
+        return None
+    try:
+        if isinstance(html, str) and html.startswith('<?'):
+            # lxml rejects unicode strings carrying an XML encoding declaration
+            html = re.sub(r'^\<\?.*?\?\>', '', html, flags=re.DOTALL)
+        return lxml.html.fromstring(html)
+    except Exception as e:
+        logger.warning(f"HTML parsing failed: {str(e)}")
+        return None
+
+
+def _is_element(node) -> bool:
+    # Comments and processing instructions have a non-string tag
+    return isinstance(node.tag, str)
+
+
+def _text_parts(element, skip_tags: frozenset) -> Iterator[str]:
+    if not _is_element(element) or element.tag in skip_tags:
+        return
+    if element.text:
+        yield element.text
+    for child in element:
+        yield from _text_parts(child, skip_tags)
+        if child.tail:
+            yield child.tail
+
+
+def stripped_text(element, skip_tags: frozenset = frozenset()) -> str:
+    """Concatenate stripped text nodes, like BeautifulSoup's get_text(strip=True)"""
+    return ''.join(part.strip() for part in _text_parts(element, skip_tags) if part.strip())
+
+
+def _is_skipped(element, skip_tags: frozenset) -> bool:
+    node = element
+    while node is not None:
+        if node.tag in skip_tags:
+            return True
+        node = node.getparent()
+    return False
+
+
+def _select(tree, css: str, skip_tags: frozenset = frozenset()) -> List:
+    matches = _selector(css)(tree)
+    if skip_tags:
+        matches = [element for element in matches if not _is_skipped(element, skip_tags)]
+    return matches
+
+
+def _absolute_media_url(src: str, base_url: str) -> str:
+    if src.startswith('//'):
+        return 'https:' + src
+    if src.startswith('/'):
+        return urljoin(base_url, src)
+    return src
+
+
+def extract_image_url(tree, url: str) -> Optional[str]:
+    """Find a lead image from meta tags, the first inline images, or figure elements"""
+    if tree is None:
+        return None
+
+    # Try only the most common meta tag variations for speed
+    for xpath in _META_IMAGE_XPATH:
+        for meta_tag in tree.xpath(xpath):
+            candidate_url = meta_tag.get('content')
+            if candidate_url:
+                if candidate_url.startswith(('http://', 'https://')):
+                    return candidate_url
+                break
+
+    # Simplified img tag search for speed - first 5 images only
+    for img in tree.xpath('//img[@src]')[:5]:
+        src = img.get('src')
+        if src:
+            src = _absolute_media_url(src, url)
+            if src.startswith(('http://', 'https://')):
+                # Quick skip for obvious unwanted images
+                if any(skip in src.lower() for skip in ['logo', 'icon', 'pixel', '1x1']):
+                    continue
+                return src
+
+    # Look for figure or picture elements
+    for img in _select(tree, 'figure img, picture img, .image img'):
+        src = img.get('src')
+        if src and src.startswith(('http://', 'https://')):
+            return src
+
+    return None
+
+
+def extract_head_meta(tree, url: str) -> Dict[str, Optional[str]]:
+    """Title, description, image, date and author from og:, twitter: and plain meta tags"""
+    values = {}
+    if tree is not None:
+        for meta in tree.iter('meta'):
+            key = (meta.get('property') or meta.get('name') or meta.get('itemprop') or '').strip().lower()
+            content = (meta.get('content') or '').strip()
+            if key and content:
+                values.setdefault(key, content)
+
+    head_meta = {field: next((values[key] for key in keys if key in values), None)
+                 for field, keys in _HEAD_META_KEYS.items()}
+    if head_meta['imageUrl']:
+        image_url = _absolute_media_url(head_meta['imageUrl'], url)
+        head_meta['imageUrl'] = image_url if image_url.startswith(('http://', 'https://')) else None
+    if head_meta['author'] and head_meta['author'].startswith(('http://', 'https://')):
+        # article:author is often a profile link rather than a name
+        head_meta['author'] = None
+    return head_meta
+
+
+def extract_media_links(tree, base_url: str) -> str:
+    """List image, video and embed URLs found anywhere on the page"""
+    if tree is None:
+        return ""
+
+    media_links = []
+
+    for img in tree.xpath('//img[@src]'):
+        src = img.get('src')
+        if src:
+            src = _absolute_media_url(src, base_url)
+            if src.startswith(('http://', 'https://')):
+                alt_text = img.get('alt', 'Image')
+                media_links.append(f"[IMAGE: {alt_text}] {src}")
+
+    for video in tree.xpath('//video[@src]'):
+        src = video.get('src')
+        if src:
+            src = _absolute_media_url(src, base_url)
+            if src.startswith(('http://', 'https://')):
+                media_links.append(f"[VIDEO] {src}")
+
+    # Extract iframe embeds (YouTube, Twitter, etc.)
+    for iframe in tree.xpath('//iframe[@src]'):
+        src = iframe.get('src')
+        if src and ('youtube' in src or 'twitter' in src or 'instagram' in src):
+            media_links.append(f"[EMBEDDED] {src}")
+
+    return '\n'.join(media_links)
+
+
+def extract_content(tree, url: str) -> str:
+    """Fallback article text using site selectors, common containers, then paragraphs"""
+    if tree is None:
+        return ""
+
+    domain = urlparse(url).netloc.lower()
+    skip = FALLBACK_SKIP_TAGS
+
+    # Try site-specific selectors first
+    content = ""
+    for site, selectors in SITE_SELECTORS.items():
+        if site in domain:
+            for css in selectors:
+                elements = _select(tree, css, skip)
+                if elements:
+                    content = ' '.join(stripped_text(element, skip) for element in elements)
+                    if len(content) > 300:  # Found substantial content
+                        break
+            if len(content) > 300:
+                break
+
+    # If site-specific failed, try common selectors
+    if not content or len(content) < 300:
+        for css in COMMON_SELECTORS:
+            elements = _select(tree, css, skip)
+            if elements:
+                content = ' '.join(stripped_text(element, skip) for element in elements)
+                if len(content) > 300:
+                    break
+
+    # If still no good content, try paragraph extraction with better filtering
+    if not content or len(content) < 300:
+        paragraph_texts = []
+        for paragraph in _select(tree, 'p', skip):
+            text = stripped_text(paragraph, skip)
+            # Filter out short paragraphs, navigation, and ads
+            if len(text) > 50 and not any(phrase in text.lower() for phrase in PARAGRAPH_SKIP_PHRASES):
+                paragraph_texts.append(text)
+        content = ' '.join(paragraph_texts)
+
+    content = content.strip()
+
+    # Remove duplicate sentences (common in news sites)
+    if content:
+        unique_sentences = []
+        seen = set()
+        for sentence in content.split('. '):
+            if sentence not in seen and len(sentence) > 20:
+                unique_sentences.append(sentence)
+                seen.add(sentence)
+        content = '. '.join(unique_sentences)
+
+    return content
+
+
+def extract_content_with_media(tree, url: str) -> str:
+    """Article paragraphs interleaved with the media found inside the main container"""
+    if tree is None:
+        return ""
+
+    skip = MEDIA_SKIP_TAGS
+    content_parts = []
+    for css in MEDIA_CONTENT_SELECTORS:
+        elements = _select(tree, css, skip)
+        if not elements:
+            continue
+        # Extract text with media link preservation, in document order
+        for child in elements[0].iterdescendants():
+            if not _is_element(child) or _is_skipped(child, skip):
+                continue
+            if child.tag == 'p':
+                text = stripped_text(child, skip)
+                if text and len(text) > 20:
+                    content_parts.append(text)
+            elif child.tag == 'img' and child.get('src'):
+                img_src = _absolute_media_url(child.get('src'), url)
+                if img_src.startswith(('http://', 'https://')):
+                    alt_text = child.get('alt', 'Image')
+                    content_parts.append(f"[IMAGE: {alt_text}] {img_src}")
+            elif child.tag == 'video' and child.get('src'):
+                video_src = _absolute_media_url(child.get('src'), url)
+                if video_src.startswith(('http://', 'https://')):
+                    content_parts.append(f"[VIDEO] {video_src}")
+            elif child.tag == 'iframe' and child.get('src'):
+                iframe_src = child.get('src')
+                if 'youtube' in iframe_src or 'twitter' in iframe_src or 'instagram' in iframe_src:
+                    content_parts.append(f"[EMBEDDED] {iframe_src}")
+        if content_parts:
+            break
+
+    return '\n\n'.join(content_parts)
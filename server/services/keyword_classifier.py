@@ -0,0 +1,177 @@
+import logging
+import re
+import string
+from typing import Dict, List, Optional, Set, Tuple
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Sources whose category is known up front, keyed by lowercase source name
+SOURCE_CATEGORIES = {
+    'techcrunch': 'technology',
+    'the verge': 'technology',
+    'engadget': 'technology',
+    'ars technica': 'technology',
+    'wired': 'technology',
+    'hacker news': 'technology',
+    'bloomberg': 'business',
+    'wall street journal': 'business',
+    'forbes': 'business',
+    'financial times': 'business',
+    'economic times': 'business'
+}
+
+CATEGORY_KEYWORDS = {
+    'technology': ['ai', 'artificial intelligence', 'tech', 'technology', 'software', 'app', 'digital', 'cyber', 'robot', 'automation', 'startup', 'computer', 'internet', 'smartphone', 'gadget', 'coding', 'programming', 'data', 'algorithm', 'silicon valley', 'blockchain', 'cryptocurrency', 'metaverse', 'virtual reality', 'ar', 'vr', 'machine learning', 'iot'],
+    'business': ['business', 'economy', 'finance', 'market', 'stock', 'investment', 'company', 'corporate', 'trade', 'banking', 'money', 'funding', 'revenue', 'profit', 'earnings', 'merger', 'acquisition', 'ipo', 'nasdaq', 'dow jones', 'economic', 'financial', 'billion', 'million', 'dollar', 'rupee', 'gdp', 'inflation'],
+    'politics': ['politics', 'government', 'minister', 'parliament', 'election', 'policy', 'law', 'court', 'supreme', 'democracy', 'vote', 'president', 'prime minister', 'congress', 'senate', 'cabinet', 'diplomatic', 'treaty', 'sanctions', 'constitutional', 'legislature', 'judicial', 'executive'],
+    'sports': ['sports', 'cricket', 'football', 'olympics', 'match', 'team', 'player', 'game', 'championship', 'tournament', 'soccer', 'basketball', 'tennis', 'hockey', 'swimming', 'athletics', 'medal', 'victory', 'defeat', 'score', 'league'],
+    'science': ['science', 'research', 'study', 'discovery', 'scientist', 'medicine', 'health', 'space', 'nasa', 'quantum', 'climate', 'medical', 'pharmaceutical', 'vaccine', 'treatment', 'diagnosis', 'hospital', 'doctor', 'patient', 'therapy', 'clinical trial', 'breakthrough'],
+    'entertainment': ['movie', 'film', 'actor', 'actress', 'bollywood', 'hollywood', 'music', 'celebrity', 'entertainment', 'cinema', 'director', 'producer', 'album', 'song', 'concert', 'festival', 'award', 'oscar', 'emmy', 'grammy', 'netflix', 'streaming']
+}
+
+# India keywords looked for in an article's title, body and source name
+INDIAN_KEYWORDS = [
+    'india', 'indian', 'delhi', 'mumbai', 'bengaluru', 'bangalore', 'kolkata', 'chennai', 'hyderabad', 'pune',
+    'bollywood', 'rupee', 'modi', 'bjp', 'congress', 'lok sabha', 'rajya sabha', 'parliament', 'supreme court',
+    'maharashtra', 'gujarat', 'rajasthan', 'punjab', 'haryana', 'uttar pradesh', 'bihar', 'west bengal',
+    'kerala', 'tamil nadu', 'karnataka', 'andhra pradesh', 'telangana', 'odisha', 'jharkhand', 'chhattisgarh',
+    'isro', 'iit', 'iisc', 'tata', 'reliance', 'infosys', 'wipro', 'ola', 'flipkart', 'paytm', 'zomato'
+]
+
+# The shorter list feed-fallback articles have always been judged by, on the title alone
+FEED_INDIAN_KEYWORDS = [
+    'india', 'indian', 'delhi', 'mumbai', 'bengaluru', 'kolkata', 'chennai', 'hyderabad', 'pune', 'ahmedabad',
+    'bjp', 'congress', 'modi', 'rahul'
+]
+
+INDIAN_REGION = 'indian'
+INTERNATIONAL_REGION = 'international'
+GENERAL_CATEGORY = 'general'
+TITLE_WEIGHT = 3
+MIN_CATEGORY_SCORE = 2
+
+# Token -> keywords memo entries kept before the memo is reset
+MAX_CACHED_TOKENS = 200000
+
+_PUNCTUATION = str.maketrans({char: ' ' for char in string.punctuation})
+
+
+class KeywordClassifier:
+    """Category and region labels from keyword lists compiled once.
+
+    The old checks ran one ``keyword in text`` scan per keyword (~200 per
+    article) over the whole body. Here the text is split on whitespace once:
+    a keyword without a space can only occur inside a single token, so each
+    distinct token is matched against the keyword list once and memoized
+    across articles (news vocabulary repeats heavily). Only the handful of
+    multi-word keywords still need a scan of the text. Matching stays
+    substring-based, so labels are the same as before;
+    ``word_boundaries=True`` counts whole words only, so 'ai' no longer
+    matches inside 'said'.
+    """
+
+    def __init__(self, category_keywords: Optional[Dict[str, List[str]]] = None,
+                 indian_keywords: Optional[List[str]] = None,
+                 feed_indian_keywords: Optional[List[str]] = None,
+                 source_categories: Optional[Dict[str, str]] = None,
+                 word_boundaries: bool = False):
+        self.category_keywords = category_keywords if category_keywords is not None else CATEGORY_KEYWORDS
+        self.indian_keywords = frozenset(indian_keywords if indian_keywords is not None else INDIAN_KEYWORDS)
+        self.feed_indian_keywords = frozenset(feed_indian_keywords if feed_indian_keywords is not None
+                                              else FEED_INDIAN_KEYWORDS)
+        self.source_categories = source_categories if source_categories is not None else SOURCE_CATEGORIES
+        self.word_boundaries = word_boundaries
+
+        self.keyword_categories: Dict[str, List[str]] = {}
+        for category, keywords in self.category_keywords.items():
+            for keyword in keywords:
+                self.keyword_categories.setdefault(keyword, [])
+                if category not in self.keyword_categories[keyword]:
+                    self.keyword_categories[keyword].append(category)
+
+        keywords = set(self.keyword_categories) | self.indian_keywords | self.feed_indian_keywords
+        self._words = frozenset(keyword for keyword in keywords if ' ' not in keyword)
+        self._phrases = sorted(keyword for keyword in keywords if ' ' in keyword)
+        self._phrase_patterns = {
+            phrase: re.compile(rf'\b{re.escape(phrase)}\b') for phrase in self._phrases
+        }
+        self._longest_phrase = max((len(phrase) for phrase in self._phrases), default=1)
+        self._token_cache: Dict[str, Tuple[str, ...]] = {}
+
+    def _token_keywords(self, token: str) -> Tuple[str, ...]:
+        hits = self._token_cache.get(token)
+        if hits is None:
+            hits = tuple(keyword for keyword in self._words if keyword in token)
+            if len(self._token_cache) >= MAX_CACHED_TOKENS:
+                self._token_cache.clear()
+            self._token_cache[token] = hits
+        return hits
+
+    def keywords_in(self, text: str) -> Set[str]:
+        """Every keyword that occurs in lowercase text"""
+        if self.word_boundaries:
+            found = set(self._words.intersection(text.translate(_PUNCTUATION).split()))
+            found.update(phrase for phrase, pattern in self._phrase_patterns.items() if pattern.search(text))
+            return found
+
+        found: Set[str] = set()
+        for token in set(text.split()):
+            found.update(self._token_keywords(token))
+        found.update(phrase for phrase in self._phrases if phrase in text)
+        return found
+
+    def classify(self, title: str, content: str = "", source: str = "",
+                 region_from_title: bool = False) -> Tuple[str, str]:
+        """(category, region) for one article.
+
+        region_from_title decides the region from the title alone, against
+        the feed-fallback list ``feed_indian_keywords``.
+        """
+        title_lower = title.lower() if title else ""
+        content_lower = content.lower() if content else ""
+        source_lower = source.lower() if source else ""
+        combined = f"{title_lower} {content_lower}"
+
+        combined_hits = self.keywords_in(combined)
+        category = self.source_categories.get(source_lower)
+        title_hits = self.keywords_in(title_lower) if category is None or region_from_title else set()
+        if region_from_title:
+            region_keywords, region_hits = self.feed_indian_keywords, title_hits
+        else:
+            # Region looks at "title content source"; only the end of the body can run into the source name
+            region_keywords = self.indian_keywords
+            region_hits = combined_hits | self.keywords_in(f"{combined[-self._longest_phrase:]} {source_lower}")
+        region = INTERNATIONAL_REGION if region_keywords.isdisjoint(region_hits) else INDIAN_REGION
+
+        if category is None:
+            scores = {name: 0 for name in self.category_keywords}
+            for keyword in combined_hits:
+                # Give higher weight to title matches
+                weight = TITLE_WEIGHT if keyword in title_hits else 1
+                for name in self.keyword_categories.get(keyword, ()):
+                    scores[name] += weight
+            category = GENERAL_CATEGORY
+            if scores:
+                best = max(scores, key=scores.get)
+                if scores[best] >= MIN_CATEGORY_SCORE:
+                    category = best
+        return category, region
+
+    def classify_batch(self, articles: List[Dict], source: Optional[str] = None) -> List[Tuple[str, str]]:
+        """(category, region) for each article dict, using its title, fullContent and source"""
+        return [
+            self.classify(article.get('title', ''), article.get('fullContent') or '',
+                          source if source is not None else article.get('source', ''))
+            for article in articles
+        ]
+
+    def categorize(self, title: str, content: str = "", source: str = "") -> str:
+        return self.classify(title, content, source)[0]
+
+    def region(self, title: str, content: str = "", source: str = "") -> str:
+        return self.classify(title, content, source)[1]
+
+
+# Compiled once and shared by every scraper
+default_classifier = KeywordClassifier()
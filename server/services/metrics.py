@@ -0,0 +1,269 @@
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_METRICS_FILE = None
+DEFAULT_METRICS_PORT = None
+METRIC_PREFIX = "newsharvester_"
+# Upper bounds in seconds, from cached lookups to slow article downloads
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# (metric name, sorted label pairs)
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _key(name: str, labels: Dict[str, str]) -> MetricKey:
+    return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+def _label_text(labels: Tuple[Tuple[str, str], ...]) -> str:
+    return ",".join(f"{label}={value}" for label, value in labels)
+
+
+class Histogram:
+    """Bucketed distribution of observed durations, in the shape Prometheus expects"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def copy(self) -> 'Histogram':
+        histogram = Histogram(self.buckets)
+        histogram.counts = list(self.counts)
+        histogram.count, histogram.sum, histogram.max = self.count, self.sum, self.max
+        return histogram
+
+    def minus(self, base: Optional['Histogram']) -> 'Histogram':
+        """Observations made since base was copied; max is the cycle's own"""
+        delta = self.copy()
+        if base is not None:
+            delta.counts = [count - base_count for count, base_count in zip(self.counts, base.counts)]
+            delta.count -= base.count
+            delta.sum -= base.sum
+        return delta
+
+    def quantile(self, q: float) -> float:
+        """Estimate from the buckets, interpolating linearly inside the bucket that holds it"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                return min(lower + (upper - lower) * (rank - seen) / count, self.max)
+            seen += count
+        return self.max
+
+    def summary(self) -> Dict:
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else 0.0,
+            'p50': round(self.quantile(0.5), 6),
+            'p95': round(self.quantile(0.95), 6),
+            'max': round(self.max, 6)
+        }
+
+
+class MetricsRegistry:
+    """Timings and counters for one scraper process.
+
+    Histograms record durations (fetch latency per host, parse, extraction,
+    classification, saves) and counters record totals (bytes, retries,
+    failures). Objects that already keep their own hit counters, like the
+    response and HTML caches, are registered as sources and read when a
+    snapshot is taken. Everything is cumulative for the Prometheus text
+    format; ``begin_cycle`` marks a point that ``snapshot(cycle=True)``
+    reports the difference from, so a slow cycle can be looked at on its own.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[MetricKey, Histogram] = {}
+        self._counters: Dict[MetricKey, float] = {}
+        self._sources: Dict[MetricKey, Callable[[], float]] = {}
+        self._cycle_histograms: Dict[MetricKey, Histogram] = {}
+        self._cycle_counters: Dict[MetricKey, float] = {}
+        self._cycle_started: Optional[float] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def observe(self, name: str, seconds: float, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def time(self, name: str, **labels):
+        """Observe how long the with-block took, whether or not it raised"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def increment(self, name: str, amount: float = 1, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def register_source(self, name: str, read: Callable[[], float], **labels):
+        """Report a counter some other object keeps, read at snapshot time"""
+        with self._lock:
+            self._sources[_key(name, labels)] = read
+
+    def _read_counters(self) -> Dict[MetricKey, float]:
+        counters = dict(self._counters)
+        for key, read in self._sources.items():
+            try:
+                counters[key] = read()
+            except Exception as e:
+                logger.debug(f"Could not read metric {key[0]}: {str(e)}")
+        return counters
+
+    def begin_cycle(self):
+        """Start the window that cycle snapshots cover"""
+        with self._lock:
+            self._cycle_counters = self._read_counters()
+            self._cycle_histograms = {key: histogram.copy() for key, histogram in self._histograms.items()}
+            for histogram in self._histograms.values():
+                histogram.max = 0.0
+            self._cycle_started = time.time()
+
+    def snapshot(self, cycle: bool = False) -> Dict:
+        """Counters and histogram summaries, cumulative or for the current cycle"""
+        with self._lock:
+            counters = self._read_counters()
+            histograms = {key: histogram.copy() for key, histogram in self._histograms.items()}
+            if cycle:
+                counters = {key: value - self._cycle_counters.get(key, 0) for key, value in counters.items()}
+                histograms = {key: histogram.minus(self._cycle_histograms.get(key))
+                              for key, histogram in histograms.items()}
+            cycle_started = self._cycle_started
+
+        result = {'generated_at': datetime.now().isoformat(), 'counters': {}, 'histograms': {}}
+        if cycle and cycle_started is not None:
+            result['cycle_seconds'] = round(time.time() - cycle_started, 3)
+        for (name, labels), value in sorted(counters.items()):
+            result['counters'].setdefault(name, {})[_label_text(labels)] = value
+        for (name, labels), histogram in sorted(histograms.items()):
+            if histogram.count:
+                result['histograms'].setdefault(name, {})[_label_text(labels)] = histogram.summary()
+        return result
+
+    def write_snapshot(self, filename: Optional[str], cycle: bool = True):
+        """Write a JSON snapshot atomically; does nothing without a filename"""
+        if not filename:
+            return
+        tmp_filename = f"{filename}.tmp"
+        try:
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                json.dump(self.snapshot(cycle=cycle), f, indent=2)
+            os.replace(tmp_filename, filename)
+        except Exception as e:
+            logger.error(f"Error writing metrics snapshot {filename}: {str(e)}")
+
+    def summary_lines(self, cycle: bool = True, limit: int = 10) -> List[str]:
+        """Where the time went: histograms with the largest total time first"""
+        snapshot = self.snapshot(cycle=cycle)
+        timings = [(values['sum'], name, labels, values)
+                   for name, by_label in snapshot['histograms'].items() for labels, values in by_label.items()]
+        lines = []
+        for total, name, labels, values in sorted(timings, reverse=True)[:limit]:
+            label = f"{{{labels}}}" if labels else ""
+            lines.append(f"{name}{label}: {values['count']} calls, {total:.2f}s total, "
+                         f"p50 {values['p50'] * 1000:.0f}ms, p95 {values['p95'] * 1000:.0f}ms, max {values['max'] * 1000:.0f}ms")
+        return lines
+
+    def to_prometheus(self) -> str:
+        """Cumulative metrics in the Prometheus text exposition format"""
+        with self._lock:
+            counters = self._read_counters()
+            histograms = {key: histogram.copy() for key, histogram in self._histograms.items()}
+
+        def labels_text(labels, extra=()):
+            pairs = list(labels) + list(extra)
+            if not pairs:
+                return ""
+            escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+            return "{" + ",".join(f'{label}="{value}"' for (label, _), value in zip(pairs, escaped)) + "}"
+
+        lines = []
+        typed = set()
+        for (name, labels), value in sorted(counters.items()):
+            metric = METRIC_PREFIX + name
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} counter")
+                typed.add(metric)
+            lines.append(f"{metric}{labels_text(labels)} {value}")
+        for (name, labels), histogram in sorted(histograms.items()):
+            metric = METRIC_PREFIX + name
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} histogram")
+                typed.add(metric)
+            cumulative = 0
+            for bound, count in zip(list(histogram.buckets) + ['+Inf'], histogram.counts):
+                cumulative += count
+                lines.append(f"{metric}_bucket{labels_text(labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{metric}_sum{labels_text(labels)} {histogram.sum}")
+            lines.append(f"{metric}_count{labels_text(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+        """Serve /metrics (Prometheus text) and /metrics.json from a background thread"""
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/metrics':
+                    body = registry.to_prometheus().encode('utf-8')
+                    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+                elif self.path == '/metrics.json':
+                    body = json.dumps(registry.snapshot(cycle=True)).encode('utf-8')
+                    content_type = 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name='metrics-server', daemon=True).start()
+        logger.info(f"Serving metrics on http://{host}:{self._server.server_address[1]}/metrics")
+        return self._server
+
+    def stop_serving(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,299 @@
+import array
+import base64
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional, Set, Tuple
+
+from .seen_urls import canonicalize_url
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_NEAR_DUPLICATE_FILE = "near_duplicates.json"
+DEFAULT_NEAR_DUPLICATE_TTL_HOURS = 48
+DEFAULT_TITLE_SIMILARITY = 0.6
+DEFAULT_BODY_SIMILARITY = 0.8
+
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // LSH_BANDS
+# Bodies shorter than this are usually the title fallback, not a real article text
+MIN_BODY_WORDS = 40
+MAX_BODY_SHINGLES = 300
+BODY_SHINGLE_WORDS = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_GOLDEN_RATIO = 0x9E3779B1
+_BIN_SHIFT = 32 - (NUM_PERMUTATIONS.bit_length() - 1)
+_BIN_VALUE_MASK = (1 << _BIN_SHIFT) - 1
+# Borrowed values are shifted past every real bin value so they only match other borrowed values
+_EMPTY_BIN_OFFSET = 1 << _BIN_SHIFT
+_WORDS = re.compile(r'\w+')
+
+# Fixed seed: signatures written by one cycle must be comparable in the next
+_rng = random.Random(1337)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+                 for _ in range(NUM_PERMUTATIONS)]
+
+
+def title_shingles(title: str) -> Set[str]:
+    """Lowercase title words, the same unit the old overlap check compared"""
+    return set(_WORDS.findall((title or '').lower()))
+
+
+def body_shingles(body: str) -> Set[str]:
+    """Word 3-grams from the start of the article body, or nothing if the body is too short"""
+    words = _WORDS.findall((body or '').lower())
+    if len(words) < MIN_BODY_WORDS:
+        return set()
+    words = words[:MAX_BODY_SHINGLES + BODY_SHINGLE_WORDS - 1]
+    return {' '.join(words[i:i + BODY_SHINGLE_WORDS]) for i in range(len(words) - BODY_SHINGLE_WORDS + 1)}
+
+
+def minhash(shingles: Set[str]) -> Optional[Tuple[int, ...]]:
+    """MinHash signature of a small shingle set (None for an empty set)"""
+    if not shingles:
+        return None
+    hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in shingles]
+    return tuple(
+        min([(a * h + b) % _MERSENNE_PRIME for h in hashes]) & _MAX_HASH
+        for a, b in _PERMUTATIONS
+    )
+
+
+def one_permutation_hash(shingles: Set[str]) -> Optional[Tuple[int, ...]]:
+    """Signature of a large shingle set from a single hash per shingle.
+
+    Each hash picks one of NUM_PERMUTATIONS bins and the bin keeps its
+    minimum, so the cost is linear in the shingles instead of shingles
+    times permutations. Empty bins borrow from the next filled bin
+    (rotation densification) so signatures stay comparable band by band.
+    """
+    if not shingles:
+        return None
+    bins: List[Optional[int]] = [None] * NUM_PERMUTATIONS
+    for shingle in shingles:
+        mixed = (zlib.crc32(shingle.encode('utf-8')) * _GOLDEN_RATIO) & _MAX_HASH
+        slot = mixed >> _BIN_SHIFT
+        value = mixed & _BIN_VALUE_MASK
+        current = bins[slot]
+        if current is None or value < current:
+            bins[slot] = value
+    for slot in range(NUM_PERMUTATIONS):
+        if bins[slot] is None:
+            for distance in range(1, NUM_PERMUTATIONS):
+                donor = bins[(slot + distance) % NUM_PERMUTATIONS]
+                if donor is not None and donor < _EMPTY_BIN_OFFSET:
+                    bins[slot] = donor + distance * _EMPTY_BIN_OFFSET
+                    break
+    return tuple(bins)
+
+
+def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(1 for x, y in zip(first, second) if x == y) / NUM_PERMUTATIONS
+
+
+def _encode(signature: Optional[Tuple[int, ...]]) -> Optional[str]:
+    if signature is None:
+        return None
+    return base64.b64encode(array.array('I', signature).tobytes()).decode('ascii')
+
+
+def _decode(value: Optional[str]) -> Optional[Tuple[int, ...]]:
+    if not value:
+        return None
+    values = array.array('I')
+    values.frombytes(base64.b64decode(value))
+    return tuple(values) if len(values) == NUM_PERMUTATIONS else None
+
+
+class _LshTable:
+    """Band buckets for one kind of signature; lookups only touch colliding entries"""
+
+    def __init__(self):
+        self.buckets: Dict[Tuple[int, int], Set[str]] = {}
+
+    @staticmethod
+    def _bands(signature: Tuple[int, ...]):
+        for band in range(LSH_BANDS):
+            yield band, hash(signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND])
+
+    def add(self, key: str, signature: Tuple[int, ...]):
+        for band_key in self._bands(signature):
+            self.buckets.setdefault(band_key, set()).add(key)
+
+    def remove(self, key: str, signature: Tuple[int, ...]):
+        for band_key in self._bands(signature):
+            bucket = self.buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self.buckets[band_key]
+
+    def candidates(self, signature: Tuple[int, ...]) -> Set[str]:
+        found: Set[str] = set()
+        for band_key in self._bands(signature):
+            found.update(self.buckets.get(band_key, ()))
+        return found
+
+
+class NearDuplicateIndex:
+    """MinHash/LSH index of recently kept articles, shared across sources and cycles.
+
+    Each article gets a signature over its title words and, when it has a
+    real body, one over word 3-grams of the body. Signatures are split into
+    bands and bucketed, so a lookup only compares against articles that
+    share at least one band instead of every title seen so far. An article
+    is a near duplicate when either signature is at least as similar as the
+    title or body threshold. Entries are keyed by canonical URL, persisted
+    to ``filename`` and expire after ``ttl_hours``.
+    """
+
+    def __init__(self, filename: Optional[str] = DEFAULT_NEAR_DUPLICATE_FILE,
+                 ttl_hours: float = DEFAULT_NEAR_DUPLICATE_TTL_HOURS,
+                 title_similarity: float = DEFAULT_TITLE_SIMILARITY,
+                 body_similarity: float = DEFAULT_BODY_SIMILARITY):
+        self.filename = filename
+        self.ttl_seconds = ttl_hours * 3600
+        self.title_similarity = title_similarity
+        self.body_similarity = body_similarity
+        self.skipped = 0
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict] = {}
+        self._titles = _LshTable()
+        self._bodies = _LshTable()
+        if filename:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable near-duplicate index {self.filename}: {str(e)}")
+            return
+        cutoff = time.time() - self.ttl_seconds
+        for key, entry in stored.items():
+            if entry.get('added_at', 0) >= cutoff:
+                self._insert(key, _decode(entry.get('title')), _decode(entry.get('body')), entry['added_at'])
+
+    def _save(self):
+        if not self.filename:
+            return
+        tmp_filename = f"{self.filename}.tmp"
+        stored = {
+            key: {'title': _encode(entry['title']), 'body': _encode(entry['body']), 'added_at': entry['added_at']}
+            for key, entry in self._entries.items()
+        }
+        try:
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                json.dump(stored, f)
+            os.replace(tmp_filename, self.filename)
+        except Exception as e:
+            logger.error(f"Error saving near-duplicate index: {str(e)}")
+
+    def _insert(self, key: str, title_signature, body_signature, added_at: float):
+        self._remove(key)
+        self._entries[key] = {'title': title_signature, 'body': body_signature, 'added_at': added_at}
+        if title_signature is not None:
+            self._titles.add(key, title_signature)
+        if body_signature is not None:
+            self._bodies.add(key, body_signature)
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        if entry['title'] is not None:
+            self._titles.remove(key, entry['title'])
+        if entry['body'] is not None:
+            self._bodies.remove(key, entry['body'])
+
+    def _prune(self):
+        cutoff = time.time() - self.ttl_seconds
+        for key in [key for key, entry in self._entries.items() if entry['added_at'] < cutoff]:
+            self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def article_key(article: Dict) -> str:
+        url = article.get('url')
+        return canonicalize_url(url) if url else f"title:{(article.get('title') or '').strip().lower()}"
+
+    @staticmethod
+    def signatures(article: Dict) -> Tuple[Optional[Tuple[int, ...]], Optional[Tuple[int, ...]]]:
+        """(title signature, body signature) for an article dict"""
+        return (minhash(title_shingles(article.get('title', ''))),
+                one_permutation_hash(body_shingles(article.get('fullContent') or '')))
+
+    def find(self, article: Dict, signatures=None) -> Optional[str]:
+        """Key of an indexed article this one nearly duplicates, ignoring the article itself"""
+        key = self.article_key(article)
+        title_signature, body_signature = signatures or self.signatures(article)
+        with self._lock:
+            for table, signature, field, threshold in (
+                (self._titles, title_signature, 'title', self.title_similarity),
+                (self._bodies, body_signature, 'body', self.body_similarity)
+            ):
+                if signature is None:
+                    continue
+                for candidate in table.candidates(signature):
+                    if candidate == key:
+                        continue
+                    other = self._entries[candidate][field]
+                    if similarity(signature, other) >= threshold:
+                        return candidate
+        return None
+
+    def add(self, article: Dict, signatures=None):
+        """Index an article without persisting"""
+        title_signature, body_signature = signatures or self.signatures(article)
+        with self._lock:
+            self._insert(self.article_key(article), title_signature, body_signature, time.time())
+
+    def dedupe(self, articles: List[Dict], record: bool = False) -> List[Dict]:
+        """Drop articles that nearly duplicate an earlier one in the list or an indexed article.
+
+        With ``record`` the kept articles are added to the index and it is
+        persisted, so later sources and cycles skip their copies.
+        """
+        batch = NearDuplicateIndex(filename=None, ttl_hours=self.ttl_seconds / 3600,
+                                   title_similarity=self.title_similarity,
+                                   body_similarity=self.body_similarity)
+        unique_articles = []
+        kept_signatures = []
+        for article in articles:
+            if batch.article_key(article) in batch._entries:
+                continue
+            signatures = self.signatures(article)
+            if batch.find(article, signatures) is not None or self.find(article, signatures) is not None:
+                continue
+            batch.add(article, signatures)
+            unique_articles.append(article)
+            kept_signatures.append(signatures)
+
+        skipped = len(articles) - len(unique_articles)
+        with self._lock:
+            self.skipped += skipped
+            if record and unique_articles:
+                now = time.time()
+                for article, (title_signature, body_signature) in zip(unique_articles, kept_signatures):
+                    self._insert(self.article_key(article), title_signature, body_signature, now)
+                # Expired entries are pruned whenever the index is written
+                self._prune()
+                self._save()
+        if skipped:
+            logger.info(f"Skipping {skipped} near-duplicate articles")
+        return unique_articles
@@ -0,0 +1,81 @@
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 0 parses in the thread that downloaded the page; set it to the core count to parse on every core
+DEFAULT_PARSE_WORKERS = 0
+
+# What a worker's own scraper needs for extraction: no caches, indexes or nested pools
+WORKER_CONFIG = {
+    'feed_cache_file': None,
+    'seen_urls_file': None,
+    'near_duplicate_file': None,
+    'html_cache_dir': None,
+    'parse_workers': 0
+}
+
+_worker_scraper = None
+
+
+def _init_worker():
+    global _worker_scraper
+    from .scraper import NewsScraper
+    _worker_scraper = NewsScraper(dict(WORKER_CONFIG))
+
+
+def _extract(url: str, html: str) -> Dict:
+    return _worker_scraper.extract_article_from_html(url, html)
+
+
+class ParsePool:
+    """Worker processes that turn downloaded article HTML into article records.
+
+    newspaper3k parsing and the lxml fallbacks are CPU-bound and hold the
+    GIL, so the extraction threads only download in parallel. Handing the
+    HTML to a process pool lets parsing use every core while the threads
+    keep fetching: each call sends ``(url, html)`` to a worker and blocks
+    until the compact article fields come back. Workers are spawned rather
+    than forked, since the scraper process is already multi-threaded. If a
+    worker dies the pool is rebuilt and that page is parsed in-thread.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = max(1, int(workers))
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker
+                )
+            return self._executor
+
+    def extract(self, url: str, html: str) -> Optional[Dict]:
+        """Article fields for url parsed in a worker, or None if the pool broke"""
+        executor = self._get_executor()
+        try:
+            return executor.submit(_extract, url, html).result()
+        except BrokenProcessPool as e:
+            logger.warning(f"Parse worker died while parsing {url}, restarting the pool: {str(e)}")
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False)
+            return None
+
+    def shutdown(self, wait_for_tasks: bool = True):
+        """Stop the worker processes"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait_for_tasks)
+                self._executor = None
@@ -0,0 +1,161 @@
+"""
+Partial page downloads.
+
+``HeadBuffer`` keeps only the ``<head>`` of a page, for summary-depth
+articles that need nothing but its meta tags. ``PageBuffer`` keeps a whole
+page up to a byte cap and, for article pages, can stop as soon as the head
+(with its ``og:`` tags) and the main content container have both closed,
+so the comments, related stories and inline scripts after them are never
+downloaded. ``is_html_content_type`` lets callers refuse PDFs, video and
+other non-HTML responses from their headers alone, before the body is read.
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Enough for the <head> of nearly every news page, including inline JSON-LD
+DEFAULT_HEAD_MAX_BYTES = 64 * 1024
+HEAD_END = b'</head'
+# Large enough for nearly every article and homepage; huge homepages are cut off here
+DEFAULT_PAGE_MAX_BYTES = 2 * 1024 * 1024
+DEFAULT_STOP_EARLY = True
+PAGE_CHUNK_BYTES = 64 * 1024
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+HEAD_CLOSE = re.compile(rb'</head\s*>', re.IGNORECASE)
+CONTAINER_TAG = re.compile(rb'<(/?)(main|article)\b[^>]*>', re.IGNORECASE)
+SCRIPT_OR_STYLE = re.compile(rb'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+ANY_TAG = re.compile(rb'<[^>]*>')
+# A closed container with less visible text than this is a teaser card or an embed, not the story
+MIN_CONTAINER_TEXT_BYTES = 500
+# Rescanned from the previous chunk so a tag split across chunks is still found
+SCAN_OVERLAP = 16
+
+
+class NotHTMLError(ValueError):
+    """Raised when a page request is answered with something other than HTML"""
+
+
+def is_html_content_type(content_type: Optional[str]) -> bool:
+    """True for HTML, and for responses that do not say what they are"""
+    media_type = (content_type or '').split(';', 1)[0].strip().lower()
+    return not media_type or media_type in HTML_CONTENT_TYPES
+
+
+class HeadBuffer:
+    """Collects the start of a streamed page until its ``</head>`` closes or ``max_bytes`` arrive.
+
+    Feed chunks in as they are read and stop reading once ``feed`` returns
+    True; the body of the page is never downloaded. ``range_header`` asks
+    servers that support ranges not to send more than ``max_bytes`` at all.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_HEAD_MAX_BYTES):
+        self.max_bytes = max(1, int(max_bytes))
+        self.data = bytearray()
+        self.complete = False
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def range_header(self) -> Dict[str, str]:
+        return {'Range': f"bytes=0-{self.max_bytes - 1}"}
+
+    def feed(self, chunk: bytes) -> bool:
+        """Add a chunk; True once enough has been read"""
+        # Search from just before the new chunk so a tag split across chunks is still found
+        start = max(0, len(self.data) - len(HEAD_END) + 1)
+        self.data.extend(chunk)
+        if bytes(self.data[start:]).lower().find(HEAD_END) != -1:
+            self.complete = True
+        elif len(self.data) >= self.max_bytes:
+            del self.data[self.max_bytes:]
+            self.complete = True
+        return self.complete
+
+    def text(self, encoding: Optional[str] = None) -> str:
+        try:
+            return self.data.decode(encoding or 'utf-8', errors='replace')
+        except LookupError:
+            return self.data.decode('utf-8', errors='replace')
+
+
+class PageBuffer:
+    """Collects a streamed page up to ``max_bytes``, optionally stopping once the article is in.
+
+    With ``stop_early`` the buffer is complete as soon as ``</head>`` has
+    been read and an outermost ``<main>`` or ``<article>`` has closed with
+    at least ``MIN_CONTAINER_TEXT_BYTES`` of visible text in it. Open
+    containers are counted, so an article nested in ``<main>`` or inside
+    the story does not end it, and teaser cards in navigation bars are
+    too short to count. Pages without such a container are read to the
+    cap. ``truncated`` tells whether the cap cut the page off.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_PAGE_MAX_BYTES, stop_early: bool = False):
+        self.max_bytes = max(1, int(max_bytes))
+        self.stop_early = stop_early
+        self.data = bytearray()
+        self.complete = False
+        self.truncated = False
+        self._pos = 0
+        self._body_start: Optional[int] = None
+        self._open: List[bytes] = []
+        self._container_start = 0
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def feed(self, chunk: bytes) -> bool:
+        """Add a chunk; True once enough has been read"""
+        start = max(self._pos, len(self.data) - SCAN_OVERLAP)
+        self.data.extend(chunk)
+        if self.stop_early and self._container_closed(start):
+            self.complete = True
+        elif len(self.data) >= self.max_bytes:
+            del self.data[self.max_bytes:]
+            self.complete = self.truncated = True
+        return self.complete
+
+    def _container_closed(self, start: int) -> bool:
+        if self._body_start is None:
+            match = HEAD_CLOSE.search(self.data, start)
+            if match is None:
+                return False
+            self._body_start = self._pos = match.end()
+
+        # Only the unscanned tail is copied; the buffer itself may be cut below
+        base = self._pos
+        tail = bytes(self.data[base:])
+        for match in CONTAINER_TAG.finditer(tail):
+            self._pos = base + match.end()
+            name = match.group(2).lower()
+            if not match.group(1):
+                if not self._open:
+                    self._container_start = base + match.start()
+                self._open.append(name)
+                continue
+            if name not in self._open:
+                continue
+            # An unclosed inner container ends with its parent, as browsers treat it
+            while self._open.pop() != name:
+                pass
+            if not self._open and self._has_text(self._container_start, self._pos):
+                # Keep the closing tag; the rest of the chunk is dropped
+                del self.data[self._pos:]
+                return True
+        # Resume at a tag the chunk may have cut in half
+        partial = self.data.rfind(b'<', self._pos)
+        self._pos = partial if partial != -1 else len(self.data)
+        return False
+
+    def _has_text(self, start: int, end: int) -> bool:
+        markup = SCRIPT_OR_STYLE.sub(b' ', bytes(self.data[start:end]))
+        return len(b''.join(ANY_TAG.sub(b' ', markup).split())) >= MIN_CONTAINER_TEXT_BYTES
+
+    def content(self) -> bytes:
+        return bytes(self.data)
@@ -0,0 +1,138 @@
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 25
+DEFAULT_QUEUE_SIZE = 100
+DEFAULT_FLUSH_SECONDS = 2.0
+
+_DONE = object()
+
+
+class ScrapePipeline:
+    """Streams scraped articles into storage while scraping is still running.
+
+    A producer thread walks ``scraper.iter_all_sources`` and puts each
+    finalized article on a bounded queue; the calling thread drains it and
+    saves batches of ``batch_size``. A partial batch is flushed once no new
+    article has arrived for ``flush_seconds``, so the first articles are
+    saved within seconds. Memory is bounded by the queue and one batch
+    instead of the whole cycle's corpus, because the producer blocks when
+    storage falls behind.
+    """
+
+    def __init__(self, scraper, storage, batch_size: int = DEFAULT_BATCH_SIZE,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, flush_seconds: float = DEFAULT_FLUSH_SECONDS):
+        self.scraper = scraper
+        self.storage = storage
+        self.batch_size = max(1, batch_size)
+        self.queue_size = max(1, queue_size)
+        self.flush_seconds = flush_seconds
+
+    @staticmethod
+    def _put(article_queue: queue.Queue, item, stop: threading.Event) -> bool:
+        """Queue item, waiting for room until stop is set; False if it was not queued"""
+        while not stop.is_set():
+            try:
+                article_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, articles: Iterable[Dict], article_queue: queue.Queue, errors: List[Exception],
+                 stop: threading.Event):
+        try:
+            for article in articles:
+                if not self._put(article_queue, article, stop):
+                    break
+        except Exception as e:
+            logger.error(f"Scraping stage failed: {str(e)}")
+            errors.append(e)
+        finally:
+            # Release the scraper's generator here, in the thread that iterates it
+            close = getattr(articles, 'close', None)
+            if close is not None:
+                close()
+            self._put(article_queue, _DONE, stop)
+
+    def run(self, sources: List[Dict], on_article: Optional[Callable[[Dict], None]] = None,
+            deadline: Optional[float] = None) -> Dict:
+        """Scrape every source and save articles in batches as they arrive.
+
+        ``on_article`` is called for each article before it is queued for
+        saving, so callers can keep running statistics without holding the
+        articles. Sources not started by ``deadline`` are deferred by the
+        scraper. Returns counters for the cycle.
+        """
+        stats = {
+            'scraped': 0,
+            'batches_saved': 0,
+            'batches_failed': 0,
+            'articles_in_failed_batches': 0,
+            'first_save_seconds': None,
+            'scrape_errors': 0
+        }
+        article_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        errors: List[Exception] = []
+        stop = threading.Event()
+        start_time = time.time()
+
+        articles = self.scraper.iter_all_sources(sources, deadline=deadline)
+        producer = threading.Thread(
+            target=self._produce,
+            args=(articles, article_queue, errors, stop),
+            name='scrape-producer',
+            daemon=True
+        )
+        producer.start()
+
+        batch: List[Dict] = []
+
+        def flush():
+            if not batch:
+                return
+            if self.storage.save_scraped_articles(batch):
+                stats['batches_saved'] += 1
+                if stats['first_save_seconds'] is None:
+                    stats['first_save_seconds'] = time.time() - start_time
+            else:
+                stats['batches_failed'] += 1
+                stats['articles_in_failed_batches'] += len(batch)
+                logger.error(f"Failed to save a batch of {len(batch)} articles")
+            batch.clear()
+
+        try:
+            while True:
+                try:
+                    article = article_queue.get(timeout=self.flush_seconds)
+                except queue.Empty:
+                    # Scraping is slow right now; hand over what we have
+                    flush()
+                    continue
+
+                if article is _DONE:
+                    break
+
+                stats['scraped'] += 1
+                if on_article:
+                    on_article(article)
+                batch.append(article)
+                if len(batch) >= self.batch_size:
+                    flush()
+
+            flush()
+        finally:
+            # If saving failed, stop the producer so it does not hold the scraper into the next cycle
+            stop.set()
+            producer.join()
+        stats['scrape_errors'] = len(errors)
+        stats['elapsed_seconds'] = time.time() - start_time
+        logger.info(f"Pipeline finished: {stats['scraped']} articles scraped, "
+                    f"{stats['batches_saved']} batches saved, {stats['batches_failed']} failed")
+        return stats
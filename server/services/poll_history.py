@@ -0,0 +1,121 @@
+import json
+import logging
+import os
+import threading
+from typing import Dict, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_HISTORY_FILE = "poll_history.json"
+DEFAULT_ADAPTIVE_INTERVALS = True
+DEFAULT_MIN_INTERVAL_MINUTES = 5
+DEFAULT_MAX_INTERVAL_MINUTES = 120
+# Polls are spaced so that each one finds about this many new articles
+DEFAULT_TARGET_NEW_PER_POLL = 3
+# Weight of the latest poll in the moving averages
+SMOOTHING = 0.3
+# A poll that found nothing stretches the interval by this factor
+BACKOFF = 1.5
+# No single poll moves the interval by more than this factor either way
+MAX_STEP = 2.0
+
+
+def _average(previous: Optional[float], value: float) -> float:
+    return value if previous is None else previous + SMOOTHING * (value - previous)
+
+
+class PollHistory:
+    """What each source's polls found, and the poll interval that suggests.
+
+    Every poll records how many new articles the source yielded and how
+    long it had been since the previous poll. Moving averages of the two
+    give the source's arrival rate, and the interval is set so a poll
+    finds about ``target_new_per_poll`` new articles: quiet feeds back off
+    towards ``max_interval_minutes`` and bursty ones tighten towards
+    ``min_interval_minutes``. History is kept per source URL in a JSON
+    file, so learned intervals survive restarts.
+    """
+
+    def __init__(self, filename: Optional[str] = DEFAULT_POLL_HISTORY_FILE,
+                 min_interval_minutes: float = DEFAULT_MIN_INTERVAL_MINUTES,
+                 max_interval_minutes: float = DEFAULT_MAX_INTERVAL_MINUTES,
+                 target_new_per_poll: float = DEFAULT_TARGET_NEW_PER_POLL):
+        self.filename = filename
+        self.min_interval = min_interval_minutes * 60
+        self.max_interval = max(self.min_interval, max_interval_minutes * 60)
+        self.target_new_per_poll = max(0.1, target_new_per_poll)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        if not self.filename:
+            return {}
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable poll history {self.filename}: {str(e)}")
+            return {}
+
+    def save(self):
+        if not self.filename:
+            return
+        with self._lock:
+            entries = json.dumps(self._entries, indent=2)
+        # Write to a temp file first so a crash never leaves a truncated history behind
+        tmp_filename = f"{self.filename}.tmp"
+        try:
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                f.write(entries)
+            os.replace(tmp_filename, self.filename)
+        except Exception as e:
+            logger.error(f"Error saving poll history: {str(e)}")
+
+    def _clamp(self, seconds: float) -> float:
+        return min(self.max_interval, max(self.min_interval, seconds))
+
+    def interval(self, url: str, base_seconds: float) -> float:
+        """The learned interval for url, or base_seconds within the bounds for a source not yet seen"""
+        with self._lock:
+            entry = self._entries.get(url)
+            return self._clamp(entry['interval'] if entry else base_seconds)
+
+    def record(self, url: str, new_count: int, polled_at: float, base_seconds: float) -> float:
+        """Add a poll's result and return the source's new interval"""
+        with self._lock:
+            entry = self._entries.setdefault(url, {'interval': self._clamp(base_seconds), 'polls': 0})
+            last_poll = entry.get('last_poll')
+            entry['polls'] += 1
+            entry['last_poll'] = polled_at
+            if new_count:
+                entry['last_new'] = polled_at
+            # The first poll finds whatever backlog the feed holds, which says nothing about its rate
+            if last_poll is None or polled_at <= last_poll:
+                return entry['interval']
+
+            entry['avg_new'] = _average(entry.get('avg_new'), new_count)
+            entry['avg_gap'] = _average(entry.get('avg_gap'), polled_at - last_poll)
+            current = entry['interval']
+            if new_count == 0:
+                proposed = current * BACKOFF
+            else:
+                rate = entry['avg_new'] / entry['avg_gap']
+                proposed = self.target_new_per_poll / rate
+            proposed = min(current * MAX_STEP, max(current / MAX_STEP, proposed))
+            entry['interval'] = self._clamp(proposed)
+            return entry['interval']
+
+    def learned_intervals(self) -> Dict[str, Dict]:
+        """Per source URL: interval in minutes, new articles per hour and number of polls"""
+        with self._lock:
+            return {
+                url: {
+                    'interval_minutes': round(entry['interval'] / 60, 1),
+                    'new_per_hour': round(entry['avg_new'] / entry['avg_gap'] * 3600, 2) if entry.get('avg_gap') else None,
+                    'polls': entry['polls']
+                }
+                for url, entry in self._entries.items()
+            }
@@ -0,0 +1,134 @@
+import email.utils
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST_REQUESTS_PER_SECOND = 2.0
+DEFAULT_HOST_BURST = 4
+# Pause applied to a host that answered 429 without saying how long to wait
+DEFAULT_THROTTLE_SECONDS = 10.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta seconds or HTTP date)"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostRateLimiter:
+    """Token bucket per host, shared by every fetch path of a scraper.
+
+    Each host refills at ``requests_per_second`` up to ``burst`` tokens.
+    Callers reserve a token and wait only for their own host, so requests
+    to different domains never delay each other. A 429 or Retry-After
+    pauses just the host that sent it.
+    """
+
+    def __init__(self, requests_per_second: float = DEFAULT_HOST_REQUESTS_PER_SECOND,
+                 burst: int = DEFAULT_HOST_BURST):
+        self.rate = max(0.001, float(requests_per_second))
+        self.burst = max(1, int(burst))
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Dict[str, float]] = {}
+
+    @staticmethod
+    def _host(url: str) -> str:
+        try:
+            return urlparse(url).netloc.lower()
+        except Exception:
+            return ''
+
+    def reserve(self, url: str, cost: float = 1.0) -> float:
+        """Take cost tokens for url's host and return how long the caller must wait before sending"""
+        host = self._host(url)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = {'tokens': float(self.burst), 'updated': now, 'blocked_until': 0.0}
+            bucket['tokens'] = min(self.burst, bucket['tokens'] + (now - bucket['updated']) * self.rate)
+            bucket['updated'] = now
+            # Tokens may go negative: each queued caller waits for its own slot
+            bucket['tokens'] -= cost
+            delay = -bucket['tokens'] / self.rate if bucket['tokens'] < 0 else 0.0
+            return max(delay, bucket['blocked_until'] - now)
+
+    def acquire(self, url: str, cost: float = 1.0) -> float:
+        """Block until a request to url's host is allowed; returns the time waited"""
+        delay = self.reserve(url, cost)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def throttle(self, url: str, seconds: Optional[float] = None):
+        """Pause a host, e.g. after a 429, for Retry-After seconds or the default"""
+        seconds = DEFAULT_THROTTLE_SECONDS if seconds is None else seconds
+        host = self._host(url)
+        with self._lock:
+            bucket = self._buckets.setdefault(
+                host, {'tokens': 0.0, 'updated': time.monotonic(), 'blocked_until': 0.0}
+            )
+            bucket['blocked_until'] = max(bucket['blocked_until'], time.monotonic() + seconds)
+        logger.warning(f"Rate limited by {host}, pausing requests for {seconds:.1f}s")
+
+    def drain(self, url: str):
+        """Drop a host's burst allowance so its next requests go out at the steady rate"""
+        host = self._host(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is not None:
+                bucket['tokens'] = min(bucket['tokens'], 0.0)
+
+    def observe(self, url: str, status_code: int, headers) -> bool:
+        """Throttle the host when a response says so; returns True if it did"""
+        retry_after = parse_retry_after(headers.get('Retry-After')) if headers is not None else None
+        if status_code == 429 or (status_code == 503 and retry_after is not None):
+            self.throttle(url, retry_after)
+            return True
+        return False
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that waits for the host's token before each request.
+
+    urllib3's Retry still handles retries and sleeps for Retry-After
+    between them. A final 429 throttles the host in the shared limiter, and
+    a 429 that a retry got past drops the host's burst allowance, so the
+    other threads back off too.
+    """
+
+    def __init__(self, rate_limiter: HostRateLimiter, *args, **kwargs):
+        self.rate_limiter = rate_limiter
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        self.rate_limiter.acquire(request.url)
+        response = super().send(request, **kwargs)
+
+        if not self.rate_limiter.observe(request.url, response.status_code, response.headers):
+            retries = getattr(response.raw, 'retries', None)
+            history = getattr(retries, 'history', None) or ()
+            if any(entry.status == 429 for entry in history):
+                # urllib3 already waited out the 429 and the retry succeeded; stop bursting to this host
+                self.rate_limiter.drain(request.url)
+        return response
@@ -0,0 +1,134 @@
+import logging
+import re
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPHRASE_CACHE_FILE = "rephrase_cache.db"
+DEFAULT_REPHRASE_CACHE_MAX_ENTRIES = 50000
+DEFAULT_REPHRASE_CACHE_TTL_HOURS = 720
+# Expired and least recently used entries are evicted after this many new ones
+PRUNE_EVERY = 100
+
+_WORDS = re.compile(r'\w+')
+_SOURCE_SUFFIX = re.compile(r'\s+[-|–—:]\s+([^-|–—:]+)$')
+
+
+def normalize_headline(headline: str, source: str = '') -> str:
+    """Lowercase words of the headline without punctuation or a trailing " - Source" suffix"""
+    headline = (headline or '').strip()
+    match = _SOURCE_SUFFIX.search(headline)
+    if match and source and _WORDS.findall(match.group(1).lower()) == _WORDS.findall(source.lower()):
+        headline = headline[:match.start()]
+    return ' '.join(_WORDS.findall(headline.lower()))
+
+
+class RephraseCache:
+    """SQLite store of rephrased headlines, shared across runs and sources.
+
+    Entries are keyed by the normalized headline together with the model
+    and prompt version, so the same wire story carried by several sources,
+    or seen again on a later run, is rephrased once. Entries older than
+    ``ttl_hours`` are ignored and evicted, and the least recently used ones
+    go once there are more than ``max_entries``.
+    """
+
+    def __init__(self, filename: str = DEFAULT_REPHRASE_CACHE_FILE,
+                 max_entries: int = DEFAULT_REPHRASE_CACHE_MAX_ENTRIES,
+                 ttl_hours: float = DEFAULT_REPHRASE_CACHE_TTL_HOURS):
+        self.filename = filename
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = ttl_hours * 3600
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._unpruned = 0
+        self._db = self._open(filename)
+        with self._lock:
+            self._prune()
+
+    def _open(self, filename: str) -> sqlite3.Connection:
+        # Batches are rephrased from several threads; the lock serializes use of the connection
+        try:
+            db = sqlite3.connect(filename, check_same_thread=False)
+            db.execute("""CREATE TABLE IF NOT EXISTS rephrases (
+                key TEXT PRIMARY KEY,
+                rephrased TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )""")
+            db.execute("CREATE INDEX IF NOT EXISTS rephrases_accessed_at ON rephrases (accessed_at)")
+            db.commit()
+            return db
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Ignoring unreadable rephrase cache {filename}: {str(e)}")
+            return self._open(':memory:')
+
+    @staticmethod
+    def key(headline: str, source: str, model: str, prompt_version: int) -> str:
+        return f"{prompt_version}|{model}|{normalize_headline(headline, source)}"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM rephrases").fetchone()[0]
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _prune(self):
+        """Drop expired entries, then least recently used ones until the entry cap holds"""
+        try:
+            self._db.execute("DELETE FROM rephrases WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+            self._db.execute("""DELETE FROM rephrases WHERE key IN (
+                SELECT key FROM rephrases ORDER BY accessed_at
+                LIMIT MAX(0, (SELECT COUNT(*) FROM rephrases) - ?))""", (self.max_entries,))
+            self._db.commit()
+            self._unpruned = 0
+        except sqlite3.Error as e:
+            logger.error(f"Error pruning rephrase cache: {str(e)}")
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached rephrasing for key, or None if it is missing or expired"""
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._db.execute("SELECT rephrased, created_at FROM rephrases WHERE key = ?", (key,)).fetchone()
+                if row is None or now - row[1] >= self.ttl_seconds:
+                    self.misses += 1
+                    return None
+                self._db.execute("UPDATE rephrases SET accessed_at = ? WHERE key = ?", (now, key))
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Rephrase cache lookup failed: {str(e)}")
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, rephrased: str):
+        """Store a rephrased headline"""
+        if not rephrased:
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                self._db.execute("INSERT OR REPLACE INTO rephrases (key, rephrased, created_at, accessed_at) "
+                                 "VALUES (?, ?, ?, ?)", (key, rephrased, now, now))
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Error caching rephrased headline: {str(e)}")
+                return
+            self._unpruned += 1
+            if self._unpruned >= PRUNE_EVERY:
+                self._prune()
+
+    def close(self):
+        with self._lock:
+            self._prune()
+            self._db.close()
@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .seen_urls import canonicalize_url
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESPONSE_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class ResponseCache:
+    """Page responses fetched during the current cycle, so a URL is downloaded once per run.
+
+    Article downloads, index pages and the direct-fetch fallbacks all go
+    through it: a fallback that re-reads a page right after extraction gave
+    up gets the same response instead of a second request. Failed fetches
+    are remembered too, so a dead URL is not retried within the cycle.
+    Bodies are kept in LRU order up to ``max_bytes``; ``clear`` starts a
+    new cycle.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_RESPONSE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._in_flight: Dict[str, threading.Event] = {}
+        self._async_in_flight: Dict[str, asyncio.Future] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return entry
+
+    def _store(self, key: str, response=None, error: Optional[BaseException] = None):
+        size = len(getattr(response, 'content', b'') or b'') if response is not None else 0
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= previous['size']
+        self._entries[key] = {'response': response, 'error': error, 'size': size}
+        self._size += size
+        while self._size > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted['size']
+
+    @staticmethod
+    def _result(entry: Dict[str, Any]):
+        if entry['error'] is not None:
+            raise entry['error']
+        return entry['response']
+
+    def get_or_fetch(self, url: str, fetch: Callable[[], Any]):
+        """Return the cycle's response for url, calling fetch only the first time.
+
+        Concurrent callers for the same URL wait for the first one instead
+        of issuing their own request. Exceptions raised by fetch are cached
+        and re-raised.
+        """
+        key = canonicalize_url(url)
+        while True:
+            with self._lock:
+                entry = self._lookup(key)
+                if entry is not None:
+                    return self._result(entry)
+                waiter = self._in_flight.get(key)
+                if waiter is None:
+                    self.misses += 1
+                    self._in_flight[key] = threading.Event()
+                    break
+            waiter.wait()
+
+        response = None
+        error = None
+        try:
+            response = fetch()
+            return response
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            with self._lock:
+                self._store(key, response, error)
+                self._in_flight.pop(key).set()
+
+    async def aget_or_fetch(self, url: str, fetch: Callable[[], Awaitable[Any]]):
+        """Async counterpart of get_or_fetch for the event-loop scraper.
+
+        Concurrent tasks for the same URL await the first one's fetch. If
+        that fetch is cancelled nothing is cached and a waiting task fetches
+        the URL itself.
+        """
+        key = canonicalize_url(url)
+        while True:
+            with self._lock:
+                entry = self._lookup(key)
+                if entry is not None:
+                    return self._result(entry)
+                waiter = self._async_in_flight.get(key)
+                if waiter is None:
+                    self.misses += 1
+                    self._async_in_flight[key] = asyncio.get_running_loop().create_future()
+                    break
+            # Shielded so that cancelling this waiter does not cancel the shared future
+            await asyncio.shield(waiter)
+
+        response = None
+        error = None
+        finished = False
+        try:
+            response = await fetch()
+            finished = True
+            return response
+        except Exception as e:
+            error = e
+            finished = True
+            raise
+        finally:
+            with self._lock:
+                if finished:
+                    self._store(key, response, error)
+                self._async_in_flight.pop(key).set_result(None)
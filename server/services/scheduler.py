@@ -1,26 +1,78 @@
-import schedule
 import time
 import json
 import logging
+import signal
+import threading
 from datetime import datetime
+from typing import Dict, List, Optional
 from .scraper import NewsScraper, save_articles_to_json, load_sources_from_json
 from .ai_rephraser import AIRephraser, save_rephrased_articles
 from .storage_integration import StorageIntegration
+from .pipeline import ScrapePipeline, DEFAULT_BATCH_SIZE, DEFAULT_QUEUE_SIZE
+from .metrics import DEFAULT_METRICS_FILE, DEFAULT_METRICS_PORT
+from .sources import SourceRegistry, DEFAULT_SOURCE_OVERRIDES
+from .source_schedule import (SourceSchedule, ConfigWatcher, DEFAULT_INTERVAL_MINUTES, DEFAULT_SOURCE_REFRESH_MINUTES,
+                              DEFAULT_CYCLE_BUDGET_MINUTES)
+from .poll_history import (PollHistory, DEFAULT_POLL_HISTORY_FILE, DEFAULT_ADAPTIVE_INTERVALS,
+                           DEFAULT_MIN_INTERVAL_MINUTES, DEFAULT_MAX_INTERVAL_MINUTES, DEFAULT_TARGET_NEW_PER_POLL)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+CONFIG_FILE = "scraper_config.json"
+# "sync" scrapes sources one after another with NewsScraper; "async" uses AsyncNewsScraper
+DEFAULT_SCRAPE_ENGINE = "sync"
+
 class NewsScraperScheduler:
-    def __init__(self):
-        self.scraper = NewsScraper()
+    def __init__(self, config_file: str = CONFIG_FILE):
+        self.config_file = config_file
+        config = self.load_config()
+        self.scraper = NewsScraper(config)
         self.rephraser = AIRephraser()
-        self.storage = StorageIntegration()
+        self.storage = StorageIntegration(seen_urls=self.scraper.seen_urls, metrics=self.scraper.metrics)
+        # A JSON snapshot is written after each cycle; Prometheus can scrape /metrics when a port is set
+        self.metrics_file = config.get('metrics_file', DEFAULT_METRICS_FILE)
+        metrics_port = config.get('metrics_port', DEFAULT_METRICS_PORT)
+        if metrics_port:
+            self.scraper.metrics.serve(metrics_port)
+        # The async engine scrapes every due source at once on one event loop; the default is the thread pool engine
+        engine = self.scraper
+        if config.get('scrape_engine', DEFAULT_SCRAPE_ENGINE) == 'async':
+            from .async_scraper import AsyncSourceRunner
+            engine = AsyncSourceRunner(self.scraper, config)
+        # Articles are saved in batches while later sources are still being scraped
+        self.pipeline = ScrapePipeline(
+            engine,
+            self.storage,
+            batch_size=config.get('save_batch_size', DEFAULT_BATCH_SIZE),
+            queue_size=config.get('pipeline_queue_size', DEFAULT_QUEUE_SIZE)
+        )
         self.is_running = False
+        self.is_active = False
+        # Every source has its own next-due time; the loop sleeps until the earliest one
+        self.schedule = SourceSchedule()
+        self.sources: List[Dict] = []
+        self.interval_minutes = DEFAULT_INTERVAL_MINUTES
+        self.source_refresh_minutes = DEFAULT_SOURCE_REFRESH_MINUTES
+        self.cycle_budget_minutes = DEFAULT_CYCLE_BUDGET_MINUTES
+        self.registry = self.scraper.sources
+        self.next_source_refresh = 0.0
+        # Set to wake the loop early: a config reload or a stop
+        self._wake = threading.Event()
+        self._reload_requested = False
+        self.watcher = ConfigWatcher(config_file, self.reload)
+        # Intervals adapt to how often each source actually publishes, within the configured bounds
+        self.poll_history = PollHistory(
+            config.get('poll_history_file', DEFAULT_POLL_HISTORY_FILE),
+            min_interval_minutes=config.get('min_interval_minutes', DEFAULT_MIN_INTERVAL_MINUTES),
+            max_interval_minutes=config.get('max_interval_minutes', DEFAULT_MAX_INTERVAL_MINUTES),
+            target_new_per_poll=config.get('target_new_per_poll', DEFAULT_TARGET_NEW_PER_POLL)
+        ) if config.get('adaptive_intervals', DEFAULT_ADAPTIVE_INTERVALS) else None
         
     def load_config(self) -> dict:
         """Load scraper configuration"""
         try:
-            with open("scraper_config.json", 'r') as f:
+            with open(self.config_file, 'r') as f:
                 return json.load(f)
         except FileNotFoundError:
             return {
@@ -32,40 +84,47 @@ class NewsScraperScheduler:
     def save_config(self, config: dict):
         """Save scraper configuration"""
         try:
-            with open("scraper_config.json", 'w') as f:
+            with open(self.config_file, 'w') as f:
                 json.dump(config, f, indent=2)
+            # The scheduler's own writes are not config changes
+            self.watcher.remember()
         except Exception as e:
             logger.error(f"Error saving config: {str(e)}")
     
-    def scrape_and_rephrase(self):
-        """Main scraping and rephrasing job"""
+    def scrape_and_rephrase(self, sources: Optional[List[Dict]] = None, deadline: Optional[float] = None):
+        """Main scraping and rephrasing job, over the given sources or every active one.
+
+        Sources not started by ``deadline`` are left for the next job.
+        """
         logger.info("Starting scheduled scrape and rephrase job")
         
         try:
             # Get active sources from storage
-            sources = self.storage.get_active_sources()
+            if sources is None:
+                sources = self.storage.get_active_sources()
             if not sources:
                 logger.warning("No active sources configured")
                 return
             
-            # Scrape articles
-            articles = self.scraper.scrape_all_sources(sources)
-            if not articles:
+            # Scrape articles and save them in batches as they are extracted
+            with self.scraper.metrics.time('cycle_seconds', job='scheduler'):
+                stats = self.pipeline.run(sources, deadline=deadline)
+            self.report_cycle_metrics()
+            if not stats['scraped']:
                 logger.warning("No articles scraped")
                 return
             
-            logger.info(f"Scraped {len(articles)} articles")
+            logger.info(f"Scraped {stats['scraped']} articles")
             
-            # Save articles to storage
-            if self.storage.save_scraped_articles(articles):
-                logger.info("Successfully saved articles to storage")
-            else:
+            if stats['batches_failed'] and not stats['batches_saved']:
                 logger.error("Failed to save articles to storage")
                 return
+            logger.info(f"Saved articles to storage in {stats['batches_saved']} batches "
+                        f"({stats['articles_in_failed_batches']} articles in failed batches)")
             
             # AI rephrasing disabled - mark all articles as completed
             logger.info("AI rephrasing disabled - all articles marked as completed")
-            processed_count = len(articles)  # All articles are processed since no AI rephrasing
+            processed_count = stats['scraped']  # All articles are processed since no AI rephrasing
             
             # Update last run time in storage and local config
             self.storage.update_scraper_last_run()
@@ -73,55 +132,182 @@ class NewsScraperScheduler:
             config["last_run"] = datetime.now().isoformat()
             self.save_config(config)
             
-            logger.info(f"Completed job: {len(articles)} articles scraped, {processed_count} processed")
+            logger.info(f"Completed job: {stats['scraped']} articles scraped, {processed_count} processed")
             
         except Exception as e:
             logger.error(f"Error in scheduled job: {str(e)}")
     
+    def report_cycle_metrics(self):
+        """Log where the cycle spent its time and write the cycle's metrics snapshot"""
+        for line in self.scraper.metrics.summary_lines():
+            logger.info(f"Cycle timing: {line}")
+        self.scraper.metrics.write_snapshot(self.metrics_file)
+
+    def reload(self):
+        """Re-read the config at the loop's next wake-up; safe to call from any thread or a signal handler"""
+        self._reload_requested = True
+        self._wake.set()
+
+    def apply_config(self, config: dict):
+        """Take the activity flag and intervals from config and reschedule sources whose interval changed"""
+        was_active = self.is_active
+        self.is_active = config.get("is_active", False)
+        self.interval_minutes = config.get("interval_minutes", DEFAULT_INTERVAL_MINUTES)
+        self.source_refresh_minutes = config.get("source_refresh_minutes", DEFAULT_SOURCE_REFRESH_MINUTES)
+        self.cycle_budget_minutes = config.get("cycle_budget_minutes", DEFAULT_CYCLE_BUDGET_MINUTES)
+        # Only the scheduling fields of the registry are reloaded; other scraper settings need a restart
+        self.registry = SourceRegistry(config.get("source_registry", DEFAULT_SOURCE_OVERRIDES))
+        self.schedule.sync(self.sources, self.interval_seconds)
+        if self.is_active and not was_active:
+            logger.info("Scraper activated")
+            self.next_source_refresh = 0.0
+        elif was_active and not self.is_active:
+            logger.info("Scraper is not active, waiting for a config change...")
+
+    def base_interval_seconds(self, source: Dict) -> float:
+        """The source's registry interval, or the global interval_minutes"""
+        return self.registry.interval_minutes(source['url'], self.interval_minutes) * 60
+
+    def interval_seconds(self, source: Dict) -> float:
+        """The interval learned from the source's poll history, else its base interval"""
+        base = self.base_interval_seconds(source)
+        return self.poll_history.interval(source['url'], base) if self.poll_history else base
+
+    def refresh_sources(self, now: float):
+        """Re-read the active sources from storage and add or drop them from the schedule"""
+        self.next_source_refresh = now + self.source_refresh_minutes * 60
+        sources = self.storage.get_active_sources()
+        if not sources:
+            # Storage may just be unreachable; keep the sources already scheduled
+            logger.warning("No active sources configured")
+            return
+        self.sources = sources
+        self.schedule.sync(sources, self.interval_seconds)
+
+    def run_due_sources(self, due: List[Dict]) -> Dict[str, List[Dict]]:
+        """Scrape the sources that are due as one job within the cycle budget, then queue each for its next run.
+
+        Sources the job did not reach before the deadline are put back at
+        their original due time, so they go first in the next job. Returns
+        the sources that finished, were deferred and failed.
+        """
+        logger.info(f"Sources due: {', '.join(source['name'] for source in due)}")
+        started = time.time()
+        deadline = started + self.cycle_budget_minutes * 60 if self.cycle_budget_minutes else None
+        try:
+            self.scrape_and_rephrase(due, deadline=deadline)
+        finally:
+            finished = time.time()
+            report = self.cycle_report(due, finished - started)
+            intervals = self.learn_intervals(report['finished'], started)
+            for source in report['finished'] + report['failed']:
+                self.schedule.reschedule(source['url'], started, finished, intervals.get(source['url']))
+            for source in report['deferred']:
+                self.schedule.defer(source['url'])
+        return report
+
+    def cycle_report(self, due: List[Dict], seconds: float) -> Dict[str, List[Dict]]:
+        """Sort the job's sources into finished, deferred at the deadline and failed, and log the result"""
+        new_counts = self.scraper.new_articles_by_source
+        deferred_urls = {source['url'] for source in self.scraper.deferred_sources}
+        report = {'finished': [], 'deferred': [], 'failed': []}
+        for source in due:
+            if source['url'] in new_counts:
+                report['finished'].append(source)
+            elif source['url'] in deferred_urls:
+                report['deferred'].append(source)
+            else:
+                report['failed'].append(source)
+
+        for outcome, sources in report.items():
+            if sources:
+                self.scraper.metrics.increment('cycle_sources_total', len(sources), outcome=outcome)
+        logger.info(f"Cycle finished {len(report['finished'])} of {len(due)} sources in {seconds:.1f}s")
+        if report['deferred']:
+            logger.warning(f"Deferred to the next cycle: {', '.join(source['name'] for source in report['deferred'])}")
+        if report['failed']:
+            logger.warning(f"Failed this cycle: {', '.join(source['name'] for source in report['failed'])}")
+        return report
+
+    def learn_intervals(self, sources: List[Dict], polled_at: float) -> Dict[str, float]:
+        """Record how many new articles each source yielded and return their adjusted intervals"""
+        if self.poll_history is None:
+            return {}
+        new_counts = self.scraper.new_articles_by_source
+        intervals = {}
+        for source in sources:
+            # A source that failed before yielding says nothing about its publishing rate
+            if source['url'] not in new_counts:
+                continue
+            interval = self.poll_history.record(source['url'], new_counts[source['url']], polled_at,
+                                                self.base_interval_seconds(source))
+            intervals[source['url']] = interval
+            logger.info(f"{source['name']}: {new_counts[source['url']]} new articles, "
+                        f"next poll in {interval / 60:.1f} minutes")
+        self.poll_history.save()
+        return intervals
+
+    def learned_intervals(self) -> Dict[str, Dict]:
+        """Current poll interval and observed publishing rate per source URL"""
+        return self.poll_history.learned_intervals() if self.poll_history else {}
+
+    def seconds_until_next_event(self, now: float) -> Optional[float]:
+        """How long the loop may sleep: until the next due source or source refresh, or indefinitely when inactive.
+
+        Without a native config watcher the sleep is capped at its poll
+        interval, so edits to the config file are still noticed.
+        """
+        seconds = None
+        if self.is_active:
+            next_event = self.next_source_refresh
+            next_due = self.schedule.next_due()
+            if next_due is not None:
+                next_event = min(next_event, next_due)
+            seconds = max(0.0, next_event - now)
+        if self.watcher.polling:
+            seconds = self.watcher.poll_seconds if seconds is None else min(seconds, self.watcher.poll_seconds)
+        return seconds
+
     def start_scheduler(self):
         """Start the scheduler"""
         self.is_running = True
         logger.info("News scraper scheduler started")
-        
-        # Reset last run when starting to ensure fresh scrape
-        config = self.load_config()
-        config["last_run"] = None
-        self.save_config(config)
-        
+        self.watcher.start()
+        self.apply_config(self.load_config())
+
         while self.is_running:
-            config = self.load_config()
-            
-            if not config.get("is_active", False):
-                logger.info("Scraper is not active, waiting...")
-                time.sleep(60)  # Check every minute
+            if self._reload_requested:
+                self._reload_requested = False
+                try:
+                    self.apply_config(self.load_config())
+                except ValueError as e:
+                    # Caught mid-write; the finished write is noticed on a later check
+                    logger.warning(f"Keeping the current config, could not read {self.config_file}: {str(e)}")
+
+            now = time.time()
+            if self.is_active and now >= self.next_source_refresh:
+                self.refresh_sources(now)
+            due = self.schedule.pop_due() if self.is_active else []
+            if due:
+                self.run_due_sources(due)
                 continue
-            
-            # Schedule the job
-            interval = config.get("interval_minutes", 20)
-            schedule.clear()
-            schedule.every(interval).minutes.do(self.scrape_and_rephrase)
-            
-            # Run immediately if no last run
-            if not config.get("last_run"):
-                logger.info("Running initial scrape...")
-                self.scrape_and_rephrase()
-            
-            # Run scheduled jobs
-            while self.is_running and config.get("is_active", False):
-                schedule.run_pending()
-                time.sleep(30)  # Check every 30 seconds
-                
-                # Reload config to check for changes
-                config = self.load_config()
+
+            # Sleep until something is due; reload() and stop_scheduler() wake the loop early
+            self._wake.wait(self.seconds_until_next_event(time.time()))
+            self._wake.clear()
+            self.watcher.check()
     
     def stop_scheduler(self):
         """Stop the scheduler"""
         self.is_running = False
-        schedule.clear()
+        self.watcher.stop()
+        self._wake.set()
         logger.info("News scraper scheduler stopped")
 
 if __name__ == "__main__":
     scheduler = NewsScraperScheduler()
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, lambda signum, frame: scheduler.reload())
     
     try:
         scheduler.start_scheduler()
@@ -2,17 +2,42 @@ import requests
 from bs4 import BeautifulSoup
 import json
 import time
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 import logging
 from newspaper import Article
+from newspaper.network import get_html_2XX_only
+from newspaper.utils import extract_meta_refresh
 import re
+from .extraction_pool import ExtractionPool, DEFAULT_MAX_WORKERS, DEFAULT_PER_DOMAIN_CONCURRENCY
+from .feed_cache import FeedCache, DEFAULT_FEED_CACHE_FILE
+from .feed_parser import parse_feed, parse_feed_date, description_text
+from .partial_fetch import (HeadBuffer, PageBuffer, NotHTMLError, is_html_content_type, DEFAULT_HEAD_MAX_BYTES,
+                            DEFAULT_PAGE_MAX_BYTES, DEFAULT_STOP_EARLY, PAGE_CHUNK_BYTES)
+from .seen_urls import SeenUrlIndex, DEFAULT_SEEN_URLS_FILE, DEFAULT_SEEN_URL_TTL_HOURS
+from .keyword_classifier import default_classifier
+from .enrichment import ArticleEnricher, DEFAULT_ENRICH_NLP, DEFAULT_PROBE_IMAGES
+from .html_cache import HtmlCache, DEFAULT_HTML_CACHE_DIR, DEFAULT_HTML_CACHE_MAX_MB, DEFAULT_HTML_CACHE_TTL_HOURS
+from .metrics import MetricsRegistry
+from .response_cache import ResponseCache, DEFAULT_RESPONSE_CACHE_BYTES
+from .parse_pool import ParsePool, DEFAULT_PARSE_WORKERS
+from .near_duplicates import NearDuplicateIndex, DEFAULT_NEAR_DUPLICATE_FILE, DEFAULT_NEAR_DUPLICATE_TTL_HOURS
+from .sources import SourceRegistry, RSS_FEEDS, SCRAPE_DEPTHS, DEFAULT_SCRAPE_DEPTH, DEFAULT_SOURCE_OVERRIDES, DEFAULT_FEED_TIMEOUT, DEFAULT_FEED_ITEM_LIMIT, DEFAULT_INDEX_TIMEOUT, DEFAULT_COMPREHENSIVE_TIMEOUT
+from .rate_limiter import HostRateLimiter, RateLimitedAdapter, DEFAULT_HOST_REQUESTS_PER_SECOND, DEFAULT_HOST_BURST
+from .html_extract import parse_html, extract_content, extract_content_with_media, extract_image_url, extract_media_links, extract_head_meta
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Articles each source is expected to contribute per cycle (10 Indian + 10 International)
+ARTICLES_PER_SOURCE = 20
+
+# Stand-in images used when an article page has no image of its own
+PLACEHOLDER_IMAGE_PREFIX = "https://via.placeholder.com/"
+
 class NewsScraper:
-    def __init__(self):
+    def __init__(self, config: Optional[Dict] = None):
+        config = config or {}
         self.session = requests.Session()
         # Enhanced headers to bypass bot detection
         self.session.headers.update({
@@ -28,8 +53,10 @@ class NewsScraper:
             'Cache-Control': 'max-age=0'
         })
         
+        # Timings and counters for this scraper, shared with storage and reported after each cycle
+        self.metrics = MetricsRegistry()
+
         # Add retry strategy
-        from requests.adapters import HTTPAdapter
         from urllib3.util.retry import Retry
         
         retry_strategy = Retry(
@@ -37,50 +64,383 @@ class NewsScraper:
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Per-host politeness shared by every request this scraper makes
+        self.rate_limiter = HostRateLimiter(
+            requests_per_second=config.get('host_requests_per_second', DEFAULT_HOST_REQUESTS_PER_SECOND),
+            burst=config.get('host_burst', DEFAULT_HOST_BURST)
+        )
+        # Pool size matches the extraction workers so parallel downloads reuse connections
+        max_workers = config.get('extraction_workers', DEFAULT_MAX_WORKERS)
+        adapter = RateLimitedAdapter(self.rate_limiter, max_retries=retry_strategy,
+                                     pool_connections=max_workers, pool_maxsize=max_workers)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
+        # Every page fetched this cycle, so fallbacks never download the same URL twice
+        self.response_cache = ResponseCache(config.get('response_cache_bytes', DEFAULT_RESPONSE_CACHE_BYTES))
+        # Page bodies are streamed and cut off at this size; article pages can stop once their content has closed
+        self.page_max_bytes = config.get('page_max_bytes', DEFAULT_PAGE_MAX_BYTES)
+        self.page_stop_early = config.get('page_stop_early', DEFAULT_STOP_EARLY)
+
+        # Raw article HTML kept on disk, so crashed runs and extraction changes need no re-download;
+        # replay mode extracts from it only and never uses the network
+        html_cache_dir = config.get('html_cache_dir', DEFAULT_HTML_CACHE_DIR)
+        self.html_cache = HtmlCache(
+            html_cache_dir,
+            max_mb=config.get('html_cache_max_mb', DEFAULT_HTML_CACHE_MAX_MB),
+            ttl_hours=config.get('html_cache_ttl_hours', DEFAULT_HTML_CACHE_TTL_HOURS)
+        ) if html_cache_dir else None
+        self.replay_mode = config.get('replay_mode', False)
+
+        # Validators from previous feed fetches, so unchanged feeds come back as 304
+        feed_cache_file = config.get('feed_cache_file', DEFAULT_FEED_CACHE_FILE)
+        self.feed_cache = FeedCache(feed_cache_file) if feed_cache_file else None
+
+        # Keyword lists are compiled once per process and shared
+        self.classifier = default_classifier
+
+        # Near-duplicate stories are dropped within a source, across sources and across cycles
+        self.near_duplicates = NearDuplicateIndex(
+            config.get('near_duplicate_file', DEFAULT_NEAR_DUPLICATE_FILE),
+            ttl_hours=config.get('near_duplicate_ttl_hours', DEFAULT_NEAR_DUPLICATE_TTL_HOURS)
+        )
+
+        # Articles already saved to storage are skipped before extraction
+        seen_urls_file = config.get('seen_urls_file', DEFAULT_SEEN_URLS_FILE)
+        self.seen_urls = SeenUrlIndex(
+            seen_urls_file,
+            ttl_hours=config.get('seen_url_ttl_hours', DEFAULT_SEEN_URL_TTL_HOURS)
+        ) if seen_urls_file else None
+
+        # Feeds, index parsers and per-host tuning for each known source, looked up by host
+        self.sources = SourceRegistry(config.get('source_registry', DEFAULT_SOURCE_OVERRIDES))
+        # How much of each feed article is fetched, unless the source's row says otherwise
+        self.scrape_depth = config.get('scrape_depth', DEFAULT_SCRAPE_DEPTH)
+
+        # Article pages are collected first and then extracted in parallel
+        self.extraction_pool = ExtractionPool(
+            max_workers=max_workers,
+            per_domain_concurrency=config.get('per_domain_concurrency', DEFAULT_PER_DOMAIN_CONCURRENCY),
+            host_concurrency=self.sources.concurrency
+        )
+
+        # Downloaded HTML is parsed in worker processes when there are cores to spare
+        parse_workers = config.get('parse_workers', DEFAULT_PARSE_WORKERS)
+        self.parse_pool = ParsePool(parse_workers) if parse_workers else None
+
+        # NLP keywords/summary and image probing only run when config asks for them
+        self.enricher = ArticleEnricher(
+            self.session,
+            self.extraction_pool,
+            nlp_enabled=config.get('enrich_nlp', DEFAULT_ENRICH_NLP),
+            probe_images=config.get('probe_images', DEFAULT_PROBE_IMAGES)
+        )
+
+        self.new_articles_by_source: Dict[str, int] = {}
+        self.deferred_sources: List[Dict] = []
+
+        self.register_cache_metrics()
+
+    def register_cache_metrics(self):
+        """Report the hit and skip counters the caches and indexes already keep"""
+        self.metrics.register_source('cache_hits_total', lambda: self.response_cache.hits, cache='response')
+        self.metrics.register_source('cache_misses_total', lambda: self.response_cache.misses, cache='response')
+        if self.html_cache is not None:
+            self.metrics.register_source('cache_hits_total', lambda: self.html_cache.hits, cache='html')
+            self.metrics.register_source('cache_misses_total', lambda: self.html_cache.misses, cache='html')
+        if self.feed_cache is not None:
+            self.metrics.register_source('cache_hits_total', lambda: self.feed_cache.hits, cache='feed')
+            self.metrics.register_source('cache_misses_total', lambda: self.feed_cache.misses, cache='feed')
+        if self.seen_urls is not None:
+            self.metrics.register_source('articles_skipped_total', lambda: self.seen_urls.skipped, reason='seen')
+        self.metrics.register_source('articles_skipped_total', lambda: self.near_duplicates.skipped, reason='near_duplicate')
+
+    def timed_get(self, url: str, stop_early: Optional[bool] = None, **kwargs):
+        """session.get that records latency, bytes, retries and failures for the URL's host.
+
+        With ``stop_early`` set (True or False) the response is an HTML page
+        whose body is streamed through ``read_page_body`` inside the timing.
+        """
+        host = urlparse(url).netloc.lower()
+        try:
+            with self.metrics.time('fetch_seconds', host=host):
+                if stop_early is None:
+                    response = self.session.get(url, **kwargs)
+                else:
+                    response = self.read_page_body(self.session.get(url, stream=True, **kwargs), stop_early)
+        except requests.exceptions.RequestException:
+            self.metrics.increment('fetch_failures_total', host=host)
+            raise
+        except NotHTMLError:
+            self.metrics.increment('pages_rejected_total', host=host)
+            raise
+
+        self.metrics.increment('fetched_bytes_total', len(response.content), host=host)
+        # urllib3 records each retry it made before returning this response
+        history = getattr(getattr(response.raw, 'retries', None), 'history', None)
+        if history:
+            self.metrics.increment('fetch_retries_total', len(history), host=host)
+        if response.status_code >= 400:
+            self.metrics.increment('fetch_failures_total', host=host)
+        return response
+
+    def fetch_page(self, url: str, timeout: float = 15, stop_early: bool = False):
+        """GET a page through the pooled session, at most once per cycle; raises for HTTP errors.
+
+        Non-HTML responses raise NotHTMLError before their body is read. Set
+        ``stop_early`` for article pages, which need nothing after their main
+        content container.
+        """
+        if self.replay_mode:
+            raise requests.exceptions.ConnectionError(f"Replay mode: not fetching {url}")
+
+        def fetch():
+            response = self.timed_get(url, stop_early=stop_early and self.page_stop_early,
+                                      timeout=timeout, allow_redirects=True)
+            response.raise_for_status()
+            return response
+
+        return self.response_cache.get_or_fetch(url, fetch)
+
+    def read_page_body(self, response, stop_early: bool = False):
+        """Read a streamed response's body into ``response.content``, up to page_max_bytes"""
+        if response.status_code < 400:
+            content_type = response.headers.get('Content-Type')
+            if not is_html_content_type(content_type):
+                response.close()
+                raise NotHTMLError(f"Not an HTML page ({content_type}): {response.url}")
+
+        page = PageBuffer(self.page_max_bytes, stop_early=stop_early)
+        try:
+            for chunk in response.iter_content(chunk_size=PAGE_CHUNK_BYTES):
+                if page.feed(chunk):
+                    # Unread bytes are still on the wire; drop the connection instead of reusing it
+                    if response.raw is not None:
+                        response.raw.close()
+                    break
+        except Exception:
+            response.close()
+            raise
+        if page.truncated:
+            logger.debug(f"Page cut off at {self.page_max_bytes} bytes: {response.url}")
+        response._content = page.content()
+        response._content_consumed = True
+        response.close()
+        return response
+
+    def fetch_page_head(self, url: str, max_bytes: int = DEFAULT_HEAD_MAX_BYTES, timeout: float = 10) -> str:
+        """The start of a page up to its </head>, read from a stream without downloading the body"""
+        if self.replay_mode:
+            raise requests.exceptions.ConnectionError(f"Replay mode: not fetching {url}")
+        host = urlparse(url).netloc.lower()
+        head = HeadBuffer(max_bytes)
+        try:
+            with self.metrics.time('fetch_seconds', host=host):
+                with self.session.get(url, timeout=timeout, stream=True, headers=head.range_header()) as response:
+                    if response.status_code >= 400:
+                        self.metrics.increment('fetch_failures_total', host=host)
+                    response.raise_for_status()
+                    for chunk in response.iter_content(chunk_size=16384):
+                        if head.feed(chunk):
+                            break
+                    encoding = response.encoding
+        except requests.exceptions.RequestException:
+            if not head.complete:
+                self.metrics.increment('fetch_failures_total', host=host)
+            raise
+        self.metrics.increment('fetched_bytes_total', len(head), host=host)
+        return head.text(encoding)
+
+    def start_cycle(self):
+        """Forget the previous cycle's responses and start the cycle's metrics window"""
+        self.response_cache.clear()
+        self.metrics.begin_cycle()
+
+    def finish_cycle(self):
+        """Persist what the cycle added to the on-disk HTML cache"""
+        if self.html_cache is not None:
+            self.html_cache.flush()
+
+    def skip_seen(self, articles: List[Dict]) -> List[Dict]:
+        """Drop candidates whose URL is already in storage according to the seen-URL index"""
+        return self.seen_urls.filter_new(articles) if self.seen_urls else articles
+
+    def extract_articles(self, articles: List[Dict]) -> List[Dict]:
+        """Extract full content for new article candidates in parallel"""
+        articles = self.skip_seen(articles)
+        details = self.extraction_pool.map(
+            lambda article: self.extract_full_article(article['url']) if article.get('url') else {},
+            articles,
+            key=lambda article: article.get('url', '')
+        )
+        for article, article_details in zip(articles, details):
+            article.update(article_details or {})
+        return articles
+
+    def _extract_with_feed_fallback(self, article_url: str, description: str, source_name: str) -> Dict:
+        """Extract an article, falling back to the feed description and a direct fetch"""
+        article_details = self.extract_full_article(article_url) if article_url else {}
+
+        # Use RSS description as fallback if full content extraction fails
+        if not article_details.get('fullContent') and description:
+            article_details['fullContent'] = description
+
+        # If still no content, try direct scraping
+        if not article_details.get('fullContent') and article_url:
+            try:
+                direct_response = self.fetch_page(article_url, timeout=8, stop_early=True)
+                fallback_content = self._extract_content_fallback(article_url, direct_response.text)
+                if fallback_content:
+                    article_details['fullContent'] = fallback_content
+            except:
+                pass
+
+        # Ensure we always have some content
+        if not article_details.get('fullContent'):
+            article_details['fullContent'] = f"Complete article available at {source_name}: {article_url}"
+
+        return article_details
+
+    def extract_articles_with_feed_fallback(self, articles: List[Dict], descriptions: Dict[str, str]) -> List[Dict]:
+        """Parallel extraction for feeds whose descriptions back up failed extractions"""
+        articles = self.skip_seen(articles)
+        details = self.extraction_pool.map(
+            lambda article: self._extract_with_feed_fallback(article['url'], descriptions.get(article['url'], ''), article['source']),
+            articles,
+            key=lambda article: article.get('url', ''),
+            default={}
+        )
+        for article, article_details in zip(articles, details):
+            self.label_feed_article(article, article_details or {})
+        return articles
+
+    def label_feed_article(self, article: Dict, article_details: Dict) -> Dict:
+        """Attach category, region and extracted details to a description-fallback feed article"""
+        content = article_details.get('fullContent') or article.get('fullContent') or ''
+        # Feed labels have always judged the region on the title alone
+        article['category'], article['region'] = self.label_article(article['title'], content, article['source'],
+                                                                    region_from_title=True)
+        article.update(article_details)
+        return article
+
+    @staticmethod
+    def _empty_article_details() -> Dict:
+        return {
+            'fullContent': None,
+            'excerpt': None,
+            'publishedAt': None,
+            'imageUrl': None,
+            'author': None
+        }
+
+    def _build_article(self, url: str) -> Article:
+        """Create a newspaper3k Article with the scraper's extraction settings"""
+        # Enhanced article extraction with comprehensive content parsing
+        article = Article(url)
+        article.config.request_timeout = 15  # Increased timeout for complete extraction
+        article.config.browser_user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        article.config.follow_meta_refresh = True
+        # Sizing candidate images means downloading them; that is left to the optional enrichment stage
+        article.config.fetch_images = False
+        article.config.memoize_articles = False
+        return article
+
+    @staticmethod
+    def is_article_url(url: str) -> bool:
+        """Check that a link is an absolute http(s) URL worth downloading"""
+        return bool(url) and not url.startswith('#') and not url.startswith('javascript:') and url.startswith(('http://', 'https://'))
+
     def extract_full_article(self, url: str) -> Dict:
         """Extract complete article content including embedded media links"""
+        if not self.is_article_url(url):
+            return self._empty_article_details()
+
         try:
-            if not url or url.startswith('#') or url.startswith('javascript:') or not url.startswith(('http://', 'https://')):
-                return {
-                    'fullContent': None,
-                    'excerpt': None,
-                    'publishedAt': None,
-                    'imageUrl': None,
-                    'author': None
-                }
+            html = self.download_article_html(url, self._build_article(url).config)
+        except NotHTMLError as e:
+            logger.debug(f"Skipping {url}: {str(e)}")
+            return self._empty_article_details()
+        except requests.exceptions.RequestException as e:
+            # Same as a failed newspaper3k download: nothing to extract
+            logger.debug(f"Download failed for {url}: {str(e)}")
+            return self._empty_article_details()
+        except Exception as e:
+            logger.warning(f"Failed to extract full article from {url}: {str(e)}")
+            return self._empty_article_details()
+
+        return self.extract_article_from_html(url, html)
+
+    def download_article_html(self, url: str, article_config) -> str:
+        """What Article.download() fetched, but through the pooled session and the cycle's response cache"""
+        html = self.html_cache.get(url) if self.html_cache is not None else None
+        if html is not None:
+            return html
+
+        response = self.fetch_page(url, timeout=article_config.request_timeout, stop_early=True)
+        html = get_html_2XX_only(url, article_config, response=response)
+        if article_config.follow_meta_refresh:
+            # newspaper3k follows one meta refresh hop
+            meta_refresh_url = extract_meta_refresh(html)
+            if meta_refresh_url:
+                refreshed = self.fetch_page(meta_refresh_url, timeout=article_config.request_timeout, stop_early=True)
+                html = get_html_2XX_only(meta_refresh_url, article_config, response=refreshed)
+        if self.html_cache is not None:
+            self.html_cache.put(url, html)
+        return html
+
+    def iter_replayed_articles(self) -> Iterator[Dict]:
+        """Re-run extraction over every page in the HTML cache without touching the network"""
+        if self.html_cache is None:
+            return
+        for url, html in self.html_cache.iter_pages():
+            article_details = self.extract_article_from_html(url, html)
+            article_details['url'] = url
+            yield article_details
+
+    def extract_article_from_html(self, url: str, html: str) -> Dict:
+        """Extract article details from HTML that was already downloaded"""
+        if not html:
+            return self._empty_article_details()
+
+        if self.parse_pool is not None:
+            with self.metrics.time('extract_seconds'):
+                article_details = self.parse_pool.extract(url, html)
+            if article_details is not None:
+                return article_details
 
-            # Enhanced article extraction with comprehensive content parsing
-            article = Article(url)
-            article.config.request_timeout = 15  # Increased timeout for complete extraction
-            article.config.browser_user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            article.config.follow_meta_refresh = True
-            article.config.fetch_images = True
-            article.config.memoize_articles = False
-            
-            article.download()
+        try:
+            article = self._build_article(url)
+            article.set_html(html)
+        except Exception as e:
+            logger.warning(f"Failed to extract full article from {url}: {str(e)}")
+            return self._empty_article_details()
+
+        with self.metrics.time('extract_seconds'):
+            return self._extract_from_article(url, article)
+
+    def _extract_from_article(self, url: str, article: Article) -> Dict:
+        """Turn a downloaded newspaper3k Article into the scraper's article fields"""
+        try:
+            content = ""
+            excerpt = None
+            tree = None
             if article.html:
-                article.parse()
-                
-                # Enable NLP processing for better content extraction
-                try:
-                    article.nlp()
-                except:
-                    pass  # Continue without NLP if it fails
+                with self.metrics.time('parse_seconds', kind='article'):
+                    article.parse()
 
                 # Extract complete content with enhanced fallback
                 content = article.text.strip() if article.text else ""
                 
+                # newspaper3k already parsed the page; reuse its untouched tree for every extractor below
+                tree = article.clean_doc if article.clean_doc is not None else parse_html(article.html)
+
                 # Fallback content extraction if newspaper3k fails
                 if not content or len(content) < 100:
-                    content = self._extract_content_fallback(url, article.html)
+                    content = self._content_from_tree(url, tree)
                 
                 # Additional enhancement: Extract and preserve embedded media URLs
-                if article.html and content:
-                    media_content = self._extract_media_links(article.html, url)
+                if content:
+                    media_content = self._media_links_from_tree(tree, url)
                     if media_content:
                         content = content + "\n\n" + media_content
                 
@@ -98,62 +458,14 @@ class NewsScraper:
             if article.top_image and article.top_image.startswith(('http://', 'https://')):
                 image_url = article.top_image
 
-            # Method 2: Optimized meta tags search (fewer selectors for speed)
-            if not image_url and hasattr(article, 'html') and article.html:
+            # Methods 2-4: meta tags, first inline images, figure/picture elements
+            if not image_url and tree is not None:
                 try:
-                    soup = BeautifulSoup(article.html, 'html.parser')
-                    
-                    # Try only the most common meta tag variations for speed
-                    meta_selectors = [
-                        'meta[property="og:image"]',
-                        'meta[name="twitter:image"]',
-                        'meta[property="twitter:image"]'
-                    ]
-                    
-                    for selector in meta_selectors:
-                        meta_tag = soup.select_one(selector)
-                        if meta_tag and meta_tag.get('content'):
-                            candidate_url = meta_tag.get('content')
-                            if candidate_url.startswith(('http://', 'https://')):
-                                image_url = candidate_url
-                                break
-                    
-                    # Method 3: Simplified img tag search for speed
-                    if not image_url:
-                        img_tags = soup.find_all('img', src=True, limit=5)  # Limit to first 5 images
-                        for img in img_tags:
-                            src = img.get('src')
-                            if src:
-                                # Convert relative URLs to absolute
-                                if src.startswith('//'):
-                                    src = 'https:' + src
-                                elif src.startswith('/'):
-                                    from urllib.parse import urljoin
-                                    src = urljoin(url, src)
-                                
-                                if src.startswith(('http://', 'https://')):
-                                    # Quick skip for obvious unwanted images
-                                    if any(skip in src.lower() for skip in ['logo', 'icon', 'pixel', '1x1']):
-                                        continue
-                                    
-                                    # Take the first valid image for speed
-                                    image_url = src
-                                    break
-                    
-                    # Method 4: Look for figure or picture elements
-                    if not image_url:
-                        figure_imgs = soup.select('figure img, picture img, .image img')
-                        for img in figure_imgs:
-                            src = img.get('src')
-                            if src and src.startswith(('http://', 'https://')):
-                                image_url = src
-                                break
-                                
+                    image_url = extract_image_url(tree, url)
                 except Exception as e:
                     logger.warning(f"Error extracting image from HTML: {str(e)}")
-                    pass
             
-            # Method 4: Generate placeholder image URL based on source
+            # Method 5: Generate placeholder image URL based on source
             if not image_url:
                 # Create a placeholder image URL based on the source domain
                 try:
@@ -202,1176 +514,392 @@ class NewsScraper:
                     'author': ', '.join(article.authors) if article.authors else None
                 }
             else:
-                return {
-                    'fullContent': None,
-                    'excerpt': None,
-                    'publishedAt': None,
-                    'imageUrl': None,
-                    'author': None
-                }
+                return self._empty_article_details()
         except Exception as e:
             logger.warning(f"Failed to extract full article from {url}: {str(e)}")
-            return {
-                'fullContent': None,
-                'excerpt': None,
-                'publishedAt': None,
-                'imageUrl': None,
-                'author': None
-            }
+            return self._empty_article_details()
 
     def _extract_content_fallback(self, url: str, html: str) -> str:
         """Enhanced fallback content extraction for all news sites"""
+        return self._content_from_tree(url, parse_html(html))
+
+    def _content_from_tree(self, url: str, tree) -> str:
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Remove unwanted elements
-            for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'form', 'iframe', 'noscript']):
-                element.decompose()
-            
-            domain = urlparse(url).netloc.lower()
-            
-            # Site-specific selectors for better content extraction
-            site_selectors = {
-                'timesofindia.indiatimes.com': [
-                    '.Normal', '.ga-headline', '._s30J', '.yYiw2',
-                    '.story_content', '.article_content', '.article-body',
-                    '.story-body', '.post-content', '.content-body'
-                ],
-                'indiatoday.in': [
-                    '.story-details', '.story-content', '.description',
-                    '.content-body', '.post-content', '.story-body'
-                ],
-                'ndtv.com': [
-                    '.ins_storybody', '.story-content', '.content-body',
-                    '.article-body', '.story-body', '.post-content'
-                ],
-                'thehindu.com': [
-                    '.articlebodycontent', '.article-body', '.story-content',
-                    '.content-body', '.post-content', '.story-body'
-                ],
-                'economictimes.indiatimes.com': [
-                    '.Normal', '.articleText', '.article-body',
-                    '.story-content', '.content-body', '.post-content'
-                ],
-                'bbc.com': [
-                    '.story-body__inner', '.story-body', '.article-body',
-                    '.content-body', '.post-content'
-                ],
-                'cnn.com': [
-                    '.zn-body__paragraph', '.paragraph', '.article-body',
-                    '.story-body', '.content-body'
-                ],
-                'techcrunch.com': [
-                    '.article-content', '.entry-content', '.post-content',
-                    '.article-body', '.story-body'
-                ],
-                'theverge.com': [
-                    '.duet--article--article-body-component', '.article-body',
-                    '.entry-content', '.post-content'
-                ]
-            }
-            
-            # Try site-specific selectors first
-            content = ""
-            if any(site in domain for site in site_selectors):
-                for site in site_selectors:
-                    if site in domain:
-                        for selector in site_selectors[site]:
-                            elements = soup.select(selector)
-                            if elements:
-                                content = ' '.join([elem.get_text(strip=True) for elem in elements])
-                                if len(content) > 300:  # Found substantial content
-                                    break
-                        if len(content) > 300:
-                            break
-            
-            # If site-specific failed, try common selectors
-            if not content or len(content) < 300:
-                common_selectors = [
-                    'article', '[role="main"]', '.article-content', '.story-content',
-                    '.post-content', '.content', '.entry-content', '.article-body',
-                    '.story-body', 'main', '.content-body', '.article-text'
-                ]
-                
-                for selector in common_selectors:
-                    elements = soup.select(selector)
-                    if elements:
-                        content = ' '.join([elem.get_text(strip=True) for elem in elements])
-                        if len(content) > 300:  # Found substantial content
-                            break
-            
-            # If still no good content, try paragraph extraction with better filtering
-            if not content or len(content) < 300:
-                paragraphs = soup.find_all('p')
-                paragraph_texts = []
-                for p in paragraphs:
-                    text = p.get_text(strip=True)
-                    # Filter out short paragraphs, navigation, and ads
-                    if (len(text) > 50 and 
-                        not any(skip in text.lower() for skip in ['subscribe', 'advertisement', 'follow us', 'share', 'tweet', 'facebook', 'copyright', 'terms of service', 'privacy policy', 'cookie policy'])):
-                        paragraph_texts.append(text)
-                
-                content = ' '.join(paragraph_texts)
-            
-            # Clean up the content
-            content = content.strip()
-            
-            # Remove duplicate sentences (common in news sites)
-            if content:
-                sentences = content.split('. ')
-                unique_sentences = []
-                seen = set()
-                for sentence in sentences:
-                    if sentence not in seen and len(sentence) > 20:
-                        unique_sentences.append(sentence)
-                        seen.add(sentence)
-                content = '. '.join(unique_sentences)
-            
-            return content
-            
+            return extract_content(tree, url)
         except Exception as e:
             logger.warning(f"Fallback content extraction failed for {url}: {str(e)}")
             return ""
 
     def _extract_media_links(self, html: str, base_url: str) -> str:
         """Extract media links and embedded content from HTML"""
+        return self._media_links_from_tree(parse_html(html), base_url)
+
+    def _media_links_from_tree(self, tree, base_url: str) -> str:
         try:
-            from bs4 import BeautifulSoup
-            from urllib.parse import urljoin
-            
-            soup = BeautifulSoup(html, 'html.parser')
-            media_links = []
-            
-            # Extract image links
-            for img in soup.find_all('img', src=True):
-                src = img.get('src')
-                if src:
-                    if src.startswith('//'):
-                        src = 'https:' + src
-                    elif src.startswith('/'):
-                        src = urljoin(base_url, src)
-                    
-                    if src.startswith(('http://', 'https://')):
-                        alt_text = img.get('alt', 'Image')
-                        media_links.append(f"[IMAGE: {alt_text}] {src}")
-            
-            # Extract video links
-            for video in soup.find_all('video', src=True):
-                src = video.get('src')
-                if src:
-                    if src.startswith('//'):
-                        src = 'https:' + src
-                    elif src.startswith('/'):
-                        src = urljoin(base_url, src)
-                    
-                    if src.startswith(('http://', 'https://')):
-                        media_links.append(f"[VIDEO] {src}")
-            
-            # Extract iframe embeds (YouTube, Twitter, etc.)
-            for iframe in soup.find_all('iframe', src=True):
-                src = iframe.get('src')
-                if src and ('youtube' in src or 'twitter' in src or 'instagram' in src):
-                    media_links.append(f"[EMBEDDED] {src}")
-            
-            return '\n'.join(media_links) if media_links else ""
-            
+            return extract_media_links(tree, base_url)
         except Exception as e:
             logger.warning(f"Media extraction failed: {str(e)}")
             return ""
 
     def _extract_complete_content_with_media(self, url: str, html: str) -> str:
         """Enhanced content extraction preserving media links and embedded content"""
+        tree = parse_html(html)
         try:
-            from bs4 import BeautifulSoup
-            from urllib.parse import urljoin
-            
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Remove unwanted elements but preserve media containers
-            for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'form', 'ads']):
-                element.decompose()
-            
-            # Try enhanced article selectors
-            content_selectors = [
-                'article',
-                '[role="main"]',
-                '.article-content',
-                '.post-content',
-                '.entry-content',
-                '.content',
-                '.story-body',
-                '.article-body',
-                '.article-text',
-                '.post-body',
-                'main'
-            ]
-            
-            content_parts = []
-            for selector in content_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    # Extract text with media link preservation
-                    for child in element.descendants:
-                        if child.name == 'p':
-                            text = child.get_text(strip=True)
-                            if text and len(text) > 20:
-                                content_parts.append(text)
-                        elif child.name == 'img' and child.get('src'):
-                            img_src = child.get('src')
-                            if img_src.startswith('//'):
-                                img_src = 'https:' + img_src
-                            elif img_src.startswith('/'):
-                                img_src = urljoin(url, img_src)
-                            
-                            if img_src.startswith(('http://', 'https://')):
-                                alt_text = child.get('alt', 'Image')
-                                content_parts.append(f"[IMAGE: {alt_text}] {img_src}")
-                        elif child.name == 'video' and child.get('src'):
-                            video_src = child.get('src')
-                            if video_src.startswith('//'):
-                                video_src = 'https:' + video_src
-                            elif video_src.startswith('/'):
-                                video_src = urljoin(url, video_src)
-                            
-                            if video_src.startswith(('http://', 'https://')):
-                                content_parts.append(f"[VIDEO] {video_src}")
-                        elif child.name == 'iframe' and child.get('src'):
-                            iframe_src = child.get('src')
-                            if 'youtube' in iframe_src or 'twitter' in iframe_src or 'instagram' in iframe_src:
-                                content_parts.append(f"[EMBEDDED] {iframe_src}")
-                    
-                    if content_parts:
-                        break
-            
+            content = extract_content_with_media(tree, url)
             # Fallback to comprehensive text extraction
-            if not content_parts:
-                return self._extract_content_fallback(url, html)
-            
-            return '\n\n'.join(content_parts) if content_parts else ""
-            
+            return content or self._content_from_tree(url, tree)
         except Exception as e:
             logger.warning(f"Enhanced content extraction failed: {str(e)}")
-            return self._extract_content_fallback(url, html)
-
-    def scrape_bbc_news(self, url: str) -> List[Dict]:
-        """Scrape BBC News headlines"""
-        try:
-            # Try RSS feed first as it's more reliable
-            rss_url = "http://feeds.bbci.co.uk/news/rss.xml"
-            response = self.session.get(rss_url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
-
-            # Parse RSS feed - get up to 25 items
-            items = soup.find_all('item')[:25]
-
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-
-                if title_elem and title_elem.text:
-                    title = title_elem.text.strip()
-                    if len(title) > 20:
-                        article_url = link_elem.text.strip() if link_elem else ""
-
-                        # Extract full article content
-                        article_details = self.extract_full_article(article_url) if article_url else {}
-
-                        articles.append({
-                            'title': title,
-                            'url': article_url,
-                            'source': 'BBC News',
-                            **article_details
-                        })
-
-            return articles
-
-        except Exception as e:
-            logger.error(f"Error scraping BBC News RSS: {str(e)}")
-            # Fallback to generic scraping
-            return self.scrape_generic_news(url, "BBC News")
-
-    def scrape_reuters(self, url: str) -> List[Dict]:
-        """Scrape Reuters headlines"""
-        try:
-            # Direct web scraping with enhanced headers
-            response = self.session.get(url, timeout=15, allow_redirects=True)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-            articles = []
-
-            # Multiple selectors for Reuters articles
-            article_selectors = [
-                'div[data-testid="ArticleCard"]',
-                'article',
-                '.story-card',
-                '.media-story-card__headline__eqhp9',
-                '.media-story-card__body__3tRWy',
-                '[data-testid="Heading"]',
-                '.media-story-card',
-                'h3 a',
-                'h2 a',
-                'h1 a'
-            ]
-
-            for selector in article_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    for element in elements[:30]:  # Get more elements for better filtering
-                        title_elem = element.find('h3') or element.find('h2') or element.find('h1') or element.find('a')
-                        if title_elem:
-                            title = title_elem.get_text(strip=True)
-                            if len(title) > 20:
-                                # Find the article URL
-                                link_elem = element.find('a') or title_elem
-                                if link_elem and link_elem.get('href'):
-                                    article_url = link_elem.get('href')
-                                    if article_url.startswith('/'):
-                                        article_url = urljoin(url, article_url)
-                                    elif not article_url.startswith(('http://', 'https://')):
-                                        continue
-
-                                    # Extract full article content
-                                    article_details = self.extract_full_article(article_url)
-
-                                    articles.append({
-                                        'title': title,
-                                        'url': article_url,
-                                        'source': 'Reuters',
-                                        **article_details
-                                    })
-
-                    if articles:
-                        break
-
+            return self._content_from_tree(url, tree)
+
+    def parse_feed_items(self, content: bytes, item_limit: int) -> List[Dict]:
+        """Stream-parse RSS or Atom into title/link/description/date/image records"""
+        with self.metrics.time('parse_seconds', kind='feed'):
+            return parse_feed(content, item_limit)
+
+    def fetch_feed_items(self, source_key: str) -> List[Dict]:
+        """Download and parse the RSS feed of the source registered under source_key"""
+        source = self.sources[source_key]
+        rss_url = source['rss_url']
+        if self.replay_mode:
+            raise requests.exceptions.ConnectionError(f"Replay mode: not fetching {rss_url}")
+        headers = self.feed_cache.conditional_headers(rss_url) if self.feed_cache else {}
+        response = self.timed_get(rss_url, timeout=DEFAULT_FEED_TIMEOUT, headers=headers)
+        if response.status_code == 304 and self.feed_cache:
+            return self.cached_feed_items(rss_url)
+        response.raise_for_status()
+
+        feed_items = self.parse_feed_items(response.content, source.get('item_limit', DEFAULT_FEED_ITEM_LIMIT))
+        if self.feed_cache:
+            self.feed_cache.store(rss_url, response.headers, feed_items)
+        return feed_items
+
+    def cached_feed_items(self, rss_url: str) -> List[Dict]:
+        """Items stored for a feed the server reported as 304 Not Modified"""
+        feed_items = self.feed_cache.not_modified(rss_url)
+        if feed_items is None:
+            raise ValueError(f"Got 304 Not Modified for {rss_url} without a cached copy")
+        return feed_items
+
+    def extract_feed_articles(self, source_key: str, feed_items: List[Dict]) -> List[Dict]:
+        """Turn parsed feed items into articles, fetching as much of each page as the source's depth asks"""
+        source = self.sources[source_key]
+        depth = self.depth_for(source_key)
+        if depth != 'full':
+            articles = self.skip_seen([self.feed_article(source, item) for item in feed_items])
+            if depth == 'summary':
+                self.extraction_pool.map(self.summarize_article, articles, key=lambda article: article['url'])
+            for article in articles:
+                self.label_feed_article(article, {})
             return articles
 
-        except Exception as e:
-            logger.error(f"Error scraping Reuters: {str(e)}")
-            # Fallback to generic scraping
-            return self.scrape_generic_news(url, "Reuters")
-
-    def scrape_hackernews(self, url: str) -> List[Dict]:
-        """Scrape Hacker News headlines"""
-        try:
-            response = self.session.get(url, timeout=15, allow_redirects=True)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-            articles = []
-
-            # Hacker News specific selectors
-            story_rows = soup.find_all('tr', class_='athing')[:30]
-
-            for story in story_rows:
-                title_elem = story.find('span', class_='titleline')
-                if title_elem:
-                    link_elem = title_elem.find('a')
-                    if link_elem:
-                        title = link_elem.get_text(strip=True)
-                        article_url = link_elem.get('href', '')
-
-                        # Handle relative URLs
-                        if article_url.startswith('item?id='):
-                            article_url = urljoin(url, article_url)
-
-                        if title and len(title) > 20:
-                            # Extract full article content
-                            article_details = self.extract_full_article(article_url) if article_url else {}
-
-                            articles.append({
-                                'title': title,
-                                'url': article_url,
-                                'source': 'Hacker News',
-                                **article_details
-                            })
-
-            return articles
+        articles = [{
+            'title': item['title'],
+            'url': item['url'],
+            'source': source['source']
+        } for item in feed_items]
 
-        except Exception as e:
-            logger.error(f"Error scraping Hacker News: {str(e)}")
-            return []
+        if source.get('description_fallback'):
+            descriptions = {item['url']: item['description'] for item in feed_items if item['description']}
+            articles = self.extract_articles_with_feed_fallback(articles, descriptions)
+        else:
+            articles = self.extract_articles(articles)
+        return self.apply_feed_details(articles, feed_items)
+
+    @staticmethod
+    def apply_feed_details(articles: List[Dict], feed_items: List[Dict]) -> List[Dict]:
+        """Use the feed's published date and image where the article page gave none"""
+        feed_details = {item['url']: item for item in feed_items}
+        for article in articles:
+            item = feed_details.get(article.get('url'))
+            if not item:
+                continue
+            if not article.get('publishedAt') and item.get('publishedAt'):
+                article['publishedAt'] = item['publishedAt']
+            image_url = article.get('imageUrl')
+            if item.get('imageUrl') and (not image_url or image_url.startswith(PLACEHOLDER_IMAGE_PREFIX)):
+                article['imageUrl'] = item['imageUrl']
+        return articles
+
+    def depth_for(self, source_key: str) -> str:
+        """headline, summary or full: the source row's depth, else the configured default"""
+        depth = self.sources[source_key].get('depth', self.scrape_depth)
+        if depth not in SCRAPE_DEPTHS:
+            logger.warning(f"Unknown scrape depth {depth!r} for {source_key}, fetching full articles")
+            return 'full'
+        return depth
+
+    @staticmethod
+    def feed_article(source: Dict, item: Dict) -> Dict:
+        """An article built from feed data alone, with the description as its content"""
+        content = description_text(item.get('description') or '')
+        return {
+            'title': item['title'],
+            'url': item['url'],
+            'source': source['source'],
+            'fullContent': content or None,
+            'excerpt': (content[:500] + "..." if len(content) > 500 else content) or None,
+            'publishedAt': item.get('publishedAt'),
+            'imageUrl': item.get('imageUrl'),
+            'author': item.get('author')
+        }
 
-    def scrape_generic_news(self, url: str, source_name: str) -> List[Dict]:
-        """Enhanced generic news scraper for other sources"""
+    def summarize_article(self, article: Dict) -> Dict:
+        """Fill in what the feed left out from the og: and meta tags in the article page's head"""
+        if not self.is_article_url(article.get('url', '')):
+            return article
         try:
-            # Use random delay to avoid rate limiting
-            import random
-            time.sleep(random.uniform(0.5, 2.0))
-            
-            response = self.session.get(url, timeout=15, allow_redirects=True)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-            articles = []
-
-            # Enhanced selectors for better coverage
-            selectors = [
-                # Article containers
-                'article a',
-                '.article a',
-                '.story a',
-                '.post a',
-                '.entry a',
-                '.news-item a',
-                '.story-card a',
-                '.article-card a',
-                
-                # Direct headline selectors
-                'h1 a', 'h2 a', 'h3 a', 'h4 a',
-                '.headline a', '.title a', '.article-title a',
-                '.story-headline a', '.news-title a',
-                '.entry-title a', '.post-title a',
-                
-                # Tech-specific selectors
-                '.post-title a', '.story-title a',
-                
-                # Generic content selectors
-                '[data-testid*="headline"] a',
-                '[data-testid*="title"] a',
-                '[class*="headline"] a',
-                '[class*="title"] a',
-                '[class*="story"] a',
-                
-                # Fallback for standalone headlines
-                'h1', 'h2', 'h3',
-                '[class*="headline"]',
-                '[class*="title"]',
-                '[class*="story"]'
-            ]
-
-            for selector in selectors:
-                elements = soup.select(selector)
-                if elements:
-                    for element in elements[:40]:  # Increased limit for better results
-                        title = ""
-                        article_url = ""
-                        
-                        if element.name == 'a':
-                            title = element.get_text(strip=True)
-                            article_url = element.get('href', '')
-                        else:
-                            title = element.get_text(strip=True)
-                            # Find associated link
-                            link_elem = element.find('a') or element.find_parent('a')
-                            if link_elem:
-                                article_url = link_elem.get('href', '')
-                                    
-                        if len(title) > 20 and article_url:
-                            # Normalize URL
-                            if article_url.startswith('/'):
-                                article_url = urljoin(url, article_url)
-                            elif not article_url.startswith(('http://', 'https://')):
-                                continue
-
-                            # Extract full article content
-                            article_details = self.extract_full_article(article_url)
-
-                            articles.append({
-                                'title': title,
-                                'url': article_url,
-                                'source': source_name,
-                                **article_details
-                            })
-
-                            if len(articles) >= 30:  # Increased to get more articles
-                                break
-
-                    if len(articles) >= 30:
-                        break
-
-            return articles
-
+            html = self.fetch_page_head(article['url'])
         except Exception as e:
-            logger.error(f"Error scraping {source_name}: {str(e)}")
-            return []
-
-    def scrape_cnn(self, url: str) -> List[Dict]:
-        """Scrape CNN headlines"""
-        try:
-            # Try RSS feed first
-            rss_url = "http://rss.cnn.com/rss/edition.rss"
-            response = self.session.get(rss_url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
-
-            # Parse RSS feed - get up to 25 items
-            items = soup.find_all('item')[:25]
-
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-
-                if title_elem and title_elem.text:
-                    title = title_elem.text.strip()
-                    if len(title) > 20:
-                        article_url = link_elem.text.strip() if link_elem else ""
-
-                        # Extract full article content
-                        article_details = self.extract_full_article(article_url) if article_url else {}
+            logger.debug(f"Head fetch failed for {article['url']}: {str(e)}")
+            return article
+        with self.metrics.time('parse_seconds', kind='head'):
+            head_meta = extract_head_meta(parse_html(html), article['url'])
+        return self.apply_head_meta(article, head_meta)
+
+    @staticmethod
+    def apply_head_meta(article: Dict, head_meta: Dict) -> Dict:
+        """Prefer the page's description when it says more than the feed, and fill the gaps"""
+        description = head_meta.get('description') or ''
+        if len(description) > len(article.get('fullContent') or ''):
+            article['fullContent'] = description
+            article['excerpt'] = description[:500] + "..." if len(description) > 500 else description
+        if not article.get('publishedAt') and head_meta.get('publishedAt'):
+            article['publishedAt'] = parse_feed_date(head_meta['publishedAt'])
+        for field in ('imageUrl', 'author'):
+            if not article.get(field) and head_meta.get(field):
+                article[field] = head_meta[field]
+        return article
+
+    def scrape_registered_source(self, source_key: str, url: str) -> List[Dict]:
+        """Scrape a registry source: its feed, then its index parser, then the generic homepage scraper"""
+        source = self.sources[source_key]
+        source_name = source['source']
+        if source.get('rss_url'):
+            try:
+                return self.extract_feed_articles(source_key, self.fetch_feed_items(source_key))
+            except Exception as e:
+                logger.error(f"Error scraping {source_name} RSS: {str(e)}")
 
-                        articles.append({
-                            'title': title,
-                            'url': article_url,
-                            'source': 'CNN',
-                            **article_details
-                        })
+        if source.get('index_parser'):
+            try:
+                response = self.fetch_page(url, timeout=source.get('index_timeout', DEFAULT_INDEX_TIMEOUT))
+                parse_index = getattr(self, source['index_parser'])
+                return self.extract_articles(parse_index(response.content, url))
+            except Exception as e:
+                logger.error(f"Error scraping {source_name} website: {str(e)}")
 
-            return articles
+        if source.get('generic_fallback', True):
+            return self.scrape_generic_news(url, source_name)
+        return []
 
-        except Exception as e:
-            logger.error(f"Error scraping CNN RSS: {str(e)}")
-            # Fallback to generic scraping
-            return self.scrape_generic_news(url, "CNN")
+    def parse_reuters_index(self, content: bytes, url: str) -> List[Dict]:
+        """Collect Reuters article candidates from its homepage HTML"""
+        soup = BeautifulSoup(content, 'html.parser')
+        articles = []
+
+        # Multiple selectors for Reuters articles
+        article_selectors = [
+            'div[data-testid="ArticleCard"]',
+            'article',
+            '.story-card',
+            '.media-story-card__headline__eqhp9',
+            '.media-story-card__body__3tRWy',
+            '[data-testid="Heading"]',
+            '.media-story-card',
+            'h3 a',
+            'h2 a',
+            'h1 a'
+        ]
 
-    def scrape_guardian(self, url: str) -> List[Dict]:
-        """Scrape The Guardian headlines"""
-        try:
-            # Try RSS feed first
-            rss_url = "https://www.theguardian.com/world/rss"
-            response = self.session.get(rss_url, timeout=10)
-            response.raise_for_status()
+        for selector in article_selectors:
+            elements = soup.select(selector)
+            if elements:
+                for element in elements[:30]:  # Get more elements for better filtering
+                    title_elem = element.find('h3') or element.find('h2') or element.find('h1') or element.find('a')
+                    if title_elem:
+                        title = title_elem.get_text(strip=True)
+                        if len(title) > 20:
+                            # Find the article URL
+                            link_elem = element.find('a') or title_elem
+                            if link_elem and link_elem.get('href'):
+                                article_url = link_elem.get('href')
+                                if article_url.startswith('/'):
+                                    article_url = urljoin(url, article_url)
+                                elif not article_url.startswith(('http://', 'https://')):
+                                    continue
+
+                                articles.append({
+                                    'title': title,
+                                    'url': article_url,
+                                    'source': 'Reuters'
+                                })
+
+                if articles:
+                    break
 
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
+        return articles
 
-            # Parse RSS feed - get up to 25 items
-            items = soup.find_all('item')[:25]
+    def parse_hackernews_index(self, content: bytes, url: str) -> List[Dict]:
+        """Collect Hacker News story candidates from the front page HTML"""
+        soup = BeautifulSoup(content, 'html.parser')
+        articles = []
 
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
+        # Hacker News specific selectors
+        story_rows = soup.find_all('tr', class_='athing')[:30]
 
-                if title_elem and title_elem.text:
-                    title = title_elem.text.strip()
-                    if len(title) > 20:
-                        article_url = link_elem.text.strip() if link_elem else ""
+        for story in story_rows:
+            title_elem = story.find('span', class_='titleline')
+            if title_elem:
+                link_elem = title_elem.find('a')
+                if link_elem:
+                    title = link_elem.get_text(strip=True)
+                    article_url = link_elem.get('href', '')
 
-                        # Extract full article content
-                        article_details = self.extract_full_article(article_url) if article_url else {}
+                    # Handle relative URLs
+                    if article_url.startswith('item?id='):
+                        article_url = urljoin(url, article_url)
 
+                    if title and len(title) > 20:
                         articles.append({
                             'title': title,
                             'url': article_url,
-                            'source': 'The Guardian',
-                            **article_details
+                            'source': 'Hacker News'
                         })
 
-            return articles
-
-        except Exception as e:
-            logger.error(f"Error scraping The Guardian RSS: {str(e)}")
-            # Fallback to generic scraping
-            return self.scrape_generic_news(url, "The Guardian")
+        return articles
 
-    def scrape_npr(self, url: str) -> List[Dict]:
-        """Scrape NPR headlines"""
+    def scrape_generic_news(self, url: str, source_name: str) -> List[Dict]:
+        """Enhanced generic news scraper for other sources"""
         try:
-            # Try RSS feed first
-            rss_url = "https://feeds.npr.org/1001/rss.xml"
-            response = self.session.get(rss_url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
+            response = self.fetch_page(url, timeout=DEFAULT_INDEX_TIMEOUT)
 
-            # Parse RSS feed - get up to 25 items
-            items = soup.find_all('item')[:25]
-
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-
-                if title_elem and title_elem.text:
-                    title = title_elem.text.strip()
-                    if len(title) > 20:
-                        article_url = link_elem.text.strip() if link_elem else ""
-
-                        # Extract full article content
-                        article_details = self.extract_full_article(article_url) if article_url else {}
-
-                        articles.append({
-                            'title': title,
-                            'url': article_url,
-                            'source': 'NPR News',
-                            **article_details
-                        })
-
-            return articles
+            return self.extract_articles(self.parse_generic_index(response.content, url, source_name))
 
         except Exception as e:
-            logger.error(f"Error scraping NPR RSS: {str(e)}")
-            # Fallback to generic scraping
-            return self.scrape_generic_news(url, "NPR News")
-
-    def scrape_ap(self, url: str) -> List[Dict]:
-        """Scrape Associated Press headlines"""
-        try:
-            # Try RSS feed first
-            rss_url = "https://feeds.ap.org/ApTopHeadlines"
-            response = self.session.get(rss_url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
+            logger.error(f"Error scraping {source_name}: {str(e)}")
+            return []
 
-            # Parse RSS feed - get up to 25 items
-            items = soup.find_all('item')[:25]
+    def parse_generic_index(self, content: bytes, url: str, source_name: str) -> List[Dict]:
+        """Collect headline candidates from any news homepage HTML"""
+        soup = BeautifulSoup(content, 'html.parser')
+        articles = []
+
+        # Enhanced selectors for better coverage
+        selectors = [
+            # Article containers
+            'article a',
+            '.article a',
+            '.story a',
+            '.post a',
+            '.entry a',
+            '.news-item a',
+            '.story-card a',
+            '.article-card a',
+
+            # Direct headline selectors
+            'h1 a', 'h2 a', 'h3 a', 'h4 a',
+            '.headline a', '.title a', '.article-title a',
+            '.story-headline a', '.news-title a',
+            '.entry-title a', '.post-title a',
+
+            # Tech-specific selectors
+            '.post-title a', '.story-title a',
+
+            # Generic content selectors
+            '[data-testid*="headline"] a',
+            '[data-testid*="title"] a',
+            '[class*="headline"] a',
+            '[class*="title"] a',
+            '[class*="story"] a',
+
+            # Fallback for standalone headlines
+            'h1', 'h2', 'h3',
+            '[class*="headline"]',
+            '[class*="title"]',
+            '[class*="story"]'
+        ]
 
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
+        for selector in selectors:
+            elements = soup.select(selector)
+            if elements:
+                for element in elements[:40]:  # Increased limit for better results
+                    title = ""
+                    article_url = ""
 
-                if title_elem and title_elem.text:
-                    title = title_elem.text.strip()
-                    if len(title) > 20:
-                        article_url = link_elem.text.strip() if link_elem else ""
+                    if element.name == 'a':
+                        title = element.get_text(strip=True)
+                        article_url = element.get('href', '')
+                    else:
+                        title = element.get_text(strip=True)
+                        # Find associated link
+                        link_elem = element.find('a') or element.find_parent('a')
+                        if link_elem:
+                            article_url = link_elem.get('href', '')
 
-                        # Extract full article content
-                        article_details = self.extract_full_article(article_url) if article_url else {}
+                    if len(title) > 20 and article_url:
+                        # Normalize URL
+                        if article_url.startswith('/'):
+                            article_url = urljoin(url, article_url)
+                        elif not article_url.startswith(('http://', 'https://')):
+                            continue
 
                         articles.append({
                             'title': title,
                             'url': article_url,
-                            'source': 'Associated Press',
-                            **article_details
+                            'source': source_name
                         })
 
-            return articles
-
-        except Exception as e:
-            logger.error(f"Error scraping Associated Press RSS: {str(e)}")
-            # Fallback to generic scraping
-            return self.scrape_generic_news(url, "Associated Press")
-
-    def scrape_india_today(self, url: str) -> List[Dict]:
-        """Scrape India Today headlines"""
-        try:
-            # Try RSS feed first as it's more reliable
-            rss_url = "https://www.indiatoday.in/rss/1206578"
-            response = self.session.get(rss_url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
-
-            # Parse RSS feed - get up to 25 items
-            items = soup.find_all('item')[:25]
-
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-
-                if title_elem and title_elem.text:
-                    title = title_elem.text.strip()
-                    if len(title) > 20:
-                        article_url = link_elem.text.strip() if link_elem else ""
+                        if len(articles) >= 30:  # Increased to get more articles
+                            break
 
-                        # Extract full article content
-                        article_details = self.extract_full_article(article_url) if article_url else {}
+                if len(articles) >= 30:
+                    break
 
-                        articles.append({
-                            'title': title,
-                            'url': article_url,
-                            'source': 'India Today',
-                            **article_details
-                        })
+        return articles
+
+    def parse_india_today_index(self, content: bytes, url: str) -> List[Dict]:
+        """Collect India Today headline candidates from its homepage HTML"""
+        soup = BeautifulSoup(content, 'html.parser')
+        articles = []
+
+        # India Today specific selectors
+        headline_selectors = [
+            '.story-list .story-card h2 a',
+            '.lead-story h2 a',
+            '.top-news h2 a',
+            '.story h2 a',
+            '.story-list h3 a',
+            '.catagory-listing h2 a'
+        ]
 
-            return articles
+        for selector in headline_selectors:
+            headlines = soup.select(selector)
+            for headline in headlines[:10]:
+                title = headline.get_text(strip=True)
+                if title and len(title) > 20:
+                    article_url = urljoin(url, headline.get('href', ''))
 
-        except Exception as e:
-            logger.error(f"Error scraping India Today RSS: {str(e)}")
-            # Fallback to website scraping
-            try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.content, 'html.parser')
-                articles = []
-
-                # India Today specific selectors
-                headline_selectors = [
-                    '.story-list .story-card h2 a',
-                    '.lead-story h2 a',
-                    '.top-news h2 a',
-                    '.story h2 a',
-                    '.story-list h3 a',
-                    '.catagory-listing h2 a'
-                ]
-
-                for selector in headline_selectors:
-                    headlines = soup.select(selector)
-                    for headline in headlines[:10]:
-                        title = headline.get_text(strip=True)
-                        if title and len(title) > 20:
-                            article_url = urljoin(url, headline.get('href', ''))
-
-                            # Extract full article content
-                            article_details = self.extract_full_article(article_url) if article_url else {}
-
-                            articles.append({
-                                'title': title,
-                                'url': article_url,
-                                'source': 'India Today',
-                                **article_details
-                            })
-
-                            if len(articles) >= 10:
-                                break
+                    articles.append({
+                        'title': title,
+                        'url': article_url,
+                        'source': 'India Today'
+                    })
 
                     if len(articles) >= 10:
                         break
 
-                return articles
-
-            except Exception as e2:
-                logger.error(f"Error scraping India Today website: {str(e2)}")
-                # Final fallback to generic scraping
-                return self.scrape_generic_news(url, "India Today")
-
-    def scrape_ndtv(self, url: str) -> List[Dict]:
-        """Enhanced NDTV scraping with complete content extraction"""
-        try:
-            # NDTV RSS feed
-            rss_url = "https://feeds.feedburner.com/ndtvnews-top-stories"
-            response = self.session.get(rss_url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
-
-            items = soup.find_all('item')[:20]  # Increased count
-
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-                desc_elem = item.find('description')
-
-                if title_elem and title_elem.text:
-                    title = title_elem.text.strip()
-                    if len(title) > 20:
-                        article_url = link_elem.text.strip() if link_elem else ""
-
-                        # Enhanced full article extraction
-                        article_details = self.extract_full_article(article_url) if article_url else {}
-                        
-                        # Use RSS description as fallback if full content extraction fails
-                        if not article_details.get('fullContent') and desc_elem:
-                            article_details['fullContent'] = desc_elem.text.strip() if desc_elem.text else ""
-                        
-                        # If still no content, try direct scraping
-                        if not article_details.get('fullContent') and article_url:
-                            try:
-                                direct_response = self.session.get(article_url, timeout=8)
-                                direct_response.raise_for_status()
-                                fallback_content = self._extract_content_fallback(article_url, direct_response.text)
-                                if fallback_content:
-                                    article_details['fullContent'] = fallback_content
-                            except:
-                                pass
-                        
-                        # Ensure we always have some content
-                        if not article_details.get('fullContent'):
-                            article_details['fullContent'] = f"Complete article available at NDTV: {article_url}"
-
-                        articles.append({
-                            'title': title,
-                            'url': article_url,
-                            'source': 'NDTV',
-                            'category': self.categorize_article(title, article_details.get('fullContent', ''), 'NDTV'),
-                            'region': 'indian' if any(keyword in title.lower() for keyword in ['india', 'indian', 'delhi', 'mumbai', 'bengaluru', 'kolkata', 'chennai', 'hyderabad', 'pune', 'ahmedabad', 'bjp', 'congress', 'modi', 'rahul']) else 'international',
-                            **article_details
-                        })
-
-            return articles
-
-        except Exception as e:
-            logger.error(f"Error scraping NDTV: {str(e)}")
-            return self.scrape_generic_news(url, "NDTV")
-
-    def scrape_times_of_india(self, url: str) -> List[Dict]:
-        """Enhanced Times of India scraping with complete content extraction"""
-        try:
-            # Times of India RSS feed
-            rss_url = "https://timesofindia.indiatimes.com/rssfeedstopstories.cms"
-            response = self.session.get(rss_url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
-
-            items = soup.find_all('item')[:20]  # Increased to get more articles
-
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-                desc_elem = item.find('description')
-
-                if title_elem and title_elem.text:
-                    title = title_elem.text.strip()
-                    if len(title) > 20:
-                        article_url = link_elem.text.strip() if link_elem else ""
-                        
-                        # Enhanced full article extraction
-                        article_details = self.extract_full_article(article_url) if article_url else {}
-                        
-                        # Use RSS description as fallback if full content extraction fails
-                        if not article_details.get('fullContent') and desc_elem:
-                            article_details['fullContent'] = desc_elem.text.strip() if desc_elem.text else ""
-                        
-                        # If still no content, try one more time with direct scraping
-                        if not article_details.get('fullContent') and article_url:
-                            try:
-                                direct_response = self.session.get(article_url, timeout=8)
-                                direct_response.raise_for_status()
-                                fallback_content = self._extract_content_fallback(article_url, direct_response.text)
-                                if fallback_content:
-                                    article_details['fullContent'] = fallback_content
-                            except:
-                                pass
-                        
-                        # Ensure we always have some content
-                        if not article_details.get('fullContent'):
-                            article_details['fullContent'] = f"Complete article available at Times of India: {article_url}"
-
-                        articles.append({
-                            'title': title,
-                            'url': article_url,
-                            'source': 'Times of India',
-                            'category': self.categorize_article(title, article_details.get('fullContent', ''), 'Times of India'),
-                            'region': 'indian' if any(keyword in title.lower() for keyword in ['india', 'indian', 'delhi', 'mumbai', 'bengaluru', 'kolkata', 'chennai', 'hyderabad', 'pune', 'ahmedabad', 'bjp', 'congress', 'modi', 'rahul']) else 'international',
-                            **article_details
-                        })
-
-            return articles
-
-        except Exception as e:
-            logger.error(f"Error scraping Times of India: {str(e)}")
-            return self.scrape_generic_news(url, "Times of India")
-
-    def scrape_hindu(self, url: str) -> List[Dict]:
-        """Scrape The Hindu headlines"""
-        try:
-            # The Hindu RSS feed
-            rss_url = "https://www.thehindu.com/feeder/default.rss"
-            response = self.session.get(rss_url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
-
-            items = soup.find_all('item')[:15]
-
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-
-                if title_elem and title_elem.text:
-                    title = title_elem.text.strip()
-                    if len(title) > 20:
-                        article_url = link_elem.text.strip() if link_elem else ""
-
-                        article_details = self.extract_full_article(article_url) if article_url else {}
-
-                        articles.append({
-                            'title': title,
-                            'url': article_url,
-                            'source': 'Hindu',
-                            **article_details
-                        })
-
-            return articles
-
-        except Exception as e:
-            logger.error(f"Error scraping The Hindu: {str(e)}")
-            return self.scrape_generic_news(url, "Hindu")
-
-    def scrape_economic_times(self, url: str) -> List[Dict]:
-        """Enhanced Economic Times scraping with complete content extraction"""
-        try:
-            # Economic Times RSS feed
-            rss_url = "https://economictimes.indiatimes.com/rssfeedstopstories.cms"
-            response = self.session.get(rss_url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
-
-            items = soup.find_all('item')[:20]  # Increased count
-
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-                desc_elem = item.find('description')
-
-                if title_elem and title_elem.text:
-                    title = title_elem.text.strip()
-                    if len(title) > 20:
-                        article_url = link_elem.text.strip() if link_elem else ""
-
-                        # Enhanced full article extraction
-                        article_details = self.extract_full_article(article_url) if article_url else {}
-                        
-                        # Use RSS description as fallback if full content extraction fails
-                        if not article_details.get('fullContent') and desc_elem:
-                            article_details['fullContent'] = desc_elem.text.strip() if desc_elem.text else ""
-                        
-                        # If still no content, try direct scraping
-                        if not article_details.get('fullContent') and article_url:
-                            try:
-                                direct_response = self.session.get(article_url, timeout=8)
-                                direct_response.raise_for_status()
-                                fallback_content = self._extract_content_fallback(article_url, direct_response.text)
-                                if fallback_content:
-                                    article_details['fullContent'] = fallback_content
-                            except:
-                                pass
-                        
-                        # Ensure we always have some content
-                        if not article_details.get('fullContent'):
-                            article_details['fullContent'] = f"Complete article available at Economic Times: {article_url}"
-
-                        articles.append({
-                            'title': title,
-                            'url': article_url,
-                            'source': 'Economic Times',
-                            'category': self.categorize_article(title, article_details.get('fullContent', ''), 'Economic Times'),
-                            'region': 'indian' if any(keyword in title.lower() for keyword in ['india', 'indian', 'delhi', 'mumbai', 'bengaluru', 'kolkata', 'chennai', 'hyderabad', 'pune', 'ahmedabad', 'bjp', 'congress', 'modi', 'rahul']) else 'international',
-                            **article_details
-                        })
-
-            return articles
-
-        except Exception as e:
-            logger.error(f"Error scraping Economic Times: {str(e)}")
-            return self.scrape_generic_news(url, "Economic Times")
-
-    def scrape_techcrunch(self, url: str) -> List[Dict]:
-        """Scrape TechCrunch headlines"""
-        try:
-            rss_url = "https://techcrunch.com/feed/"
-            response = self.session.get(rss_url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
-
-            items = soup.find_all('item')[:10]
-
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-
-                if title_elem and title_elem.text:
-                    title = title_elem.text.strip()
-                    if len(title) > 20:
-                        article_url = link_elem.text.strip() if link_elem else ""
-
-                        article_details = self.extract_full_article(article_url) if article_url else {}
-
-                        articles.append({
-                            'title': title,
-                            'url': article_url,
-                            'source': 'TechCrunch',
-                            **article_details
-                        })
-
-            return articles
-
-        except Exception as e:
-            logger.error(f"Error scraping TechCrunch RSS: {str(e)}")
-            return self.scrape_generic_news(url, "TechCrunch")
-
-    def scrape_wired(self, url: str) -> List[Dict]:
-        """Scrape WIRED headlines"""
-        try:
-            rss_url = "https://www.wired.com/feed/rss"
-            response = self.session.get(rss_url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
-
-            items = soup.find_all('item')[:10]
-
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-
-                if title_elem and title_elem.text:
-                    title = title_elem.text.strip()
-                    if len(title) > 20:
-                        article_url = link_elem.text.strip() if link_elem else ""
-
-                        article_details = self.extract_full_article(article_url) if article_url else {}
-
-                        articles.append({
-                            'title': title,
-                            'url': article_url,
-                            'source': 'WIRED',
-                            **article_details
-                        })
-
-            return articles
-
-        except Exception as e:
-            logger.error(f"Error scraping WIRED RSS: {str(e)}")
-            return self.scrape_generic_news(url, "WIRED")
-
-    def scrape_engadget(self, url: str) -> List[Dict]:
-        """Scrape Engadget headlines"""
-        try:
-            rss_url = "https://www.engadget.com/rss.xml"
-            response = self.session.get(rss_url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
-
-            items = soup.find_all('item')[:10]
-
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-
-                if title_elem and title_elem.text:
-                    title = title_elem.text.strip()
-                    if len(title) > 20:
-                        article_url = link_elem.text.strip() if link_elem else ""
-
-                        article_details = self.extract_full_article(article_url) if article_url else {}
-
-                        articles.append({
-                            'title': title,
-                            'url': article_url,
-                            'source': 'Engadget',
-                            **article_details
-                        })
-
-            return articles
-
-        except Exception as e:
-            logger.error(f"Error scraping Engadget RSS: {str(e)}")
-            return self.scrape_generic_news(url, "Engadget")
-
-    def scrape_ars_technica(self, url: str) -> List[Dict]:
-        """Scrape Ars Technica headlines"""
-        try:
-            rss_url = "https://feeds.arstechnica.com/arstechnica/index"
-            response = self.session.get(rss_url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
-
-            items = soup.find_all('item')[:10]
-
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-
-                if title_elem and title_elem.text:
-                    title = title_elem.text.strip()
-                    if len(title) > 20:
-                        article_url = link_elem.text.strip() if link_elem else ""
-
-                        article_details = self.extract_full_article(article_url) if article_url else {}
-
-                        articles.append({
-                            'title': title,
-                            'url': article_url,
-                            'source': 'Ars Technica',
-                            **article_details
-                        })
-
-            return articles
-
-        except Exception as e:
-            logger.error(f"Error scraping Ars Technica RSS: {str(e)}")
-            return self.scrape_generic_news(url, "Ars Technica")
-
-    def scrape_verge(self, url: str) -> List[Dict]:
-        """Scrape The Verge headlines"""
-        try:
-            rss_url = "https://www.theverge.com/rss/index.xml"
-            response = self.session.get(rss_url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
-
-            items = soup.find_all('item')[:10]
-
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-
-                if title_elem and title_elem.text:
-                    title = title_elem.text.strip()
-                    if len(title) > 20:
-                        article_url = link_elem.text.strip() if link_elem else ""
-
-                        article_details = self.extract_full_article(article_url) if article_url else {}
-
-                        articles.append({
-                            'title': title,
-                            'url': article_url,
-                            'source': 'The Verge',
-                            **article_details
-                        })
-
-            return articles
+            if len(articles) >= 10:
+                break
 
-        except Exception as e:
-            logger.error(f"Error scraping The Verge RSS: {str(e)}")
-            return self.scrape_generic_news(url, "The Verge")
+        return articles
 
     def scrape_source(self, url: str, source_name: str) -> List[Dict]:
-        """Scrape a news source based on domain"""
-        domain = urlparse(url).netloc.lower()
-
-        if 'bbc.com' in domain:
-            return self.scrape_bbc_news(url)
-        elif 'reuters.com' in domain:
-            return self.scrape_reuters(url)
-        elif 'cnn.com' in domain:
-            return self.scrape_cnn(url)
-        elif 'theguardian.com' in domain:
-            return self.scrape_guardian(url)
-        elif 'npr.org' in domain:
-            return self.scrape_npr(url)
-        elif 'apnews.com' in domain:
-            return self.scrape_ap(url)
-        elif 'ycombinator.com' in domain:
-            return self.scrape_hackernews(url)
-        elif 'indiatoday.in' in domain:
-            return self.scrape_india_today(url)
-        elif 'ndtv.com' in domain:
-            return self.scrape_ndtv(url)
-        elif 'timesofindia.indiatimes.com' in domain:
-            return self.scrape_times_of_india(url)
-        elif 'thehindu.com' in domain:
-            return self.scrape_hindu(url)
-        elif 'economictimes.indiatimes.com' in domain:
-            return self.scrape_economic_times(url)
-        elif 'techcrunch.com' in domain:
-            return self.scrape_techcrunch(url)
-        elif 'wired.com' in domain:
-            return self.scrape_wired(url)
-        elif 'engadget.com' in domain:
-            return self.scrape_engadget(url)
-        elif 'arstechnica.com' in domain:
-            return self.scrape_ars_technica(url)
-        elif 'theverge.com' in domain:
-            return self.scrape_verge(url)
-        else:
+        """Scrape a news source with its registry row, or generically when it has none"""
+        source_key = self.sources.key_for(url)
+        if source_key is None:
             return self.scrape_generic_news(url, source_name)
+        return self.scrape_registered_source(source_key, url)
 
     def scrape_source_comprehensive(self, url: str, source_name: str) -> List[Dict]:
         """
@@ -1381,46 +909,11 @@ class NewsScraper:
         try:
             logger.info(f"COMPREHENSIVE: Starting complete extraction from {source_name}")
             
-            # Use domain-specific scraper first for better results
-            domain = urlparse(url).netloc.lower()
-            
-            # Use existing specialized scrapers but enhance them for comprehensive data
-            if 'bbc.com' in domain:
-                articles = self.scrape_bbc_comprehensive(url)
-            elif 'reuters.com' in domain:
-                articles = self.scrape_reuters_comprehensive(url)
-            elif 'cnn.com' in domain:
-                articles = self.scrape_cnn_comprehensive(url)
-            elif 'theguardian.com' in domain:
-                articles = self.scrape_guardian_comprehensive(url)
-            elif 'npr.org' in domain:
-                articles = self.scrape_npr_comprehensive(url)
-            elif 'apnews.com' in domain:
-                articles = self.scrape_ap_comprehensive(url)
-            elif 'ycombinator.com' in domain:
-                articles = self.scrape_hackernews_comprehensive(url)
-            elif 'indiatoday.in' in domain:
-                articles = self.scrape_india_today_comprehensive(url)
-            elif 'ndtv.com' in domain:
-                articles = self.scrape_ndtv_comprehensive(url)
-            elif 'timesofindia.indiatimes.com' in domain:
-                articles = self.scrape_times_of_india_comprehensive(url)
-            elif 'thehindu.com' in domain:
-                articles = self.scrape_hindu_comprehensive(url)
-            elif 'economictimes.indiatimes.com' in domain:
-                articles = self.scrape_economic_times_comprehensive(url)
-            elif 'techcrunch.com' in domain:
-                articles = self.scrape_techcrunch_comprehensive(url)
-            elif 'wired.com' in domain:
-                articles = self.scrape_wired_comprehensive(url)
-            elif 'engadget.com' in domain:
-                articles = self.scrape_engadget_comprehensive(url)
-            elif 'arstechnica.com' in domain:
-                articles = self.scrape_ars_technica_comprehensive(url)
-            elif 'theverge.com' in domain:
-                articles = self.scrape_verge_comprehensive(url)
-            else:
+            source_key = self.sources.key_for(url)
+            if source_key is None:
                 articles = self.scrape_generic_comprehensive(url, source_name)
+            else:
+                articles = self.scrape_comprehensive_source(source_key, url)
             
             logger.info(f"COMPREHENSIVE: Extracted {len(articles)} total articles from {source_name}")
             return articles
@@ -1436,304 +929,166 @@ class NewsScraper:
         Scrapes every visible article link from top to bottom of the page
         """
         try:
-            import random
-            time.sleep(random.uniform(0.5, 1.5))
-            
-            response = self.session.get(url, timeout=20, allow_redirects=True)
-            response.raise_for_status()
+            response = self.fetch_page(url, timeout=DEFAULT_COMPREHENSIVE_TIMEOUT)
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            articles = []
-            seen_urls = set()
+            return self.parse_generic_comprehensive_index(response.content, url, source_name)
 
-            # COMPREHENSIVE SELECTORS - Extract EVERYTHING
-            comprehensive_selectors = [
-                # Primary article containers (high priority)
-                'article a[href*="/"]', 'article h1 a', 'article h2 a', 'article h3 a',
-                '.article a[href*="/"]', '.story a[href*="/"]', '.post a[href*="/"]',
-                '.news-item a[href*="/"]', '.story-card a[href*="/"]', '.article-card a[href*="/"]',
-                
-                # Headlines and titles (medium priority)
-                'h1 a[href*="/"]', 'h2 a[href*="/"]', 'h3 a[href*="/"]', 'h4 a[href*="/"]',
-                '.headline a[href*="/"]', '.title a[href*="/"]', '.article-title a[href*="/"]',
-                '.story-headline a[href*="/"]', '.news-title a[href*="/"]',
-                '.entry-title a[href*="/"]', '.post-title a[href*="/"]',
-                
-                # Navigation and listing areas
-                '.content a[href*="/"]', '.main a[href*="/"]', '.primary a[href*="/"]',
-                '.articles a[href*="/"]', '.stories a[href*="/"]', '.posts a[href*="/"]',
-                '.news a[href*="/"]', '.feed a[href*="/"]', '.list a[href*="/"]',
-                
-                # Data attributes (modern websites)
-                '[data-testid*="headline"] a[href*="/"]', '[data-testid*="title"] a[href*="/"]',
-                '[data-testid*="story"] a[href*="/"]', '[data-testid*="article"] a[href*="/"]',
-                
-                # Class-based selectors (catch-all)
-                '[class*="headline"] a[href*="/"]', '[class*="title"] a[href*="/"]',
-                '[class*="story"] a[href*="/"]', '[class*="article"] a[href*="/"]',
-                '[class*="news"] a[href*="/"]', '[class*="post"] a[href*="/"]',
-                
-                # Generic link selectors as fallback
-                'a[href*="/news/"]', 'a[href*="/article/"]', 'a[href*="/story/"]',
-                'a[href*="/post/"]', 'a[href*="' + urlparse(url).netloc + '"]'
-            ]
+        except Exception as e:
+            logger.error(f"COMPREHENSIVE generic scraping failed for {source_name}: {e}")
+            return []
 
-            logger.info(f"COMPREHENSIVE: Scanning {source_name} with {len(comprehensive_selectors)} selector patterns")
+    def parse_generic_comprehensive_index(self, content: bytes, url: str, source_name: str) -> List[Dict]:
+        """Collect every visible article link on a homepage as lightweight articles"""
+        soup = BeautifulSoup(content, 'html.parser')
+        articles = []
+        seen_urls = set()
+
+        # COMPREHENSIVE SELECTORS - Extract EVERYTHING
+        comprehensive_selectors = [
+            # Primary article containers (high priority)
+            'article a[href*="/"]', 'article h1 a', 'article h2 a', 'article h3 a',
+            '.article a[href*="/"]', '.story a[href*="/"]', '.post a[href*="/"]',
+            '.news-item a[href*="/"]', '.story-card a[href*="/"]', '.article-card a[href*="/"]',
+
+            # Headlines and titles (medium priority)
+            'h1 a[href*="/"]', 'h2 a[href*="/"]', 'h3 a[href*="/"]', 'h4 a[href*="/"]',
+            '.headline a[href*="/"]', '.title a[href*="/"]', '.article-title a[href*="/"]',
+            '.story-headline a[href*="/"]', '.news-title a[href*="/"]',
+            '.entry-title a[href*="/"]', '.post-title a[href*="/"]',
+
+            # Navigation and listing areas
+            '.content a[href*="/"]', '.main a[href*="/"]', '.primary a[href*="/"]',
+            '.articles a[href*="/"]', '.stories a[href*="/"]', '.posts a[href*="/"]',
+            '.news a[href*="/"]', '.feed a[href*="/"]', '.list a[href*="/"]',
+
+            # Data attributes (modern websites)
+            '[data-testid*="headline"] a[href*="/"]', '[data-testid*="title"] a[href*="/"]',
+            '[data-testid*="story"] a[href*="/"]', '[data-testid*="article"] a[href*="/"]',
+
+            # Class-based selectors (catch-all)
+            '[class*="headline"] a[href*="/"]', '[class*="title"] a[href*="/"]',
+            '[class*="story"] a[href*="/"]', '[class*="article"] a[href*="/"]',
+            '[class*="news"] a[href*="/"]', '[class*="post"] a[href*="/"]',
+
+            # Generic link selectors as fallback
+            'a[href*="/news/"]', 'a[href*="/article/"]', 'a[href*="/story/"]',
+            'a[href*="/post/"]', 'a[href*="' + urlparse(url).netloc + '"]'
+        ]
 
-            for selector in comprehensive_selectors:
-                try:
-                    elements = soup.select(selector)
-                    for element in elements:
-                        title = element.get_text(strip=True)
-                        article_url = element.get('href', '')
-                        
-                        # Validate article content
-                        if len(title) < 10 or len(title) > 200:  # Reasonable title length
-                            continue
-                            
-                        # Skip navigation, menu, and non-article links
-                        skip_keywords = [
-                            'menu', 'nav', 'footer', 'header', 'sidebar', 'comment', 'share',
-                            'subscribe', 'newsletter', 'login', 'register', 'contact', 'about',
-                            'privacy', 'terms', 'cookie', 'advertise', 'shop', 'buy'
-                        ]
-                        
-                        if any(keyword in title.lower() for keyword in skip_keywords):
-                            continue
-                            
-                        # Normalize URL
-                        if article_url.startswith('/'):
-                            article_url = urljoin(url, article_url)
-                        elif not article_url.startswith(('http://', 'https://')):
-                            continue
-                            
-                        # Skip duplicates
-                        if article_url in seen_urls:
-                            continue
-                        seen_urls.add(article_url)
-                        
-                        # Skip obvious non-article URLs
-                        skip_url_patterns = [
-                            '/tag/', '/category/', '/author/', '/search/', '/page/',
-                            '/feed/', '/rss/', '/sitemap/', '/archive/', '/contact/',
-                            '.pdf', '.jpg', '.png', '.gif', '.mp4', '.video'
-                        ]
-                        
-                        if any(pattern in article_url.lower() for pattern in skip_url_patterns):
-                            continue
+        logger.info(f"COMPREHENSIVE: Scanning {source_name} with {len(comprehensive_selectors)} selector patterns")
 
-                        # Extract article content (without full article extraction for speed)
-                        article_data = {
-                            'title': title,
-                            'url': article_url,
-                            'source': source_name,
-                            'fullContent': title,  # Use title as initial content
-                            'excerpt': title[:200] + '...' if len(title) > 200 else title,
-                            'publishedAt': None,
-                            'imageUrl': '',
-                            'author': '',
-                            'category': self.categorize_article(title, title, source_name),
-                            'region': self.get_article_region(title, source_name)
-                        }
-                        
-                        articles.append(article_data)
-                        
-                        # Log progress every 50 articles
-                        if len(articles) % 50 == 0:
-                            logger.info(f"COMPREHENSIVE: Collected {len(articles)} articles from {source_name}")
-                            
-                        # Reasonable limit to prevent infinite collection
-                        if len(articles) >= 200:  # Collect up to 200 articles per source
-                            logger.info(f"COMPREHENSIVE: Reached limit of 200 articles for {source_name}")
-                            break
-                            
-                except Exception as e:
-                    logger.debug(f"Selector '{selector}' failed for {source_name}: {e}")
-                    continue
-                    
-                if len(articles) >= 200:
-                    break
+        for selector in comprehensive_selectors:
+            try:
+                elements = soup.select(selector)
+                for element in elements:
+                    title = element.get_text(strip=True)
+                    article_url = element.get('href', '')
 
-            # Remove duplicates based on title similarity
-            unique_articles = []
-            seen_titles = set()
-            
-            for article in articles:
-                title_key = article['title'].lower().strip()[:50]  # First 50 chars for similarity
-                if title_key not in seen_titles:
-                    seen_titles.add(title_key)
-                    unique_articles.append(article)
+                    # Validate article content
+                    if len(title) < 10 or len(title) > 200:  # Reasonable title length
+                        continue
 
-            logger.info(f"COMPREHENSIVE: Final result - {len(unique_articles)} unique articles from {source_name}")
-            return unique_articles[:150]  # Final limit per source
+                    # Skip navigation, menu, and non-article links
+                    skip_keywords = [
+                        'menu', 'nav', 'footer', 'header', 'sidebar', 'comment', 'share',
+                        'subscribe', 'newsletter', 'login', 'register', 'contact', 'about',
+                        'privacy', 'terms', 'cookie', 'advertise', 'shop', 'buy'
+                    ]
 
-        except Exception as e:
-            logger.error(f"COMPREHENSIVE generic scraping failed for {source_name}: {e}")
-            return []
+                    if any(keyword in title.lower() for keyword in skip_keywords):
+                        continue
 
-    def scrape_bbc_comprehensive(self, url: str) -> List[Dict]:
-        """Comprehensive BBC scraping - extract all visible articles"""
-        # First get from RSS for structured data
-        articles = self.scrape_bbc_news(url)
-        
-        # Then get additional articles from main page
-        additional = self.scrape_generic_comprehensive(url, "BBC News")
-        
-        # Combine and deduplicate
-        all_titles = {article['title'].lower() for article in articles}
-        for article in additional:
-            if article['title'].lower() not in all_titles:
-                articles.append(article)
-                
-        return articles[:100]  # Limit BBC to 100 articles
+                    # Normalize URL
+                    if article_url.startswith('/'):
+                        article_url = urljoin(url, article_url)
+                    elif not article_url.startswith(('http://', 'https://')):
+                        continue
 
-    def scrape_cnn_comprehensive(self, url: str) -> List[Dict]:
-        """Comprehensive CNN scraping"""
-        articles = self.scrape_cnn(url)
-        additional = self.scrape_generic_comprehensive(url, "CNN")
-        
-        all_titles = {article['title'].lower() for article in articles}
-        for article in additional:
-            if article['title'].lower() not in all_titles:
-                articles.append(article)
-                
-        return articles[:100]
+                    # Skip duplicates
+                    if article_url in seen_urls:
+                        continue
+                    seen_urls.add(article_url)
 
-    def scrape_guardian_comprehensive(self, url: str) -> List[Dict]:
-        """Comprehensive Guardian scraping"""
-        articles = self.scrape_guardian(url)
-        additional = self.scrape_generic_comprehensive(url, "The Guardian")
-        
-        all_titles = {article['title'].lower() for article in articles}
-        for article in additional:
-            if article['title'].lower() not in all_titles:
-                articles.append(article)
-                
-        return articles[:100]
+                    # Skip obvious non-article URLs
+                    skip_url_patterns = [
+                        '/tag/', '/category/', '/author/', '/search/', '/page/',
+                        '/feed/', '/rss/', '/sitemap/', '/archive/', '/contact/',
+                        '.pdf', '.jpg', '.png', '.gif', '.mp4', '.video'
+                    ]
 
-    def scrape_times_of_india_comprehensive(self, url: str) -> List[Dict]:
-        """Comprehensive Times of India scraping"""
-        articles = self.scrape_times_of_india(url)
-        additional = self.scrape_generic_comprehensive(url, "Times of India")
-        
-        all_titles = {article['title'].lower() for article in articles}
-        for article in additional:
-            if article['title'].lower() not in all_titles:
-                articles.append(article)
-                
-        return articles[:100]
+                    if any(pattern in article_url.lower() for pattern in skip_url_patterns):
+                        continue
 
-    def scrape_ndtv_comprehensive(self, url: str) -> List[Dict]:
-        """Comprehensive NDTV scraping"""
-        articles = self.scrape_ndtv(url)
-        additional = self.scrape_generic_comprehensive(url, "NDTV")
-        
-        all_titles = {article['title'].lower() for article in articles}
-        for article in additional:
-            if article['title'].lower() not in all_titles:
-                articles.append(article)
-                
-        return articles[:100]
+                    # Extract article content (without full article extraction for speed)
+                    category, region = self.label_article(title, title, source_name)
+                    article_data = {
+                        'title': title,
+                        'url': article_url,
+                        'source': source_name,
+                        'fullContent': title,  # Use title as initial content
+                        'excerpt': title[:200] + '...' if len(title) > 200 else title,
+                        'publishedAt': None,
+                        'imageUrl': '',
+                        'author': '',
+                        'category': category,
+                        'region': region
+                    }
+
+                    articles.append(article_data)
+
+                    # Log progress every 50 articles
+                    if len(articles) % 50 == 0:
+                        logger.info(f"COMPREHENSIVE: Collected {len(articles)} articles from {source_name}")
+
+                    # Reasonable limit to prevent infinite collection
+                    if len(articles) >= 200:  # Collect up to 200 articles per source
+                        logger.info(f"COMPREHENSIVE: Reached limit of 200 articles for {source_name}")
+                        break
 
-    # Add fallback methods for sources that don't have comprehensive versions yet
-    def scrape_reuters_comprehensive(self, url: str) -> List[Dict]:
-        return self.scrape_generic_comprehensive(url, "Reuters")
-        
-    def scrape_npr_comprehensive(self, url: str) -> List[Dict]:
-        return self.scrape_generic_comprehensive(url, "NPR")
-        
-    def scrape_ap_comprehensive(self, url: str) -> List[Dict]:
-        return self.scrape_generic_comprehensive(url, "Associated Press")
-        
-    def scrape_hackernews_comprehensive(self, url: str) -> List[Dict]:
-        return self.scrape_generic_comprehensive(url, "Hacker News")
-        
-    def scrape_india_today_comprehensive(self, url: str) -> List[Dict]:
-        return self.scrape_generic_comprehensive(url, "India Today")
-        
-    def scrape_hindu_comprehensive(self, url: str) -> List[Dict]:
-        return self.scrape_generic_comprehensive(url, "The Hindu")
-        
-    def scrape_economic_times_comprehensive(self, url: str) -> List[Dict]:
-        return self.scrape_generic_comprehensive(url, "Economic Times")
-        
-    def scrape_techcrunch_comprehensive(self, url: str) -> List[Dict]:
-        return self.scrape_generic_comprehensive(url, "TechCrunch")
-        
-    def scrape_wired_comprehensive(self, url: str) -> List[Dict]:
-        return self.scrape_generic_comprehensive(url, "WIRED")
-        
-    def scrape_engadget_comprehensive(self, url: str) -> List[Dict]:
-        return self.scrape_generic_comprehensive(url, "Engadget")
-        
-    def scrape_ars_technica_comprehensive(self, url: str) -> List[Dict]:
-        return self.scrape_generic_comprehensive(url, "Ars Technica")
-        
-    def scrape_verge_comprehensive(self, url: str) -> List[Dict]:
-        return self.scrape_generic_comprehensive(url, "The Verge")
+            except Exception as e:
+                logger.debug(f"Selector '{selector}' failed for {source_name}: {e}")
+                continue
 
-    def categorize_article(self, title: str, content: str = "", source: str = "") -> str:
-        """Enhanced categorization based on title, content, and source"""
-        title_lower = title.lower()
-        content_lower = content.lower() if content else ""
-        source_lower = source.lower()
-        combined = f"{title_lower} {content_lower}"
-
-        # Source-based categorization first
-        if source_lower in ['techcrunch', 'the verge', 'engadget', 'ars technica', 'wired', 'hacker news']:
-            return 'technology'
-        elif source_lower in ['bloomberg', 'wall street journal', 'forbes', 'financial times', 'economic times']:
-            return 'business'
-
-        # Enhanced keyword matching with weighted scores
-        categories = {
-            'technology': ['ai', 'artificial intelligence', 'tech', 'technology', 'software', 'app', 'digital', 'cyber', 'robot', 'automation', 'startup', 'computer', 'internet', 'smartphone', 'gadget', 'coding', 'programming', 'data', 'algorithm', 'silicon valley', 'blockchain', 'cryptocurrency', 'metaverse', 'virtual reality', 'ar', 'vr', 'machine learning', 'iot'],
-            'business': ['business', 'economy', 'finance', 'market', 'stock', 'investment', 'company', 'corporate', 'trade', 'banking', 'money', 'funding', 'revenue', 'profit', 'earnings', 'merger', 'acquisition', 'ipo', 'nasdaq', 'dow jones', 'economic', 'financial', 'billion', 'million', 'dollar', 'rupee', 'gdp', 'inflation'],
-            'politics': ['politics', 'government', 'minister', 'parliament', 'election', 'policy', 'law', 'court', 'supreme', 'democracy', 'vote', 'president', 'prime minister', 'congress', 'senate', 'cabinet', 'diplomatic', 'treaty', 'sanctions', 'constitutional', 'legislature', 'judicial', 'executive'],
-            'sports': ['sports', 'cricket', 'football', 'olympics', 'match', 'team', 'player', 'game', 'championship', 'tournament', 'soccer', 'basketball', 'tennis', 'hockey', 'swimming', 'athletics', 'medal', 'victory', 'defeat', 'score', 'league'],
-            'science': ['science', 'research', 'study', 'discovery', 'scientist', 'medicine', 'health', 'space', 'nasa', 'quantum', 'climate', 'medical', 'pharmaceutical', 'vaccine', 'treatment', 'diagnosis', 'hospital', 'doctor', 'patient', 'therapy', 'clinical trial', 'breakthrough'],
-            'entertainment': ['movie', 'film', 'actor', 'actress', 'bollywood', 'hollywood', 'music', 'celebrity', 'entertainment', 'cinema', 'director', 'producer', 'album', 'song', 'concert', 'festival', 'award', 'oscar', 'emmy', 'grammy', 'netflix', 'streaming']
-        }
+            if len(articles) >= 200:
+                break
 
-        # Calculate scores for each category
-        scores = {}
-        for category, keywords in categories.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in combined:
-                    # Give higher weight to title matches
-                    if keyword in title_lower:
-                        score += 3
-                    else:
-                        score += 1
-            scores[category] = score
+        # Remove duplicates based on title similarity
+        unique_articles = self.deduplicate(articles)
 
-        # Return category with highest score, minimum threshold of 2
-        max_category = max(scores, key=scores.get)
-        if scores[max_category] >= 2:
-            return max_category
-        else:
-            return 'general'
+        logger.info(f"COMPREHENSIVE: Final result - {len(unique_articles)} unique articles from {source_name}")
+        return unique_articles[:150]  # Final limit per source
+
+    def merge_comprehensive(self, articles: List[Dict], additional: List[Dict], limit: int = 100) -> List[Dict]:
+        """Combine feed articles with homepage articles, dropping near-duplicate stories"""
+        return self.deduplicate(articles + additional)[:limit]
+
+    def scrape_comprehensive_source(self, source_key: str, url: str) -> List[Dict]:
+        """Comprehensive scraping for a source in the source registry"""
+        source = self.sources[source_key]
+        source_name = source.get('homepage_source', source['source'])
+        if not source.get('merge_feed'):
+            return self.scrape_generic_comprehensive(url, source_name)
+
+        # First get from RSS for structured data, then additional articles from main page
+        articles = self.scrape_registered_source(source_key, url)
+        additional = self.scrape_generic_comprehensive(url, source_name)
+        return self.merge_comprehensive(articles, additional)
+
+    def categorize_article(self, title: str, content: str = "", source: str = "") -> str:
+        """Enhanced categorization based on title, content, and source"""
+        with self.metrics.time('classify_seconds'):
+            return self.classifier.categorize(title, content, source)
 
     def detect_indian_content(self, title: str, content: str = "", source: str = "") -> str:
         """Detect if content is India-related"""
-        title_lower = title.lower()
-        content_lower = content.lower() if content else ""
-        source_lower = source.lower()
-        combined = f"{title_lower} {content_lower} {source_lower}"
-
-        indian_keywords = [
-            'india', 'indian', 'delhi', 'mumbai', 'bengaluru', 'bangalore', 'kolkata', 'chennai', 'hyderabad', 'pune',
-            'bollywood', 'rupee', 'modi', 'bjp', 'congress', 'lok sabha', 'rajya sabha', 'parliament', 'supreme court',
-            'maharashtra', 'gujarat', 'rajasthan', 'punjab', 'haryana', 'uttar pradesh', 'bihar', 'west bengal',
-            'kerala', 'tamil nadu', 'karnataka', 'andhra pradesh', 'telangana', 'odisha', 'jharkhand', 'chhattisgarh',
-            'isro', 'iit', 'iisc', 'tata', 'reliance', 'infosys', 'wipro', 'ola', 'flipkart', 'paytm', 'zomato'
-        ]
+        with self.metrics.time('classify_seconds'):
+            return self.classifier.region(title, content, source)
 
-        if any(keyword in combined for keyword in indian_keywords) or 'india' in source_lower:
-            return 'indian'
-        else:
-            return 'international'
+    def label_article(self, title: str, content: str = "", source: str = "",
+                      region_from_title: bool = False) -> Tuple[str, str]:
+        """(category, region) from one classifier pass, for callers that need both"""
+        with self.metrics.time('classify_seconds'):
+            return self.classifier.classify(title, content, source, region_from_title=region_from_title)
 
     def scrape_source_with_categories(self, url: str, source_name: str, target_articles: int = 20) -> List[Dict]:
         """
@@ -1751,34 +1106,27 @@ class NewsScraper:
             all_articles = self.scrape_source(url, source_name)
             
             # MANDATORY: Process each article to ensure full content extraction
-            for article in all_articles:
-                if article.get('url') and not article.get('fullContent'):
-                    logger.info(f"Extracting full content for: {article['title'][:50]}...")
-                    content_data = self.extract_full_article(article['url'])
-                    article.update(content_data)
-                    
-                # QUALITY CHECK: Ensure article has meaningful content
+            missing_content = [article for article in all_articles if article.get('url') and not article.get('fullContent')]
+            if missing_content:
+                logger.info(f"Extracting full content for {len(missing_content)} articles...")
+                self.extract_articles(missing_content)
+
+            # QUALITY CHECK: Ensure article has meaningful content
+            insufficient = [article for article in all_articles
+                            if not article.get('fullContent') or len(article.get('fullContent', '').strip()) < 50]
+            for article in insufficient:
+                logger.warning(f"Article has insufficient content: {article['title'][:50]}...")
+
+            # Try to re-extract content
+            self.extract_articles([article for article in insufficient if article.get('url')])
+
+            for article in insufficient:
+                # If still no content, use title as content fallback
                 if not article.get('fullContent') or len(article.get('fullContent', '').strip()) < 50:
-                    logger.warning(f"Article has insufficient content: {article['title'][:50]}...")
-                    # Try to re-extract content
-                    if article.get('url'):
-                        content_data = self.extract_full_article(article['url'])
-                        article.update(content_data)
-                    
-                    # If still no content, use title as content fallback
-                    if not article.get('fullContent') or len(article.get('fullContent', '').strip()) < 50:
-                        article['fullContent'] = article['title'] + "\n\n" + (article.get('excerpt', '') or 'Content not available')
+                    article['fullContent'] = article['title'] + "\n\n" + (article.get('excerpt', '') or 'Content not available')
             
-            # Remove duplicates based on title similarity
-            unique_articles = []
-            seen_titles = set()
-            for article in all_articles:
-                title_words = set(article['title'].lower().split())
-                is_duplicate = any(len(title_words.intersection(set(seen_title.split()))) > len(title_words) * 0.6 
-                                 for seen_title in seen_titles)
-                if not is_duplicate:
-                    unique_articles.append(article)
-                    seen_titles.add(article['title'].lower())
+            # Remove duplicates based on title and body similarity
+            unique_articles = self.deduplicate(all_articles)
             
             # Categorize articles
             categorized_articles = {
@@ -1792,11 +1140,9 @@ class NewsScraper:
                 }
             }
             
-            for article in unique_articles:
-                # Enhanced categorization
-                category = self.categorize_article(article['title'], article.get('fullContent', ''), source_name)
-                region = self.detect_indian_content(article['title'], article.get('fullContent', ''), source_name)
-                
+            with self.metrics.time('classify_seconds'):
+                labels = self.classifier.classify_batch(unique_articles, source=source_name)
+            for article, (category, region) in zip(unique_articles, labels):
                 article['category'] = category
                 article['region'] = region
                 
@@ -1828,8 +1174,12 @@ class NewsScraper:
             # STRICT ENFORCEMENT: If we don't have enough validated articles, try to get more
             if len(validated_articles) < target_articles:
                 logger.warning(f"Only {len(validated_articles)} articles validated, need {target_articles}")
-                # Try to get more articles from available categories
-                for region in ['indian', 'international']:
+                # Try to get more articles from available categories, the source's own region first
+                source_key = self.sources.key_for(url)
+                regions = ['indian', 'international']
+                if source_key and self.sources[source_key].get('region') == 'international':
+                    regions.reverse()
+                for region in regions:
                     if len(validated_articles) >= target_articles:
                         break
                     for category in categorized_articles[region]:
@@ -1896,67 +1246,76 @@ class NewsScraper:
         
         return selected[:target_count]
 
+    def deduplicate(self, articles: List[Dict], record: bool = False) -> List[Dict]:
+        """Drop near-duplicate stories; with record, kept articles are remembered for later sources and cycles"""
+        with self.metrics.time('dedupe_seconds'):
+            return self.near_duplicates.dedupe(articles, record=record)
+
+    def finalize_source_articles(self, source_name: str, articles: List[Dict]) -> List[Dict]:
+        """Drop already ingested URLs and near-duplicate stories, and make sure every article has content"""
+        processed_articles = []
+        # Enhanced duplicate detection across all sources
+        for article in self.deduplicate(self.skip_seen(articles), record=True):
+            # Ensure content is available (relaxed validation)
+            if not article.get('fullContent') or len(article.get('fullContent', '').strip()) < 20:
+                # Use title as fallback content
+                article['fullContent'] = article['title'] + "\n\n" + (article.get('excerpt', '') or 'Full content not available for this article.')
+                logger.info(f"Using title as content for: {article['title'][:50]}...")
+
+            # Add article to processed list
+            processed_articles.append(article)
+
+        with self.metrics.time('enrich_seconds'):
+            return self.enricher.enrich(processed_articles)
+
+    def iter_all_sources(self, sources: List[Dict], deadline: Optional[float] = None) -> Iterator[Dict]:
+        """Yield finalized articles source by source, as soon as each source has been scraped.
+
+        Sources not yet started when ``deadline`` (a ``time.time()`` value)
+        passes are skipped and listed in ``deferred_sources``; the source
+        being scraped at the deadline is finished first.
+        """
+        self.start_cycle()
+        # New articles each source yielded this cycle, by source URL, for the scheduler's poll history
+        self.new_articles_by_source = {}
+        self.deferred_sources = []
+        for index, source in enumerate(sources):
+            if not source.get('isActive', True):
+                continue
+            if deadline is not None and time.time() >= deadline:
+                self.deferred_sources = [pending for pending in sources[index:] if pending.get('isActive', True)]
+                logger.warning(f"Cycle deadline reached; deferring {len(self.deferred_sources)} sources")
+                break
+
+            logger.info(f"COMPREHENSIVE SCRAPING: Extracting ALL articles from {source['name']}")
+
+            # Use comprehensive scraping method to get all available articles
+            articles = self.scrape_source_comprehensive(source['url'], source['name'])
+            processed_articles = self.finalize_source_articles(source['name'], articles)
+            self.new_articles_by_source[source['url']] = len(processed_articles)
+            indian_count = sum(1 for article in processed_articles if article.get('region') == 'indian')
+
+            # STRICT RULE VALIDATION: Log the exact distribution
+            logger.info(f"STRICT RULE RESULT: {source['name']} provided {len(processed_articles)} articles")
+            logger.info(f"  - Indian articles: {indian_count}")
+            logger.info(f"  - International articles: {len(processed_articles) - indian_count}")
+
+            if len(processed_articles) < ARTICLES_PER_SOURCE:
+                logger.warning(f"WARNING: {source['name']} only provided {len(processed_articles)} articles, expected {ARTICLES_PER_SOURCE}")
+
+            yield from processed_articles
+        self.finish_cycle()
+
     def scrape_all_sources(self, sources: List[Dict]) -> List[Dict]:
         """
         ENHANCED COMPREHENSIVE SCRAPING: Extract ALL available articles from each source's main page
         This ensures maximum data collection from top to bottom of each news site
         """
-        all_articles = []
-        seen_titles = set()  # Track titles to prevent duplicates
-        
         logger.info(f"COMPREHENSIVE SCRAPING: Starting complete extraction from {len(sources)} sources")
         logger.info(f"Target: Extract ALL visible articles from each source's main page")
-        
-        for source in sources:
-            if source.get('isActive', True):
-                logger.info(f"COMPREHENSIVE SCRAPING: Extracting ALL articles from {source['name']}")
-                
-                # Use comprehensive scraping method to get all available articles
-                articles = self.scrape_source_comprehensive(source['url'], source['name'])
-                
-                processed_articles = []
-                indian_count = 0
-                international_count = 0
-                
-                for article in articles:
-                    # Enhanced duplicate detection across all sources
-                    title_clean = article['title'].strip().lower()
-                    # Create a more robust duplicate key using title and source
-                    duplicate_key = f"{title_clean}_{source['name'].lower()}"
-                    
-                    if duplicate_key in seen_titles:
-                        continue
-                    
-                    # Ensure content is available (relaxed validation)
-                    if not article.get('fullContent') or len(article.get('fullContent', '').strip()) < 20:
-                        # Use title as fallback content
-                        article['fullContent'] = article['title'] + "\n\n" + (article.get('excerpt', '') or 'Full content not available for this article.')
-                        logger.info(f"Using title as content for: {article['title'][:50]}...")
-                    
-                    # Count region distribution
-                    region = article.get('region', 'international')
-                    if region == 'indian':
-                        indian_count += 1
-                    else:
-                        international_count += 1
-                    
-                    # Add article to processed list
-                    processed_articles.append(article)
-                    seen_titles.add(duplicate_key)
-                
-                # Add processed articles to the main list
-                all_articles.extend(processed_articles)
-                
-                # STRICT RULE VALIDATION: Log the exact distribution
-                logger.info(f"STRICT RULE RESULT: {source['name']} provided {len(processed_articles)} articles")
-                logger.info(f"  - Indian articles: {indian_count}")
-                logger.info(f"  - International articles: {international_count}")
-                
-                if len(processed_articles) < ARTICLES_PER_SOURCE:
-                    logger.warning(f"WARNING: {source['name']} only provided {len(processed_articles)} articles, expected {ARTICLES_PER_SOURCE}")
-                
-                logger.info(f"Total articles collected so far: {len(all_articles)}")
-        
+
+        all_articles = list(self.iter_all_sources(sources))
+
         # Final statistics and validation
         category_counts = {}
         region_counts = {}
@@ -0,0 +1,121 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEEN_URLS_FILE = "seen_urls.json"
+DEFAULT_SEEN_URL_TTL_HOURS = 168
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'ref', 'ref_src', 'cmpid', 'cmp', 'ncid', 'ocid', 'intcmp', 'ito',
+    'at_medium', 'at_campaign', 'mc_cid', 'mc_eid', 'ftag', 'from'
+}
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize an article URL so links to the same page compare equal.
+
+    Scheme, ``www.``, default ports, fragments, trailing slashes and
+    tracking parameters are dropped; remaining query parameters are sorted.
+    """
+    url = (url or '').strip()
+    try:
+        parsed = urlparse(url)
+    except Exception:
+        return url
+    if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+        return url
+
+    host = (parsed.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+
+    path = parsed.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    return urlunparse(('https', host, path, parsed.params, urlencode(query), ''))
+
+
+class SeenUrlIndex:
+    """Canonical URLs of articles already saved to storage, persisted to disk.
+
+    Scrapers consult it before extracting an article so steady-state cycles
+    only download pages that are actually new. Entries expire after
+    ``ttl_hours`` so the file stays bounded.
+    """
+
+    def __init__(self, filename: str = DEFAULT_SEEN_URLS_FILE, ttl_hours: float = DEFAULT_SEEN_URL_TTL_HOURS):
+        self.filename = filename
+        self.ttl_seconds = ttl_hours * 3600
+        self.skipped = 0
+        self._lock = threading.Lock()
+        self._seen: Dict[str, float] = self._load()
+
+    def _load(self) -> Dict[str, float]:
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                seen = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable seen-URL index {self.filename}: {str(e)}")
+            return {}
+        cutoff = time.time() - self.ttl_seconds
+        return {url: saved_at for url, saved_at in seen.items() if saved_at >= cutoff}
+
+    def _save(self):
+        tmp_filename = f"{self.filename}.tmp"
+        try:
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                json.dump(self._seen, f)
+            os.replace(tmp_filename, self.filename)
+        except Exception as e:
+            logger.error(f"Error saving seen-URL index: {str(e)}")
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            saved_at = self._seen.get(canonicalize_url(url))
+        return saved_at is not None and time.time() - saved_at < self.ttl_seconds
+
+    def filter_new(self, articles: List[Dict]) -> List[Dict]:
+        """Drop articles whose URL was already saved; articles without a URL are kept"""
+        new_articles = [article for article in articles if not article.get('url') or article['url'] not in self]
+        skipped = len(articles) - len(new_articles)
+        if skipped:
+            with self._lock:
+                self.skipped += skipped
+            logger.info(f"Skipping {skipped} already ingested articles")
+        return new_articles
+
+    def add_many(self, urls: Iterable[str]):
+        """Record successfully saved article URLs and persist the index"""
+        now = time.time()
+        cutoff = now - self.ttl_seconds
+        with self._lock:
+            for url in urls:
+                if url:
+                    self._seen[canonicalize_url(url)] = now
+            # Expired entries are pruned whenever the index is written
+            self._seen = {url: saved_at for url, saved_at in self._seen.items() if saved_at >= cutoff}
+            self._save()
@@ -0,0 +1,206 @@
+"""
+Per-source scheduling for the scraper service.
+
+``SourceSchedule`` keeps every active source in a min-heap ordered by the
+time it is next due, each with its own interval, so the scheduler can
+sleep exactly until the earliest source is due instead of polling.
+``ConfigWatcher`` reports writes to the config file through watchdog when
+it is installed; without it the scheduler checks the file's modification
+time every ``CONFIG_POLL_SECONDS``.
+"""
+
+import heapq
+import importlib.util
+import itertools
+import logging
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_MINUTES = 20
+# How often the active source list is re-read from storage
+DEFAULT_SOURCE_REFRESH_MINUTES = 10
+# Wall-clock budget for one scheduled run; sources not started by then wait for the next run
+DEFAULT_CYCLE_BUDGET_MINUTES = 15
+# How often the config file is checked for changes when watchdog is not installed
+CONFIG_POLL_SECONDS = 30
+
+
+class SourceSchedule:
+    """Sources ordered by when each is next due, every one on its own interval.
+
+    Sources are keyed by URL. Rescheduling pushes a new heap entry and the
+    superseded one is skipped when it surfaces, so changing an interval or
+    dropping a source costs O(log n). A popped source is not due again
+    until ``reschedule`` is called for it, so a run that overruns the
+    source's interval never overlaps the next one.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self._heap: List[Tuple[float, int, str]] = []
+        self._entries: Dict[str, Dict] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._entries
+
+    def _push(self, url: str, due: float):
+        entry = self._entries[url]
+        entry['due'] = due
+        entry['seq'] = next(self._counter)
+        heapq.heappush(self._heap, (due, entry['seq'], url))
+
+    def _is_current(self, item: Tuple[float, int, str]) -> bool:
+        entry = self._entries.get(item[2])
+        return entry is not None and entry['seq'] == item[1] and entry['due'] is not None
+
+    def sync(self, sources: List[Dict], interval_for: Callable[[Dict], float]):
+        """Match the schedule to the active sources.
+
+        New sources are due now and removed ones are dropped. A changed
+        interval counts from the source's last run.
+        """
+        now = self.clock()
+        wanted = {source['url']: source for source in sources if source.get('url')}
+        for url in list(self._entries):
+            if url not in wanted:
+                del self._entries[url]
+
+        for url, source in wanted.items():
+            interval = float(interval_for(source))
+            entry = self._entries.get(url)
+            if entry is None:
+                self._entries[url] = {'source': source, 'interval': interval, 'last_run': None, 'due': None, 'seq': None}
+                self._push(url, now)
+                continue
+            entry['source'] = source
+            if interval != entry['interval']:
+                entry['interval'] = interval
+                # A running source picks the new interval up when it is rescheduled
+                if entry['due'] is not None:
+                    last_run = entry['last_run']
+                    self._push(url, now if last_run is None else max(now, last_run + interval))
+
+    def interval(self, url: str) -> Optional[float]:
+        entry = self._entries.get(url)
+        return entry['interval'] if entry else None
+
+    def next_due(self) -> Optional[float]:
+        """When the earliest waiting source is due, or None when none is waiting"""
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[float] = None) -> List[Dict]:
+        """Take every source that is due, earliest first"""
+        now = self.clock() if now is None else now
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            item = heapq.heappop(self._heap)
+            if self._is_current(item):
+                entry = self._entries[item[2]]
+                entry['due'] = None
+                entry['popped_due'] = item[0]
+                due.append(entry['source'])
+        return due
+
+    def defer(self, url: str):
+        """Put back a popped source that did not run, at its original due time so it goes first"""
+        entry = self._entries.get(url)
+        if entry is not None and entry['due'] is None:
+            self._push(url, entry.get('popped_due', self.clock()))
+
+    def reschedule(self, url: str, started: float, finished: Optional[float] = None,
+                   interval: Optional[float] = None):
+        """Queue a source that has run again, one interval after its run started.
+
+        ``interval`` replaces the source's interval from this run on.
+        """
+        entry = self._entries.get(url)
+        if entry is None:
+            return
+        finished = self.clock() if finished is None else finished
+        if interval is not None:
+            entry['interval'] = float(interval)
+        entry['last_run'] = started
+        self._push(url, max(started + entry['interval'], finished))
+
+
+class ConfigWatcher:
+    """Calls ``on_change`` whenever the config file is written.
+
+    Uses watchdog's native file-system events when the package is
+    installed; ``start`` returns False otherwise, and the owner calls
+    ``check`` at least every ``poll_seconds`` to compare the file's
+    modification time instead. The file's directory is watched, so
+    editors that replace the file are noticed too.
+    """
+
+    def __init__(self, path: str, on_change: Callable[[], None], poll_seconds: float = CONFIG_POLL_SECONDS):
+        self.path = os.path.abspath(path)
+        self.on_change = on_change
+        self.poll_seconds = poll_seconds
+        self._observer = None
+        self._stamp = self._file_stamp()
+
+    @property
+    def polling(self) -> bool:
+        """True when changes are only found by ``check``"""
+        return self._observer is None
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def start(self) -> bool:
+        self.remember()
+        if importlib.util.find_spec('watchdog') is None:
+            logger.info(f"watchdog is not installed; checking the config file every {self.poll_seconds}s")
+            return False
+
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                paths = (getattr(event, 'src_path', ''), getattr(event, 'dest_path', ''))
+                if any(path and os.path.abspath(path) == watcher.path for path in paths):
+                    watcher.on_change()
+
+        self._observer = Observer()
+        self._observer.daemon = True
+        self._observer.schedule(Handler(), os.path.dirname(self.path), recursive=False)
+        self._observer.start()
+        return True
+
+    def remember(self):
+        """Treat the file as it is now as already seen by ``check``"""
+        self._stamp = self._file_stamp()
+
+    def check(self) -> bool:
+        """Without watchdog, call ``on_change`` if the file changed since the last check"""
+        if not self.polling:
+            return False
+        stamp = self._file_stamp()
+        if stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        self.on_change()
+        return True
+
+    def stop(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
@@ -0,0 +1,129 @@
+import logging
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_FEED_TIMEOUT = 10
+DEFAULT_FEED_ITEM_LIMIT = 25
+DEFAULT_INDEX_TIMEOUT = 15
+DEFAULT_COMPREHENSIVE_TIMEOUT = 20
+DEFAULT_SOURCE_OVERRIDES = None
+# How much of each feed article is fetched: feed data only, feed plus the page's <head> meta, or the whole page
+SCRAPE_DEPTHS = ('headline', 'summary', 'full')
+DEFAULT_SCRAPE_DEPTH = 'full'
+
+# One row per news source, keyed by its registered domain. Every URL on that domain or a
+# subdomain of it is scraped with the row:
+#   source               name given to feed and index articles
+#   homepage_source      name used for comprehensive homepage scraping (defaults to source)
+#   rss_url, item_limit  feed tried first, and how many of its items are used (default 25)
+#   description_fallback use the feed description when full extraction fails
+#   index_parser         NewsScraper parse_*_index method for the homepage, tried after the feed
+#   index_timeout        timeout for that homepage request (default DEFAULT_INDEX_TIMEOUT)
+#   generic_fallback     fall back to the generic homepage scraper when all else failed (default True)
+#   merge_feed           comprehensive scraping merges feed articles into the homepage links
+#   depth                one of SCRAPE_DEPTHS for the feed's articles (default: the scrape_depth config key)
+#   region               'indian' or 'international': which region tops up a short category selection first
+#   concurrency          parallel article downloads per host (default per_domain_concurrency)
+#   interval_minutes     how often the scheduler scrapes the source (default: the interval_minutes config key)
+SOURCE_REGISTRY = {
+    'bbc.com': {'source': 'BBC News', 'rss_url': "http://feeds.bbci.co.uk/news/rss.xml", 'item_limit': 25,
+                'merge_feed': True, 'region': 'international'},
+    'reuters.com': {'source': 'Reuters', 'index_parser': 'parse_reuters_index', 'region': 'international'},
+    'cnn.com': {'source': 'CNN', 'rss_url': "http://rss.cnn.com/rss/edition.rss", 'item_limit': 25,
+                'merge_feed': True, 'region': 'international'},
+    'theguardian.com': {'source': 'The Guardian', 'rss_url': "https://www.theguardian.com/world/rss", 'item_limit': 25,
+                        'merge_feed': True, 'region': 'international'},
+    'npr.org': {'source': 'NPR News', 'homepage_source': 'NPR', 'rss_url': "https://feeds.npr.org/1001/rss.xml",
+                'item_limit': 25, 'region': 'international'},
+    'apnews.com': {'source': 'Associated Press', 'rss_url': "https://feeds.ap.org/ApTopHeadlines", 'item_limit': 25,
+                   'region': 'international'},
+    'ycombinator.com': {'source': 'Hacker News', 'index_parser': 'parse_hackernews_index', 'generic_fallback': False,
+                        'region': 'international'},
+    'indiatoday.in': {'source': 'India Today', 'rss_url': "https://www.indiatoday.in/rss/1206578", 'item_limit': 25,
+                      'index_parser': 'parse_india_today_index', 'index_timeout': 10, 'region': 'indian'},
+    'ndtv.com': {'source': 'NDTV', 'rss_url': "https://feeds.feedburner.com/ndtvnews-top-stories", 'item_limit': 20,
+                 'description_fallback': True, 'merge_feed': True, 'region': 'indian', 'interval_minutes': 5},
+    'timesofindia.indiatimes.com': {'source': 'Times of India', 'rss_url': "https://timesofindia.indiatimes.com/rssfeedstopstories.cms",
+                                    'item_limit': 20, 'description_fallback': True, 'merge_feed': True, 'region': 'indian'},
+    'thehindu.com': {'source': 'Hindu', 'homepage_source': 'The Hindu', 'rss_url': "https://www.thehindu.com/feeder/default.rss",
+                     'item_limit': 15, 'region': 'indian'},
+    'economictimes.indiatimes.com': {'source': 'Economic Times', 'rss_url': "https://economictimes.indiatimes.com/rssfeedstopstories.cms",
+                                     'item_limit': 20, 'description_fallback': True, 'region': 'indian'},
+    'techcrunch.com': {'source': 'TechCrunch', 'rss_url': "https://techcrunch.com/feed/", 'item_limit': 10, 'region': 'international',
+                       'interval_minutes': 60},
+    'wired.com': {'source': 'WIRED', 'rss_url': "https://www.wired.com/feed/rss", 'item_limit': 10, 'region': 'international',
+                  'interval_minutes': 60},
+    'engadget.com': {'source': 'Engadget', 'rss_url': "https://www.engadget.com/rss.xml", 'item_limit': 10, 'region': 'international',
+                     'interval_minutes': 60},
+    'arstechnica.com': {'source': 'Ars Technica', 'rss_url': "https://feeds.arstechnica.com/arstechnica/index", 'item_limit': 10,
+                        'region': 'international', 'interval_minutes': 60},
+    'theverge.com': {'source': 'The Verge', 'rss_url': "https://www.theverge.com/rss/index.xml", 'item_limit': 10,
+                     'region': 'international', 'interval_minutes': 60},
+}
+
+# Rows with a feed, for callers that only need the feeds
+RSS_FEEDS = {key: row for key, row in SOURCE_REGISTRY.items() if row.get('rss_url')}
+
+
+class SourceRegistry:
+    """Source rows with lookup by host.
+
+    A host matches the row registered for it or for its closest parent
+    domain (``news.ycombinator.com`` finds ``ycombinator.com``), so a lookup
+    is one dict probe per hostname label however many sources there are.
+    ``overrides`` rows, from the ``source_registry`` config key, are merged
+    over the built-in row with the same key or added as new sources.
+    """
+
+    def __init__(self, overrides: Optional[Dict[str, Dict]] = DEFAULT_SOURCE_OVERRIDES):
+        self.rows: Dict[str, Dict] = {key: dict(row) for key, row in SOURCE_REGISTRY.items()}
+        for key, row in (overrides or {}).items():
+            key = key.lower()
+            merged = dict(self.rows.get(key, {}), **row)
+            if not merged.get('source'):
+                logger.warning(f"Ignoring source row {key}: it has no source name")
+                continue
+            self.rows[key] = merged
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.rows)
+
+    def __getitem__(self, key: str) -> Dict:
+        return self.rows[key]
+
+    def key_for_host(self, host: str) -> Optional[str]:
+        """Key of the row for host or its closest registered parent domain"""
+        labels = host.lower().split(':')[0].rstrip('.').split('.')
+        for index in range(len(labels)):
+            candidate = '.'.join(labels[index:])
+            if candidate in self.rows:
+                return candidate
+        return None
+
+    def key_for(self, url: str) -> Optional[str]:
+        """Key of the row for url's host, or None for unregistered sites"""
+        try:
+            host = urlparse(url).netloc
+        except Exception:
+            return None
+        return self.key_for_host(host) if host else None
+
+    def concurrency(self, host: str, default: int) -> int:
+        """Parallel downloads allowed against host"""
+        key = self.key_for_host(host) if host else None
+        return max(1, int(self.rows[key].get('concurrency', default))) if key else default
+
+    def interval_minutes(self, url: str, default: float) -> float:
+        """Minutes between scheduled scrapes of the source at url"""
+        key = self.key_for(url)
+        return max(1, float(self.rows[key].get('interval_minutes', default))) if key else default
+
+
+# Built-in rows, for code that has no scraper config to hand
+default_registry = SourceRegistry()
@@ -1,15 +1,30 @@
 import requests
+import gzip
 import json
 import logging
 import os
 from typing import List, Dict, Optional
+from .metrics import MetricsRegistry
+from .seen_urls import SeenUrlIndex
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_BULK_CHUNK_SIZE = 100
+
 class StorageIntegration:
-    def __init__(self, base_url: str = "http://0.0.0.0:5000"):
+    def __init__(self, base_url: str = "http://0.0.0.0:5000", seen_urls: Optional[SeenUrlIndex] = None,
+                 bulk_chunk_size: int = DEFAULT_BULK_CHUNK_SIZE, metrics: Optional[MetricsRegistry] = None):
         self.base_url = base_url
+        # Save latency and outcomes; pass the scraper's registry to report both in one snapshot
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        # Articles are saved in chunks through /api/articles/bulk; None until the route has been tried
+        self.bulk_chunk_size = max(1, bulk_chunk_size)
+        self.bulk_supported: Optional[bool] = None
+        # Requests that failed with a server or connection error, across every save
+        self.request_failures = 0
+        # Successfully saved URLs are recorded here so the scraper skips them next cycle
+        self.seen_urls = seen_urls
         self.session = requests.Session()
         self.session.headers.update({
             'Content-Type': 'application/json',
@@ -41,72 +56,157 @@ class StorageIntegration:
             logger.error(f"Error getting sources from storage: {str(e)}")
             return []
 
+    def _article_payload(self, article: Dict) -> Optional[Dict]:
+        """Convert a scraped article into the API's article schema, or None if it cannot be saved"""
+        # Ensure the title meets minimum length requirement
+        title = article.get('title', '').strip()
+        if len(title) < 10:  # Skip articles with very short titles
+            logger.warning(f"Skipping article with short title: {title}")
+            return None
+
+        # Clean and validate URL
+        url = article.get('url', '').strip()
+        if not url or not url.startswith(('http://', 'https://')):
+            url = None
+
+        # Clean image URL
+        image_url = article.get('imageUrl', '')
+        if image_url and not image_url.startswith(('http://', 'https://')):
+            image_url = None
+
+        # Convert publishedAt to ISO string if it's a date
+        published_at = article.get('publishedAt')
+        if published_at and hasattr(published_at, 'isoformat'):
+            published_at = published_at.isoformat()
+        elif published_at and isinstance(published_at, str):
+            # Already a string, keep as is
+            pass
+        else:
+            published_at = None
+
+        return {
+            'sourceName': article['source'],
+            'originalTitle': title,
+            'originalUrl': url,
+            'fullContent': article.get('fullContent'),
+            'excerpt': article.get('excerpt'),
+            'publishedAt': published_at,
+            'imageUrl': image_url,
+            'author': article.get('author'),
+            'category': article.get('category', 'general'),
+            'region': article.get('region', 'international'),
+            # Set only when the enrichment stage is enabled
+            'keywords': article.get('keywords'),
+            'summary': article.get('summary'),
+            'imageWidth': article.get('imageWidth'),
+            'imageHeight': article.get('imageHeight'),
+        }
+
     def save_scraped_articles(self, articles: List[Dict]) -> bool:
         """Save scraped articles to the Node.js storage"""
+        payloads = [payload for payload in (self._article_payload(article) for article in articles) if payload]
+        saved_urls = []
+        failures_before = self.request_failures
         try:
-            saved_count = 0
-            for article in articles:
-                # Ensure the title meets minimum length requirement
-                title = article.get('title', '').strip()
-                if len(title) < 10:  # Skip articles with very short titles
-                    logger.warning(f"Skipping article with short title: {title}")
-                    continue
-
-                # Clean and validate URL
-                url = article.get('url', '').strip()
-                if not url or not url.startswith(('http://', 'https://')):
-                    url = None
-
-                # Clean image URL
-                image_url = article.get('imageUrl', '')
-                if image_url and not image_url.startswith(('http://', 'https://')):
-                    image_url = None
-
-                # Convert publishedAt to ISO string if it's a date
-                published_at = article.get('publishedAt')
-                if published_at and hasattr(published_at, 'isoformat'):
-                    published_at = published_at.isoformat()
-                elif published_at and isinstance(published_at, str):
-                    # Already a string, keep as is
-                    pass
-                else:
-                    published_at = None
-
-                article_data = {
-                    'sourceName': article['source'],
-                    'originalTitle': title,
-                    'originalUrl': url,
-                    'fullContent': article.get('fullContent'),
-                    'excerpt': article.get('excerpt'),
-                    'publishedAt': published_at,
-                    'imageUrl': image_url,
-                    'author': article.get('author'),
-                    'category': article.get('category', 'general'),
-                    'region': article.get('region', 'international'),
-                }
+            results = self.save_article_payloads(payloads)
+            self.metrics.increment('articles_saved_total', sum(results))
+            self.metrics.increment('articles_save_failed_total', len(results) - sum(results))
+            for payload, saved in zip(payloads, results):
+                if saved:
+                    saved_urls.append(payload['originalUrl'])
+                    logger.info(f"Saved article: {payload['originalTitle'][:50]}...")
+
+            logger.info(f"Successfully saved {len(saved_urls)} out of {len(articles)} articles")
+            # Nothing got through because storage could not be reached
+            return bool(saved_urls) or self.request_failures == failures_before
 
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error saving articles to storage: {str(e)}")
+            self.metrics.increment('save_failures_total')
+            return False
+
+        finally:
+            if self.seen_urls is not None and saved_urls:
+                self.seen_urls.add_many(saved_urls)
+
+    def save_article_payloads(self, payloads: List[Dict]) -> List[bool]:
+        """Save API-shaped articles in chunked bulk requests; returns one saved flag per payload.
+
+        Falls back to one POST per article when the server has no bulk
+        route, or when a chunk is rejected as too large. A chunk that fails
+        with a server or connection error counts as unsaved and the
+        remaining chunks are still sent.
+        """
+        results = []
+        for start in range(0, len(payloads), self.bulk_chunk_size):
+            chunk = payloads[start:start + self.bulk_chunk_size]
+            try:
+                chunk_results = self._save_bulk_chunk(chunk) if self.bulk_supported is not False else None
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Error saving a chunk of {len(chunk)} articles: {str(e)}")
+                self.request_failures += 1
+                self.metrics.increment('save_failures_total')
+                chunk_results = [False] * len(chunk)
+            if chunk_results is None:
+                chunk_results = [self.save_article_payload(payload) for payload in chunk]
+            results.extend(chunk_results)
+        return results
+
+    def _save_bulk_chunk(self, chunk: List[Dict]) -> Optional[List[bool]]:
+        body = gzip.compress(json.dumps({'articles': chunk}).encode('utf-8'), compresslevel=5)
+        with self.metrics.time('save_seconds', route='bulk'):
+            response = self.session.post(
+                f"{self.base_url}/api/articles/bulk",
+                data=body,
+                headers={'Content-Encoding': 'gzip'},
+                timeout=30
+            )
+        self.metrics.increment('saved_bytes_total', len(body))
+
+        if response.status_code in (404, 405):
+            logger.warning("Bulk article route not available, saving articles one by one")
+            self.bulk_supported = False
+            return None
+        if response.status_code == 413:
+            logger.warning(f"Bulk chunk of {len(chunk)} articles rejected as too large, saving one by one")
+            return None
+        response.raise_for_status()
+        self.bulk_supported = True
+
+        item_results = response.json().get('results', [])
+        saved = []
+        for payload, result in zip(chunk, item_results):
+            if not result.get('success'):
+                logger.warning(f"Failed to save article: {payload['originalTitle'][:50]}... - Status: {result.get('status')}")
+                if result.get('status') == 400:
+                    logger.warning(f"Validation error: {result.get('details')}")
+            saved.append(bool(result.get('success')))
+        # Missing results count as failures
+        saved.extend([False] * (len(chunk) - len(saved)))
+        return saved
+
+    def save_article_payload(self, article_data: Dict) -> bool:
+        """Save one API-shaped article with a single POST"""
+        try:
+            with self.metrics.time('save_seconds', route='single'):
                 response = self.session.post(
                     f"{self.base_url}/api/articles",
                     json=article_data,
                     headers=self.session.headers,
                     timeout=10
                 )
-
-                if response.status_code != 200:
-                    logger.warning(f"Failed to save article: {article['title'][:50]}... - Status: {response.status_code}")
-                    if response.status_code == 400:
-                        logger.warning(f"Validation error: {response.text}")
-                    continue
-
-                saved_count += 1
-                logger.info(f"Saved article: {article['title'][:50]}...")
-
-            logger.info(f"Successfully saved {saved_count} out of {len(articles)} articles")
-            return True
-
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error saving articles to storage: {str(e)}")
+            logger.error(f"Error saving article {article_data['originalTitle'][:50]}...: {str(e)}")
+            self.request_failures += 1
+            self.metrics.increment('save_failures_total')
+            return False
+
+        if response.status_code != 200:
+            logger.warning(f"Failed to save article: {article_data['originalTitle'][:50]}... - Status: {response.status_code}")
+            if response.status_code == 400:
+                logger.warning(f"Validation error: {response.text}")
             return False
+        return True
 
     def get_pending_articles(self) -> List[Dict]:
         """Get articles that need AI rephrasing"""
@@ -26,6 +26,11 @@ export const newsArticles = pgTable("news_articles", {
   author: text("author"),
   category: text("category").default("general"), // general, technology, politics, sports, business, entertainment, health, science, indian
   region: text("region").default("international"), // indian, international
+  // Filled in by the scraper's optional enrichment stage
+  keywords: jsonb("keywords").$type<string[]>(),
+  summary: text("summary"),
+  imageWidth: integer("image_width"),
+  imageHeight: integer("image_height"),
   status: text("status").notNull().default("pending"), // pending, processing, completed, failed
   scrapedAt: timestamp("scraped_at").defaultNow(),
   rephrasedAt: timestamp("rephrased_at"),
@@ -68,6 +73,10 @@ export const insertNewsArticleSchema = createInsertSchema(newsArticles).pick({
   author: true,
   category: true,
   region: true,
+  keywords: true,
+  summary: true,
+  imageWidth: true,
+  imageHeight: true,
 }).extend({
   originalTitle: z.string().min(1, "Title is required"),
   sourceName: z.string().min(1, "Source name is required"),
@@ -76,6 +85,10 @@ export const insertNewsArticleSchema = createInsertSchema(newsArticles).pick({
   category: z.string().optional(),
   region: z.string().optional(),
   publishedAt: z.union([z.string(), z.date()]).optional().nullable(),
+  keywords: z.array(z.string()).optional().nullable(),
+  summary: z.string().optional().nullable(),
+  imageWidth: z.number().int().optional().nullable(),
+  imageHeight: z.number().int().optional().nullable(),
 });
 
 export const updateScraperConfigSchema = createInsertSchema(scraperConfig).pick({
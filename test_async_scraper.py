@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Test the asyncio scraping engine against an in-process stub transport"""
+
+import sys
+import os
+import asyncio
+import json
+import tempfile
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+import httpx
+from services.async_scraper import AsyncNewsScraper, AsyncSourceRunner
+from services.pipeline import ScrapePipeline
+from services.scraper import NewsScraper, RSS_FEEDS
+from services.scheduler import NewsScraperScheduler
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ARTICLE_BODY = " ".join(["The committee published its findings on regional transport funding today."] * 12)
+
+def stub_feed(count):
+    items = "".join(
+        f"<item><title>Stub headline number {i} about transport funding</title>"
+        f"<link>https://stub.example/articles/{i}</link>"
+        f"<description>Short summary {i}</description></item>"
+        for i in range(count)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'
+
+def stub_article(path):
+    return (f"<html><head><title>{path}</title>"
+            f'<meta property="og:image" content="https://stub.example/img{path}.jpg"></head>'
+            f"<body><article><p>{ARTICLE_BODY}</p></article></body></html>")
+
+def make_transport(requested):
+    async def handler(request):
+        requested.append(str(request.url))
+        if request.url.host == 'slow.example':
+            await asyncio.sleep(5)
+        if str(request.url) == RSS_FEEDS['bbc.com']['rss_url']:
+            return httpx.Response(200, text=stub_feed(5), headers={'content-type': 'application/rss+xml'})
+        if request.url.host == 'stub.example':
+            return httpx.Response(200, text=stub_article(request.url.path), headers={'content-type': 'text/html'})
+        return httpx.Response(404)
+    return httpx.MockTransport(handler)
+
+def test_rss_source_fetches_feed_and_articles():
+    """An RSS source fetches its feed and every article over the shared client"""
+    requested = []
+
+    async def run():
+        async with AsyncNewsScraper(transport=make_transport(requested)) as scraper:
+            return await scraper.scrape_source("https://www.bbc.com/news", "BBC News")
+
+    articles = asyncio.run(run())
+
+    assert len(articles) == 5
+    assert all(article['source'] == 'BBC News' for article in articles)
+    assert all(article['fullContent'] and 'regional transport funding' in article['fullContent'] for article in articles)
+    assert sum(1 for url in requested if 'stub.example' in url) == 5
+    logger.info(f"✅ Async scrape returned {len(articles)} articles with content")
+
+def test_timeout_cancels_unfinished_sources():
+    """Sources still running at the deadline are cancelled instead of awaited"""
+    async def slow_handler(request):
+        await asyncio.sleep(5)
+        return httpx.Response(200, text="")
+
+    async def run():
+        async with AsyncNewsScraper(transport=httpx.MockTransport(slow_handler)) as scraper:
+            return await scraper.scrape_all_sources(
+                [{'name': 'Slow Source', 'url': 'https://slow.example', 'isActive': True}], timeout=0.2
+            )
+
+    assert asyncio.run(run()) == []
+    logger.info("✅ Unfinished sources were cancelled at the deadline")
+
+def test_empty_source_list_finishes_the_cycle():
+    """A cycle with no active sources is still started and finished"""
+    scraper = NewsScraper({'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None,
+                           'html_cache_dir': None})
+    finished = []
+    scraper.finish_cycle = lambda: finished.append(True)
+    scraper.deferred_sources = [{'name': 'Left over'}]
+
+    async def run():
+        async with AsyncNewsScraper(scraper=scraper, transport=make_transport([])) as engine:
+            return await engine.scrape_all_sources([{'name': 'Off', 'url': 'https://off.example', 'isActive': False}])
+
+    assert asyncio.run(run()) == [] and finished == [True]
+    assert scraper.deferred_sources == [] and scraper.new_articles_by_source == {}
+    logger.info("✅ An empty cycle is finished")
+
+class StubStorage:
+    def __init__(self):
+        self.saved = []
+
+    def save_scraped_articles(self, articles):
+        self.saved.extend(articles)
+        return True
+
+    def update_scraper_last_run(self):
+        pass
+
+def test_scheduler_runs_the_async_engine():
+    """With scrape_engine "async" the scheduler's jobs run on AsyncNewsScraper and keep the cycle report"""
+    config_file = os.path.join(tempfile.mkdtemp(), 'scraper_config.json')
+    with open(config_file, 'w') as f:
+        json.dump({'scrape_engine': 'async', 'cycle_budget_minutes': 0.01, 'adaptive_intervals': False,
+                   'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None,
+                   'html_cache_dir': None, 'metrics_file': None}, f)
+    scheduler = NewsScraperScheduler(config_file)
+    scheduler.apply_config(scheduler.load_config())
+    scheduler.storage = scheduler.pipeline.storage = StubStorage()
+    requested = []
+    scheduler.pipeline.scraper.transport = make_transport(requested)
+
+    bbc = {'name': 'BBC News', 'url': 'https://www.bbc.com/news', 'isActive': True}
+    slow = {'name': 'Slow Source', 'url': 'https://slow.example', 'isActive': True}
+    report = scheduler.run_due_sources([bbc, slow])
+
+    assert report['finished'] == [bbc] and report['deferred'] == [slow]
+    assert len(scheduler.storage.saved) == scheduler.scraper.new_articles_by_source[bbc['url']] > 0
+    assert any('stub.example' in url for url in requested)
+    logger.info(f"✅ Scheduler saved {len(scheduler.storage.saved)} articles scraped by the async engine")
+
+def test_pipeline_saves_each_source_as_it_finishes():
+    """On the async engine the pipeline saves a finished source while a slower one is still running"""
+    scraper = NewsScraper({'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None,
+                           'html_cache_dir': None})
+    runner = AsyncSourceRunner(scraper, transport=make_transport([]))
+    storage = StubStorage()
+    bbc = {'name': 'BBC News', 'url': 'https://www.bbc.com/news', 'isActive': True}
+    slow = {'name': 'Slow Source', 'url': 'https://slow.example', 'isActive': True}
+
+    stats = ScrapePipeline(runner, storage, flush_seconds=0.05).run([slow, bbc], deadline=time.time() + 1.5)
+
+    assert stats['scraped'] == len(storage.saved) == scraper.new_articles_by_source[bbc['url']] > 0
+    # Saved long before the slow source was cancelled at the deadline
+    assert stats['first_save_seconds'] < 1.0 <= stats['elapsed_seconds']
+    assert scraper.deferred_sources == [slow]
+    logger.info(f"✅ First async source saved after {stats['first_save_seconds']:.2f}s")
+
+def main():
+    """Run all tests"""
+    test_rss_source_fetches_feed_and_articles()
+    test_timeout_cancels_unfinished_sources()
+    test_empty_source_list_finishes_the_cycle()
+    test_scheduler_runs_the_async_engine()
+    test_pipeline_saves_each_source_as_it_finishes()
+    logger.info("🎉 Async scraper tests passed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Test the offline benchmark harness: fixtures, stub server routing and baseline comparison"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+sys.path.append(os.path.join(os.path.dirname(__file__), 'benchmarks'))
+
+from fixtures import SOURCES, synthesize_fixtures, save_fixtures, load_fixtures, article_urls
+from stub_server import StubServer
+from bench_scrape import make_scraper, compare
+from record_fixtures import record_session
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def test_fixtures_are_deterministic_and_round_trip():
+    """The synthetic set is identical between runs and survives save/load"""
+    pages = synthesize_fixtures(articles_per_source=2)
+    assert pages == synthesize_fixtures(articles_per_source=2)
+    assert len(article_urls(pages)) == 2 * len(SOURCES)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        save_fixtures(pages, tmp)
+        assert load_fixtures(tmp) == pages
+    logger.info("✅ Fixtures are deterministic and round trip through disk")
+
+def test_every_source_is_served_from_fixtures():
+    """scrape_source gets full articles for every source without a request leaving the stub"""
+    pages = synthesize_fixtures(articles_per_source=2)
+    with StubServer(pages) as server:
+        scraper = make_scraper(server)
+        for source in SOURCES:
+            articles = scraper.scrape_source(source['url'], source['name'])
+            assert len(articles) == 2, source['name']
+            assert all(len(article['fullContent']) > 500 for article in articles), source['name']
+        scraper.extraction_pool.shutdown()
+        assert server.misses == []
+        assert server.requests > 0
+    logger.info("✅ Every source is scraped from the stub server")
+
+def test_recording_captures_streamed_pages():
+    """A recorded run holds the feed, the homepage and full article HTML fetched through streamed GETs"""
+    pages = synthesize_fixtures(articles_per_source=2)
+    source = next(source for source in SOURCES if source['name'] == 'BBC News')
+    recorded = {}
+    with StubServer(pages) as server:
+        scraper = make_scraper(server)
+        record_session(scraper, recorded)
+        scraper.start_cycle()
+        scraper.scrape_source(source['url'], source['name'])
+        scraper.scrape_source_comprehensive(source['url'], source['name'])
+        scraper.extraction_pool.shutdown()
+
+    articles = article_urls(recorded)
+    assert len(articles) == 2 and source['url'] in recorded
+    # Bodies are recorded in full, not cut where the scraper stopped reading
+    assert all(recorded[url] == pages[url] for url in articles + [source['url']])
+    logger.info(f"✅ Recording kept {len(recorded)} responses, {len(articles)} of them article pages")
+
+def test_regressions_are_reported():
+    """Slower or fewer results than the baseline are flagged, machine speed is factored out"""
+    stage = {'articles': 10, 'articles_per_sec': 20.0, 'cpu_ms_per_article': 10.0,
+             'p50_ms': 50.0, 'p95_ms': 80.0, 'peak_rss_mb': 60.0}
+    baseline = {'calibration_s': 0.04, 'stages': {'extract_full_article': stage}}
+
+    same = {'calibration_s': 0.04, 'stages': {'extract_full_article': dict(stage)}}
+    slower_machine = {'calibration_s': 0.08, 'stages': {'extract_full_article': dict(
+        stage, articles_per_sec=10.0, cpu_ms_per_article=20.0, p50_ms=100.0, p95_ms=160.0)}}
+    regressed = {'calibration_s': 0.04, 'stages': {'extract_full_article': dict(
+        stage, articles=9, cpu_ms_per_article=15.0)}}
+
+    assert compare(same, baseline, 0.3) == []
+    assert compare(slower_machine, baseline, 0.3) == []
+    assert len(compare(regressed, baseline, 0.3)) == 2
+    logger.info("✅ Regressions against the baseline are reported")
+
+def main():
+    """Run all tests"""
+    test_fixtures_are_deterministic_and_round_trip()
+    test_every_source_is_served_from_fixtures()
+    test_recording_captures_streamed_pages()
+    test_regressions_are_reported()
+    logger.info("🎉 Benchmark harness tests passed")
+
+if __name__ == "__main__":
+    main()
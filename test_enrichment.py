@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Test lean extraction and the opt-in enrichment stage"""
+
+import sys
+import os
+import io
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+from newspaper import Article
+from PIL import Image
+from services.enrichment import ArticleEnricher
+from services.extraction_pool import ExtractionPool
+from services.scraper import NewsScraper
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STORY = ("Flood defences along the estuary will be raised before the winter storms. "
+         "The council approved the plan on Monday after years of flooding. ") * 8
+
+def png_bytes(width, height):
+    buffer = io.BytesIO()
+    Image.new('RGB', (width, height)).save(buffer, format='PNG')
+    return buffer.getvalue()
+
+class StubResponse:
+    def __init__(self, body, content_type='image/png'):
+        self.status_code = 200
+        self.headers = {'Content-Type': content_type}
+        self.body = body
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+class StubSession:
+    def __init__(self, images):
+        self.images = images
+        self.requested = []
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        return StubResponse(self.images[url])
+
+def test_extraction_skips_nlp_and_image_downloads():
+    """The hot path parses text and metadata only"""
+    scraper = NewsScraper({'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None})
+    calls = []
+    original_nlp = Article.nlp
+    Article.nlp = lambda self: calls.append(self.url)
+    try:
+        html = (f'<html><head><meta property="og:image" content="https://cdn.example/lead.jpg"></head>'
+                f'<body><article><p>{STORY}</p></article></body></html>')
+        details = scraper.extract_article_from_html("https://news.example/story", html)
+    finally:
+        Article.nlp = original_nlp
+
+    assert scraper._build_article("https://news.example/story").config.fetch_images is False
+    assert calls == []
+    assert details['imageUrl'] == "https://cdn.example/lead.jpg"
+    assert 'keywords' not in details
+    logger.info("✅ Extraction runs without NLP or image downloads")
+
+def test_enrichment_is_off_by_default():
+    """Without config flags finalized articles are not enriched"""
+    scraper = NewsScraper({'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None})
+    article = {'title': 'Flood defences raised along the estuary', 'fullContent': STORY,
+               'url': 'https://news.example/a', 'imageUrl': 'https://cdn.example/a.png', 'source': 'Stub'}
+    processed = scraper.finalize_source_articles('Stub', [article])
+    assert not scraper.enricher.enabled
+    assert 'keywords' not in processed[0] and 'imageWidth' not in processed[0]
+    logger.info("✅ Enrichment is opt-in")
+
+def test_nlp_enrichment_adds_keywords():
+    """NLP enrichment attaches newspaper3k keywords"""
+    enricher = ArticleEnricher(None, ExtractionPool(max_workers=2), nlp_enabled=True)
+    article = {'title': 'Flood defences raised along the estuary', 'fullContent': STORY, 'url': 'https://news.example/a'}
+    enricher.enrich([article])
+    assert 'estuary' in article['keywords']
+    logger.info("✅ NLP enrichment adds keywords")
+
+def test_image_probe_records_size_and_drops_tiny_images():
+    """Image probing reads dimensions and drops images too small to lead an article"""
+    session = StubSession({
+        'https://cdn.example/large.png': png_bytes(800, 450),
+        'https://cdn.example/pixel.png': png_bytes(1, 1)
+    })
+    enricher = ArticleEnricher(session, ExtractionPool(max_workers=2), probe_images=True)
+    large = {'title': 'Large lead image', 'url': 'https://news.example/1', 'imageUrl': 'https://cdn.example/large.png'}
+    tracker = {'title': 'Tracking pixel', 'url': 'https://news.example/2', 'imageUrl': 'https://cdn.example/pixel.png'}
+
+    enricher.enrich([large, tracker])
+
+    assert (large['imageWidth'], large['imageHeight']) == (800, 450)
+    assert large['imageUrl'] == 'https://cdn.example/large.png'
+    assert tracker['imageUrl'] is None
+    logger.info("✅ Image probing records sizes and drops tiny images")
+
+def main():
+    """Run all tests"""
+    test_extraction_skips_nlp_and_image_downloads()
+    test_enrichment_is_off_by_default()
+    test_nlp_enrichment_adds_keywords()
+    test_image_probe_records_size_and_drops_tiny_images()
+    logger.info("🎉 Enrichment tests passed")
+
+if __name__ == "__main__":
+    main()
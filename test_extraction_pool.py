@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Test the parallel article extraction pool without touching the network"""
+
+import sys
+import os
+import threading
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+from services.extraction_pool import ExtractionPool
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def test_results_keep_input_order():
+    """Results come back in the order the URLs were submitted"""
+    pool = ExtractionPool(max_workers=4, per_domain_concurrency=2)
+    urls = [f"https://site{i % 3}.example/article-{i}" for i in range(12)]
+
+    def slow_echo(url):
+        time.sleep(0.01 * (12 - int(url.rsplit('-', 1)[1])) / 12)
+        return url.upper()
+
+    results = pool.map(slow_echo, urls)
+    pool.shutdown()
+
+    assert results == [url.upper() for url in urls]
+    logger.info("✅ Pool results keep input order")
+
+def test_concurrency_limits():
+    """Never more than the global or per-host limit run at once"""
+    pool = ExtractionPool(max_workers=4, per_domain_concurrency=2)
+    lock = threading.Lock()
+    running = {'total': 0, 'max_total': 0}
+    per_host = {}
+    max_per_host = {}
+
+    def track(url):
+        host = url.split('/')[2]
+        with lock:
+            running['total'] += 1
+            running['max_total'] = max(running['max_total'], running['total'])
+            per_host[host] = per_host.get(host, 0) + 1
+            max_per_host[host] = max(max_per_host.get(host, 0), per_host[host])
+        time.sleep(0.02)
+        with lock:
+            running['total'] -= 1
+            per_host[host] -= 1
+        return host
+
+    urls = [f"https://a.example/{i}" for i in range(8)] + [f"https://b.example/{i}" for i in range(8)] + \
+           [f"https://c.example/{i}" for i in range(8)]
+    pool.map(track, urls)
+    pool.shutdown()
+
+    assert running['max_total'] <= 4
+    assert all(count <= 2 for count in max_per_host.values())
+    logger.info(f"✅ Peak concurrency {running['max_total']}, per host {max_per_host}")
+
+def test_failures_use_default():
+    """A failing extraction does not abort the rest of the batch"""
+    pool = ExtractionPool(max_workers=2, per_domain_concurrency=1)
+
+    def flaky(url):
+        if url.endswith('bad'):
+            raise ValueError("boom")
+        return url
+
+    results = pool.map(flaky, ["https://x.example/good", "https://x.example/bad"], default={})
+    pool.shutdown()
+
+    assert results == ["https://x.example/good", {}]
+    logger.info("✅ Failed extractions fall back to the default value")
+
+def main():
+    """Run all tests"""
+    test_results_keep_input_order()
+    test_concurrency_limits()
+    test_failures_use_default()
+    logger.info("🎉 Extraction pool tests passed")
+
+if __name__ == "__main__":
+    main()
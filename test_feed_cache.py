@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Test conditional GETs for RSS feeds against an in-process stub transport"""
+
+import sys
+import os
+import asyncio
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+import httpx
+from services.async_scraper import AsyncNewsScraper
+from services.feed_cache import FeedCache
+from services.scraper import NewsScraper, RSS_FEEDS
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+FEED = ('<?xml version="1.0"?><rss version="2.0"><channel>'
+        '<item><title>Stub headline about the city budget vote</title>'
+        '<link>https://stub.example/budget</link><description>Budget</description></item>'
+        '</channel></rss>')
+
+def make_transport(requests_seen):
+    def handler(request):
+        requests_seen.append(request)
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=FEED, headers={'ETag': '"v1"', 'content-type': 'application/rss+xml'})
+    return httpx.MockTransport(handler)
+
+def test_unchanged_feed_is_served_from_cache():
+    """The second fetch revalidates with If-None-Match and reuses the stored items"""
+    requests_seen = []
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, 'feed_cache.json')
+        scraper = NewsScraper({'feed_cache_file': cache_file})
+
+        async def run():
+            async with AsyncNewsScraper(scraper=scraper, transport=make_transport(requests_seen)) as async_scraper:
+                first = await async_scraper.fetch_feed_items('bbc.com')
+                second = await async_scraper.fetch_feed_items('bbc.com')
+                return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first == second
+        assert first[0]['url'] == 'https://stub.example/budget'
+        assert 'If-None-Match' not in requests_seen[0].headers
+        assert requests_seen[1].headers['If-None-Match'] == '"v1"'
+        assert scraper.feed_cache.stats()['hits'] == 1
+        assert scraper.feed_cache.stats()['misses'] == 1
+
+        # Validators survive a restart
+        reloaded = FeedCache(cache_file)
+        assert reloaded.conditional_headers(RSS_FEEDS['bbc.com']['rss_url']) == {'If-None-Match': '"v1"'}
+    logger.info("✅ Unchanged feed served from the validator cache")
+
+def test_feed_without_validators_is_not_cached():
+    """Responses without ETag or Last-Modified leave nothing to revalidate"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FeedCache(os.path.join(tmp, 'feed_cache.json'))
+        cache.store('https://feeds.example/rss', {}, [{'title': 'x', 'url': 'y', 'description': ''}])
+
+        assert cache.conditional_headers('https://feeds.example/rss') == {}
+        assert cache.not_modified('https://feeds.example/rss') is None
+    logger.info("✅ Feeds without validators are not cached")
+
+def main():
+    """Run all tests"""
+    test_unchanged_feed_is_served_from_cache()
+    test_feed_without_validators_is_not_cached()
+    logger.info("🎉 Feed cache tests passed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Test the streaming RSS/Atom parser and the feed dates and images it hands to articles"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+from services.feed_parser import parse_feed, parse_feed_date
+from services.sources import RSS_FEEDS
+from test_response_cache import ARTICLE_BODY
+from test_source_registry import make_scraper
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+RSS = b'''<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/" xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel><title>Stub News</title><link>https://stub.example/</link>
+<item><title><![CDATA[Council approves the new flood defence budget]]></title>
+  <link>https://stub.example/flood-budget</link>
+  <description>&lt;p&gt;The vote passed.&lt;/p&gt;</description>
+  <pubDate>Tue, 10 Jun 2025 09:30:00 GMT</pubDate>
+  <media:content url="https://img.stub.example/flood.jpg" medium="image"><media:title>Flood wall</media:title></media:content>
+</item>
+<item><title>Live</title><link>https://stub.example/live</link></item>
+<item><title>Harbour project reaches its second construction phase</title>
+  <link>https://stub.example/harbour</link>
+  <enclosure url="https://stub.example/harbour.mp3" type="audio/mpeg"/>
+  <enclosure url="https://img.stub.example/harbour.jpg" type="image/jpeg"/>
+  <dc:date>2025-06-10T10:00:00Z</dc:date>
+</item>
+<item><title>This item is past the cap and is never parsed</title><link>https://stub.example/late</link></item>
+'''
+
+ATOM = b'''<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Stub Atom</title>
+<entry><title type="html">Rail strike called off after overnight talks</title>
+  <link rel="alternate" href="https://stub.example/rail"/>
+  <link rel="enclosure" type="image/png" href="https://img.stub.example/rail.png"/>
+  <summary>Unions accepted the offer.</summary>
+  <published>2025-06-10T10:00:00+05:30</published>
+</entry></feed>'''
+
+def test_rss_items_stop_at_the_cap():
+    """RSS items carry dates and images, short titles count towards the cap, and parsing stops there"""
+    # The feed is deliberately cut off after the fourth item; the cap means it is never reached
+    items = parse_feed(RSS, 3)
+    assert [item['url'] for item in items] == ["https://stub.example/flood-budget", "https://stub.example/harbour"]
+    assert items[0]['title'] == "Council approves the new flood defence budget"
+    assert items[0]['description'] == "<p>The vote passed.</p>"
+    assert items[0]['publishedAt'] == "2025-06-10T09:30:00+00:00"
+    assert items[0]['imageUrl'] == "https://img.stub.example/flood.jpg"
+    assert items[1]['imageUrl'] == "https://img.stub.example/harbour.jpg"
+    assert items[1]['publishedAt'] == "2025-06-10T10:00:00+00:00"
+    assert [item['url'] for item in parse_feed(RSS, 1)] == ["https://stub.example/flood-budget"]
+    logger.info("✅ RSS items are parsed up to the cap")
+
+def test_atom_and_malformed_feeds():
+    """Atom entries use alternate links and enclosures; broken or empty feeds give what parsed"""
+    entry, = parse_feed(ATOM, 25)
+    assert entry['url'] == "https://stub.example/rail"
+    assert entry['description'] == "Unions accepted the offer."
+    assert entry['imageUrl'] == "https://img.stub.example/rail.png"
+    assert entry['publishedAt'] == "2025-06-10T10:00:00+05:30"
+
+    truncated = parse_feed(RSS, 25)
+    assert [item['url'] for item in truncated][:2] == ["https://stub.example/flood-budget", "https://stub.example/harbour"]
+    assert parse_feed(b"", 25) == [] and parse_feed(b"<html>not a feed", 25) == []
+    assert parse_feed_date("yesterday") is None
+    logger.info("✅ Atom and malformed feeds are handled")
+
+def test_feed_dates_and_images_reach_articles():
+    """Feed metadata fills in what the article page lacks, including over the placeholder image"""
+    rss_url = RSS_FEEDS['bbc.com']['rss_url']
+    article = f"<html><body><article><p>{ARTICLE_BODY}</p></article></body></html>"
+    scraper, _ = make_scraper({
+        rss_url: (200, RSS.decode('utf-8') + "</channel></rss>"),
+        "https://stub.example/flood-budget": (200, article),
+        "https://stub.example/harbour": (200, article),
+    })
+
+    articles = {article['url']: article for article in scraper.scrape_source("https://www.bbc.com/news", "BBC News")}
+    assert articles["https://stub.example/flood-budget"]['imageUrl'] == "https://img.stub.example/flood.jpg"
+    assert articles["https://stub.example/flood-budget"]['publishedAt'] == "2025-06-10T09:30:00+00:00"
+    assert articles["https://stub.example/harbour"]['imageUrl'] == "https://img.stub.example/harbour.jpg"
+    assert ARTICLE_BODY[:40] in articles["https://stub.example/harbour"]['fullContent']
+    logger.info("✅ Feed dates and images reach the articles")
+
+def main():
+    """Run all tests"""
+    test_rss_items_stop_at_the_cap()
+    test_atom_and_malformed_feeds()
+    test_feed_dates_and_images_reach_articles()
+    logger.info("🎉 Feed parser tests passed")
+
+if __name__ == "__main__":
+    main()
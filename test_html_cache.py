@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Test the on-disk article HTML cache and offline replay"""
+
+import sys
+import os
+import tempfile
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+import requests
+from services.html_cache import HtmlCache
+from services.scraper import NewsScraper
+from test_response_cache import StubAdapter, ARTICLE_BODY
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def article_page(headline):
+    return f"<html><head><title>{headline}</title></head><body><article><h1>{headline}</h1><p>{ARTICLE_BODY}</p></article></body></html>"
+
+def make_scraper(directory, pages=None, **config):
+    scraper = NewsScraper(dict({'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None,
+                                'html_cache_dir': directory}, **config))
+    adapter = StubAdapter(pages or {})
+    scraper.session.mount("https://", adapter)
+    return scraper, adapter
+
+def test_pages_round_trip_and_share_objects():
+    """Pages come back unchanged and identical bodies are stored once"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HtmlCache(tmp)
+        cache.put("https://a.example/story?utm_source=feed", article_page("Shared"))
+        cache.put("https://b.example/mirror", article_page("Shared"))
+        cache.put("https://c.example/other", article_page("Other"))
+
+        assert cache.get("https://a.example/story") == article_page("Shared")
+        assert cache.get("https://missing.example/") is None
+        assert len(cache) == 3
+        assert len(os.listdir(os.path.join(tmp, 'objects'))) == 2
+        cache.flush()
+
+        reloaded = HtmlCache(tmp)
+        assert reloaded.get("https://b.example/mirror") == article_page("Shared")
+        assert reloaded.size_bytes == cache.size_bytes
+    logger.info("✅ Pages round trip and share content-addressed objects")
+
+def test_expired_and_least_recent_pages_are_evicted():
+    """Pages past the TTL are dropped and the size cap evicts the least recently used page"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HtmlCache(tmp, ttl_hours=1)
+        cache.put("https://a.example/old", article_page("Old"))
+        cache._entries["https://a.example/old"]['fetched_at'] = time.time() - 7200
+        assert cache.get("https://a.example/old") is None
+        cache.flush()
+        assert len(cache) == 0 and cache.size_bytes == 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HtmlCache(tmp)
+        for index in range(3):
+            cache.put(f"https://a.example/{index}", article_page(f"Story {index} " + os.urandom(200).hex()))
+            time.sleep(0.01)
+        cache.get("https://a.example/0")
+        cache.max_bytes = cache.size_bytes - 1
+        cache.flush()
+
+        assert cache.get("https://a.example/1") is None
+        assert cache.get("https://a.example/0") is not None
+        assert len(os.listdir(os.path.join(tmp, 'objects'))) == 2
+    logger.info("✅ TTL and size cap evict pages")
+
+def test_orphaned_objects_are_removed_on_load():
+    """Objects written after the last index save are cleaned up by the next run"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HtmlCache(tmp)
+        cache.put("https://a.example/kept", article_page("Kept"))
+        cache.flush()
+        cache.put("https://a.example/unsaved", article_page("Unsaved"))
+
+        reloaded = HtmlCache(tmp)
+        assert len(reloaded) == 1
+        assert len(os.listdir(os.path.join(tmp, 'objects'))) == 1
+    logger.info("✅ Orphaned objects are removed on load")
+
+def test_scraper_reuses_cached_pages_across_runs():
+    """A second scraper reads the page from disk instead of downloading it again"""
+    url = "https://news.example/story"
+    with tempfile.TemporaryDirectory() as tmp:
+        first, first_adapter = make_scraper(tmp, {url: (200, article_page("Flood defences"))})
+        assert ARTICLE_BODY[:40] in first.extract_full_article(url)['fullContent']
+        first.finish_cycle()
+        assert len(first_adapter.requests) == 1
+
+        second, second_adapter = make_scraper(tmp, {url: (200, article_page("Flood defences"))})
+        assert ARTICLE_BODY[:40] in second.extract_full_article(url)['fullContent']
+        assert len(second_adapter.requests) == 0
+    logger.info("✅ Cached pages are reused across runs")
+
+def test_replay_mode_never_uses_the_network():
+    """Replay re-extracts cached pages and refuses to fetch anything else"""
+    urls = [f"https://news.example/story-{index}" for index in range(3)]
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HtmlCache(tmp)
+        for index, url in enumerate(urls):
+            cache.put(url, article_page(f"Story {index}"))
+        cache.flush()
+
+        scraper, adapter = make_scraper(tmp, replay_mode=True)
+        replayed = list(scraper.iter_replayed_articles())
+        assert sorted(article['url'] for article in replayed) == urls
+        assert all(ARTICLE_BODY[:40] in article['fullContent'] for article in replayed)
+
+        try:
+            scraper.fetch_page("https://news.example/not-cached")
+            assert False, "expected replay mode to refuse the fetch"
+        except requests.exceptions.ConnectionError:
+            pass
+        assert not scraper.extract_full_article("https://news.example/not-cached")['fullContent']
+        assert len(adapter.requests) == 0
+    logger.info("✅ Replay mode extracts from the cache without network access")
+
+def main():
+    """Run all tests"""
+    test_pages_round_trip_and_share_objects()
+    test_expired_and_least_recent_pages_are_evicted()
+    test_orphaned_objects_are_removed_on_load()
+    test_scraper_reuses_cached_pages_across_runs()
+    test_replay_mode_never_uses_the_network()
+    logger.info("🎉 HTML cache tests passed")
+
+if __name__ == "__main__":
+    main()
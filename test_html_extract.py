@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Test the shared-tree HTML extractors on an inline page"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+import lxml.html
+from services.html_extract import parse_html, extract_content, extract_image_url, extract_media_links
+from services.scraper import NewsScraper
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STORY = "The council approved the riverside housing plan after a long public consultation. " * 6
+
+PAGE = f"""<html><head><meta name="twitter:image" content="https://cdn.example/lead.jpg"></head><body>
+<header><p>Top banner text that is long enough to count as a paragraph on its own.</p></header>
+<script>var tracking = "should never reach the article text";</script>
+<article><h1>Housing plan</h1><p>{STORY}</p>
+<img src="/photos/river.jpg" alt="River"><iframe src="https://www.youtube.com/embed/abc"></iframe></article>
+<aside><p>Related: another unrelated story that should be skipped</p></aside>
+</body></html>"""
+
+def test_content_skips_page_chrome():
+    """Content comes from the article container without scripts, headers or asides"""
+    tree = parse_html(PAGE)
+    content = extract_content(tree, "https://news.example/housing")
+
+    assert 'riverside housing plan' in content
+    assert 'tracking' not in content
+    assert 'Top banner' not in content
+    assert 'Related:' not in content
+    logger.info("✅ Content extraction skips page chrome")
+
+def test_one_tree_serves_every_extractor():
+    """Image, media and content extraction share one tree and leave it unchanged"""
+    tree = parse_html(PAGE)
+    before = lxml.html.tostring(tree)
+
+    assert extract_image_url(tree, "https://news.example/housing") == "https://cdn.example/lead.jpg"
+    media = extract_media_links(tree, "https://news.example/housing")
+    assert "[IMAGE: River] https://news.example/photos/river.jpg" in media
+    assert "[EMBEDDED] https://www.youtube.com/embed/abc" in media
+    extract_content(tree, "https://news.example/housing")
+
+    assert lxml.html.tostring(tree) == before
+    logger.info("✅ Extractors share one unmodified tree")
+
+def test_article_from_html_uses_parsed_tree():
+    """extract_article_from_html fills content, media and image from a single parse"""
+    details = NewsScraper().extract_article_from_html("https://news.example/housing", PAGE)
+
+    assert 'riverside housing plan' in details['fullContent']
+    assert '[EMBEDDED] https://www.youtube.com/embed/abc' in details['fullContent']
+    assert details['imageUrl'].startswith('https://')
+    logger.info("✅ Article details extracted from HTML")
+
+def main():
+    """Run all tests"""
+    test_content_skips_page_chrome()
+    test_one_tree_serves_every_extractor()
+    test_article_from_html_uses_parsed_tree()
+    logger.info("🎉 HTML extraction tests passed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Test the compiled keyword classifier behind categorize_article and detect_indian_content"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+from services.keyword_classifier import KeywordClassifier, default_classifier
+from services.scraper import NewsScraper
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def test_categories_match_substring_rules():
+    """Scores follow the old rules: substring hits, title hits worth 3, at least 2 to win"""
+    assert default_classifier.categorize("Cricket team wins the final") == 'sports'
+    # One body-only hit is not enough
+    assert default_classifier.categorize("Weekend round-up", "the cricket was rained off") == 'general'
+    # Keywords still match inside longer words, as the old `in` checks did
+    assert default_classifier.categorize("Biotech shares", "") == 'technology'
+    # Nested keywords each count: 'prime minister' also contains 'minister'
+    assert default_classifier.categorize("Statement", "the prime minister spoke") == 'politics'
+    assert default_classifier.categorize("Anything at all", "", "TechCrunch") == 'technology'
+    logger.info("✅ Categories follow the keyword scoring rules")
+
+def test_region_uses_title_content_and_source():
+    """India keywords are looked for in the title, the body and the source name"""
+    assert default_classifier.region("Monsoon arrives early", "rain in Mumbai") == 'indian'
+    assert default_classifier.region("Storm hits the coast", "", "Times of India") == 'indian'
+    assert default_classifier.region("Storm hits the coast", "flooding in Lisbon", "Reuters") == 'international'
+    # A phrase split between the end of the body and the source name still counts
+    assert default_classifier.region("Report", "a session of the lok", "Sabha TV") == 'indian'
+    logger.info("✅ Region detection covers title, body and source")
+
+def test_batch_matches_single_calls():
+    """classify_batch gives the same labels as one call per article"""
+    articles = [
+        {'title': 'Stock market rallies', 'fullContent': 'investors cheered profit figures', 'source': 'BBC News'},
+        {'title': 'ISRO launches satellite', 'fullContent': 'space agency research mission', 'source': 'NDTV'},
+        {'title': 'Quiet day', 'fullContent': None, 'source': 'Reuters'}
+    ]
+    expected = [default_classifier.classify(a['title'], a['fullContent'] or '', a['source']) for a in articles]
+    assert default_classifier.classify_batch(articles) == expected
+    assert default_classifier.classify_batch(articles, source='TechCrunch')[0] == ('technology', 'international')
+    logger.info("✅ Batch labels match single calls")
+
+def test_word_boundaries_option():
+    """Whole-word mode stops short keywords matching inside other words"""
+    whole_words = KeywordClassifier(word_boundaries=True)
+    assert default_classifier.categorize("He said the plan was fair") == 'technology'
+    assert whole_words.categorize("He said the plan was fair") == 'general'
+    assert whole_words.classify("India's AI push, at IIT-Delhi") == ('technology', 'indian')
+    logger.info("✅ Word-boundary mode matches whole words only")
+
+def legacy_feed_region(title):
+    """The region feed-fallback articles got before the shared classifier"""
+    keywords = ['india', 'indian', 'delhi', 'mumbai', 'bengaluru', 'kolkata', 'chennai', 'hyderabad', 'pune',
+                'ahmedabad', 'bjp', 'congress', 'modi', 'rahul']
+    return 'indian' if any(keyword in title.lower() for keyword in keywords) else 'international'
+
+def test_scraper_uses_shared_classifier():
+    """Full labels use the long India list, feed labels keep their own title-only list"""
+    scraper = NewsScraper({'feed_cache_file': None, 'seen_urls_file': None})
+    assert scraper.detect_indian_content('Tamil Nadu budget announced') == 'indian'
+    article = scraper.label_feed_article({'title': 'Tamil Nadu budget announced', 'source': 'Stub', 'url': 'https://stub.example/1'}, {})
+    assert article['region'] == 'international'
+    # Words only on the feed list do not mark full articles as Indian
+    assert scraper.detect_indian_content('Flooding closes roads in Ahmedabad') == 'international'
+    assert scraper.categorize_article('Cricket team wins the final') == 'sports'
+    logger.info("✅ Scraper labels go through the shared classifier")
+
+def test_feed_regions_are_unchanged():
+    """Feed-fallback articles get the same region as before the lists were compiled"""
+    scraper = NewsScraper({'feed_cache_file': None, 'seen_urls_file': None})
+    titles = [
+        'Parliament passes new budget bill',
+        'UK Supreme Court rules on Rwanda policy',
+        'Tata Steel shares jump after results',
+        'Coca-Cola sued over labelling violation',
+        'Flooding closes roads in Ahmedabad',
+        'Rahul Gandhi addresses rally in Mumbai',
+        'Storm hits the coast',
+    ]
+    for title in titles:
+        article = scraper.label_feed_article({'title': title, 'source': 'NDTV', 'url': 'https://stub.example/'},
+                                             {'fullContent': 'Talks in New Delhi continue.'})
+        assert article['region'] == legacy_feed_region(title), title
+    assert [legacy_feed_region(title) for title in titles] == ['international'] * 4 + ['indian'] * 2 + ['international']
+    logger.info("✅ Feed regions match the old title-only list")
+
+def test_label_article_classifies_once():
+    """label_article gives the same pair as the two single-label calls from one classifier pass"""
+    scraper = NewsScraper({'feed_cache_file': None, 'seen_urls_file': None})
+    body = "Parliament in Delhi passed the budget after a long debate on the economy."
+    title = "Budget vote ends a long debate"
+    assert scraper.label_article(title, body, 'Stub') == (
+        scraper.categorize_article(title, body, 'Stub'), scraper.detect_indian_content(title, body, 'Stub'))
+    # The feed labels judge the region on the title only
+    assert scraper.label_article(title, body, 'Stub', region_from_title=True)[1] == legacy_feed_region(title)
+
+    calls = []
+    classify = scraper.classifier.classify
+    scraper.classifier.classify = lambda *args, **kwargs: calls.append(args) or classify(*args, **kwargs)
+    article = scraper.label_feed_article({'title': title, 'source': 'Stub', 'url': 'https://stub.example/2'},
+                                         {'fullContent': body})
+    assert len(calls) == 1 and article['region'] == 'international'
+    assert article['category'] == scraper.categorize_article(title, body, 'Stub')
+    logger.info("✅ label_article classifies each article once")
+
+def main():
+    """Run all tests"""
+    test_categories_match_substring_rules()
+    test_region_uses_title_content_and_source()
+    test_batch_matches_single_calls()
+    test_word_boundaries_option()
+    test_scraper_uses_shared_classifier()
+    test_feed_regions_are_unchanged()
+    test_label_article_classifies_once()
+    logger.info("🎉 Keyword classifier tests passed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Test per-stage timing and counter instrumentation"""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+import requests
+from services.metrics import MetricsRegistry, Histogram
+from services.storage_integration import StorageIntegration
+from test_response_cache import StubAdapter, make_scraper, ARTICLE_BODY
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def test_histogram_quantiles():
+    """Quantiles are estimated from the buckets and never exceed the largest observation"""
+    histogram = Histogram()
+    for _ in range(90):
+        histogram.observe(0.02)
+    for _ in range(10):
+        histogram.observe(2.0)
+
+    assert histogram.count == 100 and abs(histogram.sum - 21.8) < 1e-9
+    assert 0.01 <= histogram.quantile(0.5) <= 0.025
+    assert 1.0 <= histogram.quantile(0.95) <= 2.0
+    assert histogram.quantile(1.0) == 2.0
+    logger.info("✅ Histogram quantiles come from the buckets")
+
+def test_cycle_snapshots_only_cover_the_cycle():
+    """Cycle snapshots subtract what happened before begin_cycle, including registered sources"""
+    metrics = MetricsRegistry()
+    hits = {'count': 5}
+    metrics.register_source('cache_hits_total', lambda: hits['count'], cache='response')
+    metrics.increment('fetch_failures_total', host='a.example')
+    metrics.observe('fetch_seconds', 3.0, host='a.example')
+
+    metrics.begin_cycle()
+    hits['count'] = 8
+    metrics.increment('fetch_failures_total', 2, host='a.example')
+    metrics.observe('fetch_seconds', 0.5, host='a.example')
+
+    cycle = metrics.snapshot(cycle=True)
+    assert cycle['counters']['fetch_failures_total']['host=a.example'] == 2
+    assert cycle['counters']['cache_hits_total']['cache=response'] == 3
+    assert cycle['histograms']['fetch_seconds']['host=a.example']['count'] == 1
+    assert cycle['histograms']['fetch_seconds']['host=a.example']['max'] == 0.5
+
+    total = metrics.snapshot()
+    assert total['counters']['fetch_failures_total']['host=a.example'] == 3
+    assert total['histograms']['fetch_seconds']['host=a.example']['count'] == 2
+    logger.info("✅ Cycle snapshots only cover the current cycle")
+
+def test_prometheus_text_and_endpoint():
+    """The registry renders the Prometheus text format and serves it over HTTP"""
+    metrics = MetricsRegistry()
+    metrics.observe('fetch_seconds', 0.2, host='www.bbc.com')
+    metrics.increment('fetched_bytes_total', 1024, host='www.bbc.com')
+
+    text = metrics.to_prometheus()
+    assert '# TYPE newsharvester_fetch_seconds histogram' in text
+    assert 'newsharvester_fetch_seconds_bucket{host="www.bbc.com",le="0.25"} 1' in text
+    assert 'newsharvester_fetch_seconds_bucket{host="www.bbc.com",le="+Inf"} 1' in text
+    assert 'newsharvester_fetched_bytes_total{host="www.bbc.com"} 1024' in text
+
+    server = metrics.serve(0, host='127.0.0.1')
+    try:
+        port = server.server_address[1]
+        assert requests.get(f"http://127.0.0.1:{port}/metrics", timeout=5).text == metrics.to_prometheus()
+        snapshot = requests.get(f"http://127.0.0.1:{port}/metrics.json", timeout=5).json()
+        assert snapshot['counters']['fetched_bytes_total']['host=www.bbc.com'] == 1024
+    finally:
+        metrics.stop_serving()
+    logger.info("✅ Prometheus text is rendered and served")
+
+def test_scraper_records_fetch_parse_and_cache_metrics():
+    """Fetching and extracting an article fills the per-host and per-stage metrics"""
+    url = "https://news.example/story"
+    scraper, adapter = make_scraper({url: (200, f"<html><body><article><p>{ARTICLE_BODY}</p></article></body></html>")})
+    scraper.start_cycle()
+
+    scraper.extract_full_article(url)
+    scraper.extract_full_article(url)
+    try:
+        scraper.fetch_page("https://news.example/missing")
+    except requests.exceptions.HTTPError:
+        pass
+    scraper.categorize_article("Election results", ARTICLE_BODY)
+
+    snapshot = scraper.metrics.snapshot(cycle=True)
+    assert snapshot['histograms']['fetch_seconds']['host=news.example']['count'] == 2
+    assert snapshot['counters']['fetched_bytes_total']['host=news.example'] > len(ARTICLE_BODY)
+    assert snapshot['counters']['fetch_failures_total']['host=news.example'] == 1
+    assert snapshot['counters']['cache_hits_total']['cache=response'] == 1
+    assert snapshot['histograms']['parse_seconds']['kind=article']['count'] == 2
+    assert snapshot['histograms']['extract_seconds']['']['count'] == 2
+    assert snapshot['histograms']['classify_seconds']['']['count'] == 1
+    assert any(line.startswith('fetch_seconds{host=news.example}') for line in scraper.metrics.summary_lines())
+    logger.info("✅ Scraper records fetch, parse, extraction and cache metrics")
+
+def test_storage_records_save_latency_into_the_shared_registry():
+    """Bulk saves are timed and counted in the registry the scraper passes in"""
+    metrics = MetricsRegistry()
+    storage = StorageIntegration(base_url="https://storage.example", metrics=metrics)
+    adapter = StubAdapter({"https://storage.example/api/articles/bulk": (200, json.dumps(
+        {'results': [{'success': True}, {'success': False, 'status': 500}]}))})
+    storage.session.mount("https://", adapter)
+
+    articles = [{'title': f'A long enough headline {i}', 'url': f'https://news.example/{i}', 'source': 'Stub'}
+                for i in range(2)]
+    assert storage.save_scraped_articles(articles)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, 'metrics.json')
+        metrics.write_snapshot(filename)
+        with open(filename, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    assert snapshot['histograms']['save_seconds']['route=bulk']['count'] == 1
+    assert snapshot['counters']['articles_saved_total'][''] == 1
+    assert snapshot['counters']['articles_save_failed_total'][''] == 1
+    logger.info("✅ Storage save latency lands in the shared registry")
+
+def main():
+    """Run all tests"""
+    test_histogram_quantiles()
+    test_cycle_snapshots_only_cover_the_cycle()
+    test_prometheus_text_and_endpoint()
+    test_scraper_records_fetch_parse_and_cache_metrics()
+    test_storage_records_save_latency_into_the_shared_registry()
+    logger.info("🎉 Metrics tests passed")
+
+if __name__ == "__main__":
+    main()
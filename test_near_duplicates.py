@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Test the MinHash/LSH near-duplicate index shared by every dedupe step"""
+
+import sys
+import os
+import random
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+from services.near_duplicates import NearDuplicateIndex, one_permutation_hash, body_shingles, title_shingles, minhash
+from services.scraper import NewsScraper
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+VOCABULARY = [f"word{i}" for i in range(3000)]
+
+def random_article(rng, index, source='Stub'):
+    return {
+        'title': " ".join(rng.choice(VOCABULARY) for _ in range(9)),
+        'fullContent': " ".join(rng.choice(VOCABULARY) for _ in range(400)),
+        'url': f"https://{source.lower()}.example/story/{index}",
+        'source': source
+    }
+
+def test_reworded_titles_and_syndicated_bodies():
+    """Near-identical titles and copied bodies are dropped, unrelated stories are kept"""
+    index = NearDuplicateIndex(filename=None)
+    original = {'title': 'Flood defences raised along the estuary before winter storms',
+                'fullContent': '', 'url': 'https://a.example/1'}
+    reworded = {'title': 'Flood defences raised along the estuary ahead of winter storms',
+                'fullContent': '', 'url': 'https://b.example/1'}
+    unrelated = {'title': 'Central bank holds interest rates steady for a third month',
+                 'fullContent': '', 'url': 'https://c.example/1'}
+    rng = random.Random(1)
+    wire = random_article(rng, 1)
+    syndicated = dict(wire, title='A completely different headline for the wire copy', url='https://d.example/9')
+
+    kept = index.dedupe([original, reworded, unrelated, wire, syndicated])
+
+    assert [article['url'] for article in kept] == [original['url'], unrelated['url'], wire['url']]
+    assert index.skipped == 2
+    logger.info("✅ Reworded titles and syndicated bodies are dropped")
+
+def test_index_persists_across_cycles():
+    """Recorded articles block copies in a later cycle but never block themselves"""
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, 'near_duplicates.json')
+        rng = random.Random(2)
+        article = random_article(rng, 1, 'Reuters')
+        assert NearDuplicateIndex(filename).dedupe([article], record=True) == [article]
+
+        next_cycle = NearDuplicateIndex(filename)
+        assert len(next_cycle) == 1
+        copy = dict(article, url='https://ndtv.example/wire-copy', source='NDTV')
+        assert next_cycle.dedupe([copy]) == []
+        assert next_cycle.dedupe([article]) == [article]
+    logger.info("✅ Index persists and ignores the article itself")
+
+def test_lookups_only_touch_colliding_entries():
+    """An unrelated article is compared against a handful of candidates, not the whole index"""
+    rng = random.Random(3)
+    index = NearDuplicateIndex(filename=None)
+    index.dedupe([random_article(rng, i) for i in range(1000)], record=True)
+
+    probe = random_article(rng, 5000)
+    title_signature, body_signature = index.signatures(probe)
+    candidates = index._titles.candidates(title_signature) | index._bodies.candidates(body_signature)
+    assert len(index) == 1000
+    assert len(candidates) < 50
+    assert index.find(probe) is None
+    logger.info(f"✅ Lookup compared {len(candidates)} of {len(index)} indexed articles")
+
+def test_signatures_track_jaccard_similarity():
+    """Signature agreement tracks the share of common shingles"""
+    rng = random.Random(4)
+    words = [rng.choice(VOCABULARY) for _ in range(400)]
+    changed = list(words)
+    for position in range(0, 400, 10):
+        changed[position] = 'edited'
+    first, second = body_shingles(" ".join(words)), body_shingles(" ".join(changed))
+    jaccard = len(first & second) / len(first | second)
+    matching = sum(1 for x, y in zip(one_permutation_hash(first), one_permutation_hash(second)) if x == y) / 64
+    assert abs(matching - jaccard) < 0.2
+    assert minhash(title_shingles('')) is None and one_permutation_hash(body_shingles('too short')) is None
+    logger.info(f"✅ Estimated similarity {matching:.2f} vs true Jaccard {jaccard:.2f}")
+
+def test_finalize_drops_copies_across_sources():
+    """A story already kept for one source is not kept again for another"""
+    scraper = NewsScraper({'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None})
+    rng = random.Random(5)
+    story = random_article(rng, 1, 'Reuters')
+    copy = dict(story, url='https://thehindu.example/copy', source='The Hindu')
+
+    assert len(scraper.finalize_source_articles('Reuters', [story])) == 1
+    assert scraper.finalize_source_articles('The Hindu', [copy]) == []
+    logger.info("✅ Copies are dropped across sources")
+
+def main():
+    """Run all tests"""
+    test_reworded_titles_and_syndicated_bodies()
+    test_index_persists_across_cycles()
+    test_lookups_only_touch_colliding_entries()
+    test_signatures_track_jaccard_similarity()
+    test_finalize_drops_copies_across_sources()
+    logger.info("🎉 Near-duplicate index tests passed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Test parsing downloaded article HTML in worker processes"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+from services.scraper import NewsScraper
+from test_response_cache import StubAdapter, ARTICLE_BODY
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STORY = "https://stub.example/harbour"
+PAGE = (f'<html><head><title>Harbour project reaches its second phase</title>'
+        f'<meta property="og:image" content="https://img.stub.example/harbour.jpg"></head>'
+        f'<body><article><h1>Harbour project reaches its second phase</h1><p>{ARTICLE_BODY}</p></article></body></html>')
+
+def make_scraper(parse_workers):
+    scraper = NewsScraper({'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None,
+                           'html_cache_dir': None, 'parse_workers': parse_workers})
+    scraper.session.mount("https://", StubAdapter({STORY: (200, PAGE)}))
+    return scraper
+
+def test_workers_match_in_thread_parsing():
+    """Articles parsed in worker processes come out the same as in-thread ones"""
+    in_thread = make_scraper(0)
+    pooled = make_scraper(2)
+    try:
+        assert in_thread.parse_pool is None
+        expected = in_thread.extract_full_article(STORY)
+        assert ARTICLE_BODY[:40] in expected['fullContent']
+        assert pooled.extract_full_article(STORY) == expected
+        assert pooled.extract_article_from_html(STORY, '') == in_thread._empty_article_details()
+    finally:
+        pooled.parse_pool.shutdown()
+    logger.info("✅ Worker processes parse like the extraction threads")
+
+def test_dead_worker_falls_back_to_in_thread():
+    """A worker that dies costs one in-thread parse, and the next call gets a fresh pool"""
+    scraper = make_scraper(1)
+    try:
+        executor = scraper.parse_pool._get_executor()
+        executor.submit(len, '').result()
+        for process in list(executor._processes.values()):
+            process.kill()
+            process.join()
+
+        details = scraper.extract_article_from_html(STORY, PAGE)
+        assert ARTICLE_BODY[:40] in details['fullContent']
+        assert scraper.parse_pool._get_executor() is not executor
+        assert scraper.parse_pool.extract(STORY, PAGE)['fullContent'] == details['fullContent']
+    finally:
+        scraper.parse_pool.shutdown()
+    logger.info("✅ A dead worker does not lose the article")
+
+def main():
+    """Run all tests"""
+    test_workers_match_in_thread_parsing()
+    test_dead_worker_falls_back_to_in_thread()
+    logger.info("🎉 Parse pool tests passed")
+
+if __name__ == "__main__":
+    main()
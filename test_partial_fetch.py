@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Test streamed page fetches: the byte cap, stopping after the article and refusing non-HTML responses"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+import httpx
+from services.async_scraper import AsyncNewsScraper
+from services.partial_fetch import PageBuffer, is_html_content_type
+from test_response_cache import StubAdapter, ARTICLE_BODY
+from test_source_registry import make_scraper
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STORY = "https://stub.example/harbour"
+REPORT = "https://stub.example/annual-report"
+FILLER = "<p>Related: another story you might like</p>" * 5000
+PAGE = (f'<html><head><meta property="og:image" content="https://img.stub.example/harbour.jpg"></head>'
+        f'<body><nav><a href="/">Home</a></nav><main><h1>Harbour project reaches its second phase</h1>'
+        f'<article><p>{ARTICLE_BODY}</p></article></main><aside>{FILLER}</aside></body></html>')
+
+# A teaser card in the navigation and a related story nested inside the article, before the story ends
+TEASER_PAGE = (f'<html><head><meta property="og:title" content="Harbour"></head><body>'
+               f'<nav><article class="teaser"><a href="/other">Trending: city council votes</a></article></nav>'
+               f'<article><h1>Harbour project reaches its second phase</h1><p>{ARTICLE_BODY}</p>'
+               f'<article class="related"><a href="/more">More on this</a></article>'
+               f'<p>The final paragraph of the story.</p></article><aside>{FILLER}</aside></body></html>')
+
+class TypedStubAdapter(StubAdapter):
+    """StubAdapter that serves the report as a PDF"""
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        if request.url == REPORT:
+            response.headers['Content-Type'] = 'application/pdf'
+        return response
+
+def test_page_buffer_cap_and_stop():
+    """The buffer stops after <main> closes, not the article inside it, and cuts container-less pages at the cap"""
+    page = PageBuffer(len(PAGE), stop_early=True)
+    data = PAGE.encode('utf-8')
+    # Chunk boundaries fall inside the tags it is looking for
+    for start in range(0, len(data), 7):
+        if page.feed(data[start:start + 7]):
+            break
+    assert page.content().endswith(b"</article></main>") and not page.truncated
+
+    capped = PageBuffer(100, stop_early=True)
+    assert capped.feed(b"<html><head></head><body>" + FILLER.encode('utf-8'))
+    assert len(capped) == 100 and capped.truncated
+
+    assert is_html_content_type("text/html; charset=utf-8") and is_html_content_type(None)
+    assert not is_html_content_type("application/pdf") and not is_html_content_type("video/mp4")
+    logger.info("✅ Page buffer stops after the article or at the cap")
+
+def test_teasers_and_nested_articles_do_not_stop_the_page():
+    """Only the story's own container, closed at its depth and holding real text, ends the download"""
+    data = TEASER_PAGE.encode('utf-8')
+    for chunk_size in (len(data), 7):
+        page = PageBuffer(len(data), stop_early=True)
+        for start in range(0, len(data), chunk_size):
+            if page.feed(data[start:start + chunk_size]):
+                break
+        assert page.content().endswith(b"<p>The final paragraph of the story.</p></article>"), chunk_size
+        assert ARTICLE_BODY.encode('utf-8') in page.content() and not page.truncated
+
+    # A page whose only container is a teaser is read to the cap
+    short = PageBuffer(2000, stop_early=True)
+    short.feed(b'<html><head></head><body><article><a href="/x">Teaser</a></article>' + FILLER.encode('utf-8'))
+    assert short.truncated and len(short) == 2000
+    logger.info("✅ Teaser cards and nested articles do not cut the story off")
+
+def test_article_fetch_stops_early_and_skips_pdfs():
+    """Article pages stop downloading after their content, index pages are only capped, and PDFs are refused"""
+    scraper, _ = make_scraper({})
+    adapter = TypedStubAdapter({STORY: (200, PAGE), REPORT: (200, "%PDF-1.7 binary"),
+                                "https://stub.example/": (200, PAGE)})
+    scraper.session.mount("https://", adapter)
+
+    details = scraper.extract_full_article(STORY)
+    assert ARTICLE_BODY[:40] in details['fullContent']
+    fetched = scraper.metrics.snapshot()['counters']['fetched_bytes_total']['host=stub.example']
+    assert fetched < len(PAGE) // 4
+
+    assert len(scraper.fetch_page("https://stub.example/").content) == len(PAGE)
+    scraper.page_max_bytes = 1000
+    scraper.response_cache.clear()
+    assert len(scraper.fetch_page("https://stub.example/").content) == 1000
+
+    assert scraper.extract_full_article(REPORT)['fullContent'] is None
+    counters = scraper.metrics.snapshot()['counters']
+    assert counters['pages_rejected_total']['host=stub.example'] == 1
+    logger.info("✅ Article fetches stop early and PDFs are skipped")
+
+def test_async_fetch_streams_pages():
+    """The async engine streams pages the same way"""
+    def handler(request):
+        if str(request.url) == REPORT:
+            return httpx.Response(200, content=b"%PDF-1.7 binary", headers={'content-type': 'application/pdf'})
+        return httpx.Response(200, text=PAGE, headers={'content-type': 'text/html'})
+
+    async def run():
+        config = {'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None, 'html_cache_dir': None}
+        async with AsyncNewsScraper(config, transport=httpx.MockTransport(handler)) as async_scraper:
+            response = await async_scraper.fetch(STORY, stop_early=True)
+            details = await async_scraper.extract_full_article(REPORT)
+            return response, details, async_scraper.scraper.metrics.snapshot()['counters']
+
+    response, details, counters = asyncio.run(run())
+    assert response.text.endswith("</article></main>")
+    assert not details.get('fullContent')
+    assert counters['pages_rejected_total']['host=stub.example'] == 1
+    logger.info("✅ Async page fetches stream and refuse PDFs")
+
+def main():
+    """Run all tests"""
+    test_page_buffer_cap_and_stop()
+    test_teasers_and_nested_articles_do_not_stop_the_page()
+    test_article_fetch_stops_early_and_skips_pdfs()
+    test_async_fetch_streams_pages()
+    logger.info("🎉 Partial fetch tests passed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Test the streaming scrape-to-store pipeline with stub scraper and storage"""
+
+import sys
+import os
+import threading
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+from services.pipeline import ScrapePipeline
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class StubScraper:
+    def __init__(self, count, delay=0.0):
+        self.count = count
+        self.delay = delay
+        self.produced = 0
+        self.closed = False
+        self.lock = threading.Lock()
+
+    def iter_all_sources(self, sources, deadline=None):
+        try:
+            for i in range(self.count):
+                time.sleep(self.delay)
+                with self.lock:
+                    self.produced += 1
+                yield {'title': f'Stub article {i}', 'url': f'https://stub.example/{i}', 'source': 'Stub'}
+        finally:
+            self.closed = True
+
+class StubStorage:
+    def __init__(self, scraper, fail=False):
+        self.scraper = scraper
+        self.fail = fail
+        self.batches = []
+        self.max_outstanding = 0
+        self.saved = 0
+
+    def save_scraped_articles(self, articles):
+        self.batches.append(len(articles))
+        self.saved += len(articles)
+        with self.scraper.lock:
+            self.max_outstanding = max(self.max_outstanding, self.scraper.produced - self.saved)
+        time.sleep(0.01)
+        return not self.fail
+
+def test_batches_and_bounded_queue():
+    """Articles are saved in fixed-size batches and the producer never runs far ahead"""
+    scraper = StubScraper(200)
+    storage = StubStorage(scraper)
+
+    stats = ScrapePipeline(scraper, storage, batch_size=20, queue_size=10).run([{}])
+
+    assert stats['scraped'] == 200
+    assert storage.batches == [20] * 10
+    # Queue, one batch being built and the article the producer is holding
+    assert storage.max_outstanding <= 10 + 20 + 1
+    logger.info(f"✅ Saved {len(storage.batches)} batches, at most {storage.max_outstanding} articles in flight")
+
+def test_first_batch_saved_before_scraping_ends():
+    """A slow cycle flushes partial batches so early articles are saved right away"""
+    scraper = StubScraper(6, delay=0.1)
+    storage = StubStorage(scraper)
+    seen = []
+
+    stats = ScrapePipeline(scraper, storage, batch_size=50, flush_seconds=0.05).run([{}], on_article=seen.append)
+
+    assert len(seen) == 6
+    assert sum(storage.batches) == 6
+    assert len(storage.batches) > 1
+    assert stats['first_save_seconds'] < stats['elapsed_seconds'] / 2
+    logger.info(f"✅ First batch saved after {stats['first_save_seconds']:.2f}s")
+
+def test_failed_batches_are_counted():
+    """Storage failures are reported per batch without stopping the scrape"""
+    scraper = StubScraper(30)
+    stats = ScrapePipeline(scraper, StubStorage(scraper, fail=True), batch_size=10).run([{}])
+
+    assert stats['scraped'] == 30
+    assert stats['batches_failed'] == 3
+    assert stats['articles_in_failed_batches'] == 30
+    logger.info("✅ Failed batches are counted")
+
+class BrokenStorage(StubStorage):
+    def save_scraped_articles(self, articles):
+        raise RuntimeError("storage went away")
+
+def test_storage_errors_stop_the_producer():
+    """An exception while saving stops the producer before run returns, so it cannot overlap the next cycle"""
+    scraper = StubScraper(1000)
+    try:
+        ScrapePipeline(scraper, BrokenStorage(scraper), batch_size=5, queue_size=5).run([{}])
+        assert False, "the storage error should propagate"
+    except RuntimeError:
+        pass
+
+    assert scraper.closed and scraper.produced < 1000
+    assert not any(thread.name == 'scrape-producer' for thread in threading.enumerate())
+    logger.info("✅ A failing save stops the producer")
+
+def main():
+    """Run all tests"""
+    test_batches_and_bounded_queue()
+    test_first_batch_saved_before_scraping_ends()
+    test_failed_batches_are_counted()
+    test_storage_errors_stop_the_producer()
+    logger.info("🎉 Pipeline tests passed")
+
+if __name__ == "__main__":
+    main()
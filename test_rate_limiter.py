@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Test the per-host token bucket shared by the scraper's fetch paths"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+import httpx
+from services.async_scraper import AsyncNewsScraper
+from services.rate_limiter import HostRateLimiter, parse_retry_after
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def test_burst_then_steady_rate():
+    """A host gets its burst immediately, then one request per 1/rate seconds"""
+    limiter = HostRateLimiter(requests_per_second=20, burst=2)
+    delays = [limiter.reserve("https://a.example/page") for _ in range(4)]
+
+    assert delays[0] == 0 and delays[1] == 0
+    assert abs(delays[2] - 0.05) < 0.01
+    assert abs(delays[3] - 0.10) < 0.01
+    logger.info(f"✅ Token bucket delays: {[round(delay, 3) for delay in delays]}")
+
+def test_hosts_do_not_wait_for_each_other():
+    """Threads hitting different hosts run in parallel while the same host is spaced out"""
+    limiter = HostRateLimiter(requests_per_second=5, burst=1)
+
+    def hit(host):
+        for _ in range(3):
+            limiter.acquire(f"https://{host}/")
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=hit, args=(f"host{i}.example",)) for i in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+
+    # Three requests per host at 5/s take 0.4s; serialized hosts would take about 2.8s
+    assert 0.35 < elapsed < 1.0
+    logger.info(f"✅ Five hosts finished in {elapsed:.2f}s")
+
+def test_retry_after_throttles_only_that_host():
+    """A 429 with Retry-After pauses the host that sent it and nobody else"""
+    limiter = HostRateLimiter(requests_per_second=100, burst=5)
+    assert limiter.observe("https://busy.example/x", 429, {'Retry-After': '3'})
+
+    assert limiter.reserve("https://busy.example/y") > 2.5
+    assert limiter.reserve("https://calm.example/y") == 0
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0
+    assert parse_retry_after('soon') is None
+    logger.info("✅ Retry-After throttles a single host")
+
+def test_async_fetch_waits_out_retry_after():
+    """The async engine retries a 429 after the advertised Retry-After instead of a fixed sleep"""
+    attempts = []
+
+    def handler(request):
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            return httpx.Response(429, headers={'Retry-After': '0.3'})
+        return httpx.Response(200, text='ok')
+
+    async def run():
+        async with AsyncNewsScraper(transport=httpx.MockTransport(handler)) as scraper:
+            return await scraper.fetch("https://throttled.example/feed")
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 200
+    assert len(attempts) == 2
+    assert attempts[1] - attempts[0] >= 0.29
+    logger.info(f"✅ Retried after {attempts[1] - attempts[0]:.2f}s")
+
+def main():
+    """Run all tests"""
+    test_burst_then_steady_rate()
+    test_hosts_do_not_wait_for_each_other()
+    test_retry_after_throttles_only_that_host()
+    test_async_fetch_waits_out_retry_after()
+    logger.info("🎉 Rate limiter tests passed")
+
+if __name__ == "__main__":
+    main()
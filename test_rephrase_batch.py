@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Test batched, concurrent headline rephrasing against a local stub of the chat completions API"""
+
+import sys
+import os
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+from services.ai_rephraser import AIRephraser, parse_batch_answer
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class StubCompletions:
+    """Answers batch prompts with a JSON array and single prompts with one headline, after a delay.
+
+    The first ``rate_limited`` requests are answered with a 429 and a one second Retry-After.
+    """
+
+    def __init__(self, delay=0.2, rate_limited=0):
+        self.delay = delay
+        self.rate_limited = rate_limited
+        self.prompts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                status, answer = stub.answer(self.path, body['messages'][0]['content'])
+                payload = json.dumps({'choices': [{'message': {'role': 'assistant', 'content': answer}}]}).encode()
+                self.send_response(status)
+                if status == 429:
+                    self.send_header('Retry-After', '1')
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/api/v1"
+
+    def answer(self, path, prompt):
+        with self.lock:
+            self.prompts.append(prompt)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        if path != '/api/v1/chat/completions':
+            return 404, ''
+        with self.lock:
+            if self.rate_limited:
+                self.rate_limited -= 1
+                return 429, ''
+        single = re.search(r'Original headline: "(.*)"', prompt)
+        if single:
+            return 200, f'"Rephrased: {single.group(1)}"'
+        headlines = re.findall(r'^\d+\. \[[^\]]*\] (.*)$', prompt, re.MULTILINE)
+        # A headline mentioning "skipped" is left out of the answer, as models sometimes do
+        answers = [f"Rephrased: {headline}" for headline in headlines if 'skipped' not in headline]
+        if len(answers) == len(headlines):
+            return 200, "```json\n" + json.dumps(answers) + "\n```"
+        return 200, "\n".join(f"{i}. {answer}" for i, answer in enumerate(answers, 1))
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+def make_articles(count):
+    return [{'title': f'Headline number {i}', 'source': 'BBC News', 'url': f'https://stub.example/{i}'}
+            for i in range(count)]
+
+def test_batches_run_concurrently_in_order():
+    """Forty headlines go out as four concurrent batch requests and come back in order"""
+    stub = StubCompletions()
+    try:
+        rephraser = AIRephraser(requests_per_second=50, batch_size=10, max_concurrency=4,
+                                api_key='test-key', base_url=stub.base_url)
+        articles = make_articles(40)
+        start = time.perf_counter()
+        rephrased = rephraser.rephrase_articles(articles)
+        elapsed = time.perf_counter() - start
+
+        assert [article['rephrased'] for article in rephrased] == [f"Rephrased: Headline number {i}" for i in range(40)]
+        assert [article['url'] for article in rephrased] == [article['url'] for article in articles]
+        assert len(stub.prompts) == 4 and stub.max_in_flight == 4
+        # Four sequential requests would take at least 0.8s
+        assert elapsed < 0.6
+    finally:
+        stub.close()
+    logger.info(f"✅ 40 headlines rephrased in 4 batch requests in {elapsed:.2f}s")
+
+def test_missing_answers_fall_back_to_single_requests():
+    """A batch answer that drops a headline gets that one rephrased on its own"""
+    stub = StubCompletions(delay=0.0)
+    try:
+        rephraser = AIRephraser(requests_per_second=50, batch_size=5, api_key='test-key', base_url=stub.base_url)
+        articles = make_articles(4) + [{'title': 'Headline skipped by the model', 'source': 'NDTV'}]
+        rephrased = rephraser.rephrase_articles(articles)
+        assert rephrased[-1]['rephrased'] == "Rephrased: Headline skipped by the model"
+        assert rephrased[0]['rephrased'] == "Rephrased: Headline number 0"
+        assert len(stub.prompts) == 2 and 'Original headline' in stub.prompts[1]
+    finally:
+        stub.close()
+    logger.info("✅ Headlines missing from a batch answer are rephrased singly")
+
+def test_rate_limited_batch_is_retried():
+    """A 429 is waited out and retried, and the batch still comes back rephrased"""
+    stub = StubCompletions(delay=0.0, rate_limited=1)
+    try:
+        rephraser = AIRephraser(requests_per_second=50, batch_size=5, api_key='test-key', base_url=stub.base_url)
+        start = time.perf_counter()
+        rephrased = rephraser.rephrase_articles(make_articles(5))
+        elapsed = time.perf_counter() - start
+        assert [article['rephrased'] for article in rephrased] == [f"Rephrased: Headline number {i}" for i in range(5)]
+        assert len(stub.prompts) == 2 and stub.prompts[0] == stub.prompts[1]
+        # The retry waited for Retry-After
+        assert elapsed >= 0.9
+    finally:
+        stub.close()
+    logger.info("✅ Rate limited batches are retried after Retry-After")
+
+def test_failed_requests_and_answer_parsing():
+    """A failing API marks headlines as errors, and answers parse from JSON or numbered lines"""
+    rephraser = AIRephraser(requests_per_second=50, api_key='test-key', base_url='http://127.0.0.1:9/api/v1')
+    rephrased = rephraser.rephrase_articles(make_articles(3))
+    assert [article['rephrased'] for article in rephrased] == [f"[AI Error] Headline number {i}" for i in range(3)]
+
+    assert parse_batch_answer('["One", "\\"Two\\""]', 2) == ['One', 'Two']
+    assert parse_batch_answer('Sure!\n1. One\n2) "Two"\n3. Three', 3) == ['One', 'Two', 'Three']
+    assert parse_batch_answer('["Only one"]', 2) == [None, None]
+    logger.info("✅ Failed requests and malformed answers are handled")
+
+def main():
+    """Run all tests"""
+    test_batches_run_concurrently_in_order()
+    test_missing_answers_fall_back_to_single_requests()
+    test_rate_limited_batch_is_retried()
+    test_failed_requests_and_answer_parsing()
+    logger.info("🎉 Rephrase batch tests passed")
+
+if __name__ == "__main__":
+    main()
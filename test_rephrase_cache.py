@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Test the persistent rephrase cache in front of the AI rephraser"""
+
+import sys
+import os
+import tempfile
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+from services.ai_rephraser import AIRephraser
+from services.rephrase_cache import RephraseCache, normalize_headline
+from test_rephrase_batch import StubCompletions
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SYNDICATED = [
+    {'title': 'Earthquake strikes off the coast of Japan - BBC News', 'source': 'BBC News'},
+    {'title': 'Earthquake strikes off the coast of Japan!', 'source': 'NDTV'},
+    {'title': 'EARTHQUAKE STRIKES OFF THE COAST OF JAPAN | Times of India', 'source': 'Times of India'},
+    {'title': 'Markets rally as inflation cools', 'source': 'Reuters'},
+]
+
+def test_normalized_headlines():
+    """Case, punctuation and the source's own suffix do not change the key"""
+    assert normalize_headline(SYNDICATED[0]['title'], 'BBC News') == 'earthquake strikes off the coast of japan'
+    assert normalize_headline(SYNDICATED[2]['title'], 'Times of India') == 'earthquake strikes off the coast of japan'
+    # A dash that is part of the headline stays
+    assert normalize_headline('Talks stall - again', 'BBC News') == 'talks stall again'
+    logger.info("✅ Headlines normalize to one key across sources")
+
+def test_repeated_and_syndicated_headlines_skip_the_api():
+    """A syndicated story is sent once, and a later run answers every headline from disk"""
+    filename = os.path.join(tempfile.mkdtemp(), 'rephrase_cache.db')
+    stub = StubCompletions(delay=0.0)
+    try:
+        cache = RephraseCache(filename)
+        rephraser = AIRephraser(requests_per_second=50, api_key='test-key', base_url=stub.base_url, cache=cache)
+        first = rephraser.rephrase_articles(SYNDICATED)
+        assert len(stub.prompts) == 1 and stub.prompts[0].count('\n1. ') == 1 and '\n3. ' not in stub.prompts[0]
+        assert first[1]['rephrased'] == first[0]['rephrased'] == first[2]['rephrased'] != first[3]['rephrased']
+        assert len(cache) == 2
+        cache.close()
+
+        # A new process, same file
+        cache = RephraseCache(filename)
+        rephraser = AIRephraser(requests_per_second=50, api_key='test-key', base_url=stub.base_url, cache=cache)
+        second = rephraser.rephrase_articles(SYNDICATED)
+        assert len(stub.prompts) == 1 and second == first
+        assert rephraser.rephrase_headline('Markets rally as inflation cools.', 'AP') == first[3]['rephrased']
+        assert cache.hits == 5 and cache.misses == 0 and cache.hit_rate == 1.0
+
+        # A different model is a different key
+        rephraser.model = 'another/model'
+        rephraser.rephrase_headline('Markets rally as inflation cools', 'Reuters')
+        assert len(stub.prompts) == 2 and cache.misses == 1
+    finally:
+        stub.close()
+    logger.info("✅ Repeated and syndicated headlines cost one API request")
+
+def test_ttl_and_size_eviction():
+    """Expired entries are not served, and the least recently used go past the entry cap"""
+    filename = os.path.join(tempfile.mkdtemp(), 'rephrase_cache.db')
+    cache = RephraseCache(filename, max_entries=3)
+    for i in range(5):
+        cache.put(f'key-{i}', f'Headline {i}')
+        time.sleep(0.01)
+    assert cache.get('key-0') == 'Headline 0'
+    cache.close()
+
+    cache = RephraseCache(filename, max_entries=3)
+    assert len(cache) == 3
+    assert cache.get('key-0') == 'Headline 0' and cache.get('key-1') is None and cache.get('key-4') == 'Headline 4'
+    cache.close()
+
+    cache = RephraseCache(filename, ttl_hours=0.01 / 3600)
+    time.sleep(0.02)
+    assert cache.get('key-4') is None and cache.misses == 1
+    logger.info("✅ Rephrase cache evicts by age and size")
+
+def main():
+    """Run all tests"""
+    test_normalized_headlines()
+    test_repeated_and_syndicated_headlines_skip_the_api()
+    test_ttl_and_size_eviction()
+    logger.info("🎉 Rephrase cache tests passed")
+
+if __name__ == "__main__":
+    main()
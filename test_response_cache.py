@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Test that article fetches share the pooled session and are made once per cycle"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+import requests
+from requests.adapters import BaseAdapter
+from services.scraper import NewsScraper
+from services.response_cache import ResponseCache
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ARTICLE_BODY = " ".join(["Flood defences along the estuary will be raised before the winter storms."] * 12)
+
+class StubAdapter(BaseAdapter):
+    """Serves canned pages and records every request that reaches the transport"""
+
+    def __init__(self, pages, delay=0.0):
+        super().__init__()
+        self.pages = pages
+        self.delay = delay
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.requests.append(request)
+        time.sleep(self.delay)
+        status, body = self.pages.get(request.url, (404, ''))
+        response = requests.Response()
+        response.status_code = status
+        response._content = body.encode('utf-8')
+        response._content_consumed = True
+        response.headers['Content-Type'] = 'text/html; charset=utf-8'
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+def make_scraper(pages, delay=0.0):
+    scraper = NewsScraper({'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None})
+    adapter = StubAdapter(pages, delay)
+    scraper.session.mount("https://", adapter)
+    return scraper, adapter
+
+def test_newspaper_downloads_use_the_session():
+    """extract_full_article fetches through the scraper's session and headers"""
+    url = "https://news.example/story"
+    scraper, adapter = make_scraper({url: (200, f"<html><body><article><p>{ARTICLE_BODY}</p></article></body></html>")})
+
+    details = scraper.extract_full_article(url)
+
+    assert ARTICLE_BODY[:40] in details['fullContent']
+    assert len(adapter.requests) == 1
+    assert adapter.requests[0].headers['User-Agent'] == scraper.session.headers['User-Agent']
+    logger.info("✅ newspaper3k gets HTML from the pooled session")
+
+def test_fallbacks_reuse_the_cycle_response():
+    """A direct-fetch fallback after failed extraction does not download the page again"""
+    url = "https://news.example/teaser"
+    scraper, adapter = make_scraper({url: (200, "<html><body><div class='story'><p>Short teaser</p></div></body></html>")})
+
+    scraper._extract_with_feed_fallback(url, '', 'Stub')
+    scraper.extract_full_article(url)
+
+    assert len(adapter.requests) == 1
+    assert scraper.response_cache.hits >= 1
+    logger.info("✅ Fallbacks are answered from the cycle cache")
+
+def test_failures_are_cached_until_the_next_cycle():
+    """A failed URL is not retried within a cycle but is fetched again in the next one"""
+    url = "https://news.example/missing"
+    scraper, adapter = make_scraper({})
+
+    for _ in range(3):
+        try:
+            scraper.fetch_page(url)
+            assert False, "expected an HTTP error"
+        except requests.exceptions.HTTPError:
+            pass
+    assert len(adapter.requests) == 1
+
+    scraper.start_cycle()
+    try:
+        scraper.fetch_page(url)
+    except requests.exceptions.HTTPError:
+        pass
+    assert len(adapter.requests) == 2
+    logger.info("✅ Failed fetches are remembered for the cycle")
+
+def test_concurrent_fetches_share_one_request():
+    """Threads asking for the same page at once wait for a single download"""
+    url = "https://news.example/popular"
+    scraper, adapter = make_scraper({url: (200, "<html><body>ok</body></html>")}, delay=0.2)
+
+    threads = [threading.Thread(target=scraper.fetch_page, args=(url,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(adapter.requests) == 1
+    logger.info("✅ Concurrent fetches of one URL make one request")
+
+def test_concurrent_async_fetches_share_one_request():
+    """Tasks asking for the same URL at once await one fetch, and a cancelled fetch is not cached"""
+    cache = ResponseCache()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return f"page {len(calls)}"
+
+    async def run():
+        first = await asyncio.gather(*(cache.aget_or_fetch("https://stub.example/story?utm_source=x", fetch)
+                                       for _ in range(5)))
+        # The fetching task is cancelled; the task waiting on it fetches the page itself
+        fetching = asyncio.create_task(cache.aget_or_fetch("https://stub.example/other", fetch))
+        await asyncio.sleep(0.01)
+        waiting = asyncio.create_task(cache.aget_or_fetch("https://stub.example/other", fetch))
+        await asyncio.sleep(0.01)
+        fetching.cancel()
+        return first, await waiting
+
+    first, other = asyncio.run(run())
+    assert first == ["page 1"] * 5 and other == "page 3" and len(calls) == 3
+    assert cache.misses == 3 and cache.hits == 4
+    logger.info("✅ Concurrent async fetches of one URL make one request")
+
+def main():
+    """Run all tests"""
+    test_newspaper_downloads_use_the_session()
+    test_fallbacks_reuse_the_cycle_response()
+    test_failures_are_cached_until_the_next_cycle()
+    test_concurrent_fetches_share_one_request()
+    test_concurrent_async_fetches_share_one_request()
+    logger.info("🎉 Response cache tests passed")
+
+if __name__ == "__main__":
+    main()
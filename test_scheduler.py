@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""Test the per-source schedule and the event-driven scheduler loop"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+from services.scheduler import NewsScraperScheduler
+from services.source_schedule import SourceSchedule, ConfigWatcher
+from services.poll_history import PollHistory
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+FAST = {'name': 'Fast Wire', 'url': 'https://fast.example', 'isActive': True}
+NDTV = {'name': 'NDTV', 'url': 'https://www.ndtv.com', 'isActive': True}
+BLOG = {'name': 'Slow Blog', 'url': 'https://blog.example', 'isActive': True}
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class StubStorage:
+    def __init__(self, sources):
+        self.sources = sources
+
+    def get_active_sources(self):
+        return list(self.sources)
+
+    def update_scraper_last_run(self):
+        pass
+
+class StubPipeline:
+    """Records which sources each job scraped"""
+
+    def __init__(self):
+        self.runs = []
+
+    def run(self, sources, deadline=None):
+        self.runs.append([source['name'] for source in sources])
+        return {'scraped': len(sources), 'batches_saved': 1, 'batches_failed': 0, 'articles_in_failed_batches': 0}
+
+def test_sources_run_on_their_own_intervals():
+    """Each source comes due on its own interval, and interval changes and removals take effect"""
+    clock = FakeClock()
+    schedule = SourceSchedule(clock)
+    intervals = {FAST['url']: 60, BLOG['url']: 600}
+    schedule.sync([FAST, BLOG], lambda source: intervals[source['url']])
+    assert [source['name'] for source in schedule.pop_due()] == ['Fast Wire', 'Slow Blog']
+    assert schedule.next_due() is None
+
+    for source in (FAST, BLOG):
+        schedule.reschedule(source['url'], started=1000, finished=1005)
+    assert schedule.next_due() == 1060
+    clock.now = 1060
+    assert schedule.pop_due() == [FAST]
+    # A run that overran its interval is due again as soon as it finished
+    schedule.reschedule(FAST['url'], started=1060, finished=1200)
+    assert schedule.next_due() == 1200
+
+    intervals[BLOG['url']] = 120
+    schedule.sync([FAST, BLOG], lambda source: intervals[source['url']])
+    assert schedule.interval(BLOG['url']) == 120 and schedule.next_due() == 1120
+    schedule.sync([FAST], lambda source: intervals[source['url']])
+    assert BLOG['url'] not in schedule and len(schedule) == 1
+    clock.now = 5000
+    assert schedule.pop_due() == [FAST]
+    logger.info("✅ Sources run on their own intervals")
+
+def test_scheduler_sleeps_until_due_and_reloads():
+    """The loop runs fast sources often and NDTV once, and an explicit reload pauses it without polling"""
+    directory = tempfile.mkdtemp()
+    config_file = os.path.join(directory, 'scraper_config.json')
+    config = {'is_active': True, 'interval_minutes': 0.005, 'adaptive_intervals': False, 'feed_cache_file': None,
+              'seen_urls_file': None, 'near_duplicate_file': None, 'html_cache_dir': None, 'metrics_file': None}
+    with open(config_file, 'w') as f:
+        json.dump(config, f)
+
+    scheduler = NewsScraperScheduler(config_file)
+    scheduler.storage = StubStorage([FAST, NDTV])
+    scheduler.pipeline = StubPipeline()
+    waits = []
+    wait = scheduler._wake.wait
+    scheduler._wake.wait = lambda timeout=None: waits.append(timeout) or wait(timeout)
+
+    thread = threading.Thread(target=scheduler.start_scheduler, daemon=True)
+    thread.start()
+    time.sleep(1.2)
+    runs = list(scheduler.pipeline.runs)
+    assert runs[0] == ['Fast Wire', 'NDTV']
+    assert 3 <= len(runs) <= 6 and all(run == ['Fast Wire'] for run in runs[1:])
+    assert scheduler.schedule.interval(NDTV['url']) == 5 * 60
+    # The loop only woke when the fast source was due
+    assert len(waits) <= len(runs) + 1 and all(timeout and timeout > 0.1 for timeout in waits)
+
+    with open(config_file) as f:
+        config = json.load(f)
+    assert config['last_run'] is not None
+    config['is_active'] = False
+    with open(config_file, 'w') as f:
+        json.dump(config, f)
+    scheduler.reload()
+    time.sleep(0.2)
+    paused_runs = len(scheduler.pipeline.runs)
+    time.sleep(0.5)
+    assert len(scheduler.pipeline.runs) == paused_runs
+    # Paused, the loop only wakes to check the config file when nothing watches it
+    assert waits[-1] == (scheduler.watcher.poll_seconds if scheduler.watcher.polling else None)
+
+    scheduler.stop_scheduler()
+    thread.join(timeout=2)
+    assert not thread.is_alive()
+    logger.info("✅ Scheduler sleeps until a source is due and reloads on request")
+
+def test_config_file_edits_are_noticed_without_reload():
+    """Flipping is_active in the file starts and pauses the loop with no explicit reload"""
+    directory = tempfile.mkdtemp()
+    config_file = os.path.join(directory, 'scraper_config.json')
+    config = {'is_active': False, 'interval_minutes': 0.005, 'adaptive_intervals': False, 'feed_cache_file': None,
+              'seen_urls_file': None, 'near_duplicate_file': None, 'html_cache_dir': None, 'metrics_file': None}
+    with open(config_file, 'w') as f:
+        json.dump(config, f)
+
+    scheduler = NewsScraperScheduler(config_file)
+    scheduler.watcher = ConfigWatcher(config_file, scheduler.reload, poll_seconds=0.1)
+    scheduler.storage = StubStorage([FAST])
+    scheduler.pipeline = StubPipeline()
+    thread = threading.Thread(target=scheduler.start_scheduler, daemon=True)
+    thread.start()
+    time.sleep(0.3)
+    assert not scheduler.is_active and not scheduler.pipeline.runs
+
+    config['is_active'] = True
+    with open(config_file, 'w') as f:
+        json.dump(config, f)
+    time.sleep(0.6)
+    assert scheduler.is_active and scheduler.pipeline.runs
+
+    with open(config_file) as f:
+        config = json.load(f)
+    config['is_active'] = False
+    with open(config_file, 'w') as f:
+        json.dump(config, f)
+    time.sleep(0.3)
+    paused_runs = len(scheduler.pipeline.runs)
+    time.sleep(0.5)
+    assert not scheduler.is_active and len(scheduler.pipeline.runs) == paused_runs
+
+    scheduler.stop_scheduler()
+    thread.join(timeout=2)
+    assert not thread.is_alive()
+    logger.info("✅ Config file edits are picked up without a reload")
+
+def test_intervals_adapt_to_publishing_rate():
+    """Quiet feeds back off to the maximum, busy ones tighten to the minimum, and history is kept on disk"""
+    history_file = os.path.join(tempfile.mkdtemp(), 'poll_history.json')
+    history = PollHistory(history_file, min_interval_minutes=5, max_interval_minutes=120, target_new_per_poll=3)
+    base = 20 * 60
+    assert history.interval(BLOG['url'], base) == base
+    assert history.interval(BLOG['url'], 1) == 5 * 60
+
+    now = 0.0
+    # The first poll only finds the backlog, so it teaches nothing
+    assert history.record(BLOG['url'], 25, now, base) == base
+    intervals = []
+    for _ in range(8):
+        now += history.interval(BLOG['url'], base)
+        intervals.append(history.record(BLOG['url'], 0, now, base))
+    assert intervals[0] == base * 1.5 and intervals == sorted(intervals) and intervals[-1] == 120 * 60
+
+    now = 0.0
+    history.record(NDTV['url'], 20, now, base)
+    for _ in range(6):
+        now += history.interval(NDTV['url'], base)
+        # Twelve new stories every twenty minutes is one every hundred seconds
+        interval = history.record(NDTV['url'], round(12 * history.interval(NDTV['url'], base) / base), now, base)
+    assert interval == 5 * 60
+
+    history.save()
+    learned = PollHistory(history_file).learned_intervals()
+    assert learned[BLOG['url']]['interval_minutes'] == 120 and learned[BLOG['url']]['polls'] == 9
+    assert learned[NDTV['url']]['interval_minutes'] == 5 and learned[NDTV['url']]['new_per_hour'] > 20
+    logger.info("✅ Poll intervals follow each source's publishing rate")
+
+def test_scheduler_learns_from_each_run():
+    """The scheduler feeds each source's new-article count into its history and reschedules with the result"""
+    directory = tempfile.mkdtemp()
+    config_file = os.path.join(directory, 'scraper_config.json')
+    with open(config_file, 'w') as f:
+        json.dump({'is_active': True, 'poll_history_file': os.path.join(directory, 'poll_history.json'),
+                   'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None,
+                   'html_cache_dir': None, 'metrics_file': None}, f)
+    scheduler = NewsScraperScheduler(config_file)
+    scheduler.apply_config(scheduler.load_config())
+    scheduler.storage = StubStorage([BLOG, FAST])
+    scheduler.pipeline = StubPipeline()
+    scheduler.refresh_sources(time.time())
+
+    for new_counts in ({BLOG['url']: 10, FAST['url']: 10}, {BLOG['url']: 0}):
+        scheduler.scraper.new_articles_by_source = new_counts
+        scheduler.run_due_sources(scheduler.schedule.pop_due(now=float('inf')))
+
+    # The blog found nothing on its second poll and backed off; the fast source failed, so it kept its interval
+    assert scheduler.schedule.interval(BLOG['url']) == 30 * 60
+    assert scheduler.schedule.interval(FAST['url']) == 20 * 60
+    assert scheduler.learned_intervals()[BLOG['url']]['interval_minutes'] == 30
+    assert os.path.exists(os.path.join(directory, 'poll_history.json'))
+    logger.info("✅ Scheduler runs feed the poll history")
+
+def test_cycle_budget_defers_remaining_sources():
+    """Sources not started by the cycle deadline are deferred, reported, and go first in the next job"""
+    directory = tempfile.mkdtemp()
+    config_file = os.path.join(directory, 'scraper_config.json')
+    with open(config_file, 'w') as f:
+        json.dump({'is_active': True, 'cycle_budget_minutes': 0.005, 'adaptive_intervals': False,
+                   'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None,
+                   'html_cache_dir': None, 'metrics_file': None}, f)
+    scheduler = NewsScraperScheduler(config_file)
+    scheduler.apply_config(scheduler.load_config())
+    scheduler.storage = StubStorage([FAST, NDTV, BLOG])
+    scraped = []
+
+    def slow_source(url, name):
+        scraped.append(name)
+        time.sleep(0.4)
+        return []
+
+    scheduler.scraper.scrape_source_comprehensive = slow_source
+    scheduler.refresh_sources(time.time())
+
+    report = scheduler.run_due_sources(scheduler.schedule.pop_due())
+    assert scraped == ['Fast Wire']
+    assert report['finished'] == [FAST] and report['deferred'] == [NDTV, BLOG] and not report['failed']
+    counters = scheduler.scraper.metrics.snapshot()['counters']['cycle_sources_total']
+    assert counters == {'outcome=finished': 1, 'outcome=deferred': 2}
+
+    # The deferred sources are due right away, ahead of the source that ran
+    assert scheduler.schedule.pop_due() == [NDTV, BLOG]
+    scheduler.cycle_budget_minutes = 0
+    report = scheduler.run_due_sources([NDTV, BLOG])
+    assert scraped == ['Fast Wire', 'NDTV', 'Slow Blog'] and report['finished'] == [NDTV, BLOG]
+    assert scheduler.schedule.next_due() > time.time()
+    logger.info("✅ Cycle budget defers the sources it did not reach")
+
+def main():
+    """Run all tests"""
+    test_sources_run_on_their_own_intervals()
+    test_scheduler_sleeps_until_due_and_reloads()
+    test_config_file_edits_are_noticed_without_reload()
+    test_intervals_adapt_to_publishing_rate()
+    test_scheduler_learns_from_each_run()
+    test_cycle_budget_defers_remaining_sources()
+    logger.info("🎉 Scheduler tests passed")
+
+if __name__ == "__main__":
+    main()
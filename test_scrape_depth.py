@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Test per-source scrape depth: headline and summary articles built from the feed without downloading pages"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+import httpx
+from services.async_scraper import AsyncNewsScraper
+from services.partial_fetch import HeadBuffer
+from services.sources import RSS_FEEDS
+from test_response_cache import ARTICLE_BODY
+from test_source_registry import make_scraper
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+RSS_URL = RSS_FEEDS['bbc.com']['rss_url']
+STORY = "https://stub.example/flood-budget"
+FEED = f'''<?xml version="1.0"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"><channel>
+<item><title>Council approves the new flood defence budget</title>
+  <link>{STORY}</link>
+  <description>&lt;p&gt;The vote &lt;b&gt;passed&lt;/b&gt;.&lt;/p&gt;</description>
+  <dc:creator>Jane Reporter</dc:creator>
+</item></channel></rss>'''
+PAGE_DESCRIPTION = "Councillors voted to fund a new flood wall along the river after two wet winters in a row."
+# The body comes after a long </head>, so a head fetch never needs it
+PAGE = (f'<html><head><title>Flood budget</title>'
+        f'<meta property="og:description" content="{PAGE_DESCRIPTION}">'
+        f'<meta property="og:image" content="/images/flood.jpg">'
+        f'<meta property="article:published_time" content="2025-06-10T09:30:00Z">'
+        f'</head><body><article><p>{ARTICLE_BODY}</p></article>{"<p>filler</p>" * 20000}</body></html>')
+
+def test_head_buffer_stops_at_the_end_of_head():
+    """The buffer stops at a </head> split across chunks, or at the byte cap when there is none"""
+    head = HeadBuffer(1024)
+    assert head.range_header() == {'Range': 'bytes=0-1023'}
+    assert not head.feed(b"<html><head><title>x</title></HE")
+    assert head.feed(b"AD><body>")
+    assert head.text().endswith("</HEAD><body>")
+
+    capped = HeadBuffer(10)
+    assert capped.feed(b"<html><body>no head here")
+    assert len(capped) == 10
+    logger.info("✅ Head buffer stops at </head> or the cap")
+
+def test_headline_and_summary_depths():
+    """headline uses the feed alone; summary adds og: meta from the page head; full is unchanged"""
+    pages = {RSS_URL: (200, FEED), STORY: (200, PAGE)}
+
+    scraper, adapter = make_scraper(pages, {'bbc.com': {'depth': 'headline'}})
+    article, = scraper.scrape_source("https://www.bbc.com/news", "BBC News")
+    assert [request.url for request in adapter.requests] == [RSS_URL]
+    assert article['fullContent'] == "The vote passed." and article['author'] == "Jane Reporter"
+    assert article['category'] and article['region']
+
+    scraper, adapter = make_scraper(pages, {'bbc.com': {'depth': 'summary'}})
+    article, = scraper.scrape_source("https://www.bbc.com/news", "BBC News")
+    head_request = adapter.requests[1]
+    assert head_request.url == STORY and head_request.headers['Range'].startswith('bytes=0-')
+    assert article['fullContent'] == PAGE_DESCRIPTION
+    assert article['imageUrl'] == "https://stub.example/images/flood.jpg"
+    assert article['publishedAt'] == "2025-06-10T09:30:00+00:00"
+    assert scraper.metrics.snapshot()['counters']['fetched_bytes_total']['host=stub.example'] < len(PAGE) // 10
+
+    scraper, adapter = make_scraper(pages)
+    article, = scraper.scrape_source("https://www.bbc.com/news", "BBC News")
+    assert ARTICLE_BODY[:40] in article['fullContent']
+    logger.info("✅ Depths fetch only what they need")
+
+def test_config_default_and_async_summary():
+    """The config sets the default depth, unknown depths fetch in full, and the async engine summarizes too"""
+    scraper, _ = make_scraper({}, {'bbc.com': {'depth': 'everything'}})
+    assert scraper.depth_for('bbc.com') == 'full'
+    scraper.scrape_depth = 'headline'
+    assert scraper.depth_for('cnn.com') == 'headline'
+
+    requested = []
+
+    def handler(request):
+        requested.append((str(request.url), request.headers.get('range')))
+        if str(request.url) == RSS_URL:
+            return httpx.Response(200, text=FEED)
+        return httpx.Response(200, text=PAGE, headers={'content-type': 'text/html'})
+
+    async def run():
+        config = {'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None,
+                  'html_cache_dir': None, 'scrape_depth': 'summary'}
+        async with AsyncNewsScraper(config, transport=httpx.MockTransport(handler)) as async_scraper:
+            return await async_scraper.scrape_source("https://www.bbc.com/news", "BBC News")
+
+    article, = asyncio.run(run())
+    assert requested[1][0] == STORY and requested[1][1].startswith('bytes=0-')
+    assert article['fullContent'] == PAGE_DESCRIPTION
+    assert article['imageUrl'] == "https://stub.example/images/flood.jpg"
+    logger.info("✅ Config depth applies to both engines")
+
+def main():
+    """Run all tests"""
+    test_head_buffer_stops_at_the_end_of_head()
+    test_headline_and_summary_depths()
+    test_config_default_and_async_summary()
+    logger.info("🎉 Scrape depth tests passed")
+
+if __name__ == "__main__":
+    main()
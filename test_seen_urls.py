@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Test the seen-URL index that lets cycles skip already ingested articles"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+import httpx
+from services.async_scraper import AsyncNewsScraper
+from services.scraper import NewsScraper, RSS_FEEDS
+from services.seen_urls import SeenUrlIndex, canonicalize_url
+from services.storage_integration import StorageIntegration
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ARTICLE_BODY = " ".join(["Flood defences along the estuary will be raised before the winter storms."] * 12)
+
+def test_canonical_urls():
+    """Tracking parameters, fragments, www and trailing slashes do not create new URLs"""
+    canonical = canonicalize_url("https://www.bbc.com/news/world-123")
+    assert canonicalize_url("http://bbc.com/news/world-123/") == canonical
+    assert canonicalize_url("https://www.bbc.com/news/world-123?utm_source=rss&at_medium=RSS#comments") == canonical
+    assert canonicalize_url("https://news.example/a?b=2&a=1") == canonicalize_url("https://news.example/a?a=1&b=2")
+    assert canonicalize_url("https://news.example/a?id=1") != canonicalize_url("https://news.example/a?id=2")
+    logger.info("✅ URLs canonicalize consistently")
+
+def test_entries_persist_and_expire():
+    """Saved URLs survive a reload and are forgotten after the TTL"""
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, 'seen_urls.json')
+        index = SeenUrlIndex(filename, ttl_hours=1)
+        index.add_many(["https://news.example/story-1"])
+
+        reloaded = SeenUrlIndex(filename, ttl_hours=1)
+        assert "https://news.example/story-1?utm_campaign=x" in reloaded
+        assert "https://news.example/story-2" not in reloaded
+
+        reloaded._seen[canonicalize_url("https://news.example/story-1")] = time.time() - 7200
+        assert "https://news.example/story-1" not in reloaded
+    logger.info("✅ Seen URLs persist and expire")
+
+def test_storage_records_only_saved_urls():
+    """Only articles the API accepted are added to the index"""
+    class StubResponse:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.text = ''
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = SeenUrlIndex(os.path.join(tmp, 'seen_urls.json'))
+        storage = StorageIntegration(seen_urls=index)
+        def post(url, json=None, **kwargs):
+            if url.endswith('/bulk'):
+                return StubResponse(404)
+            return StubResponse(400 if 'rejected' in json['originalUrl'] else 200)
+        storage.session.post = post
+
+        storage.save_scraped_articles([
+            {'title': 'Accepted article headline', 'url': 'https://news.example/accepted', 'source': 'Stub'},
+            {'title': 'Rejected article headline', 'url': 'https://news.example/rejected', 'source': 'Stub'}
+        ])
+
+        assert "https://news.example/accepted" in index
+        assert "https://news.example/rejected" not in index
+    logger.info("✅ Storage feeds the index from successful saves")
+
+def test_seen_articles_are_not_fetched():
+    """A cycle only downloads feed items whose URL has not been saved yet"""
+    requested = []
+
+    def handler(request):
+        requested.append(str(request.url))
+        if str(request.url) == RSS_FEEDS['bbc.com']['rss_url']:
+            items = "".join(
+                f"<item><title>Stub headline number {i} about flood defences</title>"
+                f"<link>https://stub.example/articles/{i}</link></item>" for i in range(4)
+            )
+            return httpx.Response(200, text=f"<rss><channel>{items}</channel></rss>")
+        return httpx.Response(200, text=f"<html><body><article><p>{ARTICLE_BODY}</p></article></body></html>")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = NewsScraper({'seen_urls_file': os.path.join(tmp, 'seen_urls.json'), 'feed_cache_file': None})
+        scraper.seen_urls.add_many(["https://stub.example/articles/0", "https://stub.example/articles/1"])
+
+        async def run():
+            async with AsyncNewsScraper(scraper=scraper, transport=httpx.MockTransport(handler)) as async_scraper:
+                return await async_scraper.scrape_source("https://www.bbc.com/news", "BBC News")
+
+        articles = asyncio.run(run())
+
+    assert [article['url'] for article in articles] == ["https://stub.example/articles/2", "https://stub.example/articles/3"]
+    assert not any(url.endswith(('/articles/0', '/articles/1')) for url in requested)
+    logger.info("✅ Already ingested articles are skipped before extraction")
+
+def main():
+    """Run all tests"""
+    test_canonical_urls()
+    test_entries_persist_and_expire()
+    test_storage_records_only_saved_urls()
+    test_seen_articles_are_not_fetched()
+    logger.info("🎉 Seen-URL index tests passed")
+
+if __name__ == "__main__":
+    main()
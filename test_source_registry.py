@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Test the source registry: host lookup, the per-source strategy order and sources added from config"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+from services.scraper import NewsScraper
+from services.sources import SourceRegistry, RSS_FEEDS, default_registry
+from test_response_cache import StubAdapter, ARTICLE_BODY
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def article_page(title):
+    return f"<html><head><title>{title}</title></head><body><article><h1>{title}</h1><p>{ARTICLE_BODY}</p></article></body></html>"
+
+def make_scraper(pages, source_registry=None):
+    scraper = NewsScraper({'feed_cache_file': None, 'seen_urls_file': None, 'near_duplicate_file': None,
+                           'html_cache_dir': None, 'source_registry': source_registry})
+    adapter = StubAdapter(pages)
+    scraper.session.mount("http://", adapter)
+    scraper.session.mount("https://", adapter)
+    return scraper, adapter
+
+def test_hosts_match_their_registered_domain():
+    """Subdomains find their source's row; lookalike and unknown hosts do not"""
+    assert default_registry.key_for("https://news.ycombinator.com") == 'ycombinator.com'
+    assert default_registry.key_for("https://www.bbc.com/news") == 'bbc.com'
+    assert default_registry.key_for("https://WWW.BBC.COM:443/news") == 'bbc.com'
+    assert default_registry.key_for("https://timesofindia.indiatimes.com/india") == 'timesofindia.indiatimes.com'
+    assert default_registry.key_for("https://indiatimes.com") is None
+    assert default_registry.key_for("https://notbbc.com/news") is None
+    assert default_registry.key_for("not a url") is None
+    assert set(RSS_FEEDS) <= set(default_registry)
+    assert default_registry.concurrency("www.reuters.com", 2) == 2
+    logger.info("✅ Hosts resolve to their registered source")
+
+def test_feed_then_index_parser_then_nothing():
+    """India Today falls back from its feed to its index parser; Hacker News has no generic fallback"""
+    homepage = "https://www.indiatoday.in/"
+    story = "https://www.indiatoday.in/india/story/monsoon-session-opens"
+    title = "Monsoon session of Parliament opens with a long agenda"
+    scraper, adapter = make_scraper({
+        homepage: (200, f'<html><body><div class="story"><h2><a href="{story}">{title}</a></h2></div></body></html>'),
+        story: (200, article_page(title)),
+    })
+
+    articles = scraper.scrape_source(homepage, "India Today")
+    assert [request.url for request in adapter.requests[:2]] == [RSS_FEEDS['indiatoday.in']['rss_url'], homepage]
+    assert [article['title'] for article in articles] == [title]
+    assert articles[0]['source'] == 'India Today' and ARTICLE_BODY[:40] in articles[0]['fullContent']
+
+    scraper, adapter = make_scraper({})
+    assert scraper.scrape_source("https://news.ycombinator.com", "Hacker News") == []
+    assert len(adapter.requests) == 1
+    logger.info("✅ Strategies run in registry order")
+
+def test_sources_are_added_and_tuned_from_config():
+    """A config row adds a feed-backed source, and overrides merge over the built-in row"""
+    rss_url = "https://feeds.example-news.org/top.xml"
+    stories = [(f"https://www.example-news.org/story/{i}", f"Example story number {i} about the harbour project")
+               for i in range(3)]
+    feed = ('<?xml version="1.0"?><rss version="2.0"><channel>' +
+            ''.join(f'<item><title>{title}</title><link>{url}</link></item>' for url, title in stories) +
+            '</channel></rss>')
+    pages = {url: (200, article_page(title)) for url, title in stories}
+    pages[rss_url] = (200, feed)
+    scraper, _ = make_scraper(pages, {
+        'example-news.org': {'source': 'Example News', 'rss_url': rss_url, 'item_limit': 2, 'concurrency': 1},
+        'bbc.com': {'item_limit': 5},
+        'broken.example': {'rss_url': "https://broken.example/rss"},
+    })
+
+    articles = scraper.scrape_source("https://www.example-news.org", "Example")
+    assert [article['url'] for article in articles] == [url for url, _ in stories[:2]]
+    assert all(article['source'] == 'Example News' for article in articles)
+    assert scraper.extraction_pool._host_limit("www.example-news.org") == 1
+    assert scraper.extraction_pool._host_limit("www.bbc.com") == 2
+
+    bbc = scraper.sources['bbc.com']
+    assert bbc['item_limit'] == 5 and bbc['rss_url'] == RSS_FEEDS['bbc.com']['rss_url']
+    assert scraper.sources.key_for("https://broken.example") is None
+    # Overrides stay with the scraper that was configured with them
+    assert SourceRegistry()['bbc.com']['item_limit'] == RSS_FEEDS['bbc.com']['item_limit']
+    logger.info("✅ Sources are added and tuned from config rows")
+
+def main():
+    """Run all tests"""
+    test_hosts_match_their_registered_domain()
+    test_feed_then_index_parser_then_nothing()
+    test_sources_are_added_and_tuned_from_config()
+    logger.info("🎉 Source registry tests passed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Test bulk article saving in StorageIntegration with a stubbed HTTP session"""
+
+import sys
+import os
+import gzip
+import json
+import requests
+sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
+
+from services.storage_integration import StorageIntegration
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class StubResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.payload = payload or {}
+        self.text = json.dumps(self.payload)
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise AssertionError(f"unexpected status {self.status_code}")
+
+class ErrorResponse(StubResponse):
+    def raise_for_status(self):
+        raise requests.exceptions.HTTPError(f"{self.status_code} Server Error")
+
+def make_articles(count):
+    return [{
+        'title': f'Scraped headline number {i} about the harbour',
+        'url': f'https://news.example/harbour-{i}',
+        'source': 'Stub News',
+        'fullContent': 'Body text'
+    } for i in range(count)]
+
+def test_bulk_chunks_are_compressed_with_per_item_results():
+    """Articles go out in gzip-compressed chunks and rejected items are reported per article"""
+    calls = []
+
+    def post(url, data=None, headers=None, **kwargs):
+        assert url.endswith('/api/articles/bulk')
+        assert headers['Content-Encoding'] == 'gzip'
+        chunk = json.loads(gzip.decompress(data))['articles']
+        calls.append(len(chunk))
+        results = [{'success': 'harbour-3' not in item['originalUrl'], 'status': 400} for item in chunk]
+        return StubResponse(200, {'results': results})
+
+    storage = StorageIntegration(bulk_chunk_size=4)
+    storage.session.post = post
+
+    results = storage.save_article_payloads([storage._article_payload(article) for article in make_articles(10)])
+
+    assert calls == [4, 4, 2]
+    assert results == [True, True, True, False] + [True] * 6
+    logger.info("✅ Bulk saves are chunked, compressed and report per-item results")
+
+def test_missing_bulk_route_falls_back_to_single_posts():
+    """A 404 from the bulk route switches to one POST per article for the rest of the run"""
+    calls = []
+
+    def post(url, **kwargs):
+        calls.append(url.rsplit('/', 1)[-1])
+        if url.endswith('/bulk'):
+            return StubResponse(404)
+        return StubResponse(200)
+
+    storage = StorageIntegration(bulk_chunk_size=2)
+    storage.session.post = post
+
+    assert storage.save_scraped_articles(make_articles(5))
+    assert calls == ['bulk'] + ['articles'] * 5
+    assert storage.bulk_supported is False
+    logger.info("✅ Missing bulk route falls back to single-article saves")
+
+def test_failed_chunks_do_not_stop_later_chunks():
+    """A 5xx or connection error loses only its own chunk; the rest of the articles are still saved"""
+    calls = []
+
+    def post(url, data=None, headers=None, **kwargs):
+        calls.append(len(calls))
+        if len(calls) == 2:
+            return ErrorResponse(503)
+        if len(calls) == 3:
+            raise requests.exceptions.ConnectionError("connection reset")
+        chunk = json.loads(gzip.decompress(data))['articles']
+        return StubResponse(200, {'results': [{'success': True}] * len(chunk)})
+
+    storage = StorageIntegration(bulk_chunk_size=2)
+    storage.session.post = post
+    results = storage.save_article_payloads([storage._article_payload(article) for article in make_articles(7)])
+
+    assert len(calls) == 4
+    assert results == [True, True, False, False, False, False, True]
+    assert storage.request_failures == 2
+
+    # A batch where storage could not be reached at all reports failure
+    storage.session.post = lambda *args, **kwargs: ErrorResponse(502)
+    assert storage.save_scraped_articles(make_articles(3)) is False
+    logger.info("✅ Failed bulk chunks are isolated")
+
+def test_enrichment_fields_are_saved():
+    """Keywords, summary and lead image size from enrichment go into the payload"""
+    storage = StorageIntegration()
+    article = dict(make_articles(1)[0], keywords=['harbour', 'ferry'], summary='Ferries resume.',
+                   imageUrl='https://cdn.example/lead.jpg', imageWidth=1200, imageHeight=675)
+    payload = storage._article_payload(article)
+    assert payload['keywords'] == ['harbour', 'ferry'] and payload['summary'] == 'Ferries resume.'
+    assert (payload['imageWidth'], payload['imageHeight']) == (1200, 675)
+
+    plain = storage._article_payload(make_articles(1)[0])
+    assert plain['keywords'] is None and plain['imageWidth'] is None
+    logger.info("✅ Enrichment fields are part of the saved article")
+
+def main():
+    """Run all tests"""
+    test_bulk_chunks_are_compressed_with_per_item_results()
+    test_missing_bulk_route_falls_back_to_single_posts()
+    test_failed_chunks_do_not_stop_later_chunks()
+    test_enrichment_fields_are_saved()
+    logger.info("🎉 Storage integration tests passed")
+
+if __name__ == "__main__":
+    main()